@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Pattern Engine Benchmark
+Compares the precompiled single-scan PatternSet against the previous
+per-pattern ``re.finditer`` loop with a linear overlap check on up to 1 MB
+of mixed English, Chinese and Russian text.
+"""
+
+import os
+import sys
+import time
+import json
+import random
+import re
+import logging
+from typing import Dict, Any, List
+
+# Add project root to path
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from src.config.language_specific_regex_config import LANGUAGE_REGEX_PATTERNS
+from src.core.pattern_engine import PatternSet
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SENTENCES = [
+    "Dr. Alice Johnson joined Stanford University after working at Acme Corporation in New York City.",
+    "The Ministry of Energy announced a partnership with Global Research Center on climate change.",
+    "President Michael Brown met officials from the European Union in Brussels to discuss blockchain policy.",
+    "华为技术有限公司在深圳市发布了新的人工智能芯片，清华大学的研究人员参与了测试。",
+    "北京市政府与中国科学院合作推进量子计算和大数据研究。",
+    "Владимир Иванов посетил Московский государственный университет и обсудил искусственный интеллект.",
+    "Компания Газпром открыла новый офис в Санкт-Петербург город на улице Ленина.",
+]
+
+
+def build_text(size_bytes: int, seed: int = 42) -> str:
+    """Mixed-language text of roughly ``size_bytes`` UTF-8 bytes"""
+    rng = random.Random(seed)
+    parts, size = [], 0
+    while size < size_bytes:
+        sentence = rng.choice(SENTENCES)
+        parts.append(sentence)
+        size += len(sentence.encode("utf-8")) + 1
+    return " ".join(parts)
+
+
+def legacy_extract(text: str, table: Dict[str, List[str]]) -> List[tuple]:
+    """Reference implementation of the previous pattern loop"""
+    results = []
+    used_positions = set()
+    for entity_type, pattern_list in table.items():
+        for pattern in pattern_list:
+            for match in re.finditer(pattern, text):
+                start_pos, end_pos = match.start(), match.end()
+                if any(start_pos >= used_start and end_pos <= used_end
+                       for used_start, used_end in used_positions):
+                    continue
+                results.append((match.group(), entity_type))
+                used_positions.add((start_pos, end_pos))
+    return results
+
+
+def merged_table() -> Dict[str, List[str]]:
+    """Entity patterns of all benchmark languages under shared labels"""
+    table: Dict[str, List[str]] = {}
+    for language in ("en", "zh", "ru"):
+        for entity_type, patterns in LANGUAGE_REGEX_PATTERNS[language].items():
+            table.setdefault(entity_type, []).extend(patterns)
+    return table
+
+
+def _time_call(func, repeats: int) -> float:
+    """Return the best wall-clock time over ``repeats`` calls"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes: List[int] = (64 * 1024, 256 * 1024, 1024 * 1024),
+                  legacy_max_bytes: int = 256 * 1024,
+                  repeats: int = 3) -> Dict[str, Any]:
+    """Measure MB/second for both paths; the quadratic legacy path is skipped on large inputs"""
+    table = merged_table()
+
+    start = time.perf_counter()
+    pattern_set = PatternSet(table)
+    compile_time = time.perf_counter() - start
+
+    results = {"patterns": len(pattern_set), "merged": pattern_set.merged is not None,
+               "compile_ms": compile_time * 1000, "sizes": {}}
+    for size in sizes:
+        text = build_text(size)
+        megabytes = size / (1024 * 1024)
+        engine_time = _time_call(lambda: pattern_set.scan(text), repeats)
+        entry = {
+            "matches": len(pattern_set.scan(text)),
+            "engine_mb_per_sec": megabytes / engine_time,
+            "legacy_mb_per_sec": None,
+            "speedup": None
+        }
+        if size <= legacy_max_bytes:
+            legacy_time = _time_call(lambda: legacy_extract(text, table), 1)
+            entry["legacy_mb_per_sec"] = megabytes / legacy_time
+            entry["speedup"] = legacy_time / engine_time
+            logger.info(
+                f"{size // 1024:>5} KB: legacy {legacy_time * 1000:.0f} ms, "
+                f"engine {engine_time * 1000:.0f} ms, speedup {legacy_time / engine_time:.1f}x"
+            )
+        else:
+            logger.info(f"{size // 1024:>5} KB: engine {engine_time * 1000:.0f} ms (legacy skipped)")
+        results["sizes"][size] = entry
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures cold-start time and peak RSS of the API orchestrator and the
+unified MCP server in one process, with agents built lazily (the default)
+and with every agent built up front as before (the MCP server's duplicate
+agent instances are not recreated, so the eager figures are a lower bound).
+Each scenario runs in a fresh interpreter so imports do not carry over.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import logging
+from typing import Dict, Any
+
+# Add project root to path
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCENARIO_SCRIPT = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from src.core.orchestrator import get_shared_orchestrator
+orchestrator = get_shared_orchestrator()
+if {with_mcp}:
+    from src.mcp_servers.unified_mcp_server import UnifiedMCPServer
+    server = UnifiedMCPServer()
+startup = time.perf_counter() - start
+if {eager}:
+    # Build every agent now, as startup did before; bool() builds a LazyAgent
+    agents = list(orchestrator.agents.values())
+    if {with_mcp}:
+        agents += [value for name, value in vars(server).items() if name.endswith("_agent") and value is not None]
+    for agent in agents:
+        bool(agent)
+total = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"startup_s": startup, "ready_s": total, "peak_rss_mb": rss_kb / 1024,
+                   "agents": len(orchestrator.agents)}}))
+"""
+
+
+def _run_scenario(eager: bool, with_mcp: bool) -> Dict[str, Any]:
+    """Run one scenario in a fresh interpreter and parse its JSON line"""
+    script = SCENARIO_SCRIPT.format(root=project_root, eager=eager, with_mcp=with_mcp)
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd=project_root
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "scenario failed")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark() -> Dict[str, Any]:
+    """Compare lazy and eager agent construction for the API alone and API + MCP server"""
+    results = {}
+    for with_mcp in (False, True):
+        label = "api_and_mcp" if with_mcp else "api"
+        lazy = _run_scenario(eager=False, with_mcp=with_mcp)
+        eager = _run_scenario(eager=True, with_mcp=with_mcp)
+        results[label] = {
+            "lazy": lazy,
+            "eager": eager,
+            "startup_speedup": eager["ready_s"] / lazy["startup_s"],
+            "rss_saved_mb": eager["peak_rss_mb"] - lazy["peak_rss_mb"]
+        }
+        logger.info(
+            f"{label}: lazy start {lazy['startup_s']:.2f}s / {lazy['peak_rss_mb']:.0f} MB, "
+            f"eager {eager['ready_s']:.2f}s / {eager['peak_rss_mb']:.0f} MB"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,91 @@
+"""
+Tests for indexed, load-aware agent routing.
+"""
+
+import asyncio
+
+from src.core.agent_router import AgentRouter, ROUND_ROBIN
+from src.core.models import AnalysisRequest, DataType
+
+
+class _Agent:
+    def __init__(self, agent_id, accepts=None, model_name="llama3.2:latest", capabilities=()):
+        self.agent_id = agent_id
+        self.model_name = model_name
+        self.max_capacity = 2
+        self.metadata = {"capabilities": list(capabilities)}
+        self.accepts = accepts
+        self.checked = 0
+
+    async def can_process(self, request):
+        self.checked += 1
+        return self.accepts is None or request.data_type in self.accepts
+
+
+class _OtherAgent(_Agent):
+    pass
+
+
+def _request(data_type=DataType.TEXT, **kwargs):
+    return AnalysisRequest(data_type=data_type, content="content", **kwargs)
+
+
+class TestAgentRouter:
+    """Test indexing, preference order and dispatch across equivalent agents."""
+
+    def test_routes_by_index_in_registration_order(self):
+        async def run():
+            router = AgentRouter()
+            audio = _OtherAgent("audio")
+            text = _Agent("text", capabilities=["sentiment"])
+            router.register(audio, [DataType.AUDIO])
+            router.register(text, [DataType.TEXT])
+            router.register(_OtherAgent("text-other", model_name="mistral"), [DataType.TEXT, DataType.PDF])
+
+            assert (await router.route(_request())).agent_id == "text"
+            assert audio.checked == 0
+            assert (await router.route(_request(model_preference="mistral"))).agent_id == "text-other"
+            assert (await router.route(_request(DataType.PDF))).agent_id == "text-other"
+            assert (await router.route(_request(DataType.IMAGE, metadata={}))).agent_id == "audio"
+            assert router.candidate_pools(DataType.TEXT, "sentiment")[0].representative is text
+
+        asyncio.run(run())
+
+    def test_least_in_flight_and_concurrency_limit(self):
+        async def run():
+            router = AgentRouter()
+            siblings = [_Agent(f"text-{i}") for i in range(3)]
+            for agent in siblings:
+                router.register(agent, [DataType.TEXT])
+
+            release = asyncio.Event()
+            active = []
+
+            async def handle():
+                agent = await router.route(_request())
+                async with router.lease(agent):
+                    active.append(agent.agent_id)
+                    await release.wait()
+
+            tasks = [asyncio.create_task(handle()) for _ in range(7)]
+            await asyncio.sleep(0.01)
+            # Six slots (3 agents x 2), evenly spread; the seventh request waits
+            assert sorted(active) == ["text-0", "text-0", "text-1", "text-1", "text-2", "text-2"]
+            assert sum(router.get_load(a.agent_id)["in_flight"] for a in siblings) == 7
+            release.set()
+            await asyncio.gather(*tasks)
+            assert len(active) == 7
+            assert all(router.get_load(a.agent_id)["in_flight"] == 0 for a in siblings)
+
+        asyncio.run(run())
+
+
+def test_round_robin_policy():
+    async def run():
+        router = AgentRouter(policy=ROUND_ROBIN)
+        for i in range(3):
+            router.register(_Agent(f"text-{i}"), [DataType.TEXT])
+        picks = [(await router.route(_request())).agent_id for _ in range(4)]
+        assert picks == ["text-0", "text-1", "text-2", "text-0"]
+
+    asyncio.run(run())
@@ -0,0 +1,141 @@
+"""
+Tests for bounded-concurrency chunk extraction, using the Strands mock agent
+as the LLM backend.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.core.concurrent_chunk_processor import ConcurrentChunkProcessor
+from src.core.strands_mock import Agent
+
+
+def _chunks(n):
+    return [f"Please extract entities: John Smith works at Google (chunk {i})" for i in range(n)]
+
+
+class TestConcurrentChunkProcessor:
+    """Test concurrency bounds, ordering, retry and progress reporting."""
+
+    def test_chunks_run_concurrently_against_mock_llm(self):
+        """20 mock round-trips of 0.1s finish in a few concurrent waves."""
+        agent = Agent(name="extractor")
+        processor = ConcurrentChunkProcessor(max_concurrency=10)
+
+        start = time.perf_counter()
+        outcomes = asyncio.run(processor.process(_chunks(20), agent.run))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0  # 20 sequential calls would take >= 2s
+        assert [o.chunk_id for o in outcomes] == list(range(20))
+        assert all(o.succeeded and o.attempts == 1 for o in outcomes)
+        assert len(agent.conversation_history) == 20
+
+    def test_in_flight_limit_and_ordering(self):
+        """No more than max_concurrency workers run at once; order follows chunk_id."""
+        state = {"active": 0, "peak": 0}
+
+        async def worker(chunk):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later chunks finish first
+            await asyncio.sleep(0.02 * (5 - chunk % 5))
+            state["active"] -= 1
+            return chunk * 10
+
+        outcomes = asyncio.run(ConcurrentChunkProcessor(max_concurrency=3).process(list(range(12)), worker))
+        assert state["peak"] == 3
+        assert [o.result for o in outcomes] == [i * 10 for i in range(12)]
+
+    def test_retry_then_success_and_final_failure(self):
+        """Transient failures are retried; persistent ones are reported, not raised."""
+        calls = {}
+
+        async def worker(chunk):
+            calls[chunk] = calls.get(chunk, 0) + 1
+            if chunk == "flaky" and calls[chunk] < 2:
+                raise RuntimeError("timeout")
+            if chunk == "broken":
+                raise RuntimeError("bad response")
+            return json.dumps({"chunk": chunk})
+
+        processor = ConcurrentChunkProcessor(max_concurrency=2, max_retries=2, retry_backoff=0.001)
+        flaky, ok, broken = asyncio.run(processor.process(["flaky", "ok", "broken"], worker))
+
+        assert flaky.succeeded and flaky.attempts == 2
+        assert ok.succeeded and ok.attempts == 1
+        assert not broken.succeeded and broken.attempts == 3 and "bad response" in broken.error
+
+    def test_progress_reporting(self):
+        """The callback (sync or async) sees every chunk complete."""
+        events = []
+
+        async def on_progress(event):
+            events.append(event)
+
+        agent = Agent(name="extractor")
+        asyncio.run(ConcurrentChunkProcessor(max_concurrency=4).process(_chunks(6), agent.run, on_progress))
+
+        assert sorted(e["chunk_id"] for e in events) == list(range(6))
+        assert [e["completed"] for e in events] == list(range(1, 7))
+        assert all(e["total"] == 6 and e["failed"] == 0 for e in events)
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            ConcurrentChunkProcessor(max_concurrency=0)
+
+
+class _LanguageService:
+    def extract_entities_with_config(self, text, language):
+        return {
+            "entities": {"PERSON": ["John Smith"]},
+            "settings": {"confidence_threshold": 0.7, "use_enhanced_extraction": True},
+            "language": language
+        }
+
+
+class _FlakyExtractor:
+    """Reports the first ``failures`` LLM errors the way EntityExtractionAgent does."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def extract_entities(self, text):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return {"entities": [], "count": 0, "categories_found": [], "error": "model timeout"}
+        return {"entities": [{"name": "Google", "type": "organization", "confidence": 0.9}]}
+
+
+@pytest.mark.parametrize("failures, expected, calls", [
+    (1, {("John Smith", "PERSON"), ("Google", "ORGANIZATION")}, 2),
+    # Three attempts fail; the basic-extraction fallback does not call the LLM again
+    (5, {("John Smith", "PERSON")}, 3),
+])
+def test_knowledge_graph_chunks_retry_failed_llm_extraction(monkeypatch, failures, expected, calls):
+    """LLM failures reported as error dicts are retried, then fall back to basic entities."""
+    from types import SimpleNamespace
+
+    from src.agents import knowledge_graph_agent as kg_module
+
+    monkeypatch.setattr(kg_module, "settings", SimpleNamespace(knowledge_graph_processing=SimpleNamespace(
+        max_concurrent_chunk_extractions=2, chunk_extraction_retries=2, chunk_retry_backoff=0.001
+    )))
+    agent = kg_module.KnowledgeGraphAgent.__new__(kg_module.KnowledgeGraphAgent)
+    agent.language_service = _LanguageService()
+    agent.entity_extraction_agent = _FlakyExtractor(failures)
+    agent._split_text_into_chunks = lambda text: [text]
+    agent._select_relationship_candidates = lambda text, entities: []
+
+    async def map_relationships(text, entities, language):
+        return {"content": [{"json": {"relationships": []}}]}
+
+    agent.map_relationships = map_relationships
+
+    entities, _ = asyncio.run(agent._process_text_chunks("John Smith works at Google", "en"))
+    assert {(e["text"], e["type"]) for e in entities} == expected
+    assert agent.entity_extraction_agent.calls == calls
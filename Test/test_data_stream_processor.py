@@ -0,0 +1,107 @@
+"""
+Tests for micro-batching and backpressure in the enhanced stream processor.
+"""
+
+import asyncio
+
+from src.core.real_time.stream_processor import StreamConfig
+from src.core.streaming.data_stream_processor import EnhancedDataStreamProcessor
+
+
+def _processor(**overrides):
+    config = StreamConfig(
+        batch_size=overrides.pop("batch_size", 50),
+        processing_interval=0.01,
+        max_batch_wait=0.005,
+        **overrides
+    )
+    return EnhancedDataStreamProcessor(config)
+
+
+class TestBackpressure:
+    """Test the queue overflow policies."""
+
+    def test_drop_oldest_and_drop_newest(self):
+        async def run():
+            for policy, kept in (("drop_oldest", [2, 3, 4]), ("drop_newest", [0, 1, 2])):
+                processor = _processor(queue_capacities={"normal": 3}, overflow_policy=policy)
+                accepted = [await processor.add_data_point_enhanced(i) for i in range(5)]
+                assert [p.value for p in processor.normal_priority_queue] == kept
+                assert accepted == ([True] * 5 if policy == "drop_oldest" else [True] * 3 + [False] * 2)
+                metrics = processor.get_stream_metrics()
+                assert metrics["total_dropped"] == 2 and metrics["dropped_by_priority"] == {"normal": 2}
+
+        asyncio.run(run())
+
+    def test_block_waits_for_space(self):
+        async def run():
+            processor = _processor(queue_capacities={"high": 2}, overflow_policy="block", enqueue_timeout=0.05)
+            for i in range(2):
+                await processor.add_data_point_enhanced(i, priority="high")
+            assert not await processor.add_data_point_enhanced(2, priority="high")
+
+            processor.config.enqueue_timeout = 1.0
+            producer = asyncio.create_task(processor.add_data_point_enhanced(3, priority="high"))
+            await asyncio.sleep(0.01)
+            assert not producer.done()
+            assert len(await processor._next_batch()) == 2
+            assert await producer
+            assert processor.stream_metrics.total_dropped == 1
+
+        asyncio.run(run())
+
+
+def test_batches_by_priority_and_runs_callbacks():
+    async def run():
+        processor = _processor(batch_size=4)
+        seen = []
+
+        async def analytics(data_point):
+            await asyncio.sleep(0.01)
+            return data_point.value * 2
+
+        processor.add_quality_validator("half", lambda data_point: 0.5)
+        processor.add_real_time_analytics("double", analytics)
+        processor.add_alert_condition("large", lambda data_point: data_point.value > 2)
+        processor.register_consumer("default", seen.append)
+
+        for i in range(3):
+            await processor.add_data_point_enhanced(i, priority="low")
+        await processor.add_data_point_enhanced(3, priority="high")
+        await processor.add_data_point_enhanced(4)
+
+        batch = await processor._next_batch()
+        assert [(p.value, priority) for p, priority in batch] == [(3, "high"), (4, "normal"), (0, "low"), (1, "low")]
+
+        started = asyncio.get_running_loop().time()
+        await processor._process_enhanced_batch(batch)
+        assert asyncio.get_running_loop().time() - started < 0.04
+        await asyncio.sleep(0)
+
+        point = batch[0][0]
+        assert point.quality_score == 0.5
+        assert point.metadata["analytics_results"] == {"double": 6}
+        assert [alert["condition"] for alert in point.metadata["alerts"]] == ["large"]
+        assert processor.stream_metrics.total_completed == 4
+        assert processor.stream_metrics.batches_processed == 1
+
+    asyncio.run(run())
+
+
+def test_callbacks_see_validated_quality_score():
+    async def run():
+        processor = _processor()
+        seen_scores = []
+        processor.add_quality_validator("poor", lambda data_point: 0.2)
+        processor.add_real_time_analytics("score", lambda data_point: seen_scores.append(data_point.quality_score))
+        processor.add_alert_condition("low_quality", lambda data_point: data_point.quality_score < 0.5)
+
+        await processor.add_data_point_enhanced(1)
+        batch = await processor._next_batch()
+        await processor._process_enhanced_batch(batch)
+
+        point = batch[0][0]
+        assert seen_scores == [0.2]
+        assert [alert["condition"] for alert in point.metadata["alerts"]] == ["low_quality"]
+
+    asyncio.run(run())
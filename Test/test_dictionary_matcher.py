@@ -0,0 +1,79 @@
+"""
+Tests for the Aho-Corasick dictionary matcher.
+"""
+
+import json
+import random
+import string
+
+from src.config.entity_types_config import EntityTypesConfig
+from src.core.dictionary_matcher import (
+    DictionaryMatcher, clear_dictionary_matchers, get_dictionary_matcher
+)
+
+
+class TestDictionaryMatcher:
+    """Test single-pass dictionary matching."""
+
+    def test_overlapping_matches_with_positions(self):
+        matcher = DictionaryMatcher([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+        hits = [(m.start, m.end, m.term) for m in matcher.find_all("uSHers")]
+        assert hits == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_case_sensitivity_and_cjk(self):
+        names = {"LOCATION": ["北京", "New York"], "ORGANIZATION": ["华为", "Meta"]}
+        insensitive = DictionaryMatcher.from_dictionaries(names)
+        sensitive = DictionaryMatcher.from_dictionaries(names, case_sensitive=True)
+        text = "华为 opened an office in new york and 北京; metadata"
+        assert insensitive.matched_entries(text) == [
+            ("北京", "LOCATION"), ("New York", "LOCATION"), ("华为", "ORGANIZATION"), ("Meta", "ORGANIZATION")
+        ]
+        assert sensitive.matched_entries(text) == [("北京", "LOCATION"), ("华为", "ORGANIZATION")]
+
+    def test_same_term_under_two_values(self):
+        matcher = DictionaryMatcher([("Washington", "PERSON"), ("Washington", "LOCATION"), ("washington", "PERSON")])
+        assert len(matcher) == 2
+        assert matcher.matched_entries("Washington") == [("Washington", "PERSON"), ("Washington", "LOCATION")]
+
+    def test_matches_naive_substring_search(self):
+        rng = random.Random(0)
+        alphabet = "abc "
+        terms = list({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))).strip() for _ in range(300)} - {""})
+        text = "".join(rng.choice(alphabet) for _ in range(2000))
+        matcher = DictionaryMatcher((term, None) for term in terms)
+
+        assert {term for term, _ in matcher.matched_entries(text)} == {t for t in terms if t in text}
+        expected = sorted((i, i + len(t), t) for t in terms for i in range(len(text)) if text.startswith(t, i))
+        assert sorted((m.start, m.end, m.term) for m in matcher.find_all(text)) == expected
+
+    def test_large_gazetteer(self):
+        rng = random.Random(1)
+        names = ["".join(rng.choice(string.ascii_lowercase) for _ in range(10)) for _ in range(100000)]
+        matcher = DictionaryMatcher((name, "PERSON") for name in names)
+        text = " ".join(names[::1000])
+        assert len(matcher.matched_entries(text)) == 100
+
+
+class TestSharedMatchers:
+    """Test matcher sharing and reload on configuration changes."""
+
+    def test_rebuilds_when_gazetteer_changes(self, tmp_path):
+        clear_dictionary_matchers()
+        config = EntityTypesConfig()
+        builds = []
+
+        def matcher():
+            def build():
+                builds.append(config.version)
+                return DictionaryMatcher.from_dictionaries(config.get_entity_dictionary("en"))
+            return get_dictionary_matcher("test:en", config.version, build)
+
+        assert matcher().matched_entries("Ada Lovelace") == []
+        assert matcher() is matcher()
+
+        gazetteer = tmp_path / "people.json"
+        gazetteer.write_text(json.dumps({"person": ["Ada Lovelace", "Alan Turing"]}), encoding="utf-8")
+        assert config.load_gazetteer("en", gazetteer) == 2
+        assert matcher().matched_entries("Ada Lovelace") == [("Ada Lovelace", "PERSON")]
+        assert len(builds) == 2
+        clear_dictionary_matchers()
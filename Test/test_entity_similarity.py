@@ -0,0 +1,129 @@
+"""
+Tests for blocked entity similarity and merging.
+"""
+
+import random
+import re
+
+from src.core.entity_similarity import (
+    EntityOccurrenceIndex, group_by_containment, minhash_candidate_pairs, proximity_candidate_pairs
+)
+from src.core.semantic_similarity_analyzer import SemanticSimilarityAnalyzer
+
+
+def _greedy_groups(names):
+    """Reference quadratic merge"""
+    lowered = [name.lower() for name in names]
+    groups, processed = [], set()
+    for i, first in enumerate(lowered):
+        if i in processed:
+            continue
+        processed.add(i)
+        group = [i]
+        for j in range(i + 1, len(lowered)):
+            second = lowered[j]
+            if j not in processed and (first in second or second in first):
+                group.append(j)
+                processed.add(j)
+        groups.append(group)
+    return groups
+
+
+class TestGroupByContainment:
+    """Test the near-linear merge against the pairwise loop."""
+
+    def test_matches_pairwise_merge(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            names = ["".join(rng.choice("abAB") for _ in range(rng.randint(0, 4))) for _ in range(40)]
+            assert group_by_containment(names) == _greedy_groups(names)
+
+    def test_entity_names(self):
+        names = ["OpenAI", "openai inc", "Microsoft", "AI", "Google", "microsoft"]
+        assert group_by_containment(names) == [[0, 1, 3], [2, 5], [4]]
+
+
+class TestCandidateGeneration:
+    """Test MinHash and proximity blocking."""
+
+    def test_minhash_buckets_near_duplicates(self):
+        names = ["清华大学", "清华大学院", "华为技术有限公司", "华为技术公司", "北京"]
+        pairs = minhash_candidate_pairs(names)
+        assert (0, 1) in pairs and (2, 3) in pairs
+        assert not any(4 in pair for pair in pairs)
+
+    def test_proximity_window(self):
+        pairs = proximity_candidate_pairs([0, 5, None, 50, 52], max_distance=10)
+        assert pairs == {(0, 1), (3, 4)}
+
+
+class TestSemanticSimilarityAnalyzer:
+    """Test that indexed scoring matches direct text scans."""
+
+    TEXT = (
+        "清华大学与北京大学合作开展人工智能研究。华为技术有限公司支持清华大学的研究项目！"
+        "北京市政府推动科技企业发展，华为公司与腾讯公司竞争激烈？阿里巴巴集团在杭州投资。"
+    )
+    ENTITIES = ["清华大学", "北京大学", "人工智能", "华为技术有限公司", "北京市政府", "腾讯公司", "杭州", "缺失实体"]
+
+    def test_occurrence_index_matches_find(self):
+        index = EntityOccurrenceIndex(self.TEXT, self.ENTITIES)
+        sentences = re.split(r'[。！？]', self.TEXT)
+        assert index.sentences == sentences
+        for entity in self.ENTITIES:
+            assert index.first_position(entity) == self.TEXT.find(entity)
+            assert index.sentence_ids(entity) == {i for i, s in enumerate(sentences) if entity in s}
+
+    def test_exhaustive_scores_match_text_scan(self):
+        analyzer = SemanticSimilarityAnalyzer()
+        results = analyzer.analyze_semantic_similarity([{"text": e} for e in self.ENTITIES], self.TEXT)
+        assert len(results) == len(self.ENTITIES) * (len(self.ENTITIES) - 1) // 2
+        for result in results:
+            e1, e2 = result.entity1, result.entity2
+            pos1, pos2 = self.TEXT.find(e1), self.TEXT.find(e2)
+            contextual = 0.0
+            if pos1 != -1 and pos2 != -1:
+                context = self.TEXT[max(0, min(pos1, pos2) - 100):max(pos1, pos2) + 100]
+                weights = [analyzer.relationship_weights[t] for t, indicators in analyzer.relationship_indicators.items()
+                           for i in indicators if i in context]
+                distance = max(0, 1 - abs(pos1 - pos2) / (len(self.TEXT) * 0.1))
+                contextual = distance * 0.6 + sum(weights) / max(len(weights), 1) * 0.4
+            expected = (analyzer._calculate_lexical_similarity(e1, e2) * 0.2
+                        + analyzer._calculate_semantic_similarity(e1, e2, self.TEXT) * 0.5 + contextual * 0.3)
+            assert abs(result.similarity_score - expected) < 1e-9
+            evidence = [s.strip() for s in re.split(r'[。！？]', self.TEXT) if e1 in s and e2 in s and len(s.strip()) > 10]
+            assert result.context_evidence == evidence[:3]
+
+    def test_min_score_keeps_strong_pairs(self):
+        analyzer = SemanticSimilarityAnalyzer()
+        entities = [{"text": e} for e in self.ENTITIES]
+        everything = analyzer.analyze_semantic_similarity(entities, self.TEXT)
+        blocked = analyzer.analyze_semantic_similarity(entities, self.TEXT, min_score=0.5)
+        expected = {(r.entity1, r.entity2) for r in everything if r.similarity_score >= 0.5}
+        assert expected and {(r.entity1, r.entity2) for r in blocked} == expected
+
+    def test_min_score_keeps_distant_same_category_pairs(self):
+        analyzer = SemanticSimilarityAnalyzer()
+        text = "复旦大学发布报告。" + "。".join(["天气晴朗"] * 60) + "。中国科学院召开会议。"
+        entities = [{"text": e} for e in ["复旦大学", "中国科学院", "杭州"]]
+        everything = analyzer.analyze_semantic_similarity(entities, text)
+        blocked = analyzer.analyze_semantic_similarity(entities, text, min_score=0.4)
+        expected = {(r.entity1, r.entity2) for r in everything if r.similarity_score >= 0.4}
+        assert expected == {("复旦大学", "中国科学院")}
+        assert {(r.entity1, r.entity2) for r in blocked} == expected
+
+    def test_category_blocks_skip_categories_below_min_score(self):
+        analyzer = SemanticSimilarityAnalyzer()
+        text = "复旦大学和杭州地区。" + "。".join(["天气晴朗"] * 60) + "。中国科学院和北京城市。"
+        entities = [{"text": e} for e in ["复旦大学", "杭州地区", "中国科学院", "北京城市"]]
+        names = [e["text"] for e in entities]
+        occurrences = EntityOccurrenceIndex(text, names + analyzer._indicator_terms, analyzer.sentence_pattern)
+        categories = {name: analyzer._get_entity_category(name) for name in names}
+
+        # Academic (weight 0.8) stays blocked at 0.45; location (0.6) cannot reach it without other signals
+        pairs = analyzer._candidate_pairs(names, occurrences, text, categories, 0.45)
+        assert (0, 2) in pairs and (1, 3) not in pairs
+        everything = analyzer.analyze_semantic_similarity(entities, text)
+        blocked = analyzer.analyze_semantic_similarity(entities, text, min_score=0.45)
+        expected = {(r.entity1, r.entity2) for r in everything if r.similarity_score >= 0.45}
+        assert {(r.entity1, r.entity2) for r in blocked} == expected
@@ -0,0 +1,75 @@
+"""
+Tests for bounded path search and cached graph metrics.
+"""
+
+import time
+
+import networkx as nx
+import pytest
+
+from src.core.knowledge_graph_analytics import GraphMetricsCache, bounded_path_search
+
+
+class TestBoundedPathSearch:
+    """Test lazy path enumeration limits."""
+
+    def test_matches_exhaustive_search_on_small_graph(self):
+        graph = nx.gnp_random_graph(12, 0.4, seed=1, directed=True)
+        result = bounded_path_search(graph, 0, 5, max_paths=5)
+        expected = list(nx.all_simple_paths(graph, 0, 5))
+
+        assert result["paths_count"] == len(expected)
+        assert result["paths_count_exact"]
+        assert result["shortest_path"] == nx.shortest_path(graph, 0, 5)
+        assert [len(p) for p in result["paths"]] == sorted(len(p) for p in expected)[:5]
+
+    def test_length_bound(self):
+        graph = nx.gnp_random_graph(12, 0.4, seed=1, directed=True)
+        result = bounded_path_search(graph, 0, 5, max_length=3)
+        assert result["paths_count"] == len(list(nx.all_simple_paths(graph, 0, 5, cutoff=3)))
+        assert all(len(path) - 1 <= 3 for path in result["paths"])
+
+    def test_no_path(self):
+        graph = nx.DiGraph([(0, 1), (2, 3)])
+        result = bounded_path_search(graph, 0, 3)
+        assert result["shortest_path_length"] == -1
+        assert result["paths"] == [] and result["paths_count"] == 0
+
+    @pytest.mark.parametrize("count_limit, timeout", [(1000, None), (10 ** 9, 0.2)])
+    def test_dense_graph_returns_promptly(self, count_limit, timeout):
+        """A complete graph has astronomically many paths; the search still stops."""
+        graph = nx.complete_graph(40, create_using=nx.DiGraph)
+        start = time.perf_counter()
+        result = bounded_path_search(graph, 0, 1, count_limit=count_limit, timeout=timeout)
+        assert time.perf_counter() - start < 2.0
+        assert not result["paths_count_exact"]
+        assert result["timed_out"] == (timeout is not None)
+        assert len(result["paths"]) == 5 and result["paths"][0] == [0, 1]
+
+
+class TestGraphMetricsCache:
+    """Test centrality caching and invalidation."""
+
+    def test_values_match_networkx(self):
+        graph = nx.gnp_random_graph(50, 0.1, seed=2, directed=True)
+        cache = GraphMetricsCache()
+        assert cache.degree_centrality(graph, 3) == pytest.approx(nx.degree_centrality(graph)[3])
+        assert cache.pagerank(graph, 3) == pytest.approx(nx.pagerank(graph)[3], rel=1e-4)
+        assert cache.betweenness(graph, 3) == pytest.approx(nx.betweenness_centrality(graph)[3])
+
+    def test_recomputes_only_past_staleness(self):
+        graph = nx.path_graph(100, create_using=nx.DiGraph)
+        cache = GraphMetricsCache(staleness=0.05)
+        first = cache.pagerank(graph)
+
+        graph.add_edge(100, 101)
+        assert cache.pagerank(graph) is first
+        assert cache.pagerank(graph, 101) == 0.0
+
+        graph.add_edges_from((i, i + 1) for i in range(101, 120))
+        assert cache.pagerank(graph) is not first
+        assert cache.pagerank(graph, 101) > 0
+
+        refreshed = cache.pagerank(graph)
+        cache.invalidate()
+        assert cache.pagerank(graph) is not refreshed
@@ -0,0 +1,96 @@
+"""
+Tests for the knowledge graph inverted index.
+"""
+
+import time
+
+import networkx as nx
+import pytest
+
+from src.core.knowledge_graph_index import GraphInvertedIndex, tokenize
+
+
+def _graph():
+    graph = nx.DiGraph()
+    graph.add_node("Sun Tzu", type="PERSON", language="en", domain="military")
+    graph.add_node("Art of War", type="WORK", language="en", original_text="孙子兵法")
+    graph.add_node("孙子兵法", type="WORK", language="zh")
+    graph.add_node("Warfare Strategy", type="CONCEPT", language="en")
+    graph.add_node("China", type="LOCATION", language="en")
+    graph.add_edge("Sun Tzu", "Art of War")
+    graph.add_edge("Art of War", "Warfare Strategy")
+    graph.add_edge("China", "Sun Tzu")
+    return graph
+
+
+class TestGraphInvertedIndex:
+    """Test indexed term, facet and neighbourhood queries."""
+
+    def test_prefix_cjk_and_facet_terms(self):
+        index = GraphInvertedIndex()
+        index.rebuild(_graph())
+        assert index.search("war") == {"Art of War", "Warfare Strategy"}
+        assert index.search("兵法") == {"Art of War", "孙子兵法"}
+        assert index.search("person") == {"Sun Tzu"}
+        assert index.search("子兵法") == {"Art of War", "孙子兵法"}
+        assert index.search("法兵") == set()
+
+    def test_and_or_and_facet_filters(self):
+        index = GraphInvertedIndex()
+        index.rebuild(_graph())
+        assert index.search("sun china") == {"Sun Tzu", "China"}
+        assert index.search("art war", mode="and") == {"Art of War"}
+        assert index.search("sun china", mode="and") == set()
+        assert index.search("兵法 language:zh") == {"孙子兵法"}
+        assert index.search("", types=["work"]) == {"Art of War", "孙子兵法"}
+        with pytest.raises(ValueError):
+            index.search("war", mode="xor")
+
+    def test_k_hop_expansion(self):
+        graph = _graph()
+        assert GraphInvertedIndex.expand(graph, {"Sun Tzu"}, hops=1) == {"Sun Tzu", "Art of War", "China"}
+        assert "Warfare Strategy" in GraphInvertedIndex.expand(graph, {"Sun Tzu"}, hops=2)
+        assert len(GraphInvertedIndex.expand(graph, {"Sun Tzu"}, hops=2, max_nodes=2)) == 2
+
+    def test_incremental_updates_match_rebuild(self):
+        graph = _graph()
+        incremental = GraphInvertedIndex()
+        for node, attrs in graph.nodes(data=True):
+            incremental.add_node(node, attrs)
+
+        graph.nodes["China"].update(type="COUNTRY", original_text="中国")
+        incremental.update_node("China", graph.nodes["China"])
+        rebuilt = GraphInvertedIndex()
+        rebuilt.rebuild(graph)
+
+        for query in ("中国", "location", "country", "war", "sun"):
+            assert incremental.search(query) == rebuilt.search(query)
+        assert incremental.search("location") == set()
+        assert incremental.matches(graph)
+        assert tokenize("孙子 Art") == {"孙", "子", "孙子", "art"}
+
+    def test_query_time_independent_of_graph_size(self):
+        graph = nx.DiGraph()
+        for i in range(50000):
+            graph.add_node(f"entity {i}", type="CONCEPT", language="en")
+        graph.add_node("Needle Target", type="PERSON", language="en")
+        index = GraphInvertedIndex()
+        index.rebuild(graph)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            assert index.search("needle target", mode="and") == {"Needle Target"}
+        assert (time.perf_counter() - start) / 100 < 0.005
+
+    def test_mentioned_nodes_follow_document(self):
+        """Only entities whose name or original text occurs in the text are found."""
+        graph = _graph()
+        for i in range(20000):
+            graph.add_node(f"unrelated entity {i}", type="CONCEPT")
+        index = GraphInvertedIndex()
+        index.rebuild(graph)
+
+        text = "The Art of War (孙子兵法) was studied in ancient China. Warfare changed."
+        assert index.mentioned_nodes(text) == {"Art of War", "孙子兵法", "China"}
+        assert index.mentioned_nodes("An unrelated sentence") == set()
+        assert index.name_chars == sum(len(node) for node in graph)
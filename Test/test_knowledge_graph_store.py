@@ -0,0 +1,108 @@
+"""
+Tests for the append-only knowledge graph store and incremental statistics.
+"""
+
+import random
+
+import networkx as nx
+import pytest
+
+from src.core.knowledge_graph_store import AppendOnlyGraphStore, IncrementalGraphStats
+
+
+def _add_random(graph, stats, store, rng, num_nodes=60, num_edges=200):
+    """Mutate graph, stats and store the way KnowledgeGraphAgent does."""
+    for i in range(num_nodes):
+        name = f"n{i}"
+        if name not in graph:
+            attrs = {"type": "PERSON", "language": rng.choice(["en", "zh", "ja"])}
+            graph.add_node(name, **attrs)
+            stats.node_added(name, attrs)
+            store.add_node(name, attrs)
+    for _ in range(num_edges):
+        source, target = f"n{rng.randrange(num_nodes)}", f"n{rng.randrange(num_nodes)}"
+        if graph.has_edge(source, target):
+            continue
+        attrs = {"relationship_type": "RELATED_TO", "language": "en"}
+        stats.edge_added(graph, source, target, attrs)
+        graph.add_edge(source, target, **attrs)
+        store.add_edge(source, target, attrs)
+
+
+class TestKnowledgeGraphStore:
+    """Test log replay, compaction and stats parity with networkx."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store in a temporary directory."""
+        return AppendOnlyGraphStore(tmp_path, compact_threshold=1000)
+
+    def test_incremental_stats_match_networkx(self, store):
+        """Clustering, components and density match a full recomputation."""
+        graph, stats, rng = nx.DiGraph(), IncrementalGraphStats(), random.Random(3)
+        _add_random(graph, stats, store, rng)
+
+        undirected = graph.to_undirected()
+        result = stats.as_dict()
+        assert result["nodes"] == graph.number_of_nodes()
+        assert result["edges"] == graph.number_of_edges()
+        assert result["density"] == pytest.approx(nx.density(graph))
+        assert result["average_clustering"] == pytest.approx(nx.average_clustering(undirected))
+        assert result["connected_components"] == nx.number_connected_components(undirected)
+        assert sum(v["edges"] for v in result["languages"].values()) == graph.number_of_edges()
+
+        rebuilt = IncrementalGraphStats()
+        rebuilt.rebuild(graph)
+        assert rebuilt.as_dict()["average_clustering"] == pytest.approx(result["average_clustering"])
+        assert rebuilt.as_dict()["connected_components"] == result["connected_components"]
+
+    def test_flush_appends_and_load_replays(self, store, tmp_path):
+        """A reloaded store reproduces nodes, edges and attribute updates."""
+        graph, stats = nx.DiGraph(), IncrementalGraphStats()
+        _add_random(graph, stats, store, random.Random(1))
+        store.update_node("n0", {"confidence": 0.99})
+        graph.nodes["n0"]["confidence"] = 0.99
+        store.flush()
+
+        size_before = store.log_file.stat().st_size
+        store.add_node("extra", {"language": "en"})
+        assert store.flush() == 1
+        assert store.log_file.stat().st_size > size_before
+        assert not store.snapshot_file.exists()
+
+        loaded = AppendOnlyGraphStore(tmp_path).load()
+        graph.add_node("extra", language="en")
+        assert set(loaded.nodes) == set(graph.nodes)
+        assert set(loaded.edges) == set(graph.edges)
+        assert loaded.nodes["n0"]["confidence"] == 0.99
+
+    def test_compaction_writes_snapshot_and_truncates_log(self, store, tmp_path):
+        """Crossing the threshold folds the log into a snapshot."""
+        graph, stats = nx.DiGraph(), IncrementalGraphStats()
+        store.compact_threshold = 50
+        _add_random(graph, stats, store, random.Random(2))
+        store.flush()
+        assert store.maybe_compact(graph)
+        assert store.snapshot_file.exists()
+        assert store.log_file.stat().st_size == 0
+
+        store.add_edge("n1", "new", {"language": "en"})
+        graph.add_edge("n1", "new", language="en")
+        store.flush()
+        loaded = AppendOnlyGraphStore(tmp_path).load()
+        assert set(loaded.edges) == set(graph.edges)
+
+    def test_torn_tail_is_discarded(self, store, tmp_path):
+        """A partially written last entry is dropped and later appends still load."""
+        store.add_node("a", {"language": "en"})
+        store.flush()
+        with open(store.log_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "node", "id": "torn"')
+
+        reopened = AppendOnlyGraphStore(tmp_path)
+        graph = reopened.load()
+        assert list(graph.nodes) == ["a"]
+
+        reopened.add_node("b", {"language": "en"})
+        reopened.flush()
+        assert set(AppendOnlyGraphStore(tmp_path).load().nodes) == {"a", "b"}
@@ -0,0 +1,97 @@
+"""
+Tests for lazily built, process-shared agents.
+"""
+
+import asyncio
+
+from src.core.agent_router import AgentRouter
+from src.core.lazy_loader import LazyAgent, LazyLoader, import_factory
+from src.core.models import AnalysisRequest, DataType
+
+
+class _Agent:
+    built = 0
+
+    def __init__(self, capabilities=("sentiment",), model_name=None, max_capacity=None):
+        _Agent.built += 1
+        self.metadata = {"capabilities": list(capabilities)}
+        self.model_name = model_name
+        self.max_capacity = max_capacity
+
+    async def can_process(self, request):
+        return True
+
+    async def process(self, request):
+        return "processed"
+
+
+def _broken_factory():
+    raise ImportError("missing dependency")
+
+
+class TestLazyAgent:
+    """Test deferred construction and sharing by key."""
+
+    def test_built_once_on_first_use_and_shared(self):
+        _Agent.built = 0
+        loader = LazyLoader()
+        loaded = []
+        first = LazyAgent("Agent", _Agent, loader=loader)
+        second = LazyAgent("Agent", lambda: _Agent(capabilities=()), loader=loader)
+        first.on_load(lambda instance: loaded.append("first"))
+        second.on_load(lambda instance: loaded.append("second"))
+        assert _Agent.built == 0 and not first.is_loaded
+
+        assert asyncio.run(first.process(None)) == "processed"
+        assert loaded == ["first"] and second.is_loaded
+        assert first.instance is second.instance and _Agent.built == 1
+        assert second.metadata["capabilities"] == ["sentiment"]
+        assert loaded == ["first", "second"]
+
+    def test_unavailable_agent_is_falsy(self):
+        agent = LazyAgent("Broken", _broken_factory, loader=LazyLoader())
+        assert not agent
+        assert LazyAgent("Counter", import_factory("collections:Counter", a=2), loader=LazyLoader()).instance["a"] == 2
+
+
+def test_router_builds_only_the_agents_it_needs():
+    async def run():
+        _Agent.built = 0
+        loader = LazyLoader()
+        router = AgentRouter()
+        router.register(LazyAgent("Broken", _broken_factory, loader=loader), [DataType.TEXT])
+        text = LazyAgent("Text", _Agent, loader=loader)
+        router.register(text, [DataType.TEXT])
+        router.register(LazyAgent("Audio", _Agent, loader=loader), [DataType.AUDIO])
+
+        request = AnalysisRequest(data_type=DataType.TEXT, content="content")
+        assert await router.route(request) is text
+        assert _Agent.built == 1
+        assert len(router.candidate_pools(DataType.TEXT)) == 1
+        assert router.candidate_pools(DataType.TEXT, "sentiment")[0].representative is text
+
+    asyncio.run(run())
+
+
+def test_router_applies_model_and_capacity_of_loaded_agents():
+    async def run():
+        loader = LazyLoader()
+        router = AgentRouter()
+        small = LazyAgent("Small", lambda: _Agent(model_name="small", max_capacity=5), loader=loader)
+        large = LazyAgent("Large", lambda: _Agent(model_name="large", max_capacity=3), loader=loader)
+        router.register(small, [DataType.TEXT])
+        router.register(large, [DataType.TEXT])
+        assert router.get_load("Small")["max_concurrency"] == router.default_max_concurrency
+
+        # Unbuilt agents are not built just to compare models
+        request = AnalysisRequest(data_type=DataType.TEXT, content="content", model_preference="large")
+        assert await router.route(request) is small
+        assert not large.is_loaded
+        assert router.get_load("Small")["max_concurrency"] == 5
+
+        large.instance
+        assert await router.route(request) is large
+        assert router.get_load("Large")["max_concurrency"] == 3
+        assert router._slots["Large"]._value == 3
+
+    asyncio.run(run())
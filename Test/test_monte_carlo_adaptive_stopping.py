@@ -0,0 +1,83 @@
+"""
+Tests for adaptive early stopping with a target precision.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core.monte_carlo.config import MonteCarloConfig
+from src.core.monte_carlo.engine import MonteCarloEngine
+from src.core.monte_carlo.precision import metric_standard_error
+
+
+def _scenario():
+    return {
+        "variables": {
+            "cost": {"distribution": "normal", "parameters": {"mean": 100.0, "std": 10.0}},
+            "delay": {"distribution": "exponential", "parameters": {"scale": 5.0}},
+        },
+        "correlations": [[1.0, 0.0], [0.0, 1.0]],
+    }
+
+
+class TestAdaptiveStopping:
+    """Test batch-wise sampling that stops once the precision target is met."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create engine without result caching."""
+        return MonteCarloEngine(MonteCarloConfig(cache_results=False, results_mode="summary",
+                                                 store_samples=False))
+
+    def test_stops_early_when_target_met(self, engine):
+        """A loose target converges well before the iteration cap."""
+        result = asyncio.run(engine.run_simulation(
+            _scenario(), 200000, parallel=False,
+            target_precision={"relative_standard_error": 0.01, "batch_size": 1000}
+        ))
+        adaptive = result["adaptive_stopping"]
+        assert adaptive["converged"]
+        assert adaptive["iterations_used"] < 200000
+        assert result["num_iterations"] == adaptive["iterations_used"]
+        assert result["sample_summary"]["total_samples"] == adaptive["iterations_used"]
+        # exponential(5): relative SE = 1/sqrt(n) -> needs ~10000 iterations
+        assert 9000 <= adaptive["iterations_used"] <= 12000
+
+    def test_cap_reached_reports_not_converged(self, engine):
+        """An unreachable CI width runs to the cap and says so."""
+        result = asyncio.run(engine.run_simulation(
+            _scenario(), 5000, parallel=False,
+            target_precision={"ci_width": 1e-6, "metrics": ["mean", "var_95"], "batch_size": 1000}
+        ))
+        adaptive = result["adaptive_stopping"]
+        assert not adaptive["converged"]
+        assert adaptive["iterations_used"] == 5000
+        assert set(adaptive["precision"]["cost"]) == {"mean", "var_95"}
+
+    def test_adaptive_samples_are_prefix_of_full_run(self, engine):
+        """Batches are the fixed-seed chunks, so early stopping only truncates."""
+        target = {"relative_standard_error": 0.02, "variables": ["delay"], "batch_size": 500}
+        samples, adaptive = asyncio.run(
+            engine._generate_samples_adaptive(_scenario(), 50000, target)
+        )
+        engine.sampler.chunk_size = 500
+        full = engine.sampler.sample(_scenario(), 50000)
+        assert np.array_equal(samples, full[:len(samples)])
+        assert adaptive["batches"] == len(samples) // 500
+
+    def test_invalid_target_rejected(self, engine):
+        """Targets without a precision criterion or with unknown metrics fail fast."""
+        for target in ({"metrics": ["mean"]},
+                       {"relative_standard_error": 0.01, "metrics": ["median"]},
+                       {"relative_standard_error": 0.01, "variables": ["missing"]}):
+            with pytest.raises(ValueError):
+                asyncio.run(engine.run_simulation(_scenario(), 1000, target_precision=target))
+
+    def test_quantile_standard_error_matches_replication(self):
+        """The order-statistic VaR error agrees with the spread across replicates."""
+        rng = np.random.default_rng(0)
+        estimates = [np.percentile(rng.normal(size=4000), 5) for _ in range(200)]
+        _, standard_error = metric_standard_error(rng.normal(size=4000), "var_95")
+        assert standard_error == pytest.approx(np.std(estimates), rel=0.3)
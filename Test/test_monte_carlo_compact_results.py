@@ -0,0 +1,77 @@
+"""
+Tests for compact Monte Carlo result payloads backed by the sample store.
+"""
+
+import json
+import os
+import uuid
+
+import numpy as np
+import pytest
+
+from src.core.monte_carlo.config import MonteCarloConfig
+from src.core.monte_carlo.engine import MonteCarloEngine
+from src.core.monte_carlo.sample_store import SampleStore
+
+
+VARIABLES = {
+    "cost": {"distribution": "normal", "parameters": {"mean": 10.0, "std": 2.0}},
+    "delay": {"distribution": "exponential", "parameters": {"scale": 3.0}},
+}
+
+
+class TestCompactResults:
+    """Test summary results mode and sample handles."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Create an engine storing samples in a temporary directory."""
+        config = MonteCarloConfig(max_workers=1, sample_store_dir=str(tmp_path))
+        return MonteCarloEngine(config)
+
+    def test_summary_mode_omits_samples(self, engine):
+        """Summary results carry a handle instead of the sample array."""
+        full = engine.run_custom_simulation(VARIABLES, num_iterations=5000, results_mode="full")
+        summary = engine.run_custom_simulation(VARIABLES, num_iterations=5000, results_mode="summary")
+
+        assert "samples" not in summary
+        assert summary["sample_handle"]["shape"] == [5000, 2]
+        assert len(json.dumps(summary, default=str)) * 10 < len(json.dumps(full, default=str))
+
+    def test_handle_round_trips_samples(self, engine):
+        """Samples fetched through the handle match the full payload."""
+        full = engine.run_custom_simulation(VARIABLES, num_iterations=1000, results_mode="full")
+        summary = engine.run_custom_simulation(VARIABLES, num_iterations=1000, results_mode="summary")
+
+        sample_id = summary["sample_handle"]["sample_id"]
+        assert np.array_equal(engine.get_samples(sample_id), np.array(full["samples"]))
+
+    def test_range_and_decimation(self, tmp_path):
+        """Row ranges, variable selection and decimation are applied on load."""
+        store = SampleStore(tmp_path)
+        samples = np.arange(200, dtype=float).reshape(100, 2)
+        handle = store.save("6f1c8d3e-2b7a-4f43-9a3e-0d4b5c6a7e81", samples)
+
+        sliced = store.load(handle["sample_id"], start=10, stop=50, max_points=10, variables=[1])
+        assert sliced.shape == (10, 1)
+        assert sliced[0, 0] == samples[10, 1]
+        assert sliced[1, 0] == samples[14, 1]
+
+    def test_rejects_non_uuid_ids(self, tmp_path):
+        """Sample ids cannot be used to address arbitrary paths."""
+        with pytest.raises(ValueError):
+            SampleStore(tmp_path).load("../../etc/passwd")
+
+    def test_store_enforces_size_budget_and_ttl(self, tmp_path):
+        """Old sample files are pruned once the store exceeds its budget."""
+        samples = np.zeros((100, 2))
+        store = SampleStore(tmp_path, max_bytes=3 * samples.nbytes + 1000, ttl_seconds=None)
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+        for i, sample_id in enumerate(ids):
+            store.save(sample_id, samples)
+            os.utime(store._path_for(sample_id), (i, i))
+        assert [store.exists(sample_id) for sample_id in ids] == [False, False, True, True, True]
+
+        store.ttl_seconds = 60
+        store.save(ids[0], samples)
+        assert [store.exists(sample_id) for sample_id in ids] == [True, False, False, False, False]
@@ -0,0 +1,85 @@
+"""
+Tests for the bounded Monte Carlo simulation result cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.monte_carlo.config import MonteCarloConfig
+from src.core.monte_carlo.engine import MonteCarloEngine
+from src.core.monte_carlo.result_cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    SimulationResultCache,
+    make_cache_key,
+)
+
+
+SCENARIO = {
+    "name": "baseline",
+    "variables": {
+        "cost": {"distribution": "normal", "parameters": {"mean": 10, "std": 2}},
+    },
+    "correlations": [[1]],
+}
+
+
+class TestResultCache:
+    """Test cache keys, eviction and engine integration."""
+
+    def test_cache_key_ignores_labels_and_number_format(self):
+        """Labels and int/float spelling do not change the cache key."""
+        relabelled = {
+            "name": "renamed",
+            "description": "same scenario",
+            "variables": {
+                "cost": {"distribution": "normal", "parameters": {"mean": 10.0, "std": 2.0}},
+            },
+            "correlations": [[1.0]],
+        }
+        assert make_cache_key(SCENARIO, num_iterations=100) == make_cache_key(relabelled, num_iterations=100)
+        assert make_cache_key(SCENARIO, num_iterations=100) != make_cache_key(SCENARIO, num_iterations=200)
+
+    def test_cache_key_keeps_nested_keys_named_like_labels(self):
+        """Only top-level labels are ignored; nested variables named "name" still count."""
+        first = dict(SCENARIO, variables={"name": {"distribution": "uniform", "parameters": {"low": 0, "high": 1}}})
+        second = dict(SCENARIO, variables={"name": {"distribution": "uniform", "parameters": {"low": 0, "high": 2}}})
+        assert make_cache_key(first) != make_cache_key(second)
+
+    def test_memory_backend_evicts_by_bytes(self):
+        """The least-recently-used entry is evicted once the byte budget is exceeded."""
+        cache = SimulationResultCache(MemoryCacheBackend(max_bytes=100))
+        cache.set("a", {"v": "x" * 30})
+        cache.set("b", {"v": "y" * 30})
+        assert cache.get("a") is not None
+        cache.set("c", {"v": "z" * 30})
+
+        stats = cache.get_stats()
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert stats["evictions"] == 1
+        assert stats["current_bytes"] <= 100
+
+    def test_disk_backend_persists_index(self, tmp_path):
+        """Disk entries are found again by a new backend instance."""
+        SimulationResultCache(DiskCacheBackend(tmp_path, max_bytes=10_000)).set("k", {"v": 1})
+        reopened = SimulationResultCache(DiskCacheBackend(tmp_path, max_bytes=10_000))
+        assert reopened.get("k") == {"v": 1}
+
+    def test_engine_reports_hits_and_misses(self):
+        """Repeated simulations are served from the cache and counted."""
+        engine = MonteCarloEngine(MonteCarloConfig(max_workers=1, results_mode="summary", store_samples=False))
+
+        first = asyncio.run(engine.run_simulation(SCENARIO, 500))
+        second = asyncio.run(engine.run_simulation(dict(SCENARIO, name="other"), 500))
+
+        stats = engine.get_cache_stats()
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_unknown_backend_rejected(self):
+        """An unsupported backend name is a configuration error."""
+        with pytest.raises(ValueError):
+            SimulationResultCache.from_config(MonteCarloConfig(cache_backend="bogus"))
@@ -0,0 +1,84 @@
+"""
+Tests for constant-memory streaming analysis of Monte Carlo samples.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core.monte_carlo.analysis import ResultAnalyzer
+from src.core.monte_carlo.config import MonteCarloConfig
+from src.core.monte_carlo.engine import MonteCarloEngine
+from src.core.monte_carlo.streaming import QuantileDigest, StreamingAnalyzer
+
+
+class TestStreamingAnalysis:
+    """Compare streaming estimates against the full-array analyzer."""
+
+    @pytest.fixture
+    def samples(self):
+        """Skewed and symmetric correlated variables."""
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=200000)
+        return np.column_stack([
+            np.exp(base),
+            0.6 * base + 0.8 * rng.normal(size=200000),
+        ])
+
+    def test_moments_match_full_array(self, samples):
+        """Running moments equal the batch computation up to rounding."""
+        analyzer = StreamingAnalyzer(2)
+        for batch in np.array_split(samples, 37):
+            analyzer.update(batch)
+
+        streamed = analyzer.calculate_statistics()["variable_0"]
+        full = ResultAnalyzer().calculate_statistics(samples)["variable_0"]
+        for key in ("mean", "std", "min", "max", "skewness", "kurtosis"):
+            assert streamed[key] == pytest.approx(full[key], rel=1e-9)
+
+    def test_quantiles_and_risk_metrics_are_close(self, samples):
+        """Sketch-based VaR/CVaR stay close to exact values."""
+        analyzer = StreamingAnalyzer(2)
+        for batch in np.array_split(samples, 20):
+            analyzer.update(batch)
+
+        streamed = analyzer.calculate_risk_metrics()["variable_1"]
+        full = ResultAnalyzer().calculate_risk_metrics(samples)["variable_1"]
+        for key in ("var_95", "cvar_95", "var_99", "cvar_99"):
+            assert streamed[key] == pytest.approx(full[key], abs=0.02)
+
+    def test_online_correlation(self, samples):
+        """Online correlation matches np.corrcoef."""
+        analyzer = StreamingAnalyzer(2)
+        for batch in np.array_split(samples, 10):
+            analyzer.update(batch)
+        assert np.allclose(analyzer.correlation_matrix(), np.corrcoef(samples.T))
+
+    def test_digest_memory_is_bounded(self):
+        """The digest keeps a bounded number of centroids."""
+        digest = QuantileDigest(compression=100)
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            digest.update(rng.normal(size=20000))
+        assert len(digest.means) <= 60
+        assert digest.quantile(0.5) == pytest.approx(0.0, abs=0.02)
+
+    def test_engine_streaming_reports_progress(self):
+        """Streaming runs report per-batch convergence and omit samples."""
+        config = MonteCarloConfig(max_workers=1, cache_results=False, sampling_chunk_size=5000)
+        engine = MonteCarloEngine(config)
+        scenario = {
+            "variables": {"cost": {"distribution": "normal", "parameters": {"mean": 10.0, "std": 2.0}}},
+            "correlations": [[1.0]],
+        }
+        progress = []
+
+        result = asyncio.run(engine.run_simulation(
+            scenario, 20000, streaming=True, progress_callback=progress.append
+        ))
+
+        assert [p["completed_iterations"] for p in progress] == [5000, 10000, 15000, 20000]
+        assert "samples" not in result
+        assert result["convergence"]["iterations"] == 20000
+        assert result["statistics"]["variable_0"]["mean"] == pytest.approx(10.0, abs=0.1)
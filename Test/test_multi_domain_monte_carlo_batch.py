@@ -0,0 +1,77 @@
+"""
+Tests for batched multi-scenario execution in MultiDomainMonteCarloEngine.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core.multi_domain_monte_carlo_engine import (
+    MultiDomainMonteCarloEngine,
+    BatchSimulationSpec,
+    SimulationConfig,
+    DomainType,
+    SimulationType,
+)
+
+
+def _spec(num_iterations=2000, custom_variables=None, scenario_name="military_capability"):
+    config = SimulationConfig(
+        domain=DomainType.DEFENSE,
+        simulation_type=SimulationType.CAPABILITY_ASSESSMENT,
+        num_iterations=num_iterations,
+        cache_results=False,
+    )
+    return BatchSimulationSpec(config, scenario_name, custom_variables)
+
+
+class TestBatchSimulation:
+    """Test shared base streams, factor caching and completion-order results."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Create engine writing its cache into a temporary directory."""
+        return MultiDomainMonteCarloEngine(cache_dir=str(tmp_path), max_workers=4)
+
+    def test_batch_returns_every_spec(self, engine):
+        """Outcomes cover every spec, including failures, and carry batch metadata."""
+        specs = [_spec(), _spec(num_iterations=500), _spec(scenario_name="missing")]
+        outcomes = asyncio.run(engine.run_batch_simulations(specs, seed=1))
+
+        assert [o.index for o in outcomes] == [0, 1, 2]
+        assert outcomes[0].result.samples.shape[0] == 2000
+        assert outcomes[1].result.samples.shape[0] == 500
+        assert outcomes[2].result is None and "not found" in outcomes[2].error
+        assert outcomes[0].result.metadata["batch_id"] == outcomes[1].result.metadata["batch_id"]
+
+    def test_identical_specs_share_base_stream(self, engine):
+        """Specs with the same iteration count see the same base draws."""
+        outcomes = asyncio.run(engine.run_batch_simulations([_spec(), _spec()], seed=7))
+        assert np.array_equal(outcomes[0].result.samples, outcomes[1].result.samples)
+
+        again = asyncio.run(engine.run_batch_simulations([_spec()], seed=7))
+        assert np.array_equal(again[0].result.samples, outcomes[0].result.samples)
+
+    def test_correlation_factor_is_cached(self, engine):
+        """Repeated correlation matrices are factorized once."""
+        asyncio.run(engine.run_batch_simulations([_spec() for _ in range(5)], seed=0))
+        assert len(engine._cholesky_cache) == 1
+
+    def test_custom_variables_do_not_leak_into_templates(self, engine):
+        """Merging custom variables leaves the shared template untouched."""
+        template = engine.scenario_templates[DomainType.DEFENSE]["military_capability"]
+        before = set(template["variables"])
+        custom = {"variables": {"extra": {"distribution": "normal",
+                                          "parameters": {"mean": 0.0, "std": 1.0}}},
+                  "correlations": [[1.0]]}
+        outcomes = asyncio.run(engine.run_batch_simulations([_spec(custom_variables=custom), _spec()]))
+        assert "extra" in outcomes[0].result.statistics
+        assert "extra" not in outcomes[1].result.statistics
+        assert set(template["variables"]) == before
+
+    def test_results_stream_as_completed(self, engine):
+        """run_batch is an async iterator yielding each outcome once."""
+        async def collect():
+            return [o.index async for o in engine.run_batch([_spec(200) for _ in range(6)])]
+        assert sorted(asyncio.run(collect())) == list(range(6))
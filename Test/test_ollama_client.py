@@ -0,0 +1,164 @@
+"""
+Tests for the shared Ollama HTTP client against a local stub server.
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from aiohttp import web
+
+from src.core.ollama_client import OllamaClient, OllamaClientConfig, OllamaError
+
+
+class StubOllama:
+    """Minimal /api/generate server recording connections and concurrency."""
+
+    def __init__(self, failures=0, failure_status=503, delay=0.0):
+        self.failures = failures
+        self.failure_status = failure_status
+        self.delay = delay
+        self.requests = 0
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, request):
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=self.failure_status, text="busy")
+
+        body = await request.json()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if not body["stream"]:
+            return web.json_response({"model": body["model"], "response": body["prompt"].upper(), "done": True})
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        for token in body["prompt"].split():
+            await response.write(json.dumps({"response": token + " ", "done": False}).encode() + b"\n")
+        await response.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+        await response.write_eof()
+        return response
+
+    async def chat(self, request):
+        body = await request.json()
+        images = body["messages"][-1].get("images", [])
+        decoded = [base64.b64decode(image).decode() for image in images]
+        return web.json_response({"model": body["model"], "message": {"role": "assistant", "content": " ".join(decoded)}})
+
+
+async def _serve(stub):
+    app = web.Application()
+    app.router.add_post("/api/generate", stub.generate)
+    app.router.add_post("/api/chat", stub.chat)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _run(stub, scenario, **config):
+    async def run():
+        runner, host = await _serve(stub)
+        client = OllamaClient(OllamaClientConfig(host=host, backoff_base=0.01, **config))
+        try:
+            return await scenario(client)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_reuses_pooled_connections():
+    stub = StubOllama()
+
+    async def scenario(client):
+        for i in range(10):
+            data = await client.generate("llama", f"hi {i}")
+            assert data["response"] == f"HI {i}"
+        await asyncio.gather(*(client.generate("llama", "x") for _ in range(8)))
+        return client.get_stats()
+
+    stats = _run(stub, scenario, default_model_concurrency=2)
+    assert stub.requests == 18
+    assert stats["sessions_created"] == 1
+    # Sequential calls share one keep-alive connection; the burst opens at most 2 more
+    assert len(stub.peers) <= 2
+
+
+def test_retries_retryable_statuses_only():
+    stub = StubOllama(failures=2)
+
+    async def scenario(client):
+        data = await client.generate("llama", "ok")
+        assert data["response"] == "OK" and client.stats["retries"] == 2
+
+        stub.failures, stub.failure_status = 1, 400
+        with pytest.raises(OllamaError) as error:
+            await client.generate("llama", "bad")
+        assert error.value.status == 400 and client.stats["retries"] == 2
+
+    _run(stub, scenario)
+    assert stub.requests == 4
+
+
+def test_bounds_concurrency_per_model_and_streams_tokens():
+    stub = StubOllama(delay=0.02)
+
+    async def scenario(client):
+        await asyncio.gather(*(client.generate("small", "x") for _ in range(9)))
+        assert stub.max_in_flight == 2
+        stub.max_in_flight = 0
+        await asyncio.gather(*(client.generate("large", "x") for _ in range(9)))
+        assert stub.max_in_flight == 3
+        return [token async for token in client.stream_generate("small", "one two three")]
+
+    tokens = _run(stub, scenario, default_model_concurrency=2, model_concurrency={"large": 3})
+    assert tokens == ["one ", "two ", "three "]
+
+
+def test_timeout_bounds_all_attempts():
+    stub = StubOllama(delay=1.0)
+
+    async def scenario(client):
+        started = time.monotonic()
+        with pytest.raises(OllamaError):
+            await client.generate("llama", "slow", timeout=0.2)
+        return time.monotonic() - started
+
+    elapsed = _run(stub, scenario, max_retries=3)
+    assert elapsed < 0.6
+    assert stub.requests == 1
+
+
+def test_run_sync_chat_encodes_images(tmp_path):
+    image_path = tmp_path / "page.png"
+    image_path.write_bytes(b"from-file")
+    stub = StubOllama()
+
+    async def scenario(client):
+        def call():
+            messages = [{"role": "user", "content": "read", "images": [b"raw", str(image_path)]}]
+            return client.run_sync(client.chat("llava", messages))
+
+        first, second = await asyncio.gather(asyncio.to_thread(call), asyncio.to_thread(call))
+        await asyncio.to_thread(client.run_sync, client.close())
+        return first, second, client.get_stats()
+
+    first, second, stats = _run(stub, scenario)
+    assert first["message"]["content"] == second["message"]["content"] == "raw from-file"
+    # Both worker threads share the background loop's session
+    assert stats["sessions_created"] == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the precompiled pattern engine.
+"""
+
+import random
+import re
+
+from src.config.language_specific_regex_config import LANGUAGE_REGEX_PATTERNS
+from src.core.pattern_engine import PatternEngine, PatternSet, SpanIndex
+
+
+class TestSpanIndex:
+    """Test interval overlap queries."""
+
+    def test_overlap_queries(self):
+        spans = SpanIndex()
+        assert spans.add(10, 20) and spans.add(30, 40)
+        assert spans.overlaps(15, 16) and spans.overlaps(5, 11) and spans.overlaps(19, 31)
+        assert not spans.overlaps(20, 30) and not spans.overlaps(0, 10)
+        assert not spans.add(35, 50)
+        assert spans.add(20, 30) and len(spans) == 3
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        spans, accepted = SpanIndex(), []
+        for _ in range(2000):
+            start = rng.randrange(10000)
+            end = start + rng.randint(1, 30)
+            expected = not any(s < end and start < e for s, e in accepted)
+            assert spans.add(start, end) == expected
+            if expected:
+                accepted.append((start, end))
+
+
+class TestPatternSet:
+    """Test single-scan matching and per-pattern modes."""
+
+    TABLE = {
+        "ORGANIZATION": [r"\b[A-Z][a-z]+ (Corp|Inc)\b"],
+        "PERSON": [r"\b[A-Z][a-z]+ [A-Z][a-z]+\b"],
+        "LOCATION": [r"\b(?:New York|Paris)\b"],
+    }
+
+    def test_scan_is_single_alternation_with_priority(self):
+        pattern_set = PatternSet(self.TABLE)
+        assert pattern_set.merged is not None
+        hits = pattern_set.scan("Acme Corp hired Jane Doe in New York")
+        assert [(h.text, h.label) for h in hits] == [
+            ("Acme Corp", "ORGANIZATION"), ("Jane Doe", "PERSON"), ("New York", "PERSON")
+        ]
+
+    def test_rejected_match_does_not_consume_span(self):
+        pattern_set = PatternSet(self.TABLE)
+        hits = pattern_set.scan("The Acme Corp", accept=lambda h: not h.text.startswith("The"))
+        assert [(h.text, h.label) for h in hits] == [("Acme Corp", "ORGANIZATION")]
+
+    def test_rejected_match_tries_lower_priority_patterns(self):
+        table = {
+            "PERSON": [r"\b[A-Z][a-z]+ [A-Z][a-z]+\b"],
+            "TECHNOLOGY": [r"\bNatural Language Processing\b"],
+        }
+        text = "Natural Language Processing"
+        pattern_set = PatternSet(table)
+
+        def accept(hit):
+            return not (hit.label == "PERSON" and hit.text.startswith("Natural"))
+
+        merged = [(h.text, h.label) for h in pattern_set.scan(text, accept)]
+        assert merged == [(h.text, h.label) for h in pattern_set._scan_separately(text, accept)]
+        assert merged == [("Natural Language Processing", "TECHNOLOGY")]
+
+    def test_unmergeable_table_falls_back_consistently(self):
+        table = dict(self.TABLE, REPEAT=[r"\b(\w+) \1\b"])
+        pattern_set = PatternSet(table)
+        assert pattern_set.merged is None
+        text = "Acme Corp hired Jane Doe in New York: very very good"
+        hits = [(h.text, h.label) for h in pattern_set.scan(text)]
+        assert hits == [(h.text, h.label) for h in PatternSet(self.TABLE).scan(text)] + [("very very", "REPEAT")]
+
+    def test_findall_and_count_match_re(self):
+        text = "Acme Corp and Beta Inc met Jane Doe in Paris"
+        pattern_set = PatternSet(self.TABLE)
+        expected = [(label, m) for label, group in self.TABLE.items() for p in group for m in re.findall(p, text)]
+        assert list(pattern_set.findall(text)) == expected
+        assert pattern_set.count(text) == len(expected)
+
+    def test_language_tables_merge(self):
+        for language in ("en", "zh", "ru"):
+            assert PatternSet(LANGUAGE_REGEX_PATTERNS[language]).merged is not None
+
+    def test_engine_compiles_once_per_table(self):
+        engine = PatternEngine()
+        first = engine.get("test", self.TABLE)
+        assert engine.get("test", dict(self.TABLE)) is first
+        assert engine.get("test", self.TABLE, re.IGNORECASE) is not first
+        assert engine.get("test", {"PERSON": [r"\bX\b"]}) is not first
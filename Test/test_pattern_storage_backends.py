@@ -0,0 +1,105 @@
+"""
+Tests for the pattern storage backends.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.core.pattern_recognition.pattern_storage import PatternStorage
+from src.core.pattern_recognition.pattern_storage_backends import (
+    JsonPatternBackend, SQLitePatternBackend
+)
+
+
+def _pattern(pattern_id, pattern_type="trend", status="active", created_at="2024-01-01T00:00:00"):
+    return {
+        "pattern_id": pattern_id,
+        "pattern_type": pattern_type,
+        "pattern_data": {"id": pattern_id},
+        "created_at": created_at,
+        "version": 1,
+        "status": status
+    }
+
+
+class TestSQLitePatternBackend:
+    """Test indexed lookups, batching and JSON migration."""
+
+    def test_indexed_search_and_reload(self, tmp_path):
+        backend = SQLitePatternBackend(tmp_path / "patterns.db")
+        with backend.batch():
+            for i in range(20):
+                pattern_type = "trend" if i % 2 else "seasonal"
+                status = "deleted" if i % 5 == 0 else "active"
+                backend.save_pattern(
+                    f"p{i}", _pattern(f"p{i}", pattern_type, status, f"2024-01-{i + 1:02d}T00:00:00"), None, []
+                )
+
+        found = backend.search("trend", "active", 3, created_after="2024-01-05")
+        assert [p["pattern_id"] for p in found] == ["p7", "p9", "p11"]
+        assert len(backend.search(None, "deleted", None)) == 4
+        plan = backend._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT document FROM patterns WHERE pattern_type = ? AND status = ?",
+            ("trend", "active")
+        ).fetchall()
+        assert "idx_patterns_type_status_created" in str(plan)
+        backend.close()
+
+        patterns, _, _ = SQLitePatternBackend(tmp_path / "patterns.db").load_all()
+        assert list(patterns) == [f"p{i}" for i in range(20)]
+
+    def test_batch_rolls_back_on_error(self, tmp_path):
+        backend = SQLitePatternBackend(tmp_path / "patterns.db")
+        with pytest.raises(RuntimeError):
+            with backend.batch():
+                backend.save_pattern("p1", _pattern("p1"), None, [])
+                raise RuntimeError("boom")
+        assert backend.search(None, None, None) == []
+
+    def test_migrates_json_files_once(self, tmp_path):
+        (tmp_path / "patterns.json").write_text(json.dumps({"a": _pattern("a"), "b": _pattern("b", "seasonal")}))
+        (tmp_path / "metadata.json").write_text(json.dumps({"a": {"pattern_id": "a", "metadata": {"x": 1}}}))
+        (tmp_path / "version_history.json").write_text(json.dumps({"a": [{"version": 1, "status": "created"}]}))
+
+        backend = SQLitePatternBackend(tmp_path / "patterns.db", migrate_from=tmp_path)
+        patterns, metadata, history = backend.load_all()
+        assert set(patterns) == {"a", "b"} and metadata["a"]["metadata"] == {"x": 1}
+        assert history == {"a": [{"version": 1, "status": "created"}], "b": []}
+        assert backend.migrate_json(tmp_path) == 0
+        assert (tmp_path / "patterns.json").exists()
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "json"])
+def test_pattern_storage_lifecycle(tmp_path, backend):
+    async def run():
+        storage = PatternStorage(str(tmp_path), backend=backend)
+        with storage.batch():
+            for i in range(5):
+                await storage.store_pattern(f"p{i}", {"i": i}, "trend" if i % 2 else "seasonal", {"n": i})
+        await storage.update_pattern("p1", {"i": 10})
+        await storage.delete_pattern("p2")
+
+        search = await storage.search_patterns("seasonal")
+        assert [r["pattern_id"] for r in search["results"]] == ["p0", "p4"]
+        storage.close()
+
+        reopened = PatternStorage(str(tmp_path), backend=backend)
+        pattern = await reopened.get_pattern("p1")
+        assert pattern["pattern"]["version"] == 2 and pattern["metadata"]["metadata"] == {"n": 1}
+        assert [h["status"] for h in pattern["version_history"]] == ["created", "updated"]
+        cleanup = await reopened.cleanup_deleted_patterns(older_than_days=-1)
+        assert cleanup["removed_patterns"] == 1
+        assert "p2" not in reopened.patterns_db
+        reopened.close()
+
+    asyncio.run(run())
+
+
+def test_json_backend_defers_writes_in_batch(tmp_path):
+    backend = JsonPatternBackend(tmp_path)
+    with backend.batch():
+        backend.save_pattern("a", _pattern("a"), None, [])
+        assert not (tmp_path / "patterns.json").exists()
+    assert json.loads((tmp_path / "patterns.json").read_text())["a"]["pattern_id"] == "a"
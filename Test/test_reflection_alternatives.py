@@ -0,0 +1,90 @@
+"""
+Tests for concurrent reflection alternatives in the orchestrator.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.core.agent_router import AgentRouter
+from src.core.models import DataType
+from src.core.orchestrator import SentimentOrchestrator
+
+
+class _SlowAgent:
+    """Agent whose confidence and delay come from the alternative's content"""
+
+    agent_id = "slow"
+    metadata = {}
+
+    def __init__(self):
+        self.cancelled = 0
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, request):
+        confidence, delay = request.content
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        if confidence is None:
+            raise RuntimeError("agent error")
+        return SimpleNamespace(sentiment=SimpleNamespace(confidence=confidence))
+
+
+def _orchestrator(policy, quorum=2, deadline=1.0):
+    orchestrator = SentimentOrchestrator.__new__(SentimentOrchestrator)
+    orchestrator.reflection_policy = policy
+    orchestrator.reflection_quorum = quorum
+    orchestrator.reflection_deadline = deadline
+    orchestrator.agent_router = AgentRouter()
+    return orchestrator
+
+
+def _run(orchestrator, alternatives, threshold=0.8, max_concurrency=None):
+    request = SimpleNamespace(id="r1", metadata={}, confidence_threshold=threshold)
+    agent = _SlowAgent()
+    if max_concurrency:
+        orchestrator.agent_router.register(agent, [DataType.TEXT], max_concurrency=max_concurrency)
+    alternatives = [SimpleNamespace(content=alt) for alt in alternatives]
+    start = time.perf_counter()
+    best, summary = asyncio.run(orchestrator._run_alternatives(request, agent, alternatives))
+    return best, summary, agent, time.perf_counter() - start
+
+
+class TestReflectionAlternatives:
+    """Test the concurrency policies, deadline and cancellation."""
+
+    def test_first_acceptable_cancels_losers(self):
+        best, summary, agent, elapsed = _run(
+            _orchestrator("first_acceptable"), [(0.5, 0.01), (0.9, 0.02), (0.99, 0.5)]
+        )
+        assert best.sentiment.confidence == 0.9
+        assert agent.cancelled == 1 and "1 cancelled" in summary
+        assert elapsed < 0.3
+
+    def test_best_runs_concurrently_and_skips_failures(self):
+        best, summary, _, elapsed = _run(_orchestrator("best"), [(0.5, 0.05), (None, 0.05), (0.7, 0.05)])
+        assert best.sentiment.confidence == 0.7
+        assert summary == ", 2 completed, 1 failed"
+        assert elapsed < 0.12
+
+    def test_quorum_and_deadline(self):
+        best, _, agent, _ = _run(_orchestrator("quorum", quorum=2), [(0.6, 0.01), (0.4, 0.02), (0.95, 0.5)])
+        assert best.sentiment.confidence == 0.6 and agent.cancelled == 1
+
+        best, summary, _, elapsed = _run(_orchestrator("best", deadline=0.05), [(0.9, 1.0), (0.9, 1.0)])
+        assert best is None and "2 cancelled" in summary and elapsed < 0.3
+
+    def test_alternatives_respect_agent_concurrency_limit(self):
+        best, summary, agent, elapsed = _run(
+            _orchestrator("best"), [(0.5, 0.03), (0.6, 0.03), (0.7, 0.03)], max_concurrency=2
+        )
+        assert best.sentiment.confidence == 0.7 and summary == ", 3 completed"
+        assert agent.peak == 2 and elapsed >= 0.06
@@ -0,0 +1,76 @@
+"""
+Tests for the bounded request cache with single-flight deduplication.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core import request_cache as request_cache_module
+from src.core.request_cache import RequestCache
+
+
+class TestRequestCache:
+    """Test LRU eviction and TTL expiry."""
+
+    def test_lru_eviction(self):
+        cache = RequestCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(request_cache_module.time, "monotonic", lambda: now[0])
+        cache = RequestCache(ttl_seconds=10)
+        cache.set("a", 1)
+        now[0] = 105.0
+        cache.set("a", 2)
+        cache.set("b", 3)
+        now[0] = 112.0
+        assert cache.get("a") == 2
+        cache.set("c", 4)
+        assert len(cache) == 3
+        now[0] = 116.0
+        cache.set("d", 5)
+        assert len(cache) == 2 and cache.get("a") is None and cache.get("c") == 4
+        assert cache.expirations == 2
+
+
+def test_concurrent_misses_share_one_computation():
+    async def run():
+        cache = RequestCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+        assert results == ["result"] * 5 and len(calls) == 1
+        assert await cache.get_or_compute("k", compute) == "result"
+        stats = cache.get_stats()
+        assert (stats["misses"], stats["coalesced"], stats["hits"], stats["in_flight"]) == (5, 4, 1, 0)
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        outcomes = await asyncio.gather(*(cache.get_or_compute("bad", fail) for _ in range(3)),
+                                        return_exceptions=True)
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert "bad" not in cache
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("bad", fail)
+
+        # A miss already seen by get() is not counted again
+        misses = cache.get_stats()["misses"]
+        assert cache.get("fresh") is None
+        assert await cache.get_or_compute("fresh", compute, record=False) == "result"
+        assert cache.get_stats()["misses"] == misses + 1
+
+    asyncio.run(run())
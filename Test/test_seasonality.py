@@ -0,0 +1,54 @@
+"""
+Tests for the FFT-based seasonality toolkit.
+"""
+
+import numpy as np
+
+from src.core.pattern_recognition.seasonality import (
+    autocorrelation, batch_autocorrelation, dominant_periods, moving_average, turning_points
+)
+
+
+def _loop_autocorrelation(data, lag):
+    """Reference per-lag loop"""
+    mean, var = np.mean(data), np.var(data)
+    if var == 0:
+        return 0.0
+    total = sum((data[i] - mean) * (data[i + lag] - mean) for i in range(len(data) - lag))
+    return total / ((len(data) - lag) * var)
+
+
+class TestAutocorrelation:
+    """Test the FFT autocorrelation against the per-lag loop."""
+
+    def test_matches_loop(self):
+        rng = np.random.default_rng(0)
+        values = np.sin(np.arange(300) * 2 * np.pi / 7) + 0.3 * rng.standard_normal(300)
+        acf = autocorrelation(values, 150)
+        assert acf[0] == 1.0 or np.isclose(acf[0], 1.0)
+        assert np.allclose(acf[1:], [_loop_autocorrelation(values, lag) for lag in range(1, 151)])
+
+    def test_batch_with_different_lengths(self):
+        rng = np.random.default_rng(1)
+        long, short = rng.standard_normal(120), rng.standard_normal(40)
+        acf = batch_autocorrelation([long, short, np.ones(10)], 60)
+        assert acf.shape == (3, 61)
+        assert np.allclose(acf[0], autocorrelation(long, 60))
+        assert np.allclose(acf[1, 1:40], [_loop_autocorrelation(short, lag) for lag in range(1, 40)])
+        assert not acf[1, 40:].any() and not acf[2].any()
+
+
+class TestPeriodsAndShapes:
+    """Test periodogram peaks and vectorized helpers."""
+
+    def test_dominant_period(self):
+        t = np.arange(730)
+        values = 3 * np.sin(2 * np.pi * t / 7) + np.sin(2 * np.pi * t / 30.4)
+        periods = dominant_periods(values, top=2)[0]
+        assert abs(periods[0]["period"] - 7) < 0.1
+        assert abs(periods[1]["period"] - 30.4) < 1.5
+
+    def test_moving_average_and_turning_points(self):
+        assert moving_average(np.array([1.0, 2.0, 3.0]), 5).tolist() == [2.0, 2.0, 2.0]
+        assert np.allclose(moving_average(np.arange(6, dtype=float), 3), [1 / 3, 1, 2, 3, 4, 14 / 3])
+        assert turning_points([1, 3, 2, 2, 1, 4]) == [1, 4]
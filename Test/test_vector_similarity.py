@@ -0,0 +1,59 @@
+"""
+Tests for blocked and approximate vector similarity search.
+"""
+
+import numpy as np
+
+from src.core.pattern_recognition.vector_similarity import (
+    average_pairwise_similarity, exact_similarity_search, lsh_similarity_search, normalize_rows
+)
+
+
+def _dense(vectors):
+    unit = normalize_rows(vectors)
+    full = unit @ unit.T
+    np.fill_diagonal(full, 0.0)
+    return unit, full
+
+
+class TestExactSimilaritySearch:
+    """Test that blocked search matches the dense matrix."""
+
+    def test_pairs_and_neighbors_match_dense_matrix(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((300, 16))
+        vectors[3] = 0.0
+        unit, full = _dense(vectors)
+        rows, cols = np.nonzero(np.triu(full > 0.3, k=1))
+        np.fill_diagonal(full, -np.inf)
+        expected_top = np.sort(full, axis=1)[:, ::-1][:, :4]
+
+        for block_size in (300, 64, 7):
+            result = exact_similarity_search(unit, 0.3, top_k=4, block_size=block_size)
+            assert sorted(zip(result.pair_rows, result.pair_cols)) == sorted(zip(rows, cols))
+            assert np.allclose(result.neighbor_similarities, expected_top)
+
+    def test_average_similarity_without_matrix(self):
+        vectors = np.random.default_rng(1).standard_normal((50, 8))
+        unit, full = _dense(vectors)
+        assert abs(average_pairwise_similarity(unit) - full.mean()) < 1e-12
+
+
+class TestLshSimilaritySearch:
+    """Test approximate threshold pair finding."""
+
+    def test_finds_clustered_pairs_without_false_positives(self):
+        rng = np.random.default_rng(2)
+        centers = rng.standard_normal((100, 64))
+        vectors = np.repeat(centers, 10, axis=0) + 0.3 * rng.standard_normal((1000, 64))
+        unit = normalize_rows(vectors, dtype=np.float32)
+
+        exact = exact_similarity_search(unit, 0.7)
+        approximate = lsh_similarity_search(unit, 0.7, top_k=3)
+        truth = set(zip(exact.pair_rows.tolist(), exact.pair_cols.tolist()))
+        found = set(zip(approximate.pair_rows.tolist(), approximate.pair_cols.tolist()))
+
+        assert found <= truth
+        assert len(found) >= 0.8 * len(truth)
+        assert approximate.neighbors.shape == (1000, 3)
+        assert (approximate.neighbor_similarities[approximate.neighbors >= 0] > 0.7).all()
@@ -39,7 +39,7 @@ except ImportError:
     logging.warning("PIL not available")
 
 try:
-    import ollama
+    from src.core.ollama_client import get_ollama_client  # noqa: F401
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
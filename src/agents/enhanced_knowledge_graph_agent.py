@@ -679,7 +679,9 @@ class EnhancedKnowledgeGraphAgent(StrandsBaseAgent):
                 entities = entities_result.get("content", [{}])[0].get("entities", [])
             
             # Run semantic similarity analysis
-            similarity_results = self.semantic_analyzer.analyze_semantic_similarity(entities, text)
+            similarity_results = self.semantic_analyzer.analyze_semantic_similarity(
+                entities, text, min_score=self.semantic_analyzer.default_min_score
+            )
             
             # Get statistics
             stats = self.semantic_analyzer.get_similarity_statistics(similarity_results)
@@ -820,7 +822,9 @@ class EnhancedKnowledgeGraphAgent(StrandsBaseAgent):
             relationships = relationships_result.get("content", [{}])[0].get("relationships", [])
             
             # Run all Phase 3 analyses
-            similarity_results = self.semantic_analyzer.analyze_semantic_similarity(entities, text)
+            similarity_results = self.semantic_analyzer.analyze_semantic_similarity(
+                entities, text, min_score=self.semantic_analyzer.default_min_score
+            )
             optimized_relationships = self.relationship_optimizer.optimize_relationships(
                 relationships, entities, text
             )
@@ -23,6 +23,10 @@ from src.core.models import (
 from src.core.processing_service import ProcessingService
 from src.core.error_handling_service import ErrorHandlingService, ErrorContext
 from src.core.model_management_service import ModelManagementService
+from src.core.pattern_engine import PatternMatch, pattern_engine
+from src.core.dictionary_matcher import DictionaryMatcher, get_dictionary_matcher
+from src.core.entity_similarity import group_by_containment
+from src.config.entity_types_config import entity_types_config
 # from src.config.entity_extraction_config import get_language_config, get_patterns, get_common_entities
 
 # Configure logger
@@ -32,6 +36,17 @@ logger = logging.getLogger(__name__)
 class EntityExtractionAgent(StrandsBaseAgent):
     """Agent for extracting entities from text content with enhanced Chinese support."""
 
+    # Filters applied to English pattern matches
+    PATTERN_COMMON_WORDS = frozenset({"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "have", "has", "had", "will", "would", "could", "should", "may", "might", "can", "must"})
+    PATTERN_GENERIC_PHRASES = frozenset({
+        "is transforming", "are leading", "being used", "have revolutionized", 
+        "models like", "algorithms are", "the world", "the development", 
+        "companies like", "and education", "in healthcare", "are being used",
+        "is transforming the", "natural language", "and bert", "and openai",
+        "leading the development", "revolutionized natural language", "companies like google"
+    })
+    PATTERN_ACTION_WORDS = ("leading", "revolutionized", "transforming", "used", "like")
+    
     def __init__(
         self,
         model_name: Optional[str] = None,
@@ -95,6 +110,59 @@ class EntityExtractionAgent(StrandsBaseAgent):
             ]
         }
 
+        # More specific English patterns to avoid overlaps
+        self.english_patterns = {
+            "PERSON": [
+                r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # First Last names
+            ],
+            "ORGANIZATION": [
+                r'\b[A-Z][a-z]+ (Corp|Inc|Ltd|LLC|University|Institute|Government|Company|Group)\b',
+                r'\b[A-Z][a-z]+ [A-Z][a-z]+ (Corp|Inc|Ltd|LLC)\b',  # Multi-word companies
+            ],
+            "LOCATION": [
+                r'\b[A-Z][a-z]+ (City|State|Country|Province|District|Region)\b',
+                r'\b[A-Z][a-z]+ [A-Z][a-z]+ (City|State|Country)\b',  # Multi-word locations
+            ],
+            "TECHNOLOGY": [
+                r'\b[A-Z][a-z]+ Intelligence\b',  # AI terms
+                r'\b[A-Z][a-z]+ Learning\b',  # ML terms
+                r'\b[A-Z][a-z]+ Computing\b',  # Computing terms
+                r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b'  # Three-word tech terms
+            ],
+            "CONCEPT": [
+                r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b'  # Three-word concepts
+            ]
+        }
+
+        # Enhanced English common entities
+        self.english_dictionaries = {
+            "PERSON": [
+                "Donald Trump", "Joe Biden", "Barack Obama", "Elon Musk", 
+                "Bill Gates", "Steve Jobs", "Mark Zuckerberg", "Jeff Bezos"
+            ],
+            "ORGANIZATION": [
+                "Microsoft", "Apple", "Google", "Amazon", "Meta", "OpenAI",
+                "US Government", "Tesla", "Netflix", "Twitter", "LinkedIn"
+            ],
+            "LOCATION": [
+                "United States", "China", "New York", "California", "Texas",
+                "Washington", "London", "Tokyo", "Beijing", "San Francisco"
+            ],
+            "TECHNOLOGY": [
+                "Artificial Intelligence", "Machine Learning", "Deep Learning",
+                "Blockchain", "Cloud Computing", "Big Data", "Internet of Things",
+                "Virtual Reality", "Augmented Reality", "Quantum Computing"
+            ],
+            "PRODUCT": [
+                "iPhone", "Android", "Windows", "MacOS", "Linux", "Chrome",
+                "Firefox", "Safari", "WordPress", "Slack", "Zoom"
+            ],
+            "CONCEPT": [
+                "Digital Transformation", "Cybersecurity", "Data Science",
+                "DevOps", "Agile", "Scrum", "API", "Microservices"
+            ]
+        }
+
         # Enhanced Chinese entity dictionaries (Phase 6.3 improvements)
         self.chinese_dictionaries = {
             'PERSON': [
@@ -657,159 +725,111 @@ class EntityExtractionAgent(StrandsBaseAgent):
         return True
 
     def _extract_with_patterns(self, text: str) -> List[Dict]:
-        """Extract entities using regex patterns."""
+        """Extract entities using regex patterns.
+        
+        The English table is compiled once into a single alternation and
+        scanned in one pass; matches never overlap, and a match rejected by
+        the filters below does not block later matches over its span.
+        """
         entities = []
         
-        # More specific English patterns to avoid overlaps
-        english_patterns = {
-            "PERSON": [
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # First Last names
-            ],
-            "ORGANIZATION": [
-                r'\b[A-Z][a-z]+ (Corp|Inc|Ltd|LLC|University|Institute|Government|Company|Group)\b',
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+ (Corp|Inc|Ltd|LLC)\b',  # Multi-word companies
-            ],
-            "LOCATION": [
-                r'\b[A-Z][a-z]+ (City|State|Country|Province|District|Region)\b',
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+ (City|State|Country)\b',  # Multi-word locations
-            ],
-            "TECHNOLOGY": [
-                r'\b[A-Z][a-z]+ Intelligence\b',  # AI terms
-                r'\b[A-Z][a-z]+ Learning\b',  # ML terms
-                r'\b[A-Z][a-z]+ Computing\b',  # Computing terms
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b'  # Three-word tech terms
-            ],
-            "CONCEPT": [
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b'  # Three-word concepts
-            ]
-        }
+        pattern_set = pattern_engine.get("entity_extraction:en", self.english_patterns, re.IGNORECASE)
+        for match in pattern_set.scan(text, accept=self._is_pattern_entity):
+            entity_type = match.label
+            entity = {
+                "name": match.text,
+                "type": entity_type.lower(),
+                "importance": "medium",
+                "description": f"{entity_type.lower()} entity",
+                "confidence": 0.7,
+                "extraction_method": "pattern"
+            }
+            entities.append(entity)
         
-        # Track used positions to avoid overlaps
-        used_positions = set()
+        return entities
+
+    def _is_pattern_entity(self, match: PatternMatch) -> bool:
+        """Filter out pattern matches that are phrases rather than entities."""
+        entity_name = match.text
+        lowered = entity_name.lower()
         
-        for entity_type, pattern_list in english_patterns.items():
-            for pattern in pattern_list:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    start_pos = match.start()
-                    end_pos = match.end()
-                    
-                    # Skip if this position is already used
-                    if any(start_pos >= used_start and end_pos <= used_end 
-                           for used_start, used_end in used_positions):
-                        continue
-                    
-                    entity_name = match.group()
-                    
-                    # Skip if entity is too long or contains sentence markers
-                    if len(entity_name) > 50 or "." in entity_name or "，" in entity_name:
-                        continue
-                    
-                    # Skip common words that shouldn't be entities
-                    common_words = {"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "have", "has", "had", "will", "would", "could", "should", "may", "might", "can", "must"}
-                    if entity_name.lower() in common_words:
-                        continue
-                    
-                    # Skip generic phrases and common patterns
-                    generic_phrases = {
-                        "is transforming", "are leading", "being used", "have revolutionized", 
-                        "models like", "algorithms are", "the world", "the development", 
-                        "companies like", "and education", "in healthcare", "are being used",
-                        "is transforming the", "natural language", "and bert", "and openai",
-                        "leading the development", "revolutionized natural language", "companies like google"
-                    }
-                    if entity_name.lower() in generic_phrases:
-                        continue
-                    
-                    # Skip phrases that start with common words
-                    if entity_name.lower().startswith(("the ", "and ", "in ", "are ", "is ", "have ", "being ", "leading ", "revolutionized ")):
-                        continue
-                    
-                    # Skip phrases that contain action words
-                    action_words = {"leading", "revolutionized", "transforming", "used", "like"}
-                    if any(word in entity_name.lower() for word in action_words):
-                        continue
-                    
-                    entity = {
-                        "name": entity_name,
-                        "type": entity_type.lower(),
-                        "importance": "medium",
-                        "description": f"{entity_type.lower()} entity",
-                        "confidence": 0.7,
-                        "extraction_method": "pattern"
-                    }
-                    entities.append(entity)
-                    
-                    # Mark this position as used
-                    used_positions.add((start_pos, end_pos))
+        # Skip if entity is too long or contains sentence markers
+        if len(entity_name) > 50 or "." in entity_name or "，" in entity_name:
+            return False
         
-        return entities
+        # Skip common words that shouldn't be entities
+        if lowered in self.PATTERN_COMMON_WORDS:
+            return False
+        
+        # Skip generic phrases and common patterns
+        if lowered in self.PATTERN_GENERIC_PHRASES:
+            return False
+        
+        # Skip phrases that start with common words
+        if lowered.startswith(("the ", "and ", "in ", "are ", "is ", "have ", "being ", "leading ", "revolutionized ")):
+            return False
+        
+        # Skip phrases that contain action words
+        if any(word in lowered for word in self.PATTERN_ACTION_WORDS):
+            return False
+        
+        return True
 
     def _extract_with_chinese_patterns(self, text: str) -> List[Dict]:
         """Extract entities using enhanced Chinese patterns."""
         entities = []
         
-        for entity_type, patterns in self.chinese_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    entity = {
-                        "name": match.group(),
-                        "type": entity_type.lower(),
-                        "importance": "medium",
-                        "description": f"{entity_type.lower()} entity",
-                        "confidence": 0.8,
-                        "extraction_method": "chinese_pattern"
-                    }
-                    entities.append(entity)
+        pattern_set = pattern_engine.get("entity_extraction:zh", self.chinese_patterns)
+        for match in pattern_set.iter_all(text):
+            entity_type = match.label
+            entity = {
+                "name": match.text,
+                "type": entity_type.lower(),
+                "importance": "medium",
+                "description": f"{entity_type.lower()} entity",
+                "confidence": 0.8,
+                "extraction_method": "chinese_pattern"
+            }
+            entities.append(entity)
         
         return entities
 
+    def _dictionary_matcher(self, language: str, dictionaries: Dict[str, List[str]],
+                            case_sensitive: bool) -> DictionaryMatcher:
+        """Shared automaton over built-in and configured dictionaries for a language.
+        
+        The built-in dictionaries are fixed per language; the matcher is
+        rebuilt only when ``entity_types_config`` dictionaries change.
+        """
+        def build():
+            extra = entity_types_config.get_entity_dictionary(language)
+            entries = [(name, entity_type) for entity_type, names in dictionaries.items() for name in names]
+            entries += [(name, entity_type) for entity_type, names in extra.items() for name in names]
+            matcher = DictionaryMatcher(entries, case_sensitive=case_sensitive)
+            logger.info(f"Compiled {language} entity dictionary with {len(matcher)} names")
+            return matcher
+        
+        return get_dictionary_matcher(
+            f"entity_extraction:{language}",
+            entity_types_config.version,
+            build
+        )
+
     def _extract_with_dictionary(self, text: str) -> List[Dict]:
         """Extract entities using dictionary lookup."""
         entities = []
         
-        # Enhanced English common entities
-        english_entities = {
-            "PERSON": [
-                "Donald Trump", "Joe Biden", "Barack Obama", "Elon Musk", 
-                "Bill Gates", "Steve Jobs", "Mark Zuckerberg", "Jeff Bezos"
-            ],
-            "ORGANIZATION": [
-                "Microsoft", "Apple", "Google", "Amazon", "Meta", "OpenAI",
-                "US Government", "Tesla", "Netflix", "Twitter", "LinkedIn"
-            ],
-            "LOCATION": [
-                "United States", "China", "New York", "California", "Texas",
-                "Washington", "London", "Tokyo", "Beijing", "San Francisco"
-            ],
-            "TECHNOLOGY": [
-                "Artificial Intelligence", "Machine Learning", "Deep Learning",
-                "Blockchain", "Cloud Computing", "Big Data", "Internet of Things",
-                "Virtual Reality", "Augmented Reality", "Quantum Computing"
-            ],
-            "PRODUCT": [
-                "iPhone", "Android", "Windows", "MacOS", "Linux", "Chrome",
-                "Firefox", "Safari", "WordPress", "Slack", "Zoom"
-            ],
-            "CONCEPT": [
-                "Digital Transformation", "Cybersecurity", "Data Science",
-                "DevOps", "Agile", "Scrum", "API", "Microservices"
-            ]
-        }
-        
-        for entity_type, entity_list in english_entities.items():
-            for entity_name in entity_list:
-                if entity_name.lower() in text.lower():
-                    entity = {
-                        "name": entity_name,
-                        "type": entity_type.lower(),
-                        "importance": "high",
-                        "description": f"Known {entity_type.lower()} entity",
-                        "confidence": 0.9,
-                        "extraction_method": "dictionary"
-                    }
-                    entities.append(entity)
+        matcher = self._dictionary_matcher("en", self.english_dictionaries, case_sensitive=False)
+        for entity_name, entity_type in matcher.matched_entries(text):
+            entity = {
+                "name": entity_name,
+                "type": entity_type.lower(),
+                "importance": "high",
+                "description": f"Known {entity_type.lower()} entity",
+                "confidence": 0.9,
+                "extraction_method": "dictionary"
+            }
+            entities.append(entity)
         
         return entities
 
@@ -817,18 +837,17 @@ class EntityExtractionAgent(StrandsBaseAgent):
         """Extract entities using Chinese dictionary lookup."""
         entities = []
         
-        for entity_type, entity_list in self.chinese_dictionaries.items():
-            for entity_name in entity_list:
-                if entity_name in text:
-                    entity = {
-                        "name": entity_name,
-                        "type": entity_type.lower(),
-                        "importance": "high",
-                        "description": f"Known Chinese {entity_type.lower()} entity",
-                        "confidence": 0.9,
-                        "extraction_method": "chinese_dictionary"
-                    }
-                    entities.append(entity)
+        matcher = self._dictionary_matcher("zh", self.chinese_dictionaries, case_sensitive=True)
+        for entity_name, entity_type in matcher.matched_entries(text):
+            entity = {
+                "name": entity_name,
+                "type": entity_type.lower(),
+                "importance": "high",
+                "description": f"Known Chinese {entity_type.lower()} entity",
+                "confidence": 0.9,
+                "extraction_method": "chinese_dictionary"
+            }
+            entities.append(entity)
         
         return entities
 
@@ -836,19 +855,18 @@ class EntityExtractionAgent(StrandsBaseAgent):
         """Extract entities using enhanced Russian patterns."""
         entities = []
         
-        for entity_type, patterns in self.russian_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    entity = {
-                        "name": match.group(),
-                        "type": entity_type.lower(),
-                        "importance": "medium",
-                        "description": f"{entity_type.lower()} entity",
-                        "confidence": 0.8,
-                        "extraction_method": "russian_pattern"
-                    }
-                    entities.append(entity)
+        pattern_set = pattern_engine.get("entity_extraction:ru", self.russian_patterns)
+        for match in pattern_set.iter_all(text):
+            entity_type = match.label
+            entity = {
+                "name": match.text,
+                "type": entity_type.lower(),
+                "importance": "medium",
+                "description": f"{entity_type.lower()} entity",
+                "confidence": 0.8,
+                "extraction_method": "russian_pattern"
+            }
+            entities.append(entity)
         
         return entities
 
@@ -856,18 +874,17 @@ class EntityExtractionAgent(StrandsBaseAgent):
         """Extract entities using Russian dictionary lookup."""
         entities = []
         
-        for entity_type, entity_list in self.russian_dictionaries.items():
-            for entity_name in entity_list:
-                if entity_name in text:
-                    entity = {
-                        "name": entity_name,
-                        "type": entity_type.lower(),
-                        "importance": "high",
-                        "description": f"Known Russian {entity_type.lower()} entity",
-                        "confidence": 0.9,
-                        "extraction_method": "russian_dictionary"
-                    }
-                    entities.append(entity)
+        matcher = self._dictionary_matcher("ru", self.russian_dictionaries, case_sensitive=True)
+        for entity_name, entity_type in matcher.matched_entries(text):
+            entity = {
+                "name": entity_name,
+                "type": entity_type.lower(),
+                "importance": "high",
+                "description": f"Known Russian {entity_type.lower()} entity",
+                "confidence": 0.9,
+                "extraction_method": "russian_dictionary"
+            }
+            entities.append(entity)
         
         return entities
 
@@ -1198,34 +1215,17 @@ class EntityExtractionAgent(StrandsBaseAgent):
         return json.dumps({"entities": entities})
 
     def _merge_similar_entities(self, entities: List[Dict]) -> List[Dict]:
-        """Merge similar entities based on name similarity."""
+        """Merge similar entities based on name similarity.
+
+        Groups are the same as comparing every pair with
+        ``_are_entities_similar``, but candidates come from one Aho-Corasick
+        pass over the names instead of a quadratic loop.
+        """
         if not entities:
             return []
 
-        merged = []
-        processed = set()
-
-        for i, entity1 in enumerate(entities):
-            if i in processed:
-                continue
-
-            similar_entities = [entity1]
-            processed.add(i)
-
-            for j, entity2 in enumerate(entities[i+1:], i+1):
-                if j in processed:
-                    continue
-
-                # Check if entities are similar (same name or very similar)
-                if self._are_entities_similar(entity1, entity2):
-                    similar_entities.append(entity2)
-                    processed.add(j)
-
-            # Merge similar entities
-            merged_entity = self._merge_entity_group(similar_entities)
-            merged.append(merged_entity)
-
-        return merged
+        groups = group_by_containment([entity.get("name", "") for entity in entities])
+        return [self._merge_entity_group([entities[i] for i in group]) for group in groups]
 
     def _are_entities_similar(self, entity1: Dict, entity2: Dict) -> bool:
         """Check if two entities are similar."""
@@ -45,11 +45,11 @@ except ImportError:
 
 # Vision model integration
 try:
-    import ollama
+    from src.core.ollama_client import get_ollama_client
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
-    logging.warning("Ollama not available. Install with: pip install ollama")
+    logging.warning("Ollama client not available. Install with: pip install aiohttp")
 
 from src.agents.base_agent import StrandsBaseAgent
 from src.core.models import (
@@ -620,7 +620,8 @@ class FileExtractionAgent(StrandsBaseAgent):
             prompt = f"""Extract all text from this PDF page {page_num}. Return only the extracted text, preserving formatting."""
 
             # Call vision model
-            response = ollama.chat(
+            client = get_ollama_client()
+            response = client.run_sync(client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -632,8 +633,9 @@ class FileExtractionAgent(StrandsBaseAgent):
                 options={
                     "temperature": 0.1,
                     "num_predict": 2000
-                }
-            )
+                },
+                timeout=self.config.timeout_per_page
+            ))
             
             extracted_text = response['message']['content'].strip()
             
@@ -23,6 +23,10 @@ from src.core.models import (
     ProcessingStatus
 )
 from src.core.vector_db import VectorDBManager
+from src.core.knowledge_graph_store import AppendOnlyGraphStore, IncrementalGraphStats
+from src.core.knowledge_graph_index import GraphInvertedIndex
+from src.core.knowledge_graph_analytics import GraphMetricsCache, bounded_path_search
+from src.core.concurrent_chunk_processor import ConcurrentChunkProcessor
 from src.core.translation_service import TranslationService
 from src.config.config import config
 from src.config.settings import settings
@@ -44,6 +48,12 @@ from src.config.language_specific_regex_config import (
 from src.config.relationship_mapping_config import get_main_prompt, get_fallback_prompt, get_relationship_patterns
 
 
+def _raise_on_error(result: dict):
+    """Raise for extractor results that report a swallowed failure as ``{"error": ...}``."""
+    if isinstance(result, dict) and result.get("error"):
+        raise RuntimeError(f"Enhanced entity extraction failed: {result['error']}")
+
+
 class KnowledgeGraphAgent(StrandsBaseAgent):
     """Knowledge Graph Agent for entity extraction and relationship mapping."""
     
@@ -67,9 +77,16 @@ class KnowledgeGraphAgent(StrandsBaseAgent):
         )
         self.graph_storage_path.mkdir(parents=True, exist_ok=True)
         
-        # Initialize NetworkX graph
+        # Initialize NetworkX graph, persisted as snapshot + append-only log
         self.graph = nx.DiGraph()
         self.graph_file = self.graph_storage_path / "knowledge_graph.pkl"
+        self.graph_store = AppendOnlyGraphStore(self.graph_storage_path)
+        self.graph_stats = IncrementalGraphStats()
+        self.graph_index = GraphInvertedIndex()
+        self.graph_metrics = GraphMetricsCache(
+            staleness=settings.knowledge_graph_processing.metrics_staleness,
+            betweenness_samples=settings.knowledge_graph_processing.betweenness_samples
+        )
         self._load_existing_graph()
         
         # Initialize vector DB manager
@@ -306,19 +323,46 @@ class KnowledgeGraphAgent(StrandsBaseAgent):
             logger.info(f"Split text into {len(chunks)} chunks using fallback method")
             return chunks
     
-    async def _process_text_chunks(self, text: str, language: str = "en") -> tuple:
-        """Process text in chunks and combine results (GraphRAG-inspired approach)."""
+    async def _process_text_chunks(self, text: str, language: str = "en", progress_callback=None) -> tuple:
+        """Process text in chunks and combine results (GraphRAG-inspired approach).
+        
+        Chunks are extracted concurrently with a bounded number of in-flight
+        extractions (``settings.knowledge_graph_processing``); each chunk is
+        retried on failure and results are combined in chunk order.
+        ``progress_callback`` receives a dict after every finished chunk.
+        """
         chunks = self._split_text_into_chunks(text)
         
         all_entities = []
         all_relationships = []
         
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Processing chunk {i+1}/{len(chunks)} with language: {language}")
+        processing_config = settings.knowledge_graph_processing
+        processor = ConcurrentChunkProcessor(
+            max_concurrency=processing_config.max_concurrent_chunk_extractions,
+            max_retries=processing_config.chunk_extraction_retries,
+            retry_backoff=processing_config.chunk_retry_backoff
+        )
+        logger.info(
+            f"Extracting entities from {len(chunks)} chunks with language: {language} "
+            f"({processor.max_concurrency} concurrent)"
+        )
+        
+        outcomes = await processor.process(
+            chunks,
+            lambda chunk: self._extract_entities_strict(chunk, language),
+            progress_callback
+        )
+        
+        for i, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+            chunk_result = outcome.result
+            if not outcome.succeeded:
+                logger.warning(
+                    f"Extraction failed for chunk {i+1}/{len(chunks)} after {outcome.attempts} attempts, "
+                    f"using basic extraction: {outcome.error}"
+                )
+                chunk_result = await self.extract_entities(chunk, language, use_enhanced=False)
             
-            # Extract entities from chunk using language-specific extraction
-            extraction_result = await self.extract_entities(chunk, language)
-            json_data = extraction_result.get("content", [{}])[0].get("json", {})
+            json_data = chunk_result.get("content", [{}])[0].get("json", {})
             chunk_entities = json_data.get("entities", [])
             
             # Add chunk metadata
@@ -344,12 +388,11 @@ class KnowledgeGraphAgent(StrandsBaseAgent):
         # Now extract relationships from the full text using all unique entities
         logger.info(f"Extracting relationships from {len(unique_entities)} unique entities")
         
-        # Get all existing entities from the graph to create relationships
-        all_graph_entities = list(self.graph.nodes())
-        logger.info(f"Found {len(all_graph_entities)} existing entities in graph")
+        # Offer only existing graph entities that this document mentions
+        graph_candidates = self._select_relationship_candidates(text, unique_entities)
         
         # Combine new entities with existing graph entities for relationship extraction
-        all_entities_for_relationships = unique_entities + [{"name": entity, "type": "CONCEPT"} for entity in all_graph_entities]
+        all_entities_for_relationships = unique_entities + [{"name": entity, "type": "CONCEPT"} for entity in graph_candidates]
         
         relationship_result = await self.map_relationships(text, all_entities_for_relationships, language)
         relationship_json = relationship_result.get("content", [{}])[0].get("json", {})
@@ -364,89 +407,61 @@ class KnowledgeGraphAgent(StrandsBaseAgent):
         
         return unique_entities, all_relationships
     
-    async def extract_entities(self, text: str, language: str = "en", entity_types: List[str] = None) -> dict:
-        """Extract entities from text using isolated language-specific processing."""
+    def _select_relationship_candidates(self, text: str, new_entities: List[Dict]) -> List[str]:
+        """Pick existing graph entities worth passing to relationship extraction.
+        
+        Only entities whose name or original text appears in ``text`` are
+        kept, best-connected first, up to
+        ``settings.knowledge_graph_processing.max_relationship_candidates``.
+        Prompt savings are recorded in ``metadata["relationship_candidates"]``.
+        """
+        index = self._get_graph_index()
+        new_names = {e.get("name", e.get("text", "")) for e in new_entities}
+        mentioned = [node for node in index.mentioned_nodes(text) if node not in new_names]
+        
+        cap = settings.knowledge_graph_processing.max_relationship_candidates
+        selected = sorted(mentioned, key=lambda node: (-self.graph.degree(node), str(node)))[:cap]
+        
+        # Entities are joined into the prompt as comma-separated names
+        graph_entities = self.graph.number_of_nodes()
+        selected_chars = sum(len(str(node)) + 2 for node in selected)
+        chars_saved = index.name_chars + 2 * graph_entities - selected_chars
+        
+        totals = self.metadata.setdefault("relationship_candidates", {
+            "documents": 0, "entities_omitted": 0, "prompt_chars_saved": 0
+        })
+        totals["documents"] += 1
+        totals["entities_omitted"] += graph_entities - len(selected)
+        totals["prompt_chars_saved"] += chars_saved
+        totals["last"] = {
+            "graph_entities": graph_entities,
+            "mentioned": len(mentioned),
+            "selected": len(selected),
+            "prompt_chars_saved": chars_saved
+        }
+        
+        logger.info(
+            f"Selected {len(selected)} of {graph_entities} graph entities for relationship extraction "
+            f"({len(mentioned)} mentioned, ~{chars_saved} prompt characters saved)"
+        )
+        return selected
+    
+    async def extract_entities(
+        self, 
+        text: str, 
+        language: str = "en", 
+        entity_types: List[str] = None, 
+        use_enhanced: bool = True
+    ) -> dict:
+        """Extract entities from text using isolated language-specific processing.
+        
+        ``use_enhanced=False`` skips the enhanced (LLM) extraction even when
+        the language settings enable it.
+        """
         try:
-            # Use the new language processing service for isolated processing
-            result = self.language_service.extract_entities_with_config(text, language)
-            
-            # Import and use the entity types configuration
-            from src.config.entity_types_config import entity_types_config
-            
-            # Filter entities by requested types if specified
-            if entity_types:
-                # Validate and normalize entity types using configuration
-                validated_types = entity_types_config.validate_entity_types(entity_types, language)
-                # Filter the result to only include requested entity types
-                filtered_entities = {}
-                for entity_type, entity_list in result["entities"].items():
-                    if entity_type.upper() in validated_types:
-                        filtered_entities[entity_type] = entity_list
-                result["entities"] = filtered_entities
-            
-            # Convert to expected format
-            entities = []
-            for entity_type, entity_list in result["entities"].items():
-                for entity_text in entity_list:
-                    entities.append({
-                        "text": entity_text,
-                        "type": entity_type.upper(),
-                        "confidence": result["settings"]["confidence_threshold"],
-                        "language": result["language"]
-                    })
-            
-            # If enhanced extraction is enabled, also use the enhanced agent
-            if result["settings"]["use_enhanced_extraction"]:
-                try:
-                    if language == "zh" and hasattr(self, 'enhanced_chinese_extractor'):
-                        # Use enhanced Chinese extractor
-                        enhanced_entities = await self.enhanced_chinese_extractor.extract_entities_enhanced(text)
-                        for entity in enhanced_entities:
-                            entities.append({
-                                "text": entity.text,
-                                "type": entity.entity_type,
-                                "confidence": entity.confidence,
-                                "language": language
-                            })
-                    elif language == "ru" and hasattr(self, 'entity_extraction_agent'):
-                        # Use enhanced Russian extraction
-                        enhanced_result = await self.entity_extraction_agent._extract_russian_entities_enhanced(text)
-                        for entity in enhanced_result.get("entities", []):
-                            entities.append({
-                                "text": entity.get("name", entity.get("text", "")),
-                                "type": entity.get("type", "CONCEPT").upper(),
-                                "confidence": entity.get("confidence", 0.7),
-                                "language": language
-                            })
-                    else:
-                        # Use general enhanced extraction
-                        enhanced_result = await self.entity_extraction_agent.extract_entities(text)
-                        enhanced_entities = enhanced_result.get("entities", [])
-                        for entity in enhanced_entities:
-                            entities.append({
-                                "text": entity.get("name", entity.get("text", "")),
-                                "type": entity.get("type", "CONCEPT").upper(),
-                                "confidence": entity.get("confidence", 0.7),
-                                "language": language
-                            })
-                except Exception as e:
-                    logger.warning(f"Enhanced extraction failed for {language}, using basic extraction: {e}")
-            
-            # Remove duplicates
-            unique_entities = []
-            seen = set()
-            for entity in entities:
-                entity_key = (entity["text"], entity["type"])
-                if entity_key not in seen:
-                    seen.add(entity_key)
-                    unique_entities.append(entity)
-            
-            return {
-                "content": [{
-                    "json": {"entities": unique_entities}
-                }]
-            }
-                
+            return await self._extract_entities_strict(
+                text, language, entity_types, fallback_to_basic=True, use_enhanced=use_enhanced
+            )
         except Exception as e:
             logger.error(f"Entity extraction failed for language {language}: {e}")
             return {
@@ -455,6 +470,105 @@ class KnowledgeGraphAgent(StrandsBaseAgent):
                 }]
             }
     
+    async def _extract_entities_strict(
+        self, 
+        text: str, 
+        language: str = "en", 
+        entity_types: List[str] = None, 
+        fallback_to_basic: bool = False,
+        use_enhanced: bool = True
+    ) -> dict:
+        """Extract entities, raising on failure so callers can retry.
+        
+        A failed enhanced (LLM) extraction raises too, unless
+        ``fallback_to_basic`` is set, in which case the basic entities are
+        returned on their own. ``use_enhanced=False`` skips the enhanced
+        extraction entirely.
+        """
+        # Use the new language processing service for isolated processing
+        result = self.language_service.extract_entities_with_config(text, language)
+        
+        # Import and use the entity types configuration
+        from src.config.entity_types_config import entity_types_config
+        
+        # Filter entities by requested types if specified
+        if entity_types:
+            # Validate and normalize entity types using configuration
+            validated_types = entity_types_config.validate_entity_types(entity_types, language)
+            # Filter the result to only include requested entity types
+            filtered_entities = {}
+            for entity_type, entity_list in result["entities"].items():
+                if entity_type.upper() in validated_types:
+                    filtered_entities[entity_type] = entity_list
+            result["entities"] = filtered_entities
+        
+        # Convert to expected format
+        entities = []
+        for entity_type, entity_list in result["entities"].items():
+            for entity_text in entity_list:
+                entities.append({
+                    "text": entity_text,
+                    "type": entity_type.upper(),
+                    "confidence": result["settings"]["confidence_threshold"],
+                    "language": result["language"]
+                })
+        
+        # If enhanced extraction is enabled, also use the enhanced agent
+        if use_enhanced and result["settings"]["use_enhanced_extraction"]:
+            try:
+                if language == "zh" and hasattr(self, 'enhanced_chinese_extractor'):
+                    # Use enhanced Chinese extractor
+                    enhanced_entities = await self.enhanced_chinese_extractor.extract_entities_enhanced(text)
+                    for entity in enhanced_entities:
+                        entities.append({
+                            "text": entity.text,
+                            "type": entity.entity_type,
+                            "confidence": entity.confidence,
+                            "language": language
+                        })
+                elif language == "ru" and hasattr(self, 'entity_extraction_agent'):
+                    # Use enhanced Russian extraction
+                    enhanced_result = await self.entity_extraction_agent._extract_russian_entities_enhanced(text)
+                    _raise_on_error(enhanced_result)
+                    for entity in enhanced_result.get("entities", []):
+                        entities.append({
+                            "text": entity.get("name", entity.get("text", "")),
+                            "type": entity.get("type", "CONCEPT").upper(),
+                            "confidence": entity.get("confidence", 0.7),
+                            "language": language
+                        })
+                else:
+                    # Use general enhanced extraction
+                    enhanced_result = await self.entity_extraction_agent.extract_entities(text)
+                    _raise_on_error(enhanced_result)
+                    enhanced_entities = enhanced_result.get("entities", [])
+                    for entity in enhanced_entities:
+                        entities.append({
+                            "text": entity.get("name", entity.get("text", "")),
+                            "type": entity.get("type", "CONCEPT").upper(),
+                            "confidence": entity.get("confidence", 0.7),
+                            "language": language
+                        })
+            except Exception as e:
+                if not fallback_to_basic:
+                    raise
+                logger.warning(f"Enhanced extraction failed for {language}, using basic extraction: {e}")
+        
+        # Remove duplicates
+        unique_entities = []
+        seen = set()
+        for entity in entities:
+            entity_key = (entity["text"], entity["type"])
+            if entity_key not in seen:
+                seen.add(entity_key)
+                unique_entities.append(entity)
+        
+        return {
+            "content": [{
+                "json": {"entities": unique_entities}
+            }]
+        }
+    
     def _get_language_specific_prompt(self, text: str, language: str) -> str:
         """Get language-specific entity extraction prompt using configuration."""
         # Use the new generic prompt system for all languages
@@ -1539,13 +1653,27 @@ Notes:
             }
     
     async def _perform_query(self, query: str) -> dict:
-        """Perform the actual query on the knowledge graph."""
+        """Perform the actual query on the knowledge graph.
+        
+        Matching entities and relationships are looked up in the inverted
+        index and given to the model; they are also the fallback result when
+        the model does not return valid JSON.
+        """
+        matched = self._match_query(query)
+        
         prompt = f"""
         Query the knowledge graph for: {query}
         
         Available graph statistics:
         - Nodes: {self.graph.number_of_nodes()}
         - Edges: {self.graph.number_of_edges()}
+        - Matching entities: {matched["total_matches"]}
+        
+        Matching entities:
+        {json.dumps(matched["entities"], ensure_ascii=False)}
+        
+        Relationships between matching entities:
+        {json.dumps(matched["relationships"], ensure_ascii=False)}
         
         Return a JSON object with:
         - query_results: list of relevant entities and relationships
@@ -1563,24 +1691,20 @@ Notes:
             else:
                 content = str(response)
             
-            # Try to parse as JSON, if it fails, create mock data
+            # Try to parse as JSON, if it fails, return the index matches
             try:
                 json_data = json.loads(content)
             except json.JSONDecodeError:
-                # Create mock query results
                 json_data = {
-                    "query_results": [
-                        {"entity": "Mock Entity", "type": "unknown"},
-                        {"relationship": "Mock Relationship"}
-                    ],
-                    "insights": f"Mock analysis for query: {query}"
+                    "query_results": matched["entities"] + matched["relationships"],
+                    "insights": f"Found {matched['total_matches']} entities matching query: {query}"
                 }
             
             return json_data
         except Exception as e:
             logger.error(f"Query performance failed: {e}")
             return {
-                "query_results": [],
+                "query_results": matched["entities"] + matched["relationships"],
                 "insights": "Query failed"
             }
     
@@ -1841,66 +1965,27 @@ Notes:
         plt.savefig(output_file, dpi=300, bbox_inches='tight')
         plt.close()
     
-    async def _filter_graph_by_query(self, query: str, target_language: str = "en") -> nx.Graph:
-        """Filter the graph to include only nodes and edges related to the query."""
+    async def _filter_graph_by_query(self, query: str, target_language: str = "en",
+                                     mode: str = "or", hops: int = 1) -> nx.Graph:
+        """Filter the graph to include only nodes and edges related to the query.
+        
+        Matching nodes come from the inverted index (any term with
+        ``mode="or"``, every term with ``mode="and"``) and are expanded by
+        ``hops`` neighbours in either direction for context.
+        """
         try:
-            # Create a subgraph with nodes that match the query
-            matching_nodes = set()
-            
-            # Search for nodes that contain the query terms
-            query_terms = query.lower().split()
+            index = self._get_graph_index()
+            matching_nodes = index.search(query, mode=mode)
             
-            # First, try to find nodes that directly match the query
-            for node, attrs in self.graph.nodes(data=True):
-                node_text = node.lower()
-                node_original = attrs.get('original_text', '').lower()
-                
-                # Check if any query term matches the node
-                for term in query_terms:
-                    if term in node_text or term in node_original:
-                        matching_nodes.add(node)
-                        break
-                
-                # Also check node attributes for matches
-                node_type = attrs.get('type', '').lower()
-                domain = attrs.get('domain', '').lower()
-                
-                for term in query_terms:
-                    if term in node_type or term in domain:
-                        matching_nodes.add(node)
-                        break
-            
-            # If no direct matches found, try semantic search approach
+            # If no direct matches found, fall back to related concepts
             if not matching_nodes:
-                logger.info(f"No direct matches found for query: {query}, trying semantic search...")
-                
-                # Get a sample of nodes to search through
-                all_nodes = list(self.graph.nodes(data=True))
-                sample_size = min(100, len(all_nodes))  # Limit to first 100 nodes for performance
-                
-                for node, attrs in all_nodes[:sample_size]:
-                    node_text = node.lower()
-                    
-                    # Check for partial matches and related terms
-                    for term in query_terms:
-                        # Check for partial word matches
-                        if any(term in word for word in node_text.split()):
-                            matching_nodes.add(node)
-                            break
-                        
-                        # Check for similar concepts
-                        if term in ['resource', 'planning', 'war', 'strategy', 'military']:
-                            if any(related in node_text for related in ['resource', 'plan', 'war', 'strategy', 'military', 'battle', 'victory']):
-                                matching_nodes.add(node)
-                                break
-            
-            # Include neighboring nodes (1-hop neighbors) for context
-            neighbors = set()
-            for node in matching_nodes:
-                neighbors.update(self.graph.neighbors(node))
+                logger.info(f"No direct matches found for query: {query}, trying related concepts...")
+                query_terms = query.lower().split()
+                if any(term in ['resource', 'planning', 'war', 'strategy', 'military'] for term in query_terms):
+                    matching_nodes = index.search("resource plan war strategy military battle victory")
             
-            # Combine matching nodes and their neighbors
-            all_relevant_nodes = matching_nodes.union(neighbors)
+            # Include neighbouring nodes for context
+            all_relevant_nodes = index.expand(self.graph, matching_nodes, hops=hops)
             
             # If still no matches, return a small sample of the graph for demonstration
             if not all_relevant_nodes:
@@ -1921,6 +2006,42 @@ Notes:
             logger.error(f"Error filtering graph by query '{query}': {e}")
             return nx.Graph()
 
+    def _get_graph_index(self) -> GraphInvertedIndex:
+        """Return the node index, rebuilding it if the graph was changed directly."""
+        if not self.graph_index.matches(self.graph):
+            logger.info("Graph changed outside the graph store, rebuilding query index")
+            self.graph_index.rebuild(self.graph)
+        return self.graph_index
+
+    def _match_query(self, query: str, limit: int = 50, mode: str = "or") -> dict:
+        """Look up entities matching ``query`` and the relationships between them."""
+        matches = self._get_graph_index().search(query, mode=mode)
+        ranked = sorted(matches, key=self.graph.degree, reverse=True)[:limit]
+        selected = set(ranked)
+        
+        entities = [
+            {
+                "entity": node,
+                "type": self.graph.nodes[node].get("type", "unknown"),
+                "language": self.graph.nodes[node].get("language", "unknown")
+            }
+            for node in ranked
+        ]
+        relationships = []
+        for node in ranked:
+            for target, attrs in self.graph.succ[node].items():
+                if target in selected:
+                    relationships.append({
+                        "source": node,
+                        "target": target,
+                        "relationship": attrs.get("relationship_type", "related_to")
+                    })
+        return {
+            "total_matches": len(matches),
+            "entities": entities,
+            "relationships": relationships[:limit]
+        }
+
     def _get_graph_stats_for_subgraph(self, subgraph: nx.Graph) -> dict:
         """Get statistics for a subgraph."""
         try:
@@ -3010,7 +3131,11 @@ Notes:
         return self._create_enhanced_html_template(nodes_data, edges_data)
     
     async def find_entity_paths(self, source: str, target: str) -> dict:
-        """Find paths between two entities in the graph."""
+        """Find paths between two entities in the graph.
+        
+        Paths are enumerated shortest first and the search stops at the
+        length, count and time bounds in ``settings.knowledge_graph_processing``.
+        """
         try:
             if source not in self.graph or target not in self.graph:
                 return {
@@ -3019,26 +3144,33 @@ Notes:
                     }]
                 }
             
-            # Find shortest path
-            try:
-                shortest_path = nx.shortest_path(self.graph, source, target)
-                path_length = len(shortest_path) - 1
-            except nx.NetworkXNoPath:
-                shortest_path = []
-                path_length = -1
-            
-            # Find all simple paths
-            all_paths = list(nx.all_simple_paths(self.graph, source, target))
+            limits = settings.knowledge_graph_processing
+            # The search is CPU-bound for up to the timeout; keep it off the event
+            # loop, on a copy of the nodes reachable from source, since
+            # _add_to_graph keeps mutating self.graph while it runs
+            reachable = nx.descendants(self.graph, source) | {source, target}
+            snapshot = self.graph.subgraph(reachable).copy()
+            search = await asyncio.to_thread(
+                bounded_path_search,
+                snapshot, source, target,
+                max_paths=limits.max_paths_returned,
+                max_length=limits.max_path_length,
+                count_limit=limits.path_count_limit,
+                timeout=limits.path_search_timeout
+            )
             
             return {
                 "content": [{
                     "json": {
                         "source": source,
                         "target": target,
-                        "shortest_path": shortest_path,
-                        "shortest_path_length": path_length,
-                        "all_paths_count": len(all_paths),
-                        "all_paths": all_paths[:5]  # Limit to first 5 paths
+                        "shortest_path": search["shortest_path"],
+                        "shortest_path_length": search["shortest_path_length"],
+                        "all_paths_count": search["paths_count"],
+                        "all_paths_count_exact": search["paths_count_exact"],
+                        "all_paths": search["paths"],
+                        "max_path_length": limits.max_path_length,
+                        "timed_out": search["timed_out"]
                     }
                 }]
             }
@@ -3051,8 +3183,18 @@ Notes:
                 }]
             }
     
-    async def get_entity_context(self, entity: str) -> dict:
-        """Get context and connections for a specific entity."""
+    async def get_entity_context(
+        self, 
+        entity: str, 
+        include_betweenness: bool = False, 
+        include_pagerank: bool = False
+    ) -> dict:
+        """Get context and connections for a specific entity.
+        
+        Centrality values come from the metrics cache. Whole-graph metrics are
+        opt-in: PageRank is only computed when ``include_pagerank`` is set and
+        sampled betweenness when ``include_betweenness`` is set.
+        """
         try:
             if entity not in self.graph:
                 return {
@@ -3075,16 +3217,22 @@ Notes:
             for neighbor in neighbors:
                 edge_data[neighbor] = self.graph.get_edge_data(entity, neighbor)
             
+            context = {
+                "entity": entity,
+                "neighbors": neighbors,
+                "incoming_connections": incoming,
+                "outgoing_connections": outgoing,
+                "edge_data": edge_data,
+                "degree_centrality": self.graph_metrics.degree_centrality(self.graph, entity)
+            }
+            if include_pagerank:
+                context["pagerank"] = self.graph_metrics.pagerank(self.graph, entity)
+            if include_betweenness:
+                context["betweenness_centrality"] = self.graph_metrics.betweenness(self.graph, entity)
+            
             return {
                 "content": [{
-                    "json": {
-                        "entity": entity,
-                        "neighbors": neighbors,
-                        "incoming_connections": incoming,
-                        "outgoing_connections": outgoing,
-                        "edge_data": edge_data,
-                        "degree_centrality": nx.degree_centrality(self.graph).get(entity, 0)
-                    }
+                    "json": context
                 }]
             }
             
@@ -3112,24 +3260,29 @@ Notes:
                 entity['original_text'] = original_text
                 
                 if entity_name not in self.graph:
-                    self.graph.add_node(entity_name, 
-                                      type=entity_type,
-                                      confidence=confidence,
-                                      first_seen=datetime.now().isoformat(),
-                                      request_id=request_id,
-                                      language=language,  # Add language metadata
-                                      original_text=original_text)  # Store original text
+                    self._graph_add_node(entity_name, 
+                                       type=entity_type,
+                                       confidence=confidence,
+                                       first_seen=datetime.now().isoformat(),
+                                       request_id=request_id,
+                                       language=language,  # Add language metadata
+                                       original_text=original_text)  # Store original text
                 else:
+                    updates = {}
+                    node_attrs = self.graph.nodes[entity_name]
+                    
                     # Update existing node with language info if not present
-                    if "language" not in self.graph.nodes[entity_name]:
-                        self.graph.nodes[entity_name]["language"] = language
-                        self.graph.nodes[entity_name]["original_text"] = original_text
+                    if "language" not in node_attrs:
+                        updates["language"] = language
+                        updates["original_text"] = original_text
                     
                     # Update confidence
-                    self.graph.nodes[entity_name]["confidence"] = max(
-                        self.graph.nodes[entity_name].get("confidence", 0),
-                        confidence
-                    )
+                    new_confidence = max(node_attrs.get("confidence", 0), confidence)
+                    if new_confidence != node_attrs.get("confidence"):
+                        updates["confidence"] = new_confidence
+                    
+                    if updates:
+                        self._graph_update_node(entity_name, **updates)
         
         # Add relationships as edges with language metadata
         edges_added = 0
@@ -3151,18 +3304,18 @@ Notes:
                     # Ensure both source and target nodes exist in the graph
                     if source not in self.graph:
                         logger.warning(f"Source entity '{source}' not in graph, adding it")
-                        self.graph.add_node(source, type="CONCEPT", confidence=0.5, language=language)
+                        self._graph_add_node(source, type="CONCEPT", confidence=0.5, language=language)
                     
                     if target not in self.graph:
                         logger.warning(f"Target entity '{target}' not in graph, adding it")
-                        self.graph.add_node(target, type="CONCEPT", confidence=0.5, language=language)
+                        self._graph_add_node(target, type="CONCEPT", confidence=0.5, language=language)
                     
-                    self.graph.add_edge(source, target,
-                                      relationship_type=rel_type,
-                                      confidence=confidence,
-                                      timestamp=datetime.now().isoformat(),
-                                      request_id=request_id,
-                                      language=language)  # Add language metadata to edge
+                    self._graph_add_edge(source, target,
+                                       relationship_type=rel_type,
+                                       confidence=confidence,
+                                       timestamp=datetime.now().isoformat(),
+                                       request_id=request_id,
+                                       language=language)  # Add language metadata to edge
                     edges_added += 1
                     logger.debug(f"Added edge: {source} -> {target} ({rel_type})")
                 else:
@@ -3180,6 +3333,29 @@ Notes:
         logger.info(f"Added {len(entities)} entities and {edges_added} edges to graph")
         logger.info(f"Graph now has {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
     
+    def _graph_add_node(self, node: str, **attrs):
+        """Add a node and record it in the graph log, incremental stats and index."""
+        self.graph.add_node(node, **attrs)
+        self.graph_stats.node_added(node, attrs)
+        self.graph_index.add_node(node, attrs)
+        self.graph_store.add_node(node, attrs)
+    
+    def _graph_update_node(self, node: str, **attrs):
+        """Merge attributes into an existing node and record the update."""
+        if "language" in attrs:
+            self.graph_stats.node_language_changed(
+                self.graph.nodes[node].get("language"), attrs["language"]
+            )
+        self.graph.nodes[node].update(attrs)
+        self.graph_index.update_node(node, self.graph.nodes[node])
+        self.graph_store.update_node(node, attrs)
+    
+    def _graph_add_edge(self, source: str, target: str, **attrs):
+        """Add a new edge and record it in the graph log and incremental stats."""
+        self.graph_stats.edge_added(self.graph, source, target, attrs)
+        self.graph.add_edge(source, target, **attrs)
+        self.graph_store.add_edge(source, target, attrs)
+    
     async def _analyze_graph_impact(self, entities: List[Dict], relationships: List[Dict]) -> Dict:
         """Analyze the impact of new entities and relationships on the graph."""
         before_nodes = self.graph.number_of_nodes() - len(entities)
@@ -3305,88 +3481,45 @@ Notes:
             }
 
     def _get_graph_stats(self) -> Dict:
-        """Get current graph statistics including language distribution."""
-        if self.graph.number_of_nodes() == 0:
-            return {"nodes": 0, "edges": 0, "density": 0, "languages": {}}
+        """Get current graph statistics including language distribution.
         
-        try:
-            # Basic stats that are always safe
-            stats = {
-                "nodes": self.graph.number_of_nodes(),
-                "edges": self.graph.number_of_edges(),
-                "density": nx.density(self.graph) if self.graph.number_of_nodes() > 1 else 0
-            }
-            
-            # Calculate language distribution
-            language_stats = {}
-            for node, attrs in self.graph.nodes(data=True):
-                lang = attrs.get("language", "unknown")
-                if lang not in language_stats:
-                    language_stats[lang] = {"nodes": 0, "edges": 0}
-                language_stats[lang]["nodes"] += 1
-            
-            # Count edges by language
-            for source, target, attrs in self.graph.edges(data=True):
-                lang = attrs.get("language", "unknown")
-                if lang not in language_stats:
-                    language_stats[lang] = {"nodes": 0, "edges": 0}
-                language_stats[lang]["edges"] += 1
-            
-            stats["languages"] = language_stats
-            stats["total_languages"] = len(language_stats)
-            
-            # Only calculate clustering for small graphs to avoid hanging
-            if self.graph.number_of_nodes() <= 100:
-                try:
-                    undirected = self.graph.to_undirected()
-                    stats["average_clustering"] = nx.average_clustering(undirected)
-                    stats["connected_components"] = nx.number_connected_components(undirected)
-                except Exception as e:
-                    logger.warning(f"Could not calculate clustering/connected components: {e}")
-                    stats["average_clustering"] = 0
-                    stats["connected_components"] = 1
-            else:
-                # For large graphs, skip expensive calculations
-                stats["average_clustering"] = 0
-                stats["connected_components"] = 1
-                logger.info("Skipping clustering calculation for large graph")
-            
-            return stats
-        except Exception as e:
-            logger.warning(f"Could not calculate all graph statistics: {e}")
-            return {
-                "nodes": self.graph.number_of_nodes(),
-                "edges": self.graph.number_of_edges(),
-                "density": 0,
-                "average_clustering": 0,
-                "connected_components": 1,
-                "languages": {},
-                "total_languages": 0
-            }
+        Statistics are maintained incrementally as nodes and edges are added;
+        they are rebuilt only if the graph was changed outside the agent's
+        add methods.
+        """
+        if not self.graph_stats.matches(self.graph):
+            logger.info("Graph changed outside the graph store, rebuilding statistics")
+            self.graph_stats.rebuild(self.graph)
+        return self.graph_stats.as_dict()
     
     def _load_existing_graph(self):
-        """Load existing graph from file."""
+        """Load existing graph from its snapshot and replay the append-only log."""
         try:
-            if self.graph_file.exists():
-                import pickle
-                with open(self.graph_file, 'rb') as f:
-                    self.graph = pickle.load(f)
+            self.graph = self.graph_store.load()
+            if self.graph.number_of_nodes():
                 logger.info(f"Loaded existing graph with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
             else:
                 logger.info("No existing graph found, starting fresh")
         except Exception as e:
             logger.error(f"Failed to load existing graph: {e}")
             self.graph = nx.DiGraph()
+        self.graph_stats.rebuild(self.graph)
+        self.graph_index.rebuild(self.graph)
+        self.graph_metrics.invalidate()
     
     def _save_graph(self):
-        """Save graph to file."""
+        """Append pending graph changes to the log, compacting it when it grows large."""
         try:
-            import pickle
-            with open(self.graph_file, 'wb') as f:
-                pickle.dump(self.graph, f)
-            logger.debug(f"Graph saved with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
+            written = self.graph_store.flush()
+            if self.graph_store.maybe_compact(self.graph):
+                logger.debug("Graph log compacted into snapshot")
+            logger.debug(f"Graph saved: {written} operations appended")
         except Exception as e:
             logger.error(f"Failed to save graph: {e}")
+    
+    def compact_graph(self):
+        """Write a full snapshot of the graph and truncate the append-only log."""
+        self.graph_store.compact(self.graph)
 
     # Interface method for MCP server compatibility
     async def generate_knowledge_graph(self, content: str, content_type: str = "text") -> dict:
@@ -10,7 +10,6 @@ import os
 import cv2
 import numpy as np
 from PIL import Image
-import requests
 import json
 import hashlib
 import pickle
@@ -34,6 +33,7 @@ from src.core.models import (
     AnalysisRequest, AnalysisResult, DataType, SentimentResult
 )
 from src.core.ollama_integration import get_ollama_model
+from src.core.ollama_client import OllamaError, get_ollama_client
 
 
 class OCRAgent(BaseAgent):
@@ -168,17 +168,16 @@ class OCRAgent(BaseAgent):
         """Initialize Ollama client for OCR processing."""
         try:
             # Test Ollama connection
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code != 200:
-                raise ConnectionError("Ollama service not available")
+            client = get_ollama_client()
+            try:
+                models = await client.get_json("/api/tags", timeout=5, max_retries=0)
+            except OllamaError as e:
+                raise ConnectionError("Ollama service not available") from e
             
-            # Import ollama client
-            import ollama
-            self.ollama_client = ollama.Client()
+            self.ollama_client = client
             
             # Check if llava model is available
-            models = self.ollama_client.list()
-            if not any("llava" in model["name"] for model in models["models"]):
+            if not any("llava" in model["name"] for model in models.get("models", [])):
                 logger.warning("Llava model not found. Please install with: ollama pull llava")
             
             logger.info("✅ Ollama client initialized for OCR")
@@ -246,7 +245,7 @@ class OCRAgent(BaseAgent):
             """
             
             # Call Ollama with image
-            response = self.ollama_client.chat(
+            response = await self.ollama_client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -319,7 +318,7 @@ class OCRAgent(BaseAgent):
             Provide your analysis in JSON format.
             """
             
-            analysis_response = self.ollama_client.chat(
+            analysis_response = await self.ollama_client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -533,7 +532,7 @@ class OCRAgent(BaseAgent):
             Text: {extracted_text}
             """
             
-            response = self.ollama_client.chat(
+            response = await self.ollama_client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -611,7 +610,7 @@ class OCRAgent(BaseAgent):
                 Text: {extracted_text}
                 """
             
-            response = self.ollama_client.chat(
+            response = await self.ollama_client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -37,11 +37,11 @@ except ImportError:
 
 # Vision model integration
 try:
-    import ollama
+    from src.core.ollama_client import get_ollama_client
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
-    logging.warning("Ollama not available. Install with: pip install ollama")
+    logging.warning("Ollama client not available. Install with: pip install aiohttp")
 
 from src.agents.base_agent import StrandsBaseAgent
 try:
@@ -310,7 +310,7 @@ class UnifiedFileExtractionAgent(StrandsBaseAgent):
             """
             
             # Call Ollama with image
-            response = ollama.chat(
+            response = await get_ollama_client().chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -389,7 +389,7 @@ class UnifiedFileExtractionAgent(StrandsBaseAgent):
             Provide your analysis in JSON format.
             """
             
-            analysis_response = ollama.chat(
+            analysis_response = await get_ollama_client().chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -535,7 +535,7 @@ class UnifiedFileExtractionAgent(StrandsBaseAgent):
                 Text: {extracted_text}
                 """
             
-            response = ollama.chat(
+            response = await get_ollama_client().chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -806,7 +806,8 @@ class UnifiedFileExtractionAgent(StrandsBaseAgent):
         try:
             prompt = f"""Extract all text from this PDF page {page_num}. Return only the extracted text, preserving formatting."""
 
-            response = ollama.chat(
+            client = get_ollama_client()
+            response = client.run_sync(client.chat(
                 model=self.model_name,
                 messages=[
                     {
@@ -819,7 +820,7 @@ class UnifiedFileExtractionAgent(StrandsBaseAgent):
                     "temperature": 0.1,
                     "num_predict": 2000
                 }
-            )
+            ))
             
             extracted_text = response['message']['content'].strip()
             
@@ -11,7 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, ConfigDict
 from loguru import logger
 
-from src.core.orchestrator import SentimentOrchestrator
+from src.core.orchestrator import get_shared_orchestrator
 from src.core.models import (
     AnalysisRequest, AnalysisResult, ModelConfig
 )
@@ -205,7 +205,7 @@ async def lifespan(app: FastAPI):
     logger.info("✅ Initializing orchestrator for full functionality")
     
     try:
-        orchestrator = SentimentOrchestrator()
+        orchestrator = get_shared_orchestrator()
         logger.info("✅ Orchestrator initialized successfully")
         
         # Set orchestrator reference for strategic deception routes if available
@@ -286,6 +286,13 @@ async def lifespan(app: FastAPI):
             await orchestrator.cleanup()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
+    
+    # Close the shared Ollama HTTP session last; every integration uses it
+    try:
+        from src.core.ollama_client import get_ollama_client
+        await get_ollama_client().close()
+    except Exception as e:
+        logger.error(f"Ollama client cleanup error: {e}")
 
 
 # Initialize FastAPI app
@@ -1198,6 +1205,15 @@ async def get_agent_status():
         raise HTTPException(status_code=500, detail=f"Failed to get agent status: {str(e)}")
 
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get analysis request cache statistics."""
+    try:
+        return orchestrator.get_cache_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
+
+
 # Business Intelligence endpoints
 @app.post("/business/dashboard")
 async def generate_business_dashboard(request: BusinessDashboardRequest):
@@ -3080,6 +3096,7 @@ async def root():
             "response_validation": "/reflection/validate",
             "models": "/models",
             "agent_status": "/agents/status",
+            "cache_stats": "/cache/stats",
             "predictive_analytics": "/analytics/predictive",
             "scenario_analysis": "/analytics/scenario",
             "decision_support": "/analytics/decision-support",
@@ -3,7 +3,7 @@ Monte Carlo API Routes
 RESTful API endpoints for Monte Carlo simulation functionality with Phase 5 advanced features
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from typing import Dict, List, Any, Optional
 import logging
 import asyncio
@@ -67,15 +67,15 @@ async def health_check():
 
 
 @router.get("/redis-health")
-async def redis_health_check():
+async def redis_health_check(
+    engine: MonteCarloEngine = Depends(get_monte_carlo_engine)
+):
     """Health check endpoint for Redis cache"""
+    redis_url = engine.config.redis_url
     try:
         import redis
-        redis_client = redis.Redis(
-            host='localhost',
-            port=6379,
-            db=0,
-            decode_responses=True,
+        redis_client = redis.Redis.from_url(
+            redis_url,
             socket_connect_timeout=1,
             socket_timeout=1
         )
@@ -84,8 +84,7 @@ async def redis_health_check():
         return {
             "status": "healthy",
             "service": "redis_cache",
-            "host": "localhost",
-            "port": 6379,
+            "url": redis_url,
             "available": True
         }
     except Exception as e:
@@ -93,8 +92,7 @@ async def redis_health_check():
         return {
             "status": "unhealthy",
             "service": "redis_cache",
-            "host": "localhost",
-            "port": 6379,
+            "url": redis_url,
             "available": False,
             "error": str(e)
         }
@@ -129,10 +127,13 @@ async def run_simulation(
         num_iterations = simulation_config.get("num_iterations")
         parallel = simulation_config.get("parallel", True)
         include_phase5_features = simulation_config.get("include_phase5_features", True)
+        results_mode = simulation_config.get("results_mode", "summary")
+        target_precision = simulation_config.get("target_precision")
         
         # Run simulation
         result = await engine.run_simulation(
-            scenario_config, num_iterations, parallel
+            scenario_config, num_iterations, parallel, results_mode,
+            target_precision=target_precision
         )
         
         logger.info(f"Monte Carlo simulation completed: {result.get('simulation_id')}")
@@ -144,6 +145,8 @@ async def run_simulation(
             "phase5_features_enabled": include_phase5_features
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid simulation request: {str(e)}")
     except Exception as e:
         logger.error(f"Simulation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
@@ -165,10 +168,11 @@ async def run_scenario_simulation(
         num_iterations = parameters.get("num_iterations")
         time_horizon = parameters.get("time_horizon")
         include_advanced_analytics = parameters.get("include_advanced_analytics", True)
+        results_mode = parameters.get("results_mode", "summary")
         
         # Run simulation
         result = engine.run_scenario_simulation(
-            scenario_type, scenario_params, num_iterations, time_horizon
+            scenario_type, scenario_params, num_iterations, time_horizon, results_mode
         )
         
         logger.info(f"Scenario simulation completed: {result.get('simulation_id')}")
@@ -192,6 +196,7 @@ async def run_custom_simulation(
     correlations: Optional[List[List[float]]] = None,
     num_iterations: Optional[int] = None,
     include_stress_testing: bool = True,
+    results_mode: str = "summary",
     engine: MonteCarloEngine = Depends(get_monte_carlo_engine)
 ):
     """Run custom Monte Carlo simulation with Phase 5 features"""
@@ -200,7 +205,9 @@ async def run_custom_simulation(
         logger.info("Starting custom Monte Carlo simulation")
         
         # Run simulation
-        result = engine.run_custom_simulation(variables, correlations, num_iterations)
+        result = engine.run_custom_simulation(
+            variables, correlations, num_iterations, results_mode
+        )
         
         logger.info(f"Custom simulation completed: {result.get('simulation_id')}")
         
@@ -222,6 +229,7 @@ async def run_time_series_simulation(
     forecast_periods: int = 12,
     num_iterations: int = 1000,
     use_parallel_processing: bool = True,
+    results_mode: str = "summary",
     engine: MonteCarloEngine = Depends(get_monte_carlo_engine)
 ):
     """Run time series Monte Carlo simulation with Phase 5 optimizations"""
@@ -231,7 +239,7 @@ async def run_time_series_simulation(
         
         # Run simulation
         result = engine.run_time_series_simulation(
-            time_series_data, forecast_periods, num_iterations
+            time_series_data, forecast_periods, num_iterations, results_mode
         )
         
         logger.info(f"Time series simulation completed: {result.get('simulation_id')}")
@@ -248,6 +256,84 @@ async def run_time_series_simulation(
         raise HTTPException(status_code=500, detail=f"Time series simulation failed: {str(e)}")
 
 
+@router.get("/samples/{sample_id}")
+async def get_simulation_samples(
+    sample_id: str,
+    start: int = 0,
+    stop: Optional[int] = None,
+    max_points: Optional[int] = None,
+    variables: Optional[str] = None,
+    format: str = "json",
+    engine: MonteCarloEngine = Depends(get_monte_carlo_engine)
+):
+    """Fetch raw samples referenced by a result's sample_handle
+    
+    Supports a row range (``start``/``stop``), decimation to at most
+    ``max_points`` rows, a comma-separated list of variable indices, and
+    ``format=npy`` for a binary NPY payload.
+    """
+    
+    try:
+        variable_indices = (
+            [int(v) for v in variables.split(",") if v.strip()] if variables else None
+        )
+        samples = engine.get_samples(sample_id, start, stop, max_points, variable_indices)
+        
+        if format == "npy":
+            import io
+            import numpy as np
+            buffer = io.BytesIO()
+            np.save(buffer, samples, allow_pickle=False)
+            return Response(content=buffer.getvalue(), media_type="application/octet-stream")
+        
+        return {
+            "status": "success",
+            "sample_id": sample_id,
+            "shape": list(samples.shape),
+            "samples": samples.tolist()
+        }
+        
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Samples '{sample_id}' not found")
+    except (ValueError, IndexError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid sample request: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to fetch samples: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch samples: {str(e)}")
+
+
+@router.post("/convergence-report")
+async def sampling_convergence_report(
+    scenario_config: Dict[str, Any],
+    target_standard_error: float,
+    methods: Optional[str] = None,
+    pilot_iterations: int = 1024,
+    replications: int = 16,
+    engine: MonteCarloEngine = Depends(get_monte_carlo_engine)
+):
+    """Compare iterations needed per sampling mode to reach a target standard error"""
+
+    try:
+        method_list = [m.strip() for m in methods.split(",")] if methods else None
+        report = await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: engine.sampling_convergence_report(
+                scenario_config, target_standard_error, method_list,
+                pilot_iterations, replications
+            )
+        )
+        return {
+            "status": "success",
+            "report": report
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Convergence report failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Convergence report failed: {str(e)}")
+
+
 @router.post("/analyze")
 async def analyze_results(
     simulation_id: str,
@@ -433,6 +519,8 @@ async def optimize_performance(
             engine.config.max_workers = max_workers
         
         engine.config.cache_results = enable_caching
+        if enable_caching and engine.cache is None:
+            engine.cache = engine._initialize_cache()
         
         return {
             "status": "success",
@@ -458,6 +546,7 @@ async def get_performance_status(
             "status": "success",
             "max_workers": engine.config.max_workers,
             "caching_enabled": engine.config.cache_results,
+            "cache": engine.get_cache_stats(),
             "parallel_processing": True,
             "memory_optimization": True
         }
@@ -3,7 +3,9 @@ Entity types configuration for multilingual processing.
 Supports different entity types for different languages and cultures.
 """
 
-from typing import Dict, List, Any
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -39,6 +41,10 @@ class EntityTypesConfig:
     
     def __init__(self):
         self.language_configs: Dict[str, LanguageEntityConfig] = {}
+        # Extra dictionary names (gazetteers) per language and entity type
+        self.entity_dictionaries: Dict[str, Dict[str, List[str]]] = {}
+        # Bumped on every dictionary change so compiled matchers can reload
+        self.version = 0
         self._initialize_default_configs()
     
     def _initialize_default_configs(self):
@@ -232,6 +238,36 @@ class EntityTypesConfig:
         config = self.get_language_config(language_code)
         return config.extraction_settings
 
+    
+    def add_entity_dictionary(self, language_code: str, entity_type: str, names: Iterable[str]) -> int:
+        """Add dictionary names for an entity type in a language."""
+        names = [name for name in names if name]
+        language_dictionaries = self.entity_dictionaries.setdefault(language_code.lower(), {})
+        language_dictionaries.setdefault(entity_type.upper(), []).extend(names)
+        self.version += 1
+        return len(names)
+    
+    def load_gazetteer(self, language_code: str, path: Union[str, Path]) -> int:
+        """Load a JSON gazetteer of the form ``{"ENTITY_TYPE": ["name", ...]}``."""
+        with open(path, "r", encoding="utf-8") as f:
+            gazetteer = json.load(f)
+        return sum(
+            self.add_entity_dictionary(language_code, entity_type, names)
+            for entity_type, names in gazetteer.items()
+        )
+    
+    def get_entity_dictionary(self, language_code: str) -> Dict[str, List[str]]:
+        """Get extra dictionary names for a language, keyed by entity type."""
+        return self.entity_dictionaries.get(language_code.lower(), {})
+    
+    def clear_entity_dictionaries(self, language_code: str = None):
+        """Remove extra dictionary names for one language or all languages."""
+        if language_code:
+            self.entity_dictionaries.pop(language_code.lower(), None)
+        else:
+            self.entity_dictionaries.clear()
+        self.version += 1
+
 
 # Global instance
 entity_types_config = EntityTypesConfig()
@@ -7,6 +7,8 @@ to handle different languages properly without conflicts.
 from typing import Dict, List, Any
 import re
 
+from src.core.pattern_engine import pattern_engine
+
 
 # Enhanced Language-specific regex patterns for entity extraction (Phase 3)
 LANGUAGE_REGEX_PATTERNS = {
@@ -737,11 +739,8 @@ def detect_language_from_text(text: str) -> str:
     language_scores = {}
     
     for lang, patterns in LANGUAGE_DETECTION_PATTERNS.items():
-        score = 0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            score += matches
-        language_scores[lang] = score
+        pattern_set = pattern_engine.get(f"language_detection:{lang}", [(lang, p) for p in patterns], re.IGNORECASE)
+        language_scores[lang] = pattern_set.count(text)
     
     # Return the language with the highest score
     if language_scores:
@@ -8,7 +8,7 @@ Configuration settings for real-time analytics dashboard features including:
 - Alert management
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 
 
@@ -20,6 +20,12 @@ class StreamProcessingConfig(BaseModel):
     batch_size: int = Field(default=100, description="Batch size for processing")
     processing_interval: float = Field(default=0.1, description="Processing interval in seconds")
     max_latency: float = Field(default=1.0, description="Maximum processing latency in seconds")
+    max_batch_wait: float = Field(default=0.01, description="Seconds to wait for a micro-batch to fill")
+    overflow_policy: str = Field(
+        default="drop_oldest",
+        description="Full queue policy: block, drop_newest or drop_oldest"
+    )
+    enqueue_timeout: Optional[float] = Field(default=None, description="Seconds a blocked producer waits")
     
     # Data quality settings
     enable_validation: bool = Field(default=True, description="Enable data validation")
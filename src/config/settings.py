@@ -122,6 +122,29 @@ class ReportGenerationConfig(BaseModel):
     dpi: int = 300
 
 
+class KnowledgeGraphProcessingConfig(BaseModel):
+    """Configuration for knowledge graph document ingest and analytics."""
+    
+    # Chunk entity extraction runs concurrently, bounded to limit LLM load
+    max_concurrent_chunk_extractions: int = 8
+    chunk_extraction_retries: int = 2
+    chunk_retry_backoff: float = 0.5  # seconds, doubled per retry
+    
+    # Existing graph entities offered to relationship extraction are limited
+    # to those mentioned in the document, capped at this many
+    max_relationship_candidates: int = 200
+    
+    # Entity path search stops at these bounds instead of enumerating every path
+    max_path_length: int = 6
+    max_paths_returned: int = 5
+    path_count_limit: int = 10000
+    path_search_timeout: float = 5.0  # seconds
+    
+    # Centrality metrics are recomputed once the graph grows by this fraction
+    metrics_staleness: float = 0.05
+    betweenness_samples: int = 64
+
+
 class ProjectPathsConfig(BaseModel):
     """Configuration for project paths and directories."""
     
@@ -176,6 +199,11 @@ class Settings(BaseModel):
         default_factory=ReportGenerationConfig
     )
     
+    # Knowledge graph ingest
+    knowledge_graph_processing: KnowledgeGraphProcessingConfig = Field(
+        default_factory=KnowledgeGraphProcessingConfig
+    )
+    
     # Project paths
     paths: ProjectPathsConfig = Field(
         default_factory=ProjectPathsConfig
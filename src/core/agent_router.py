@@ -0,0 +1,221 @@
+"""
+Agent Router
+
+Routing table for the orchestrator's agents, built at registration time:
+- agents are indexed by the data types they register for and by their
+  capability tags, so routing only visits candidate agents
+- equivalent agents (same class, model and data types) form a pool, and
+  requests are dispatched across the pool by least-in-flight or round-robin
+- each agent has a concurrency limit; leases wait for a free slot
+- lazily built agents (``LazyAgent``) are indexed without being built; their
+  capability tags, model and capacity are picked up once they load
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.core.lazy_loader import LazyAgent
+from src.core.models import AnalysisRequest, DataType
+
+LEAST_IN_FLIGHT = "least_in_flight"
+ROUND_ROBIN = "round_robin"
+
+
+class AgentPool:
+    """Interchangeable agents with per-agent in-flight counts and limits."""
+
+    def __init__(self, key: Tuple, policy: str = LEAST_IN_FLIGHT):
+        self.key = key
+        self.policy = policy
+        # Unknown for lazy agents until they load
+        self.model_name: Optional[str] = key[1]
+        self.agents: List[Any] = []
+        self.in_flight: Dict[str, int] = {}
+        self.limits: Dict[str, int] = {}
+        self._cursor = 0
+
+    @property
+    def representative(self) -> Any:
+        return self.agents[0]
+
+    def add(self, agent: Any, max_concurrency: int):
+        self.agents.append(agent)
+        self.in_flight[agent.agent_id] = 0
+        self.limits[agent.agent_id] = max_concurrency
+
+    def select(self) -> Any:
+        """Pick an agent by the pool policy, preferring agents below their limit"""
+        count = len(self.agents)
+        order = [self.agents[(self._cursor + i) % count] for i in range(count)]
+        available = [a for a in order if self.in_flight[a.agent_id] < self.limits[a.agent_id]] or order
+        if self.policy == ROUND_ROBIN:
+            agent = available[0]
+        else:
+            # min() keeps the first of equally loaded agents, i.e. round-robin among ties
+            agent = min(available, key=lambda a: self.in_flight[a.agent_id] / self.limits[a.agent_id])
+        self._cursor = (self.agents.index(agent) + 1) % count
+        return agent
+
+
+class AgentRouter:
+    """Indexed, load-aware selection of agents for analysis requests."""
+
+    def __init__(self, policy: str = LEAST_IN_FLIGHT, default_max_concurrency: int = 10):
+        if policy not in (LEAST_IN_FLIGHT, ROUND_ROBIN):
+            raise ValueError(f"Unknown routing policy: {policy}")
+        self.policy = policy
+        self.default_max_concurrency = default_max_concurrency
+        self.agents: Dict[str, Any] = {}
+        self.pools: Dict[Tuple, AgentPool] = {}
+        self._type_index: Dict[DataType, List[AgentPool]] = {}
+        self._capability_index: Dict[str, List[AgentPool]] = {}
+        self._agent_pools: Dict[str, AgentPool] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    def register(self, agent: Any, supported_types: List[DataType], max_concurrency: Optional[int] = None):
+        """Index an agent by data type and capability tags
+
+        ``max_concurrency`` defaults to the agent's ``max_capacity``. A
+        ``LazyAgent`` is not built here: it is keyed by its agent type, and
+        its capabilities, model name and ``max_capacity`` are applied when it
+        loads.
+        """
+        lazy = isinstance(agent, LazyAgent)
+        if lazy:
+            agent_type, model_name, capacity = agent.agent_type, None, None
+        else:
+            agent_type = type(agent)
+            model_name = getattr(agent, "model_name", None)
+            capacity = getattr(agent, "max_capacity", None)
+        limit = max_concurrency or capacity or self.default_max_concurrency
+        key = (agent_type, model_name, tuple(sorted(dt.value for dt in supported_types)))
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = AgentPool(key, self.policy)
+            for data_type in supported_types:
+                self._type_index.setdefault(data_type, []).append(pool)
+            if not lazy:
+                self._index_capabilities(pool, agent)
+
+        pool.add(agent, limit)
+        self.agents[agent.agent_id] = agent
+        self._agent_pools[agent.agent_id] = pool
+        self._slots[agent.agent_id] = asyncio.Semaphore(limit)
+        if lazy:
+            agent.on_load(lambda instance: self._apply_loaded(pool, agent, instance, max_concurrency))
+
+    def candidate_pools(self, data_type: DataType, capability: Optional[str] = None) -> List[AgentPool]:
+        """Pools registered for ``data_type`` (and ``capability``), in registration order"""
+        pools = self._type_index.get(data_type, [])
+        if capability:
+            tagged = self._capability_index.get(capability, [])
+            pools = [pool for pool in pools if pool in tagged]
+        return pools
+
+    async def route(self, request: AnalysisRequest) -> Optional[Any]:
+        """Select an agent for the request
+
+        The first pool (in registration order) whose agents accept the
+        request wins; a model preference moves loaded pools of that model
+        first. Lazy agents only report their model once built, so unbuilt
+        pools are tried after the loaded ones and are not built just to be
+        sorted. Agents that did not register for the data type are only
+        consulted when no indexed agent accepts it.
+        """
+        capability = request.metadata.get("capability")
+        pools = list(self._type_index.get(request.data_type, []))
+        if request.model_preference:
+            loaded = [pool for pool in pools if _is_loaded(pool)]
+            loaded.sort(key=lambda pool: pool.model_name != request.model_preference)
+            pools = loaded + [pool for pool in pools if not _is_loaded(pool)]
+
+        for pool in pools:
+            if not self._load(pool):
+                continue
+            # Lazy agents' capability tags are only known once they are built
+            if capability and pool not in self._capability_index.get(capability, []):
+                continue
+            if await _can_process(pool.representative, request):
+                return pool.select()
+
+        indexed = {id(pool) for pool in self._type_index.get(request.data_type, [])}
+        for pool in list(self.pools.values()):
+            if id(pool) in indexed or not self._load(pool):
+                continue
+            if await _can_process(pool.representative, request):
+                logger.debug(
+                    f"Agent {pool.representative.agent_id} accepts {request.data_type.value} "
+                    f"without registering for it"
+                )
+                return pool.select()
+        return None
+
+    @asynccontextmanager
+    async def lease(self, agent: Any) -> AsyncIterator[Any]:
+        """Hold one of the agent's concurrency slots while processing"""
+        pool = self._agent_pools.get(agent.agent_id)
+        if pool is None:
+            yield agent
+            return
+
+        pool.in_flight[agent.agent_id] += 1
+        try:
+            async with self._slots[agent.agent_id]:
+                yield agent
+        finally:
+            pool.in_flight[agent.agent_id] -= 1
+
+    def _apply_loaded(self, pool: AgentPool, agent: Any, instance: Any, max_concurrency: Optional[int]):
+        """Take over a loaded lazy agent's capabilities, model and capacity"""
+        self._index_capabilities(pool, instance)
+        if pool.model_name is None:
+            pool.model_name = getattr(instance, "model_name", None)
+        limit = max_concurrency or getattr(instance, "max_capacity", None) or self.default_max_concurrency
+        # Agents load while being routed, before any lease holds their slots
+        if limit != pool.limits[agent.agent_id] and pool.in_flight[agent.agent_id] == 0:
+            pool.limits[agent.agent_id] = limit
+            self._slots[agent.agent_id] = asyncio.Semaphore(limit)
+
+    def _index_capabilities(self, pool: AgentPool, agent: Any):
+        for capability in agent.metadata.get("capabilities", []):
+            if isinstance(capability, str) and pool not in self._capability_index.get(capability, []):
+                self._capability_index.setdefault(capability, []).append(pool)
+
+    def _load(self, pool: AgentPool) -> bool:
+        """Build a lazy pool representative; pools whose agent fails to build are dropped"""
+        agent = pool.representative
+        if not isinstance(agent, LazyAgent):
+            return True
+        try:
+            agent.instance
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Agent {agent.agent_id} not available: {e}")
+            self._discard(pool)
+            return False
+
+    def _discard(self, pool: AgentPool):
+        self.pools.pop(pool.key, None)
+        for index in (self._type_index, self._capability_index):
+            for pools in index.values():
+                if pool in pools:
+                    pools.remove(pool)
+
+    def get_load(self, agent_id: str) -> Dict[str, int]:
+        pool = self._agent_pools[agent_id]
+        return {"in_flight": pool.in_flight[agent_id], "max_concurrency": pool.limits[agent_id]}
+
+
+def _is_loaded(pool: AgentPool) -> bool:
+    agent = pool.representative
+    return not isinstance(agent, LazyAgent) or agent.is_loaded
+
+
+async def _can_process(agent: Any, request: AnalysisRequest) -> bool:
+    # Handle both async and sync can_process methods
+    if asyncio.iscoroutinefunction(agent.can_process):
+        return await agent.can_process(request)
+    return agent.can_process(request)
@@ -0,0 +1,97 @@
+"""
+Concurrent Chunk Processor
+Bounded-concurrency execution of per-chunk coroutines (e.g. LLM extraction
+calls) with per-chunk retry, ordered results and progress reporting.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+
+@dataclass
+class ChunkOutcome:
+    """Result of processing one chunk."""
+    chunk_id: int
+    result: Any = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class ConcurrentChunkProcessor:
+    """Run a coroutine over many chunks with at most ``max_concurrency`` in flight.
+
+    Each chunk is retried up to ``max_retries`` times with exponential
+    backoff. Outcomes are returned in chunk order regardless of completion
+    order, so ``chunk_id`` always matches the chunk's position.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = 8,
+                 max_retries: int = 2,
+                 retry_backoff: float = 0.5):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    async def process(self,
+                      chunks: Sequence[Any],
+                      worker: Callable[[Any], Awaitable[Any]],
+                      progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+                      ) -> List[ChunkOutcome]:
+        """Process every chunk and return outcomes ordered by ``chunk_id``"""
+        total = len(chunks)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outcomes: List[Optional[ChunkOutcome]] = [None] * total
+        counters = {"completed": 0, "failed": 0}
+        start = time.perf_counter()
+
+        async def run(chunk_id: int, chunk: Any):
+            async with semaphore:
+                outcome = await self._run_with_retry(chunk_id, chunk, worker)
+            outcomes[chunk_id] = outcome
+            counters["completed"] += 1
+            if not outcome.succeeded:
+                counters["failed"] += 1
+
+            if progress_callback is not None:
+                progress = progress_callback({
+                    "chunk_id": chunk_id,
+                    "completed": counters["completed"],
+                    "failed": counters["failed"],
+                    "total": total,
+                    "elapsed": time.perf_counter() - start
+                })
+                if asyncio.iscoroutine(progress):
+                    await progress
+
+        await asyncio.gather(*(run(i, chunk) for i, chunk in enumerate(chunks)))
+        return outcomes
+
+    async def _run_with_retry(self,
+                              chunk_id: int,
+                              chunk: Any,
+                              worker: Callable[[Any], Awaitable[Any]]) -> ChunkOutcome:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                return ChunkOutcome(chunk_id, await worker(chunk), attempts)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempts > self.max_retries:
+                    logger.error(f"Chunk {chunk_id} failed after {attempts} attempts: {e}")
+                    return ChunkOutcome(chunk_id, None, attempts, str(e))
+                delay = self.retry_backoff * (2 ** (attempts - 1))
+                logger.warning(f"Chunk {chunk_id} attempt {attempts} failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
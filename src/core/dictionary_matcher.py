@@ -0,0 +1,157 @@
+"""
+Dictionary Matcher
+Aho-Corasick multi-pattern matching for entity dictionaries and gazetteers.
+
+A matcher is compiled once from any number of (term, value) entries and
+then finds every occurrence of every term in a single pass over the text,
+so lookup cost depends on the text length and the number of hits rather
+than on the dictionary size. Compiled matchers are shared through
+``get_dictionary_matcher`` and rebuilt when their source version changes.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class DictionaryMatch:
+    """One dictionary hit; ``end`` is exclusive."""
+    start: int
+    end: int
+    term: str
+    value: Any
+    entry: int
+
+
+class DictionaryMatcher:
+    """Aho-Corasick automaton over dictionary terms.
+
+    Terms keep their insertion order as entry indices; the same term may
+    be added with several values (e.g. under two entity types) and then
+    reports one match per value. Repeats of a term with the same value are
+    ignored. Matching is case-insensitive unless
+    ``case_sensitive`` is set.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]] = (), case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.entries: List[Tuple[str, Any]] = []
+        self._lengths: List[int] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: Dict[int, List[int]] = {}
+        # Nearest terminal state along the failure chain (0 = none)
+        self._output_link: List[int] = [0]
+
+        for term, value in entries:
+            self._add(term, value)
+        self._build()
+
+    @classmethod
+    def from_dictionaries(cls, dictionaries: Dict[Any, Iterable[str]], case_sensitive: bool = False) -> "DictionaryMatcher":
+        """Build from ``{value: [terms]}``, e.g. entity type to names"""
+        return cls(
+            ((term, value) for value, terms in dictionaries.items() for term in terms),
+            case_sensitive=case_sensitive
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _normalize(self, text: str) -> str:
+        if self.case_sensitive:
+            return text
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Keep offsets aligned when a character lowercases to several
+            lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+        return lowered
+
+    def _add(self, term: str, value: Any):
+        key = self._normalize(term.strip()) if term else ""
+        if not key:
+            return
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._goto[state][char] = next_state
+            state = next_state
+        at_state = self._terminal.setdefault(state, [])
+        if any(self.entries[entry][1] == value for entry in at_state):
+            return
+        at_state.append(len(self.entries))
+        self.entries.append((term, value))
+        self._lengths.append(len(key))
+
+    def _build(self):
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        fail.extend([0] * (len(goto) - 1))
+        self._output_link.extend([0] * (len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                link = fail[child]
+                self._output_link[child] = link if link in terminal else self._output_link[link]
+
+    def _iter_hits(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield ``(end, entry)`` for every hit"""
+        goto, fail, terminal, output_link = self._goto, self._fail, self._terminal, self._output_link
+        state = 0
+        for position, char in enumerate(self._normalize(text), 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            hit = state if state in terminal else output_link[state]
+            while hit:
+                for entry in terminal[hit]:
+                    yield position, entry
+                hit = output_link[hit]
+
+    def iter_matches(self, text: str) -> Iterator[DictionaryMatch]:
+        """Yield every (possibly overlapping) hit in order of its end offset"""
+        for end, entry in self._iter_hits(text):
+            term, value = self.entries[entry]
+            yield DictionaryMatch(end - self._lengths[entry], end, term, value, entry)
+
+    def find_all(self, text: str) -> List[DictionaryMatch]:
+        return list(self.iter_matches(text))
+
+    def matched_entries(self, text: str) -> List[Tuple[str, Any]]:
+        """Distinct entries occurring in ``text``, in dictionary order"""
+        found = {entry for _, entry in self._iter_hits(text)}
+        return [self.entries[entry] for entry in sorted(found)]
+
+
+_MATCHERS: Dict[str, Tuple[Any, DictionaryMatcher]] = {}
+_MATCHERS_LOCK = threading.Lock()
+
+
+def get_dictionary_matcher(name: str, version: Any, build: Callable[[], DictionaryMatcher]) -> DictionaryMatcher:
+    """Return the shared matcher ``name``, rebuilding it when ``version`` changes"""
+    cached = _MATCHERS.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _MATCHERS_LOCK:
+        cached = _MATCHERS.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, build())
+            _MATCHERS[name] = cached
+        return cached[1]
+
+
+def clear_dictionary_matchers():
+    with _MATCHERS_LOCK:
+        _MATCHERS.clear()
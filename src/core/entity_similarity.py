@@ -0,0 +1,192 @@
+"""
+Entity Similarity
+Candidate generation and occurrence indexing for entity similarity and merging.
+
+Pairwise comparison of every entity is replaced by blocking:
+- ``group_by_containment`` reproduces the greedy "same name or one name
+  contains the other" merge using an Aho-Corasick pass over the names.
+- ``minhash_candidate_pairs`` buckets names by MinHash bands over their
+  character sets so only likely-similar pairs are compared.
+- ``EntityOccurrenceIndex`` records every entity occurrence and sentence in
+  one pass over the text so context lookups use precomputed offsets.
+"""
+
+import re
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.core.dictionary_matcher import DictionaryMatcher
+
+
+
+def group_by_containment(names: Sequence[str]) -> List[List[int]]:
+    """Greedy groups of indices whose lowercased names are equal or contain one another
+
+    Matches the quadratic merge: each not-yet-grouped name, in order,
+    absorbs every later ungrouped name it equals, contains or is contained
+    in. Cost is linear in the total name length plus the number of
+    containment pairs.
+    """
+    lowered = [(name or "").lower() for name in names]
+    indices_by_name: Dict[str, Set[int]] = defaultdict(set)
+    for index, name in enumerate(lowered):
+        indices_by_name[name].add(index)
+
+    distinct = [name for name in indices_by_name if name]
+    matcher = DictionaryMatcher(((name, name) for name in distinct), case_sensitive=True)
+    contains: Dict[str, Set[str]] = {}
+    contained_in: Dict[str, Set[str]] = defaultdict(set)
+    for name in distinct:
+        inner = {value for _, value in matcher.matched_entries(name)}
+        contains[name] = inner
+        for other in inner:
+            contained_in[other].add(name)
+
+    has_empty = "" in indices_by_name
+    groups = []
+    for index, name in enumerate(lowered):
+        members = indices_by_name[name]
+        if index not in members:
+            continue
+        members.discard(index)
+
+        if name:
+            neighbors = contains[name] | contained_in[name]
+            if has_empty:
+                # The empty name is a substring of every name
+                neighbors.add("")
+        else:
+            neighbors = set(indices_by_name)
+
+        group = [index]
+        for neighbor in neighbors:
+            absorbed = indices_by_name.get(neighbor)
+            if absorbed:
+                group.extend(absorbed)
+                absorbed.clear()
+        group[1:] = sorted(group[1:])
+        groups.append(group)
+    return groups
+
+
+def minhash_candidate_pairs(names: Sequence[str],
+                            num_perm: int = 32,
+                            bands: int = 8,
+                            seed: int = 1,
+                            max_bucket_size: Optional[int] = 200) -> Set[Tuple[int, int]]:
+    """Index pairs whose character sets likely have high Jaccard similarity
+
+    Uses ``bands`` bands of ``num_perm // bands`` MinHash rows; pairs with
+    Jaccard ``J`` collide with probability ``1 - (1 - J**r)**bands``. Buckets
+    larger than ``max_bucket_size`` (shared by very common characters) are
+    skipped to keep candidate generation near-linear.
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be a multiple of bands")
+    rows = num_perm // bands
+    rng = np.random.default_rng(seed)
+    # Multiply-shift hashing: odd multipliers, arithmetic wraps modulo 2**64
+    a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+    for index, name in enumerate(names):
+        shingles = {zlib.crc32(char.encode("utf-8")) for char in set(name or "")}
+        if not shingles:
+            continue
+        values = np.fromiter(shingles, dtype=np.uint64)
+        hashed = (np.multiply.outer(values, a) + b) >> np.uint64(32)
+        signature = hashed.min(axis=0)
+        for band in range(bands):
+            buckets[(band, signature[band * rows:(band + 1) * rows].tobytes())].append(index)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2 or (max_bucket_size is not None and len(members) > max_bucket_size):
+            continue
+        for position, first in enumerate(members):
+            for second in members[position + 1:]:
+                pairs.add((first, second))
+    return pairs
+
+
+def proximity_candidate_pairs(positions: Sequence[Optional[int]],
+                              max_distance: float,
+                              max_neighbors: int = 20) -> Set[Tuple[int, int]]:
+    """Index pairs whose positions lie within ``max_distance``, at most ``max_neighbors`` per item"""
+    located = sorted((position, index) for index, position in enumerate(positions) if position is not None)
+    pairs: Set[Tuple[int, int]] = set()
+    for rank, (position, index) in enumerate(located):
+        for other_position, other in located[rank + 1:rank + 1 + max_neighbors]:
+            if other_position - position >= max_distance:
+                break
+            pairs.add((min(index, other), max(index, other)))
+    return pairs
+
+
+class EntityOccurrenceIndex:
+    """Occurrences of a set of terms and the sentences they fall in, from one pass over ``text``.
+
+    Lookups mirror ``str.find`` (first occurrence) and ``term in sentence``
+    for sentences split on ``sentence_pattern``.
+    """
+
+    def __init__(self, text: str, terms: Iterable[str], sentence_pattern: str = r'[。！？]'):
+        self.text = text
+        self._starts: Dict[str, List[int]] = defaultdict(list)
+        matcher = DictionaryMatcher(((term, term) for term in set(terms) if term), case_sensitive=True)
+        for match in matcher.iter_matches(text):
+            self._starts[match.value].append(match.start)
+        for starts in self._starts.values():
+            starts.sort()
+
+        # Sentence k starts at _sentence_starts[k]; delimiters are dropped like re.split
+        self.sentences: List[str] = []
+        self._sentence_starts: List[int] = []
+        position = 0
+        for delimiter in re.finditer(sentence_pattern, text):
+            self._add_sentence(position, delimiter.start())
+            position = delimiter.end()
+        self._add_sentence(position, len(text))
+
+        self._sentence_ids: Dict[str, Set[int]] = {}
+
+    def _add_sentence(self, start: int, end: int):
+        self._sentence_starts.append(start)
+        self.sentences.append(self.text[start:end])
+
+    def positions(self, term: str) -> List[int]:
+        return self._starts.get(term, [])
+
+    def first_position(self, term: str) -> int:
+        """Like ``text.find(term)``: the first occurrence, or -1"""
+        if not term:
+            return 0
+        starts = self._starts.get(term)
+        return starts[0] if starts else -1
+
+    def sentence_ids(self, term: str) -> Set[int]:
+        """Ids of sentences that contain ``term`` entirely"""
+        if not term:
+            return set(range(len(self.sentences)))
+        ids = self._sentence_ids.get(term)
+        if ids is None:
+            ids = set()
+            for start in self._starts.get(term, ()):
+                sentence = bisect_right(self._sentence_starts, start) - 1
+                if start + len(term) <= self._sentence_starts[sentence] + len(self.sentences[sentence]):
+                    ids.add(sentence)
+            self._sentence_ids[term] = ids
+        return ids
+
+    def occurs_between(self, term: str, start: int, end: int) -> bool:
+        """Whether ``term`` occurs entirely inside ``text[start:end]``"""
+        starts = self._starts.get(term)
+        if not starts:
+            return False
+        position = bisect_left(starts, max(start, 0))
+        return position < len(starts) and starts[position] + len(term) <= end
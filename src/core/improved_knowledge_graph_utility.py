@@ -25,11 +25,20 @@ from src.core.models import (
     ProcessingStatus
 )
 from src.config.config import config
+from src.core.dictionary_matcher import DictionaryMatcher, get_dictionary_matcher
 
 
 class ImprovedKnowledgeGraphUtility:
     """Utility for improved entity extraction and knowledge graph creation."""
     
+    # Known entity category -> (entity type, confidence)
+    KNOWN_ENTITY_TYPES = {
+        "people": ("person", 0.9),
+        "organizations": ("organization", 0.9),
+        "locations": ("location", 0.9),
+        "events": ("event", 0.8)
+    }
+    
     def __init__(self, output_dir: str = "./Results"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -95,6 +104,15 @@ class ImprovedKnowledgeGraphUtility:
         
         logger.info(f"Improved Knowledge Graph Utility initialized with output directory: {self.output_dir}")
     
+    def _known_entity_matcher(self) -> DictionaryMatcher:
+        """Shared case-insensitive automaton over the predefined entity names."""
+        def build():
+            return DictionaryMatcher.from_dictionaries(
+                {category: self.known_entities.get(category, []) for category in self.KNOWN_ENTITY_TYPES}
+            )
+        
+        return get_dictionary_matcher("improved_kg_utility", None, build)
+    
     async def extract_entities_from_content(self, content: str) -> List[Dict]:
         """
         Extract entities from actual article content using predefined knowledge.
@@ -107,45 +125,15 @@ class ImprovedKnowledgeGraphUtility:
         """
         entities = []
         
-        # Extract people
-        for person in self.known_entities["people"]:
-            if person.lower() in content.lower():
-                entities.append({
-                    "name": person,
-                    "type": "person",
-                    "confidence": 0.9,
-                    "source": "predefined_knowledge"
-                })
-        
-        # Extract organizations
-        for org in self.known_entities["organizations"]:
-            if org.lower() in content.lower():
-                entities.append({
-                    "name": org,
-                    "type": "organization",
-                    "confidence": 0.9,
-                    "source": "predefined_knowledge"
-                })
-        
-        # Extract locations
-        for location in self.known_entities["locations"]:
-            if location.lower() in content.lower():
-                entities.append({
-                    "name": location,
-                    "type": "location",
-                    "confidence": 0.9,
-                    "source": "predefined_knowledge"
-                })
-        
-        # Extract events
-        for event in self.known_entities["events"]:
-            if event.lower() in content.lower():
-                entities.append({
-                    "name": event,
-                    "type": "event",
-                    "confidence": 0.8,
-                    "source": "predefined_knowledge"
-                })
+        # Match every known entity in one pass over the content
+        for name, category in self._known_entity_matcher().matched_entries(content):
+            entity_type, confidence = self.KNOWN_ENTITY_TYPES[category]
+            entities.append({
+                "name": name,
+                "type": entity_type,
+                "confidence": confidence,
+                "source": "predefined_knowledge"
+            })
         
         # Additional entity extraction from content
         content_entities = self._extract_additional_entities(content)
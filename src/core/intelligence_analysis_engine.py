@@ -19,7 +19,7 @@ import numpy as np
 from loguru import logger
 
 try:
-    import ollama
+    from src.core.ollama_client import get_ollama_client  # noqa: F401
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
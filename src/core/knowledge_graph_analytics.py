@@ -0,0 +1,184 @@
+"""
+Knowledge Graph Analytics
+Bounded path search and cached centrality metrics for the knowledge graph.
+
+Path search iterates paths lazily (shortest first) and stops at a path,
+length or time limit instead of materializing every simple path. Centrality
+metrics are computed once and reused until the graph has changed by more
+than a tolerated fraction; degree centrality is always exact and O(1).
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import networkx as nx
+from loguru import logger
+
+
+def bounded_path_search(graph: nx.Graph,
+                        source: Any,
+                        target: Any,
+                        max_paths: int = 5,
+                        max_length: Optional[int] = None,
+                        count_limit: int = 10000,
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Shortest path, up to ``max_paths`` shortest simple paths and a path count
+
+    ``max_length`` bounds path length in edges. The count enumerates at most
+    ``count_limit`` paths; ``paths_count_exact`` is False when the count was
+    cut short by that limit or by ``timeout`` seconds elapsing.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def expired() -> bool:
+        return deadline is not None and time.monotonic() > deadline
+
+    try:
+        shortest_path = nx.shortest_path(graph, source, target)
+    except nx.NetworkXNoPath:
+        return {
+            "shortest_path": [],
+            "shortest_path_length": -1,
+            "paths": [],
+            "paths_count": 0,
+            "paths_count_exact": True,
+            "timed_out": False
+        }
+
+    shortest_length = len(shortest_path) - 1
+    if max_length is not None and shortest_length > max_length:
+        max_length = shortest_length
+
+    # Keep the shortest path even when it exceeds the requested bound
+    # Yen's algorithm yields paths in length order, one at a time
+    paths: List[List[Any]] = []
+    timed_out = False
+    for path in nx.shortest_simple_paths(graph, source, target):
+        if max_length is not None and len(path) - 1 > max_length:
+            break
+        paths.append(path)
+        if len(paths) >= max_paths:
+            break
+        if expired():
+            timed_out = True
+            break
+
+    count, exact = len(paths), False
+    if not timed_out:
+        count, exact, timed_out = _count_simple_paths(
+            graph, source, target, max_length, count_limit, deadline
+        )
+        count = max(count, len(paths))
+
+    return {
+        "shortest_path": shortest_path,
+        "shortest_path_length": shortest_length,
+        "paths": paths,
+        "paths_count": count,
+        "paths_count_exact": exact,
+        "timed_out": timed_out
+    }
+
+
+def _count_simple_paths(graph: nx.Graph,
+                        source: Any,
+                        target: Any,
+                        cutoff: Optional[int],
+                        limit: int,
+                        deadline: Optional[float]):
+    """Count simple paths by iterative DFS; returns ``(count, exact, timed_out)``
+
+    The deadline is checked every few hundred expansions, so dead-end
+    branches cannot stall the search between found paths.
+    """
+    successors = graph.successors if graph.is_directed() else graph.neighbors
+    cutoff = graph.number_of_nodes() - 1 if cutoff is None else cutoff
+    count = 0
+    steps = 0
+    path = [source]
+    visited = {source}
+    stack = [iter(successors(source))]
+    while stack:
+        steps += 1
+        if deadline is not None and steps % 512 == 0 and time.monotonic() > deadline:
+            return count, False, True
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        if child in visited:
+            continue
+        if child == target:
+            count += 1
+            if count > limit:
+                return limit, False, False
+            continue
+        if len(path) < cutoff:
+            path.append(child)
+            visited.add(child)
+            stack.append(iter(successors(child)))
+    return count, True, False
+
+
+class GraphMetricsCache:
+    """Lazily computed centrality metrics, reused while the graph is nearly unchanged.
+
+    A cached metric is recomputed once the node plus edge count has drifted
+    by more than ``staleness`` (a fraction of the size at compute time) or
+    after ``invalidate``. Nodes added since then report 0.0.
+    """
+
+    def __init__(self, staleness: float = 0.05, betweenness_samples: int = 64, seed: int = 42):
+        self.staleness = staleness
+        self.betweenness_samples = betweenness_samples
+        self.seed = seed
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    def invalidate(self):
+        self._cache.clear()
+
+    @staticmethod
+    def degree_centrality(graph: nx.Graph, node: Any) -> float:
+        """Exact ``nx.degree_centrality(graph)[node]`` without touching other nodes"""
+        n = graph.number_of_nodes()
+        if node not in graph:
+            return 0.0
+        return graph.degree(node) / (n - 1) if n > 1 else 1.0
+
+    def pagerank(self, graph: nx.Graph, node: Any = None):
+        values = self._get(graph, "pagerank", lambda: nx.pagerank(graph, max_iter=100, tol=1e-6))
+        return values if node is None else values.get(node, 0.0)
+
+    def betweenness(self, graph: nx.Graph, node: Any = None):
+        """Betweenness centrality, sampled from ``betweenness_samples`` sources on large graphs"""
+        def compute():
+            n = graph.number_of_nodes()
+            k = self.betweenness_samples if n > self.betweenness_samples else None
+            return nx.betweenness_centrality(graph, k=k, seed=self.seed)
+
+        values = self._get(graph, "betweenness", compute)
+        return values if node is None else values.get(node, 0.0)
+
+    def is_fresh(self, graph: nx.Graph, metric: str) -> bool:
+        entry = self._cache.get(metric)
+        if entry is None or entry["graph"] is not graph:
+            return False
+        size = graph.number_of_nodes() + graph.number_of_edges()
+        return abs(size - entry["size"]) <= self.staleness * max(entry["size"], 1)
+
+    def _get(self, graph: nx.Graph, metric: str, compute) -> Dict[Any, float]:
+        if not self.is_fresh(graph, metric):
+            start = time.perf_counter()
+            try:
+                values = compute() if graph.number_of_nodes() else {}
+            except nx.PowerIterationFailedConvergence as e:
+                logger.warning(f"{metric} did not converge: {e}")
+                values = {}
+            self._cache[metric] = {
+                "graph": graph,
+                "size": graph.number_of_nodes() + graph.number_of_edges(),
+                "values": values
+            }
+            logger.debug(f"Computed {metric} for {graph.number_of_nodes()} nodes in {time.perf_counter() - start:.2f}s")
+        return self._cache[metric]["values"]
@@ -0,0 +1,279 @@
+"""
+Knowledge Graph Index
+In-memory inverted index over knowledge graph nodes for subgraph queries.
+
+Node names and ``original_text`` are tokenized into words (matched by
+prefix) and, for CJK text, character unigrams and bigrams (matched as
+substrings). ``type``, ``domain`` and ``language`` attributes are kept as
+facets. The index is updated per node insertion so queries cost time
+proportional to the matches rather than to the graph.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+
+FACETS = ("type", "domain", "language")
+
+_CJK_RANGES = (
+    "\u3040-\u30ff"  # Hiragana, Katakana
+    "\u3400-\u4dbf"  # CJK Extension A
+    "\u4e00-\u9fff"  # CJK Unified Ideographs
+    "\uac00-\ud7af"  # Hangul syllables
+    "\uf900-\ufaff"  # CJK compatibility ideographs
+)
+_CJK_RUN = re.compile(f"[{_CJK_RANGES}]+")
+_WORD = re.compile(f"[^\\W{_CJK_RANGES}]+")
+
+
+def _is_cjk(term: str) -> bool:
+    return bool(_CJK_RUN.fullmatch(term))
+
+
+def tokenize(text: str) -> Set[str]:
+    """Index tokens of ``text``: lowercase words plus CJK unigrams and bigrams"""
+    text = text.lower()
+    tokens = set(_WORD.findall(text))
+    for run in _CJK_RUN.findall(text):
+        tokens.update(run)
+        tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def split_query(query: str) -> List[str]:
+    """Split a query into terms; CJK runs stay whole and match as substrings"""
+    query = query.lower()
+    return _WORD.findall(query) + _CJK_RUN.findall(query)
+
+
+class GraphInvertedIndex:
+    """Token and facet postings for the nodes of a knowledge graph.
+
+    Call ``add_node`` after adding a node and ``update_node`` after changing
+    its attributes; ``rebuild`` indexes a whole graph (used after loading).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._postings: Dict[str, Set[Any]] = {}
+        self._vocabulary: List[str] = []
+        self._facets: Dict[str, Dict[str, Set[Any]]] = {facet: {} for facet in FACETS}
+        self._node_tokens: Dict[Any, Set[str]] = {}
+        self._node_facets: Dict[Any, Dict[str, str]] = {}
+        self._node_aliases: Dict[Any, List[Tuple[str, Set[str]]]] = {}
+        self.name_chars = 0
+
+    def __len__(self) -> int:
+        return len(self._node_tokens)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._node_tokens
+
+    def rebuild(self, graph: nx.Graph):
+        self.reset()
+        for node, attrs in graph.nodes(data=True):
+            self._index(node, attrs)
+        self._vocabulary = sorted(self._postings)
+
+    def matches(self, graph: nx.Graph) -> bool:
+        """Cheap consistency check against a graph mutated outside the agent"""
+        return len(self) == graph.number_of_nodes()
+
+    # Updates
+
+    def add_node(self, node: Any, attrs: Dict[str, Any]):
+        if node in self._node_tokens:
+            self.update_node(node, attrs)
+            return
+        self._index(node, attrs, keep_vocabulary_sorted=True)
+
+    def update_node(self, node: Any, attrs: Dict[str, Any]):
+        """Re-index ``node`` from its full, current attributes"""
+        self._unindex(node)
+        self._index(node, attrs, keep_vocabulary_sorted=True)
+
+    def _index(self, node: Any, attrs: Dict[str, Any], keep_vocabulary_sorted: bool = False):
+        aliases = []
+        for alias in (str(node), attrs.get("original_text")):
+            alias = str(alias).strip().lower() if alias else ""
+            if alias and all(alias != existing for existing, _ in aliases):
+                aliases.append((alias, tokenize(alias)))
+        tokens = set().union(*(alias_tokens for _, alias_tokens in aliases))
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                if keep_vocabulary_sorted:
+                    insort(self._vocabulary, token)
+            postings.add(node)
+
+        facets = {}
+        for facet in FACETS:
+            value = attrs.get(facet)
+            if value:
+                value = str(value).lower()
+                self._facets[facet].setdefault(value, set()).add(node)
+                facets[facet] = value
+
+        self._node_tokens[node] = tokens
+        self._node_facets[node] = facets
+        self._node_aliases[node] = aliases
+        self.name_chars += len(str(node))
+
+    def _unindex(self, node: Any):
+        for token in self._node_tokens.pop(node, ()):
+            postings = self._postings[token]
+            postings.discard(node)
+            if not postings:
+                del self._postings[token]
+                position = bisect_left(self._vocabulary, token)
+                if position < len(self._vocabulary) and self._vocabulary[position] == token:
+                    del self._vocabulary[position]
+        for facet, value in self._node_facets.pop(node, {}).items():
+            nodes = self._facets[facet][value]
+            nodes.discard(node)
+            if not nodes:
+                del self._facets[facet][value]
+        if self._node_aliases.pop(node, None) is not None:
+            self.name_chars -= len(str(node))
+
+    # Queries
+
+    def term_nodes(self, term: str) -> Set[Any]:
+        """Nodes matching one query term by text or by type/domain facet"""
+        term = term.lower()
+        if _is_cjk(term):
+            nodes = self._cjk_nodes(term)
+        else:
+            nodes = self._prefix_nodes(term)
+        for facet in ("type", "domain"):
+            nodes |= self._facets[facet].get(term, set())
+        return nodes
+
+    def _prefix_nodes(self, prefix: str) -> Set[Any]:
+        nodes: Set[Any] = set()
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(prefix):
+            nodes |= self._postings[self._vocabulary[position]]
+            position += 1
+        return nodes
+
+    def _cjk_nodes(self, term: str) -> Set[Any]:
+        if len(term) <= 2:
+            return set(self._postings.get(term, ()))
+        grams = sorted((term[i:i + 2] for i in range(len(term) - 1)),
+                       key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set(self._postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._postings.get(gram, set())
+        # Bigram hits can be scattered; confirm the full term occurs
+        return {node for node in candidates
+                if any(term in alias for alias, _ in self._node_aliases[node])}
+
+    def facet_nodes(self, facet: str, values: Iterable[str]) -> Set[Any]:
+        postings = self._facets[facet]
+        nodes: Set[Any] = set()
+        for value in values:
+            nodes |= postings.get(str(value).lower(), set())
+        return nodes
+
+    def search(self,
+               query: str,
+               mode: str = "or",
+               types: Optional[Iterable[str]] = None,
+               domains: Optional[Iterable[str]] = None,
+               languages: Optional[Iterable[str]] = None) -> Set[Any]:
+        """Nodes matching any (``mode="or"``) or all (``mode="and"``) query terms
+
+        Query terms of the form ``type:PERSON``, ``domain:...`` or
+        ``language:zh`` act as facet filters, like the keyword arguments.
+        """
+        if mode not in ("and", "or"):
+            raise ValueError(f"Unknown query mode: {mode}")
+
+        filters = {
+            "type": set(types or ()),
+            "domain": set(domains or ()),
+            "language": set(languages or ()),
+        }
+        terms = []
+        for part in query.split():
+            facet, sep, value = part.partition(":")
+            if sep and facet.lower() in filters and value:
+                filters[facet.lower()].add(value)
+            else:
+                terms.extend(split_query(part))
+
+        result: Optional[Set[Any]] = None
+        # Rarest terms first keeps AND intersections small
+        for nodes in sorted((self.term_nodes(term) for term in terms), key=len):
+            if result is None:
+                result = set(nodes)
+            elif mode == "and":
+                result &= nodes
+            else:
+                result |= nodes
+            if mode == "and" and not result:
+                return set()
+
+        for facet, values in filters.items():
+            if not values:
+                continue
+            allowed = self.facet_nodes(facet, values)
+            result = allowed if result is None else result & allowed
+
+        return result or set()
+
+    def mentioned_nodes(self, text: str) -> Set[Any]:
+        """Nodes whose name or ``original_text`` occurs verbatim in ``text``
+
+        Candidates come from the postings of the text's own tokens, so the
+        cost follows the document rather than the graph. Names that are a
+        single CJK character are not matched (their postings are too broad).
+        """
+        lowered = text.lower()
+        doc_tokens = tokenize(lowered)
+        candidates: Set[Any] = set()
+        for token in doc_tokens:
+            if len(token) == 1 and _is_cjk(token):
+                continue
+            candidates |= self._postings.get(token, set())
+
+        mentioned = set()
+        for node in candidates:
+            for alias, alias_tokens in self._node_aliases[node]:
+                # Token containment is a cheap filter before the substring test
+                if alias_tokens <= doc_tokens and alias in lowered:
+                    mentioned.add(node)
+                    break
+        return mentioned
+
+    @staticmethod
+    def expand(graph: nx.Graph,
+               nodes: Iterable[Any],
+               hops: int = 1,
+               max_nodes: Optional[int] = None) -> Set[Any]:
+        """Add every node within ``hops`` edges (either direction) of ``nodes``"""
+        seen = {node for node in nodes if node in graph}
+        frontier = deque((node, 0) for node in seen)
+        directed = graph.is_directed()
+        while frontier:
+            node, depth = frontier.popleft()
+            if depth >= hops:
+                continue
+            neighbors = graph.succ[node].keys() | graph.pred[node].keys() if directed else graph[node].keys()
+            for neighbor in neighbors:
+                if neighbor in seen:
+                    continue
+                if max_nodes is not None and len(seen) >= max_nodes:
+                    return seen
+                seen.add(neighbor)
+                frontier.append((neighbor, depth + 1))
+        return seen
@@ -0,0 +1,291 @@
+"""
+Knowledge Graph Store
+Append-only persistence and incrementally maintained statistics for the
+knowledge graph.
+
+The graph is persisted as a pickle snapshot plus an append-only JSON-lines
+log of node and edge upserts. Each ingest batch appends only its own
+operations; the log is folded into a fresh snapshot once it grows past a
+threshold, so ingest cost scales with the batch rather than the graph.
+"""
+
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import networkx as nx
+from loguru import logger
+
+
+class IncrementalGraphStats:
+    """Graph statistics updated per node/edge insertion.
+
+    Tracks node/edge counts, per-language counts, weakly connected
+    components (union-find) and exact average clustering of the undirected
+    view (per-node triangle counts), matching what ``nx.density``,
+    ``nx.number_connected_components`` and ``nx.average_clustering`` report
+    for ``graph.to_undirected()``.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.num_nodes = 0
+        self.num_edges = 0
+        self.languages: Dict[str, Dict[str, int]] = {}
+        self._parent: Dict[Any, Any] = {}
+        self._size: Dict[Any, int] = {}
+        self.components = 0
+        self._triangles: Dict[Any, int] = {}
+        self._degree: Dict[Any, int] = {}
+        self._clustering_sum = 0.0
+
+    def rebuild(self, graph: nx.DiGraph):
+        """Recompute every statistic from scratch (used after loading)"""
+        self.reset()
+        for node, attrs in graph.nodes(data=True):
+            self._add_node(node, attrs.get("language", "unknown"))
+
+        undirected = graph.to_undirected(as_view=True)
+        triangles = nx.triangles(undirected) if len(undirected) else {}
+        for node in graph.nodes:
+            self._degree[node] = len(set(undirected[node]) - {node})
+            self._triangles[node] = triangles.get(node, 0)
+            self._clustering_sum += self._local_clustering(node)
+
+        for source, target, attrs in graph.edges(data=True):
+            self.num_edges += 1
+            self._count_language(attrs.get("language", "unknown"), "edges")
+            self._union(source, target)
+
+    # Node updates
+
+    def node_added(self, node: Any, attrs: Dict[str, Any]):
+        """Call after a new node has been added to the graph"""
+        self._add_node(node, attrs.get("language", "unknown"))
+        self._degree[node] = 0
+        self._triangles[node] = 0
+
+    def node_language_changed(self, old_language: Optional[str], new_language: str):
+        self._count_language(old_language or "unknown", "nodes", -1)
+        self._count_language(new_language, "nodes")
+
+    # Edge updates
+
+    def edge_added(self, graph: nx.DiGraph, source: Any, target: Any, attrs: Dict[str, Any]):
+        """Call *before* adding a new directed edge whose endpoints already exist"""
+        self.num_edges += 1
+        self._count_language(attrs.get("language", "unknown"), "edges")
+        self._union(source, target)
+
+        already_adjacent = graph.has_edge(target, source)
+        if source == target or already_adjacent:
+            return
+
+        # A new undirected edge closes one triangle per common neighbour
+        common = self._neighbors(graph, source) & self._neighbors(graph, target)
+        common.discard(source)
+        common.discard(target)
+        affected = {source, target} | common
+
+        self._clustering_sum -= sum(self._local_clustering(n) for n in affected)
+        self._degree[source] += 1
+        self._degree[target] += 1
+        self._triangles[source] += len(common)
+        self._triangles[target] += len(common)
+        for node in common:
+            self._triangles[node] += 1
+        self._clustering_sum += sum(self._local_clustering(n) for n in affected)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Statistics in the shape returned by ``KnowledgeGraphAgent._get_graph_stats``"""
+        n = self.num_nodes
+        if n == 0:
+            return {"nodes": 0, "edges": 0, "density": 0, "languages": {}}
+        return {
+            "nodes": n,
+            "edges": self.num_edges,
+            "density": self.num_edges / (n * (n - 1)) if n > 1 else 0,
+            "languages": {lang: dict(counts) for lang, counts in self.languages.items()},
+            "total_languages": len(self.languages),
+            "average_clustering": max(self._clustering_sum, 0.0) / n,
+            "connected_components": self.components
+        }
+
+    def matches(self, graph: nx.DiGraph) -> bool:
+        """Cheap consistency check against a graph mutated outside the store"""
+        return (self.num_nodes == graph.number_of_nodes()
+                and self.num_edges == graph.number_of_edges())
+
+    # Internals
+
+    @staticmethod
+    def _neighbors(graph: nx.DiGraph, node: Any) -> Set[Any]:
+        return set(graph.succ[node]) | set(graph.pred[node])
+
+    def _local_clustering(self, node: Any) -> float:
+        degree = self._degree.get(node, 0)
+        if degree < 2:
+            return 0.0
+        return 2.0 * self._triangles.get(node, 0) / (degree * (degree - 1))
+
+    def _add_node(self, node: Any, language: str):
+        self.num_nodes += 1
+        self._count_language(language, "nodes")
+        self._parent[node] = node
+        self._size[node] = 1
+        self.components += 1
+
+    def _count_language(self, language: str, kind: str, delta: int = 1):
+        counts = self.languages.setdefault(language, {"nodes": 0, "edges": 0})
+        counts[kind] += delta
+
+    def _find(self, node: Any) -> Any:
+        root = node
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[node] != root:
+            self._parent[node], node = root, self._parent[node]
+        return root
+
+    def _union(self, a: Any, b: Any):
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        self.components -= 1
+
+
+class AppendOnlyGraphStore:
+    """Snapshot + append-only operation log for a ``networkx.DiGraph``.
+
+    Operations are buffered by ``add_node``/``update_node``/``add_edge`` and
+    written by ``flush`` as one append. ``maybe_compact`` rewrites the
+    snapshot and truncates the log once it holds ``compact_threshold``
+    operations. A torn final log line (e.g. from a crash mid-write) is
+    ignored on load.
+    """
+
+    def __init__(self,
+                 storage_dir: Path,
+                 snapshot_name: str = "knowledge_graph.pkl",
+                 log_name: str = "knowledge_graph.log.jsonl",
+                 compact_threshold: int = 100000,
+                 fsync: bool = False):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshot_file = self.storage_dir / snapshot_name
+        self.log_file = self.storage_dir / log_name
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.log_entries = 0
+        self._pending: List[str] = []
+
+    def load(self) -> nx.DiGraph:
+        """Load the snapshot and replay the log on top of it"""
+        graph = nx.DiGraph()
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, "rb") as f:
+                graph = pickle.load(f)
+
+        self.log_entries = 0
+        if self.log_file.exists():
+            self._truncate_torn_tail()
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        self._apply(graph, json.loads(line))
+                        self.log_entries += 1
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning(f"Skipping unreadable graph log entry at line {line_number}")
+        return graph
+
+    def _truncate_torn_tail(self):
+        """Drop a partially written last line so later appends start cleanly"""
+        size = self.log_file.stat().st_size
+        if size == 0:
+            return
+        with open(self.log_file, "rb+") as f:
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # Scan back to the last complete line
+            position = size - 1
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                block = f.read(step)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            f.truncate(position)
+        logger.warning("Discarded torn trailing entry in knowledge graph log")
+
+    def add_node(self, node: Any, attrs: Dict[str, Any]):
+        self._pending.append(self._encode({"op": "node", "id": node, "attrs": attrs}))
+
+    def update_node(self, node: Any, attrs: Dict[str, Any]):
+        """Record a partial attribute update; replay merges it into the node"""
+        self.add_node(node, attrs)
+
+    def add_edge(self, source: Any, target: Any, attrs: Dict[str, Any]):
+        self._pending.append(self._encode({"op": "edge", "source": source, "target": target, "attrs": attrs}))
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Append buffered operations to the log; returns the number written"""
+        if not self._pending:
+            return 0
+        written = len(self._pending)
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write("".join(self._pending))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._pending.clear()
+        self.log_entries += written
+        return written
+
+    def maybe_compact(self, graph: nx.DiGraph) -> bool:
+        if self.log_entries < self.compact_threshold:
+            return False
+        self.compact(graph)
+        return True
+
+    def compact(self, graph: nx.DiGraph):
+        """Write a fresh snapshot of ``graph`` and truncate the log"""
+        self.flush()
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.snapshot_file)
+        # The snapshot now contains every logged operation
+        with open(self.log_file, "w", encoding="utf-8"):
+            pass
+        self.log_entries = 0
+        logger.info(
+            f"Compacted knowledge graph snapshot: {graph.number_of_nodes()} nodes, "
+            f"{graph.number_of_edges()} edges"
+        )
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> str:
+        return json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+    @staticmethod
+    def _apply(graph: nx.DiGraph, entry: Dict[str, Any]):
+        if entry["op"] == "node":
+            graph.add_node(entry["id"], **entry["attrs"])
+        elif entry["op"] == "edge":
+            graph.add_edge(entry["source"], entry["target"], **entry["attrs"])
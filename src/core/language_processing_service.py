@@ -9,6 +9,10 @@ import re
 
 from src.config.language_config import LanguageConfigFactory, BaseLanguageConfig
 from src.core.error_handler import with_error_handling
+from src.core.pattern_engine import pattern_engine
+
+# Entities that are pure numbers, punctuation or whitespace
+_INVALID_ENTITY = re.compile(r'^(?:\d+|[^\w\s]+|\s+)$')
 
 
 class LanguageProcessingService:
@@ -61,23 +65,22 @@ class LanguageProcessingService:
             "concept": []
         }
         
-        # Extract entities using language-specific patterns
-        for entity_type, pattern_list in [
-            ("person", patterns.person),
-            ("organization", patterns.organization),
-            ("location", patterns.location),
-            ("concept", patterns.concept)
-        ]:
-            for pattern in pattern_list:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        match = " ".join(match)
-                    
-                    # Apply language-specific filtering
-                    if self._is_valid_entity(match, settings):
-                        if match not in entities[entity_type]:
-                            entities[entity_type].append(match)
+        # Extract entities using the language's patterns, compiled once per process
+        pattern_set = pattern_engine.get(f"language_processing:{language_code}", {
+            "person": patterns.person,
+            "organization": patterns.organization,
+            "location": patterns.location,
+            "concept": patterns.concept
+        }, re.IGNORECASE)
+        seen = {entity_type: set() for entity_type in entities}
+        for entity_type, match in pattern_set.findall(text):
+            if isinstance(match, tuple):
+                match = " ".join(match)
+            
+            # Apply language-specific filtering
+            if match not in seen[entity_type] and self._is_valid_entity(match, settings):
+                seen[entity_type].add(match)
+                entities[entity_type].append(match)
         
         return {
             "language": language_code,
@@ -135,17 +138,7 @@ class LanguageProcessingService:
             return False
         
         # Check for common invalid patterns
-        invalid_patterns = [
-            r'^\d+$',  # Pure numbers
-            r'^[^\w\s]+$',  # Pure punctuation
-            r'^\s+$',  # Pure whitespace
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.match(pattern, entity):
-                return False
-        
-        return True
+        return not _INVALID_ENTITY.match(entity)
     
     @with_error_handling("language_validation")
     def validate_language_processing(self, language_code: str) -> Dict[str, Any]:
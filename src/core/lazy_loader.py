@@ -5,8 +5,9 @@ components only when they're actually needed.
 """
 
 import asyncio
+import importlib
 import threading
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from loguru import logger
 
 
@@ -17,28 +18,38 @@ class LazyLoader:
         self._cache: Dict[str, Any] = {}
         self._factories: Dict[str, Callable] = {}
         self._initializing: Dict[str, bool] = {}
+        # Held while a factory runs so concurrent threads build each object once
+        self._lock = threading.RLock()
     
     def register(self, key: str, factory_func: Callable) -> None:
         """Register a factory function for lazy creation."""
         self._factories[key] = factory_func
         logger.debug(f"Registered lazy loader for: {key}")
     
+    def is_registered(self, key: str) -> bool:
+        """Check if a factory is registered for a key."""
+        return key in self._factories
+    
     def get(self, key: str) -> Any:
         """Get an object, creating it if necessary."""
-        if key not in self._cache:
-            if key not in self._factories:
-                raise KeyError(f"No factory registered for key: {key}")
-            
-            if self._initializing.get(key, False):
-                raise RuntimeError(f"Circular dependency detected for key: {key}")
-            
-            self._initializing[key] = True
-            try:
-                logger.debug(f"Lazy loading: {key}")
-                self._cache[key] = self._factories[key]()
-                logger.info(f"✅ Lazy loaded: {key}")
-            finally:
-                self._initializing[key] = False
+        if key in self._cache:
+            return self._cache[key]
+        
+        with self._lock:
+            if key not in self._cache:
+                if key not in self._factories:
+                    raise KeyError(f"No factory registered for key: {key}")
+                
+                if self._initializing.get(key, False):
+                    raise RuntimeError(f"Circular dependency detected for key: {key}")
+                
+                self._initializing[key] = True
+                try:
+                    logger.debug(f"Lazy loading: {key}")
+                    self._cache[key] = self._factories[key]()
+                    logger.info(f"✅ Lazy loaded: {key}")
+                finally:
+                    self._initializing[key] = False
         
         return self._cache[key]
     
@@ -67,6 +78,85 @@ class LazyLoader:
             logger.debug("Cleared all cached objects")
 
 
+class LazyAgent:
+    """
+    Stand-in for an agent that is built on first use.
+    
+    The agent is created by a shared ``LazyLoader`` under ``key``, so every
+    ``LazyAgent`` with the same key in a process (e.g. in the API
+    orchestrator and in the MCP server) resolves to one instance. Attribute
+    access is forwarded to the instance and builds it if needed.
+    """
+    
+    def __init__(
+        self, 
+        key: str, 
+        factory: Optional[Callable] = None, 
+        loader: Optional[LazyLoader] = None
+    ):
+        self.agent_id = key
+        self.agent_type = key
+        self._loader = loader or agent_loader
+        self._load_callbacks: List[Callable[[Any], None]] = []
+        self._notified = False
+        if factory is not None and not self._loader.is_registered(key):
+            self._loader.register(key, factory)
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loader.is_loaded(self.agent_id)
+    
+    @property
+    def instance(self) -> Any:
+        """The agent, built on first access."""
+        agent = self._loader.get(self.agent_id)
+        if not self._notified:
+            with self._loader._lock:
+                if not self._notified:
+                    self._notified = True
+                    for callback in self._load_callbacks:
+                        callback(agent)
+        return agent
+    
+    def on_load(self, callback: Callable[[Any], None]) -> None:
+        """Run ``callback(agent)`` once the agent is built (now, if it already is)."""
+        if self._notified:
+            callback(self.instance)
+            return
+        self._load_callbacks.append(callback)
+        if self.is_loaded:
+            self.instance
+    
+    def __bool__(self) -> bool:
+        """False when the agent cannot be built, like an agent left as None."""
+        try:
+            self.instance
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Agent {self.agent_id} not available: {e}")
+            return False
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the stand-in itself
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.instance, name)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"LazyAgent({self.agent_id}, {state})"
+
+
+def import_factory(class_path: str, **kwargs: Any) -> Callable[[], Any]:
+    """Factory that imports ``"package.module:ClassName"`` and builds it on call."""
+    module_name, class_name = class_path.split(":")
+    
+    def factory() -> Any:
+        return getattr(importlib.import_module(module_name), class_name)(**kwargs)
+    
+    return factory
+
+
 class AsyncLazyLoader:
     """Async lazy loader for deferring async object creation."""
     
@@ -239,3 +329,6 @@ class ServiceManager:
 
 # Global service manager instance
 service_manager = ServiceManager()
+
+# Process-wide agent instances shared by the orchestrator and the MCP server
+agent_loader = LazyLoader()
@@ -3,12 +3,13 @@ Model Management Service for centralized Ollama integration.
 Provides unified model management, caching, and fallback mechanisms.
 """
 
-import asyncio
 import time
 from typing import Any, Dict, List, Optional
 
 import logging
 
+from src.core.ollama_client import OllamaError, get_ollama_client
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -244,53 +245,24 @@ class ModelManagementService:
         config: ModelConfig
     ) -> Dict[str, Any]:
         """Make request to Ollama with retry logic."""
-        import aiohttp
-
-        for attempt in range(config.retry_attempts):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        'http://localhost:11434/api/generate',
-                        json=params,
-                        timeout=aiohttp.ClientTimeout(total=config.timeout)
-                    ) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Ollama error: {error_text}")
-
-            except asyncio.TimeoutError:
-                self.logger.warning(
-                    f"Timeout on attempt {attempt + 1} for model {config.model_id}"
-                )
-                if attempt == config.retry_attempts - 1:
-                    raise
-                await asyncio.sleep(1)
-
-            except Exception as error:
-                self.logger.warning(
-                    f"Error on attempt {attempt + 1} for model {config.model_id}: {error}"
-                )
-                if attempt == config.retry_attempts - 1:
-                    raise
-                await asyncio.sleep(1)
+        return await get_ollama_client().post_json(
+            '/api/generate',
+            params,
+            model=config.model_id,
+            timeout=config.timeout,
+            max_retries=max(0, config.retry_attempts - 1)
+        )
 
     async def get_model_info(self, model_id: str) -> Dict[str, Any]:
         """Get information about a model."""
-        import aiohttp
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    'http://localhost:11434/api/show',
-                    params={'name': model_id},
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {'error': f"Failed to get model info: {response.status}"}
+            return await get_ollama_client().get_json(
+                '/api/show', params={'name': model_id}, timeout=30, max_retries=0
+            )
+        except OllamaError as error:
+            if error.status is not None:
+                return {'error': f"Failed to get model info: {error.status}"}
+            return {'error': f"Error getting model info: {error}"}
         except Exception as error:
             return {'error': f"Error getting model info: {error}"}
 
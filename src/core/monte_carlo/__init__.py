@@ -12,6 +12,10 @@ from .correlations import CorrelationEngine
 from .scenarios import ScenarioGenerator
 from .analysis import ResultAnalyzer
 from .config import MonteCarloConfig
+from .sampling import ParallelSampler
+from .sample_store import SampleStore
+from .result_cache import SimulationResultCache
+from .streaming import StreamingAnalyzer
 
 __all__ = [
     "MonteCarloEngine",
@@ -19,5 +23,9 @@ __all__ = [
     "CorrelationEngine",
     "ScenarioGenerator",
     "ResultAnalyzer",
-    "MonteCarloConfig"
+    "MonteCarloConfig",
+    "ParallelSampler",
+    "SampleStore",
+    "SimulationResultCache",
+    "StreamingAnalyzer"
 ]
@@ -3,7 +3,7 @@ Monte Carlo Configuration
 Configuration settings for Monte Carlo simulation engine
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,14 +35,47 @@ class MonteCarloConfig:
     # Performance settings
     max_workers: int = 8
     use_gpu: bool = False
-    cache_results: bool = False  # Disable caching by default to avoid Redis dependency
+    cache_results: bool = True
     memory_limit_gb: float = 4.0
     
+    # Result cache settings: backend is "memory", "disk", "redis" or "none";
+    # memory and disk backends evict least-recently-used results once
+    # cache_max_bytes is exceeded
+    cache_backend: str = "memory"
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_ttl_seconds: int = 3600
+    cache_dir: str = "cache/monte_carlo_results"
+    redis_url: str = "redis://localhost:6379/0"
+    
     # Simulation settings
     default_iterations: int = 10000
     confidence_level: float = 0.95
     seed: int = 42
     
+    # Sampling settings: iterations are drawn in fixed-size chunks, each with
+    # its own spawned seed, so results do not depend on the worker count
+    sampling_chunk_size: int = 10000
+    parallel_threshold: int = 10000
+    
+    # Variance reduction: "pseudo_random", "antithetic", "latin_hypercube",
+    # "sobol" or "halton" (scenarios may override with "sampling_method");
+    # control variates add adjusted mean estimates to the results
+    sampling_method: str = "pseudo_random"
+    control_variates: bool = False
+    
+    # Runs at or above this many iterations are analyzed batch by batch in
+    # constant memory instead of materializing the full sample array
+    streaming_threshold: int = 5000000
+    streaming_compression: int = 200
+    
+    # Result payload settings: "full" embeds every sample in the result,
+    # "summary" returns statistics plus a handle to samples in the sample store
+    results_mode: str = "full"
+    store_samples: bool = True
+    sample_store_dir: str = "cache/monte_carlo_samples"
+    sample_store_max_bytes: Optional[int] = 1024 ** 3
+    sample_store_ttl_seconds: Optional[float] = 86400
+    
     # Distribution settings
     supported_distributions: List[str] = None
     
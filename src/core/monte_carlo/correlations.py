@@ -4,26 +4,40 @@ Handle correlated variables in Monte Carlo simulations
 """
 
 import numpy as np
-from typing import List, Optional, Tuple
-from scipy import stats
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from scipy import special, stats
 import logging
 
+from .variance_reduction import generate_uniforms
+
 logger = logging.getLogger(__name__)
 
 
 class CorrelationEngine:
     """Engine for handling correlated variables in Monte Carlo simulations"""
     
+    # Number of Cholesky factors kept per engine instance
+    CHOLESKY_CACHE_SIZE = 64
+    
     def __init__(self):
         self.supported_copulas = ["gaussian", "student_t"]
+        self._cholesky_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
     
     def generate_correlated_samples(self, 
                                   distributions: List[str],
                                   params: List[dict],
                                   correlation_matrix: List[List[float]],
                                   size: int = 1000,
-                                  copula_type: str = "gaussian") -> np.ndarray:
-        """Generate correlated samples using copula method"""
+                                  copula_type: str = "gaussian",
+                                  rng: Optional[np.random.Generator] = None,
+                                  sampling_method: str = "pseudo_random") -> np.ndarray:
+        """Generate correlated samples using copula method
+        
+        ``rng`` is an optional ``numpy.random.Generator``; when omitted the
+        global ``np.random`` state is used. ``sampling_method`` selects the
+        underlying uniforms (see ``variance_reduction.SAMPLING_METHODS``).
+        """
         
         if len(distributions) != len(params):
             raise ValueError("Number of distributions must match number of parameter sets")
@@ -31,24 +45,72 @@ class CorrelationEngine:
         if len(distributions) != len(correlation_matrix):
             raise ValueError("Number of distributions must match correlation matrix size")
         
-        # Validate correlation matrix
-        if not self._is_valid_correlation_matrix(correlation_matrix):
-            raise ValueError("Invalid correlation matrix")
+        if copula_type not in self.supported_copulas:
+            raise ValueError(f"Unsupported copula type: {copula_type}")
         
-        # Generate correlated uniform samples using copula
-        uniform_samples = self._generate_correlated_uniform(
-            correlation_matrix, size, copula_type
-        )
+        # Validate correlation matrix (factorization is cached per matrix)
+        factor = self._get_cholesky_factor(correlation_matrix)
+        if factor is None:
+            raise ValueError("Invalid correlation matrix")
         
-        # Transform uniform samples to desired distributions
-        correlated_samples = np.zeros((size, len(distributions)))
+        if sampling_method == "pseudo_random":
+            rng = np.random if rng is None else rng
+            normal_samples = self._correlated_normals(factor, size, rng)
+        else:
+            # QMC scrambling needs a Generator; the t copula draws from it too
+            rng = np.random.default_rng() if rng is None else rng
+            uniforms = generate_uniforms(sampling_method, size, factor.shape[0], rng)
+            normal_samples = special.ndtri(uniforms) @ factor.T
         
-        for i, (dist_type, dist_params) in enumerate(zip(distributions, params)):
-            correlated_samples[:, i] = self._transform_uniform_to_distribution(
-                uniform_samples[:, i], dist_type, dist_params
-            )
+        if copula_type == "gaussian":
+            uniform_samples = special.ndtr(normal_samples)
+            # Normal-family marginals can reuse the latent normals directly
+            latent_normals = normal_samples
+        else:
+            uniform_samples = self._t_to_uniform(normal_samples, size, rng, df=5)
+            latent_normals = None
         
-        return correlated_samples
+        # Transform all columns to their marginal distributions in batches
+        return self._transform_columns(uniform_samples, distributions, params, latent_normals)
+    
+    def transform_uniform_samples(self,
+                                  uniform_samples: np.ndarray,
+                                  distributions: List[str],
+                                  params: List[dict]) -> np.ndarray:
+        """Map independent uniforms to the requested marginal distributions"""
+        return self._transform_columns(uniform_samples, distributions, params)
+    
+    def _get_cholesky_factor(self, matrix: List[List[float]]) -> Optional[np.ndarray]:
+        """Return the cached lower Cholesky factor, or ``None`` if the matrix is invalid"""
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim != 2:
+            return None
+        
+        key = (matrix.shape, matrix.tobytes())
+        factor = self._cholesky_cache.get(key)
+        if factor is not None:
+            self._cholesky_cache.move_to_end(key)
+            return factor
+        
+        if not self._is_valid_correlation_matrix(matrix):
+            return None
+        
+        factor = np.linalg.cholesky(matrix)
+        self._cholesky_cache[key] = factor
+        if len(self._cholesky_cache) > self.CHOLESKY_CACHE_SIZE:
+            self._cholesky_cache.popitem(last=False)
+        return factor
+    
+    def _correlated_normals(self, factor: np.ndarray, size: int, rng=np.random) -> np.ndarray:
+        """Draw standard normals with correlation ``factor @ factor.T``"""
+        return rng.standard_normal((size, factor.shape[0])) @ factor.T
+    
+    def _t_to_uniform(self, normal_samples: np.ndarray, size: int,
+                      rng=np.random, df: int = 5) -> np.ndarray:
+        """Map correlated normals to Student-t copula uniforms"""
+        chi2_samples = rng.chisquare(df, size)
+        t_samples = normal_samples / np.sqrt(chi2_samples / df)[:, None]
+        return stats.t.cdf(t_samples, df=df)
     
     def _is_valid_correlation_matrix(self, matrix: List[List[float]]) -> bool:
         """Validate correlation matrix"""
@@ -76,51 +138,118 @@ class CorrelationEngine:
     def _generate_correlated_uniform(self, 
                                    correlation_matrix: List[List[float]],
                                    size: int,
-                                   copula_type: str = "gaussian") -> np.ndarray:
+                                   copula_type: str = "gaussian",
+                                   rng=np.random) -> np.ndarray:
         """Generate correlated uniform samples using copula"""
         
         if copula_type not in self.supported_copulas:
             raise ValueError(f"Unsupported copula type: {copula_type}")
         
         if copula_type == "gaussian":
-            return self._gaussian_copula(correlation_matrix, size)
+            return self._gaussian_copula(correlation_matrix, size, rng)
         elif copula_type == "student_t":
-            return self._student_t_copula(correlation_matrix, size, df=5)
+            return self._student_t_copula(correlation_matrix, size, df=5, rng=rng)
     
     def _gaussian_copula(self, correlation_matrix: List[List[float]], 
-                        size: int) -> np.ndarray:
+                        size: int, rng=np.random) -> np.ndarray:
         """Generate samples using Gaussian copula"""
         
-        # Generate correlated normal samples
-        correlation_matrix = np.array(correlation_matrix)
-        normal_samples = np.random.multivariate_normal(
-            mean=np.zeros(len(correlation_matrix)),
-            cov=correlation_matrix,
-            size=size
-        )
-        
-        # Transform to uniform using normal CDF
-        uniform_samples = stats.norm.cdf(normal_samples)
+        factor = self._get_cholesky_factor(correlation_matrix)
+        if factor is None:
+            raise ValueError("Invalid correlation matrix")
         
-        return uniform_samples
+        # Transform correlated normals to uniform using normal CDF
+        return special.ndtr(self._correlated_normals(factor, size, rng))
     
     def _student_t_copula(self, correlation_matrix: List[List[float]], 
-                         size: int, df: int = 5) -> np.ndarray:
+                         size: int, df: int = 5, rng=np.random) -> np.ndarray:
         """Generate samples using Student-t copula"""
         
-        # Generate correlated t-distributed samples
-        correlation_matrix = np.array(correlation_matrix)
-        t_samples = np.random.multivariate_t(
-            loc=np.zeros(len(correlation_matrix)),
-            shape=correlation_matrix,
-            df=df,
-            size=size
-        )
+        factor = self._get_cholesky_factor(correlation_matrix)
+        if factor is None:
+            raise ValueError("Invalid correlation matrix")
+        
+        # Correlated t samples as a normal/chi-square mixture, mapped through the t CDF
+        return self._t_to_uniform(self._correlated_normals(factor, size, rng), size, rng, df)
+    
+    def _transform_columns(self,
+                           uniform_samples: np.ndarray,
+                           distributions: List[str],
+                           params: List[dict],
+                           latent_normals: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform every column with one vectorized inverse CDF per distribution type"""
+        
+        samples = np.empty_like(uniform_samples, dtype=float)
+        
+        groups: Dict[str, List[int]] = {}
+        for i, dist_type in enumerate(distributions):
+            groups.setdefault(dist_type, []).append(i)
+        
+        for dist_type, columns in groups.items():
+            column_params = [params[i] for i in columns]
+            normals = latent_normals[:, columns] if latent_normals is not None else None
+            samples[:, columns] = self._inverse_cdf_batch(
+                uniform_samples[:, columns], dist_type, column_params, normals
+            )
+        
+        return samples
+    
+    def _inverse_cdf_batch(self,
+                           u: np.ndarray,
+                           distribution_type: str,
+                           column_params: List[dict],
+                           normals: Optional[np.ndarray] = None) -> np.ndarray:
+        """Inverse CDF for a block of same-distribution columns
+        
+        Uses closed forms where they exist and broadcasts per-column
+        parameters across the block otherwise.
+        """
+        
+        def param(name: str, default: float) -> np.ndarray:
+            return np.array([p.get(name, default) for p in column_params], dtype=float)
+        
+        if distribution_type in ("normal", "lognormal"):
+            z = normals if normals is not None else special.ndtri(u)
+            values = param("mean", 0) + param("std", 1) * z
+            return values if distribution_type == "normal" else np.exp(values)
+        
+        elif distribution_type == "uniform":
+            low = param("low", 0)
+            return low + u * (param("high", 1) - low)
+        
+        elif distribution_type == "exponential":
+            return -param("scale", 1) * np.log1p(-u)
+        
+        elif distribution_type == "weibull":
+            return param("scale", 1) * (-np.log1p(-u)) ** (1.0 / param("shape", 1))
+        
+        elif distribution_type == "gamma":
+            return param("scale", 1) * special.gammaincinv(param("shape", 1), u)
         
-        # Transform to uniform using t CDF
-        uniform_samples = stats.t.cdf(t_samples, df=df)
+        elif distribution_type == "beta":
+            return special.betaincinv(param("alpha", 1), param("beta", 1), u)
+        
+        elif distribution_type == "poisson":
+            return self._poisson_inverse_cdf(u, param("lambda", 1))
         
-        return uniform_samples
+        # Fall back to the per-column scipy path for anything else
+        return np.column_stack([
+            self._transform_uniform_to_distribution(u[:, i], distribution_type, p)
+            for i, p in enumerate(column_params)
+        ])
+    
+    def _poisson_inverse_cdf(self, u: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+        """Discrete Poisson inverse CDF via a per-column cumulative table lookup"""
+        
+        values = np.empty_like(u, dtype=float)
+        for i, lam in enumerate(lambdas):
+            if lam <= 0:
+                raise ValueError("Lambda must be positive")
+            # Table covers all but a negligible upper tail mass
+            k_max = int(stats.poisson.isf(1e-15, lam)) + 1
+            cdf = stats.poisson.cdf(np.arange(k_max + 1), lam)
+            values[:, i] = np.minimum(np.searchsorted(cdf, u[:, i], side="left"), k_max)
+        return values
     
     def _transform_uniform_to_distribution(self, 
                                          uniform_samples: np.ndarray,
@@ -163,10 +292,8 @@ class CorrelationEngine:
                                        scale=params.get("scale", 1))
         
         elif distribution_type == "poisson":
-            # Poisson is discrete, so we need a different approach
-            # For now, use exponential as approximation
-            return stats.expon.ppf(uniform_samples,
-                                 scale=params.get("lambda", 1))
+            return stats.poisson.ppf(uniform_samples,
+                                   mu=params.get("lambda", 1))
         
         else:
             # For other distributions, use scipy's generic method
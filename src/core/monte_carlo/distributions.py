@@ -4,6 +4,7 @@ Common probability distributions for Monte Carlo simulations
 """
 
 import numpy as np
+from scipy import special
 from typing import Dict, Any, Optional, Tuple
 import logging
 
@@ -26,13 +27,19 @@ class DistributionLibrary:
         }
     
     def sample(self, distribution_type: str, params: Dict[str, Any], 
-               size: int = 1) -> np.ndarray:
-        """Sample from a probability distribution"""
+               size: int = 1, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Sample from a probability distribution
+        
+        ``rng`` is an optional ``numpy.random.Generator``; when omitted the
+        global ``np.random`` state is used.
+        """
         if distribution_type not in self.supported_distributions:
             raise ValueError(f"Unsupported distribution: {distribution_type}")
         
         try:
-            return self.supported_distributions[distribution_type](params, size)
+            return self.supported_distributions[distribution_type](
+                params, size, np.random if rng is None else rng
+            )
         except Exception as e:
             logger.error(f"Error sampling from {distribution_type}: {e}")
             raise
@@ -49,7 +56,7 @@ class DistributionLibrary:
         except Exception:
             return False
     
-    def _normal_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _normal_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Normal distribution sampling"""
         mean = params.get("mean", 0.0)
         std = params.get("std", 1.0)
@@ -57,9 +64,9 @@ class DistributionLibrary:
         if std <= 0:
             raise ValueError("Standard deviation must be positive")
         
-        return np.random.normal(mean, std, size)
+        return rng.normal(mean, std, size)
     
-    def _lognormal_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _lognormal_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Log-normal distribution sampling"""
         mean = params.get("mean", 0.0)
         std = params.get("std", 1.0)
@@ -67,9 +74,9 @@ class DistributionLibrary:
         if std <= 0:
             raise ValueError("Standard deviation must be positive")
         
-        return np.random.lognormal(mean, std, size)
+        return rng.lognormal(mean, std, size)
     
-    def _uniform_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _uniform_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Uniform distribution sampling"""
         low = params.get("low", 0.0)
         high = params.get("high", 1.0)
@@ -77,18 +84,18 @@ class DistributionLibrary:
         if low >= high:
             raise ValueError("Low must be less than high")
         
-        return np.random.uniform(low, high, size)
+        return rng.uniform(low, high, size)
     
-    def _exponential_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _exponential_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Exponential distribution sampling"""
         scale = params.get("scale", 1.0)
         
         if scale <= 0:
             raise ValueError("Scale must be positive")
         
-        return np.random.exponential(scale, size)
+        return rng.exponential(scale, size)
     
-    def _gamma_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _gamma_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Gamma distribution sampling"""
         shape = params.get("shape", 1.0)
         scale = params.get("scale", 1.0)
@@ -96,9 +103,9 @@ class DistributionLibrary:
         if shape <= 0 or scale <= 0:
             raise ValueError("Shape and scale must be positive")
         
-        return np.random.gamma(shape, scale, size)
+        return rng.gamma(shape, scale, size)
     
-    def _beta_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _beta_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Beta distribution sampling"""
         alpha = params.get("alpha", 1.0)
         beta = params.get("beta", 1.0)
@@ -106,9 +113,9 @@ class DistributionLibrary:
         if alpha <= 0 or beta <= 0:
             raise ValueError("Alpha and beta must be positive")
         
-        return np.random.beta(alpha, beta, size)
+        return rng.beta(alpha, beta, size)
     
-    def _weibull_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _weibull_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Weibull distribution sampling"""
         shape = params.get("shape", 1.0)
         scale = params.get("scale", 1.0)
@@ -116,16 +123,38 @@ class DistributionLibrary:
         if shape <= 0 or scale <= 0:
             raise ValueError("Shape and scale must be positive")
         
-        return np.random.weibull(shape, size) * scale
+        return rng.weibull(shape, size) * scale
     
-    def _poisson_distribution(self, params: Dict[str, Any], size: int) -> np.ndarray:
+    def _poisson_distribution(self, params: Dict[str, Any], size: int, rng=np.random) -> np.ndarray:
         """Poisson distribution sampling"""
         lambda_param = params.get("lambda", 1.0)
         
         if lambda_param <= 0:
             raise ValueError("Lambda must be positive")
         
-        return np.random.poisson(lambda_param, size)
+        return rng.poisson(lambda_param, size)
+    
+    def get_theoretical_mean(self, distribution_type: str, params: Dict[str, Any]) -> Optional[float]:
+        """Analytic mean of a distribution, or ``None`` if it is unknown"""
+        if distribution_type == "normal":
+            return float(params.get("mean", 0.0))
+        if distribution_type == "lognormal":
+            return float(np.exp(params.get("mean", 0.0) + params.get("std", 1.0) ** 2 / 2))
+        if distribution_type == "uniform":
+            return (params.get("low", 0.0) + params.get("high", 1.0)) / 2
+        if distribution_type == "exponential":
+            return float(params.get("scale", 1.0))
+        if distribution_type == "gamma":
+            return float(params.get("shape", 1.0) * params.get("scale", 1.0))
+        if distribution_type == "beta":
+            alpha = params.get("alpha", 1.0)
+            return alpha / (alpha + params.get("beta", 1.0))
+        if distribution_type == "weibull":
+            shape = params.get("shape", 1.0)
+            return float(params.get("scale", 1.0) * special.gamma(1 + 1 / shape))
+        if distribution_type == "poisson":
+            return float(params.get("lambda", 1.0))
+        return None
     
     def get_distribution_info(self, distribution_type: str) -> Dict[str, Any]:
         """Get information about a distribution"""
@@ -6,25 +6,23 @@ Core Monte Carlo simulation engine with Phase 5 advanced features
 import numpy as np
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime
 import uuid
 import multiprocessing as mp
 from concurrent.futures import ProcessPoolExecutor
-import hashlib
-import json
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    redis = None
 
 from .config import MonteCarloConfig
 from .distributions import DistributionLibrary
 from .correlations import CorrelationEngine
 from .scenarios import ScenarioGenerator
 from .analysis import ResultAnalyzer
+from .sampling import ParallelSampler, sample_scenario
+from .variance_reduction import control_variate_means, convergence_report
+from .sample_store import SampleStore
+from .result_cache import SimulationResultCache, make_cache_key
+from .streaming import StreamingAnalyzer
+from .precision import normalize_precision_target, check_precision
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +36,19 @@ class MonteCarloEngine:
         self.correlations = CorrelationEngine()
         self.scenarios = ScenarioGenerator()
         self.analyzer = ResultAnalyzer()
+        self.sampler = ParallelSampler(
+            seed=self.config.seed,
+            chunk_size=self.config.sampling_chunk_size,
+            sampling_method=self.config.sampling_method
+        )
         
         # Phase 5: Performance Optimization
         self.cache = self._initialize_cache()
-        self.memory_cache = {}  # Simple in-memory cache fallback
+        self.sample_store = SampleStore(
+            self.config.sample_store_dir,
+            max_bytes=self.config.sample_store_max_bytes,
+            ttl_seconds=self.config.sample_store_ttl_seconds
+        )
         self.executor = self._initialize_executor()
         
         # Phase 5: Security & Compliance
@@ -57,35 +64,20 @@ class MonteCarloEngine:
         
         logger.info("Monte Carlo Engine initialized with Phase 5 features")
     
-    def _initialize_cache(self) -> Optional[Any]:
-        """Initialize Redis cache for result caching"""
-        if not REDIS_AVAILABLE:
-            logger.warning("Redis module not available - caching disabled")
-            self.config.cache_results = False
-            return None
-            
+    def _initialize_cache(self) -> Optional[SimulationResultCache]:
+        """Initialize the configured result cache backend"""
         try:
-            if self.config.cache_results:
-                # Test Redis connection with shorter timeout
-                redis_client = redis.Redis(
-                    host='localhost',
-                    port=6379,
-                    db=0,
-                    decode_responses=True,
-                    socket_connect_timeout=0.5,
-                    socket_timeout=0.5,
-                    retry_on_timeout=False
-                )
-                # Test connection
-                redis_client.ping()
-                logger.info("Redis cache initialized successfully")
-                return redis_client
-        except (redis.ConnectionError, redis.TimeoutError, Exception) as e:
-            logger.warning(f"Redis cache not available: {e}")
-            # Disable caching when Redis is not available
+            cache = SimulationResultCache.from_config(self.config)
+        except Exception as e:
+            logger.warning(f"Result cache not available: {e}")
+            cache = None
+        
+        if cache is None:
             self.config.cache_results = False
-            logger.info("Caching disabled - Redis not available")
-        return None
+            logger.info("Result caching disabled")
+        else:
+            logger.info(f"Result cache initialized with {cache.backend.name} backend")
+        return cache
     
     def _initialize_executor(self) -> ProcessPoolExecutor:
         """Initialize process pool executor for parallel processing"""
@@ -104,18 +96,82 @@ class MonteCarloEngine:
         logger.info(f"Audit event: {event_type} - {details}")
     
     def _get_cache_key(self, scenario_config: Dict[str, Any], 
-                      num_iterations: int) -> str:
+                      num_iterations: int,
+                      results_mode: str = "full",
+                      streaming: Optional[bool] = None,
+                      target_precision: Optional[Dict[str, Any]] = None) -> str:
         """Generate cache key for scenario configuration"""
-        config_hash = hashlib.md5(
-            json.dumps(scenario_config, sort_keys=True).encode()
-        ).hexdigest()
-        return f"monte_carlo:{config_hash}:{num_iterations}"
+        return make_cache_key(
+            scenario_config,
+            num_iterations=num_iterations,
+            results_mode=results_mode,
+            streaming=streaming,
+            target_precision=target_precision,
+            seed=self.config.seed,
+            chunk_size=self.config.sampling_chunk_size,
+            sampling_method=self.config.sampling_method,
+            control_variates=self.config.control_variates,
+            confidence_level=self.config.confidence_level
+        )
+    
+    def _resolve_results_mode(self, results_mode: Optional[str]) -> str:
+        """Resolve and validate the requested result payload mode"""
+        results_mode = results_mode or self.config.results_mode
+        if results_mode not in ("full", "summary"):
+            raise ValueError(f"Unsupported results mode: {results_mode}")
+        return results_mode
+    
+    def _attach_samples(self, 
+                       results: Dict[str, Any],
+                       samples: np.ndarray,
+                       simulation_id: str,
+                       results_mode: str):
+        """Attach raw samples to results according to the results mode"""
+        if results_mode == "full":
+            # Add samples for JSON serialization
+            results["samples"] = samples.tolist()
+        elif self.config.store_samples:
+            try:
+                results["sample_handle"] = self.sample_store.save(
+                    simulation_id, samples, results.get("variable_names")
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store samples for simulation {simulation_id}: {e}")
+    
+    def get_samples(self,
+                   sample_id: str,
+                   start: int = 0,
+                   stop: Optional[int] = None,
+                   max_points: Optional[int] = None,
+                   variables: Optional[List[int]] = None) -> np.ndarray:
+        """Fetch stored samples referenced by a result's ``sample_handle``"""
+        return self.sample_store.load(sample_id, start, stop, max_points, variables)
     
     async def run_simulation(self, 
                            scenario_config: Dict[str, Any],
                            num_iterations: Optional[int] = None,
-                           parallel: bool = True) -> Dict[str, Any]:
-        """Run Monte Carlo simulation with Phase 5 enhancements"""
+                           parallel: bool = True,
+                           results_mode: Optional[str] = None,
+                           streaming: Optional[bool] = None,
+                           progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                           target_precision: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run Monte Carlo simulation with Phase 5 enhancements
+        
+        ``results_mode`` selects the payload shape: ``"full"`` embeds every
+        sample, ``"summary"`` returns statistics plus a ``sample_handle``.
+        Defaults to ``config.results_mode``.
+        
+        ``streaming`` analyzes samples batch by batch in constant memory
+        (no samples are returned); by default it is enabled for runs of at
+        least ``config.streaming_threshold`` iterations. ``progress_callback``
+        receives convergence estimates after every streamed batch.
+        
+        ``target_precision`` enables adaptive early stopping: samples are
+        drawn in batches until every requested metric reaches the target
+        ``relative_standard_error`` and/or ``ci_width``, with
+        ``num_iterations`` acting as the cap. See
+        ``precision.normalize_precision_target`` for the accepted fields.
+        """
         
         start_time = datetime.now()
         simulation_id = str(uuid.uuid4())
@@ -129,27 +185,21 @@ class MonteCarloEngine:
         logger.info(f"Starting Monte Carlo simulation {simulation_id}")
         
         try:
+            results_mode = self._resolve_results_mode(results_mode)
+            
             # Phase 5: Performance Optimization - Check cache
-            cache_key = self._get_cache_key(scenario_config, num_iterations or self.config.default_iterations)
+            cache_key = self._get_cache_key(
+                scenario_config, num_iterations or self.config.default_iterations,
+                results_mode, streaming, target_precision
+            )
             
-            # Try Redis cache first
             if self.cache and self.config.cache_results:
-                try:
-                    cached_result = self.cache.get(cache_key)
-                    if cached_result:
-                        logger.info(f"Using Redis cached result for simulation {simulation_id}")
-                        result = json.loads(cached_result)
-                        result["cached"] = True
-                        return result
-                except Exception as e:
-                    logger.warning(f"Failed to check Redis cache: {e}")
-            
-            # Try in-memory cache as fallback
-            if cache_key in self.memory_cache:
-                logger.info(f"Using in-memory cached result for simulation {simulation_id}")
-                result = self.memory_cache[cache_key].copy()
-                result["cached"] = True
-                return result
+                cached_result = self.cache.get(cache_key)
+                if cached_result is not None:
+                    logger.info(f"Using cached result for simulation {simulation_id}")
+                    cached_result["cached"] = True
+                    cached_result["scenario_config"] = scenario_config
+                    return cached_result
             
             # Validate scenario
             if not self.scenarios.validate_scenario(scenario_config):
@@ -162,11 +212,31 @@ class MonteCarloEngine:
             # Phase 5: Dynamic Scenarios - Check for real-time data
             scenario_config = await self._enhance_with_real_time_data(scenario_config)
             
-            # Generate samples with Phase 5 optimizations
-            samples = await self._generate_samples_optimized(scenario_config, num_iterations, parallel)
+            if streaming is None:
+                streaming = (num_iterations >= self.config.streaming_threshold
+                             and not target_precision)
             
-            # Analyze results with Phase 5 advanced analytics
-            results = await self._analyze_results_advanced(samples, scenario_config)
+            if target_precision:
+                # Stop drawing batches once the requested precision is reached
+                samples, adaptive = await self._generate_samples_adaptive(
+                    scenario_config, num_iterations, target_precision, progress_callback
+                )
+                num_iterations = len(samples)
+                results = await self._analyze_results_advanced(samples, scenario_config)
+                results["adaptive_stopping"] = adaptive
+                self._attach_samples(results, samples, simulation_id, results_mode)
+            elif streaming:
+                # Constant-memory analysis for very large runs
+                results = await self._analyze_results_streaming(
+                    scenario_config, num_iterations, progress_callback
+                )
+            else:
+                # Generate samples with Phase 5 optimizations
+                samples = await self._generate_samples_optimized(scenario_config, num_iterations, parallel)
+                
+                # Analyze results with Phase 5 advanced analytics
+                results = await self._analyze_results_advanced(samples, scenario_config)
+                self._attach_samples(results, samples, simulation_id, results_mode)
             
             # Add metadata
             results["simulation_id"] = simulation_id
@@ -182,17 +252,9 @@ class MonteCarloEngine:
             }
             
             # Phase 5: Performance Optimization - Cache results
-            # Try Redis cache first
             if self.cache and self.config.cache_results:
-                try:
-                    self.cache.setex(cache_key, 3600, json.dumps(results))  # Cache for 1 hour
-                    logger.info(f"Cached results in Redis for simulation {simulation_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to cache results in Redis: {e}")
-            
-            # Always cache in memory as fallback
-            self.memory_cache[cache_key] = results.copy()
-            logger.info(f"Cached results in memory for simulation {simulation_id}")
+                if self.cache.set(cache_key, results):
+                    logger.info(f"Cached results for simulation {simulation_id}")
             
             # Phase 5: Security & Compliance
             self._log_audit_event("simulation_complete", {
@@ -235,7 +297,7 @@ class MonteCarloEngine:
                                         parallel: bool) -> np.ndarray:
         """Generate samples with Phase 5 performance optimizations"""
         
-        if parallel and num_iterations > 10000:
+        if parallel and num_iterations > self.config.parallel_threshold:
             # Use parallel processing for large simulations
             return await self._generate_samples_parallel(scenario_config, num_iterations)
         else:
@@ -245,43 +307,79 @@ class MonteCarloEngine:
     async def _generate_samples_parallel(self, 
                                        scenario_config: Dict[str, Any],
                                        num_iterations: int) -> np.ndarray:
-        """Generate samples using parallel processing"""
-        
-        # Split iterations across processes
-        num_processes = min(self.config.max_workers, mp.cpu_count())
-        iterations_per_process = num_iterations // num_processes
+        """Generate samples using parallel processing
+        
+        Chunks are seeded independently via ``SeedSequence.spawn`` and written
+        into shared memory, so the output is bit-identical to the
+        single-process path for the same seed and iteration count.
+        """
+        return await self.sampler.sample_parallel(
+            scenario_config, num_iterations, self.executor
+        )
+    
+    async def _generate_samples_adaptive(self,
+                                         scenario_config: Dict[str, Any],
+                                         max_iterations: int,
+                                         target_precision: Dict[str, Any],
+                                         progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+                                         ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Draw seeded batches until the precision target is met or the cap is hit"""
         
-        # Create tasks for parallel execution
-        tasks = []
-        for i in range(num_processes):
-            start_iter = i * iterations_per_process
-            end_iter = start_iter + iterations_per_process if i < num_processes - 1 else num_iterations
-            task = self._generate_samples_chunk(scenario_config, start_iter, end_iter)
-            tasks.append(task)
+        variable_names = list(scenario_config["variables"].keys())
+        target = normalize_precision_target(
+            target_precision, variable_names, self.config.sampling_chunk_size
+        )
         
-        # Execute tasks in parallel
-        results = await asyncio.gather(*tasks)
+        sampler = self.sampler
+        if target["batch_size"] != sampler.chunk_size:
+            sampler = ParallelSampler(
+                seed=self.config.seed,
+                chunk_size=target["batch_size"],
+                sampling_method=self.sampler.sampling_method
+            )
         
-        # Combine results
-        combined_samples = np.vstack(results)
-        return combined_samples
-    
-    async def _generate_samples_chunk(self, 
-                                    scenario_config: Dict[str, Any],
-                                    start_iter: int,
-                                    end_iter: int) -> np.ndarray:
-        """Generate samples for a chunk of iterations"""
+        # Untouched pages of the preallocated buffer are never committed
+        samples = np.empty((max_iterations, len(variable_names)), dtype=np.float64)
+        precision = {"met": False, "metrics": {}}
+        used = 0
+        batches = 0
         
-        loop = asyncio.get_event_loop()
-        chunk_iterations = end_iter - start_iter
+        for start, end, chunk in sampler.iter_chunks(scenario_config, max_iterations):
+            samples[start:end] = chunk
+            used = end
+            batches += 1
+            
+            if used >= min(target["min_iterations"], max_iterations):
+                precision = check_precision(samples[:used], variable_names, target)
+                
+                if progress_callback is not None:
+                    progress = progress_callback({
+                        "completed_iterations": used,
+                        "total_iterations": max_iterations,
+                        "precision": precision
+                    })
+                    if asyncio.iscoroutine(progress):
+                        await progress
+                
+                if precision["met"]:
+                    break
+            
+            await asyncio.sleep(0)
         
-        # Run in process pool to avoid GIL
-        return await loop.run_in_executor(
-            self.executor,
-            self._generate_samples_sync,
-            scenario_config,
-            chunk_iterations
+        logger.info(
+            f"Adaptive sampling used {used}/{max_iterations} iterations "
+            f"({'converged' if precision['met'] else 'cap reached'})"
         )
+        
+        adaptive = {
+            "converged": precision["met"],
+            "iterations_used": used,
+            "max_iterations": max_iterations,
+            "batches": batches,
+            "target": target,
+            "precision": precision["metrics"]
+        }
+        return samples[:used].copy(), adaptive
     
     async def _analyze_results_advanced(self, 
                                       samples: np.ndarray,
@@ -312,6 +410,11 @@ class MonteCarloEngine:
         if scenario_config.get("include_stress_testing", True):
             results["stress_testing"] = self.analyzer.perform_stress_tests(samples, scenario_config)
         
+        if self.config.control_variates:
+            results["control_variate_estimates"] = self._control_variate_estimates(
+                samples, scenario_config
+            )
+        
         # Variable names
         variable_names = list(scenario_config["variables"].keys())
         results["variable_names"] = variable_names
@@ -323,14 +426,60 @@ class MonteCarloEngine:
             "sample_shape": samples.shape
         }
         
-        # Add samples for JSON serialization
-        results["samples"] = samples.tolist()
+        return results
+    
+    async def _analyze_results_streaming(self,
+                                       scenario_config: Dict[str, Any],
+                                       num_iterations: int,
+                                       progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+                                       ) -> Dict[str, Any]:
+        """Sample and analyze chunk by chunk without holding the full sample array"""
+        
+        variable_names = list(scenario_config["variables"].keys())
+        analyzer = StreamingAnalyzer(len(variable_names), self.config.streaming_compression)
+        
+        for start, end, chunk in self.sampler.iter_chunks(scenario_config, num_iterations):
+            analyzer.update(chunk)
+            
+            if progress_callback is not None:
+                progress = progress_callback({
+                    "completed_iterations": end,
+                    "total_iterations": num_iterations,
+                    "convergence": analyzer.convergence()
+                })
+                if asyncio.iscoroutine(progress):
+                    await progress
+            
+            # Yield to the event loop between batches
+            await asyncio.sleep(0)
+        
+        results = {}
+        
+        if scenario_config.get("include_statistics", True):
+            results["statistics"] = analyzer.calculate_statistics()
+        
+        if scenario_config.get("include_risk_metrics", True):
+            results["risk_metrics"] = analyzer.calculate_risk_metrics(self.config.confidence_level)
+        
+        if scenario_config.get("include_stress_testing", True):
+            results["stress_testing"] = analyzer.perform_stress_tests()
+        
+        results["correlation_matrix"] = analyzer.correlation_matrix()
+        results["convergence"] = analyzer.convergence()
+        results["variable_names"] = variable_names
+        results["sample_summary"] = {
+            "total_samples": analyzer.count,
+            "num_variables": len(variable_names),
+            "sample_shape": (analyzer.count, len(variable_names)),
+            "streaming": True
+        }
         
         return results
     
     def _run_simulation_sync(self, 
                            scenario_config: Dict[str, Any],
-                           num_iterations: Optional[int] = None) -> Dict[str, Any]:
+                           num_iterations: Optional[int] = None,
+                           results_mode: Optional[str] = None) -> Dict[str, Any]:
         """Run Monte Carlo simulation synchronously"""
         
         start_time = datetime.now()
@@ -339,6 +488,8 @@ class MonteCarloEngine:
         logger.info(f"Starting Monte Carlo simulation {simulation_id}")
         
         try:
+            results_mode = self._resolve_results_mode(results_mode)
+            
             # Validate scenario
             if not self.scenarios.validate_scenario(scenario_config):
                 raise ValueError("Invalid scenario configuration")
@@ -352,6 +503,7 @@ class MonteCarloEngine:
             
             # Analyze results synchronously
             results = self._analyze_results_sync(samples, scenario_config)
+            self._attach_samples(results, samples, simulation_id, results_mode)
             
             # Add metadata
             results["simulation_id"] = simulation_id
@@ -373,29 +525,7 @@ class MonteCarloEngine:
                               num_iterations: int) -> np.ndarray:
         """Generate samples for the simulation synchronously"""
         
-        variables = scenario_config["variables"]
-        correlations = scenario_config.get("correlations", [])
-        
-        # Extract distribution information
-        distributions = []
-        params = []
-        
-        for var_name, var_config in variables.items():
-            distributions.append(var_config["distribution"])
-            params.append(var_config["parameters"])
-        
-        # Generate correlated samples
-        if len(distributions) > 1 and correlations:
-            samples = self.correlations.generate_correlated_samples(
-                distributions, params, correlations, num_iterations
-            )
-        else:
-            # Generate independent samples
-            samples = np.zeros((num_iterations, len(distributions)))
-            for i, (dist, param) in enumerate(zip(distributions, params)):
-                samples[:, i] = self.distributions.sample(dist, param, num_iterations)
-        
-        return samples
+        return self.sampler.sample(scenario_config, num_iterations)
     
     def _analyze_results_sync(self, 
                             samples: np.ndarray,
@@ -414,6 +544,11 @@ class MonteCarloEngine:
                 samples, self.config.confidence_level
             )
         
+        if self.config.control_variates:
+            results["control_variate_estimates"] = self._control_variate_estimates(
+                samples, scenario_config
+            )
+        
         # Variable names
         variable_names = list(scenario_config["variables"].keys())
         results["variable_names"] = variable_names
@@ -425,28 +560,72 @@ class MonteCarloEngine:
             "sample_shape": samples.shape
         }
         
-        # Add samples for JSON serialization
-        results["samples"] = samples.tolist()
-        
         return results
     
+    def _known_means(self, scenario_config: Dict[str, Any]) -> List[Optional[float]]:
+        """Analytic means of the scenario's input distributions"""
+        return [
+            self.distributions.get_theoretical_mean(var["distribution"], var["parameters"])
+            for var in scenario_config["variables"].values()
+        ]
+    
+    def _control_variate_estimates(self,
+                                   samples: np.ndarray,
+                                   scenario_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Control-variate adjusted means keyed by variable name"""
+        return control_variate_means(
+            samples,
+            self._known_means(scenario_config),
+            list(scenario_config["variables"].keys())
+        )
+    
+    def sampling_convergence_report(self,
+                                    scenario_config: Dict[str, Any],
+                                    target_standard_error: float,
+                                    methods: Optional[List[str]] = None,
+                                    pilot_iterations: int = 1024,
+                                    replications: int = 16) -> Dict[str, Any]:
+        """Compare how many iterations each sampling mode needs for a target standard error"""
+        if not self.scenarios.validate_scenario(scenario_config):
+            raise ValueError("Invalid scenario configuration")
+        
+        def sample_fn(method, iterations, rng):
+            return sample_scenario(
+                scenario_config, iterations, rng, self.distributions,
+                self.correlations, method
+            )
+        
+        report = convergence_report(
+            sample_fn,
+            target_standard_error,
+            methods=methods,
+            pilot_iterations=pilot_iterations,
+            replications=replications,
+            seed=self.config.seed,
+            known_means=self._known_means(scenario_config)
+        )
+        report["variable_names"] = list(scenario_config["variables"].keys())
+        return report
+    
     def run_scenario_simulation(self, 
                               scenario_type: str,
                               parameters: Dict[str, Any],
                               num_iterations: Optional[int] = None,
-                              time_horizon: Optional[int] = None) -> Dict[str, Any]:
+                              time_horizon: Optional[int] = None,
+                              results_mode: Optional[str] = None) -> Dict[str, Any]:
         """Run simulation using a predefined scenario template"""
         
         # Generate scenario
         scenario = self.scenarios.generate_scenario(scenario_type, parameters, time_horizon)
         
         # Run simulation synchronously
-        return self._run_simulation_sync(scenario, num_iterations)
+        return self._run_simulation_sync(scenario, num_iterations, results_mode)
     
     def run_custom_simulation(self, 
                             variables: Dict[str, Dict[str, Any]],
                             correlations: Optional[List[List[float]]] = None,
-                            num_iterations: Optional[int] = None) -> Dict[str, Any]:
+                            num_iterations: Optional[int] = None,
+                            results_mode: Optional[str] = None) -> Dict[str, Any]:
         """Run simulation with custom variable definitions"""
         
         # Create scenario configuration
@@ -464,19 +643,20 @@ class MonteCarloEngine:
         }
         
         # Run simulation synchronously
-        return self._run_simulation_sync(scenario_config, num_iterations)
+        return self._run_simulation_sync(scenario_config, num_iterations, results_mode)
     
     def run_time_series_simulation(self, 
                                  base_scenario: Dict[str, Any],
                                  time_steps: int,
-                                 num_iterations: Optional[int] = None) -> Dict[str, Any]:
+                                 num_iterations: Optional[int] = None,
+                                 results_mode: Optional[str] = None) -> Dict[str, Any]:
         """Run time series Monte Carlo simulation"""
         
         # Generate time series scenario
         scenario = self.scenarios.generate_time_series_scenario(base_scenario, time_steps)
         
         # Run simulation synchronously
-        return self._run_simulation_sync(scenario, num_iterations)
+        return self._run_simulation_sync(scenario, num_iterations, results_mode)
     
     def get_simulation_status(self) -> Dict[str, Any]:
         """Get current simulation engine status"""
@@ -490,11 +670,18 @@ class MonteCarloEngine:
                 "default_iterations": self.config.default_iterations,
                 "confidence_level": self.config.confidence_level
             },
+            "cache": self.get_cache_stats(),
             "supported_distributions": self.distributions.list_supported_distributions(),
             "supported_scenarios": self.scenarios.list_scenario_types(),
             "supported_copulas": self.correlations.supported_copulas
         }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache metrics"""
+        if self.cache is None:
+            return {"backend": "none", "enabled": False}
+        return {"enabled": self.config.cache_results, **self.cache.get_stats()}
+    
     def validate_configuration(self) -> bool:
         """Validate engine configuration"""
         
@@ -0,0 +1,129 @@
+"""
+Precision Targets
+Standard-error estimates for simulation metrics used by adaptive early stopping
+"""
+
+import numpy as np
+import logging
+from typing import Dict, List, Any, Tuple
+
+from scipy import special
+
+logger = logging.getLogger(__name__)
+
+PRECISION_METRICS = ["mean", "std", "var_95", "cvar_95", "var_99", "cvar_99"]
+
+_TARGET_KEYS = {
+    "metrics", "variables", "relative_standard_error", "ci_width",
+    "confidence_level", "min_iterations", "batch_size"
+}
+
+
+def normalize_precision_target(target: Dict[str, Any],
+                               variable_names: List[str],
+                               default_batch_size: int) -> Dict[str, Any]:
+    """Validate a precision target and fill in defaults
+
+    A target must set ``relative_standard_error`` and/or ``ci_width`` (the
+    full width of the confidence interval, in the metric's units). Both are
+    required to hold when both are given.
+    """
+    unknown = set(target) - _TARGET_KEYS
+    if unknown:
+        raise ValueError(f"Unknown precision target fields: {sorted(unknown)}")
+
+    if target.get("relative_standard_error") is None and target.get("ci_width") is None:
+        raise ValueError("Precision target needs relative_standard_error or ci_width")
+
+    metrics = target.get("metrics") or ["mean"]
+    invalid = [m for m in metrics if m not in PRECISION_METRICS]
+    if invalid:
+        raise ValueError(f"Unsupported precision metrics: {invalid}")
+
+    variables = target.get("variables") or variable_names
+    missing = [v for v in variables if v not in variable_names]
+    if missing:
+        raise ValueError(f"Unknown variables in precision target: {missing}")
+
+    batch_size = int(target.get("batch_size") or default_batch_size)
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive")
+
+    return {
+        "metrics": list(metrics),
+        "variables": list(variables),
+        "relative_standard_error": target.get("relative_standard_error"),
+        "ci_width": target.get("ci_width"),
+        "confidence_level": float(target.get("confidence_level", 0.95)),
+        "min_iterations": int(target.get("min_iterations", batch_size)),
+        "batch_size": batch_size
+    }
+
+
+def metric_standard_error(samples: np.ndarray, metric: str) -> Tuple[float, float]:
+    """Return ``(estimate, standard_error)`` for a metric of one variable
+
+    Definitions follow ``ResultAnalyzer``: ``var_XX`` is the ``1 - XX``
+    quantile and ``cvar_XX`` the mean of samples at or above it. Quantile
+    errors come from the distribution-free order-statistic interval.
+    """
+    n = len(samples)
+
+    if metric == "mean":
+        return float(samples.mean()), float(samples.std(ddof=1) / np.sqrt(n))
+
+    if metric == "std":
+        std = float(samples.std(ddof=1))
+        return std, std / np.sqrt(2.0 * (n - 1))
+
+    level = 0.95 if metric.endswith("95") else 0.99
+    p = 1.0 - level
+    quantile = float(np.percentile(samples, p * 100))
+
+    if metric.startswith("var"):
+        # Order statistics bracketing a 95% binomial interval for the quantile
+        spread = 1.96 * np.sqrt(n * p * (1 - p))
+        lower = max(int(np.floor(n * p - spread)), 0)
+        upper = min(int(np.ceil(n * p + spread)), n - 1)
+        ordered = np.partition(samples, (lower, upper))
+        return quantile, float(ordered[upper] - ordered[lower]) / (2 * 1.96)
+
+    tail = samples[samples >= quantile]
+    if len(tail) < 2:
+        return quantile, float("inf")
+    return float(tail.mean()), float(tail.std(ddof=1) / np.sqrt(len(tail)))
+
+
+def check_precision(samples: np.ndarray,
+                    variable_names: List[str],
+                    target: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate a normalized precision target against the samples drawn so far"""
+    z = float(special.ndtri(0.5 + target["confidence_level"] / 2))
+    metrics = {}
+    all_met = True
+
+    for name in target["variables"]:
+        column = samples[:, variable_names.index(name)]
+        per_metric = {}
+        for metric in target["metrics"]:
+            estimate, standard_error = metric_standard_error(column, metric)
+            relative = standard_error / abs(estimate) if estimate != 0 else float("inf")
+            ci_width = 2.0 * z * standard_error
+
+            met = True
+            if target["relative_standard_error"] is not None:
+                met = met and relative <= target["relative_standard_error"]
+            if target["ci_width"] is not None:
+                met = met and ci_width <= target["ci_width"]
+            all_met = all_met and met
+
+            per_metric[metric] = {
+                "estimate": estimate,
+                "standard_error": standard_error,
+                "relative_standard_error": relative if np.isfinite(relative) else None,
+                "ci_width": ci_width if np.isfinite(ci_width) else None,
+                "met": bool(met)
+            }
+        metrics[name] = per_metric
+
+    return {"met": all_met, "metrics": metrics}
@@ -0,0 +1,346 @@
+"""
+Simulation Result Cache
+Byte-budgeted, pluggable result caching for Monte Carlo simulations
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Scenario fields that label a run but do not change its results
+NON_SEMANTIC_SCENARIO_FIELDS = frozenset({
+    "name", "description", "notes", "tags", "metadata",
+    "request_id", "timestamp", "created_at", "type"
+})
+
+
+def _canonicalize(value: Any) -> Any:
+    """Normalize a scenario value so equivalent configurations hash equally"""
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if hasattr(value, "tolist"):
+        return _canonicalize(value.tolist())
+    return str(value)
+
+
+def make_cache_key(scenario_config: Dict[str, Any], **run_options: Any) -> str:
+    """Build a canonical cache key for a scenario and its run options
+
+    Non-semantic labels (name, description, tags, ...) of the scenario itself
+    are ignored and numbers are normalized, so ``{"std": 1}`` and
+    ``{"std": 1.0}`` share a cache entry. Nested keys are kept as-is, since
+    variables or parameters may legitimately use the same names.
+    """
+    scenario = {
+        k: v for k, v in scenario_config.items()
+        if k not in NON_SEMANTIC_SCENARIO_FIELDS
+    }
+    payload = {
+        "scenario": _canonicalize(scenario),
+        "options": _canonicalize(run_options)
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+    return f"monte_carlo:{digest}"
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache bounded by total payload bytes"""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int, ttl_seconds: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self.current_bytes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at is not None and time.time() > expires_at:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: bytes) -> bool:
+        if len(payload) > self.max_bytes:
+            return False
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (payload, expires_at)
+            self.current_bytes += len(payload)
+            while self.current_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        payload, _ = self._entries.pop(key)
+        self.current_bytes -= len(payload)
+
+
+class DiskCacheBackend:
+    """On-disk LRU cache bounded by total file bytes
+
+    Entries survive process restarts; the LRU index is rebuilt from file
+    modification times on startup.
+    """
+
+    name = "disk"
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int,
+                 ttl_seconds: Optional[int] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._index: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self.current_bytes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _load_index(self):
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            stat = path.stat()
+            self._index[path.name] = (stat.st_size, stat.st_mtime)
+            self.current_bytes += stat.st_size
+
+    def _expired(self, written_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - written_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path_for(key)
+        with self._lock:
+            entry = self._index.get(path.name)
+            if entry is None:
+                return None
+            if self._expired(entry[1]):
+                self._remove(path)
+                return None
+            try:
+                payload = path.read_bytes()
+            except OSError:
+                self._index.pop(path.name, None)
+                self.current_bytes -= entry[0]
+                return None
+            self._index.move_to_end(path.name)
+            return payload
+
+    def set(self, key: str, payload: bytes) -> bool:
+        if len(payload) > self.max_bytes:
+            return False
+        path = self._path_for(key)
+        with self._lock:
+            if path.name in self._index:
+                self._remove(path)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+            self._index[path.name] = (len(payload), time.time())
+            self.current_bytes += len(payload)
+            while self.current_bytes > self.max_bytes and self._index:
+                oldest = next(iter(self._index))
+                self._remove(self.cache_dir / oldest)
+                self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        path = self._path_for(key)
+        with self._lock:
+            if path.name not in self._index:
+                return False
+            self._remove(path)
+            return True
+
+    def clear(self):
+        with self._lock:
+            for name in list(self._index):
+                self._remove(self.cache_dir / name)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _remove(self, path: Path):
+        size, _ = self._index.pop(path.name, (0, 0.0))
+        self.current_bytes -= size
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class RedisCacheBackend:
+    """Redis-compatible cache; eviction is delegated to the server's policy"""
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: Optional[int] = None):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("Redis module not available")
+        self.client = redis.Redis.from_url(
+            url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+            retry_on_timeout=False
+        )
+        self.client.ping()
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self.current_bytes = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, payload: bytes) -> bool:
+        if self.ttl_seconds:
+            self.client.setex(key, self.ttl_seconds, payload)
+        else:
+            self.client.set(key, payload)
+        return True
+
+    def delete(self, key: str) -> bool:
+        return bool(self.client.delete(key))
+
+    def clear(self):
+        for key in self.client.scan_iter(match="monte_carlo:*"):
+            self.client.delete(key)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match="monte_carlo:*"))
+
+
+class SimulationResultCache:
+    """Result cache with canonical keys and hit/miss/eviction metrics"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "rejected": 0,
+            "errors": 0
+        }
+
+    @classmethod
+    def from_config(cls, config) -> Optional["SimulationResultCache"]:
+        """Build the cache described by a ``MonteCarloConfig``
+
+        Returns ``None`` when caching is disabled. A Redis backend that cannot
+        be reached falls back to the in-process backend.
+        """
+        if not config.cache_results or config.cache_backend == "none":
+            return None
+
+        ttl = config.cache_ttl_seconds or None
+        if config.cache_backend == "redis":
+            try:
+                return cls(RedisCacheBackend(config.redis_url, ttl))
+            except Exception as e:
+                logger.warning(f"Redis cache not available, using in-process cache: {e}")
+        elif config.cache_backend == "disk":
+            return cls(DiskCacheBackend(config.cache_dir, config.cache_max_bytes, ttl))
+        elif config.cache_backend != "memory":
+            raise ValueError(f"Unsupported cache backend: {config.cache_backend}")
+
+        return cls(MemoryCacheBackend(config.cache_max_bytes, ttl))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of a cached result, or ``None``"""
+        try:
+            payload = self.backend.get(key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to read simulation cache: {e}")
+            payload = None
+
+        if payload is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return json.loads(payload)
+
+    def set(self, key: str, result: Dict[str, Any]) -> bool:
+        """Cache a result; oversized results are rejected rather than stored"""
+        try:
+            payload = json.dumps(result, default=str).encode()
+            stored = self.backend.set(key, payload)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to write simulation cache: {e}")
+            return False
+
+        self.stats["sets" if stored else "rejected"] += 1
+        return stored
+
+    def delete(self, key: str) -> bool:
+        return self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache metrics"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "backend": self.backend.name,
+            **self.stats,
+            "evictions": self.backend.evictions,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+            "current_bytes": self.backend.current_bytes,
+            "max_bytes": getattr(self.backend, "max_bytes", None)
+        }
@@ -0,0 +1,144 @@
+"""
+Sample Store
+Binary storage for raw Monte Carlo samples referenced from compact result payloads
+"""
+
+import numpy as np
+import logging
+import math
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class SampleStore:
+    """Store simulation sample arrays as NPY files and serve slices of them.
+
+    Results returned in ``summary`` mode carry a small handle instead of the
+    full ``(iterations x variables)`` array; clients fetch the raw samples
+    through the handle, optionally restricted to a row range, a subset of
+    variables, or decimated to a maximum number of points.
+
+    The store is bounded: after each save, files older than ``ttl_seconds``
+    are removed, then the oldest files until the total size fits in
+    ``max_bytes``. ``None`` disables either limit.
+    """
+
+    def __init__(self,
+                 storage_dir: Union[str, Path] = "cache/monte_carlo_samples",
+                 max_bytes: Optional[int] = 1024 ** 3,
+                 ttl_seconds: Optional[float] = 86400):
+        self.storage_dir = Path(storage_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+    def _path_for(self, sample_id: str) -> Path:
+        # Sample ids are UUIDs; parsing them rejects anything path-like
+        return self.storage_dir / f"{uuid.UUID(sample_id)}.npy"
+
+    def save(self, sample_id: str, samples: np.ndarray,
+             variable_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Persist samples and return the handle to embed in results"""
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path_for(sample_id)
+        np.save(path, np.ascontiguousarray(samples), allow_pickle=False)
+        self.prune(keep=path)
+
+        return {
+            "sample_id": sample_id,
+            "format": "npy",
+            "shape": list(samples.shape),
+            "dtype": str(samples.dtype),
+            "nbytes": int(samples.nbytes),
+            "variable_names": variable_names or [],
+            "endpoint": f"/api/v1/monte-carlo/samples/{sample_id}"
+        }
+
+    def exists(self, sample_id: str) -> bool:
+        """Check whether samples for ``sample_id`` are stored"""
+        try:
+            return self._path_for(sample_id).exists()
+        except ValueError:
+            return False
+
+    def load(self,
+             sample_id: str,
+             start: int = 0,
+             stop: Optional[int] = None,
+             max_points: Optional[int] = None,
+             variables: Optional[List[int]] = None) -> np.ndarray:
+        """Load a row range of stored samples without reading the whole file
+
+        ``max_points`` decimates the selected range with a uniform stride so
+        that at most that many rows are returned.
+        """
+        path = self._path_for(sample_id)
+        if not path.exists():
+            raise KeyError(f"Samples not found: {sample_id}")
+
+        samples = np.load(path, mmap_mode="r", allow_pickle=False)
+        total = samples.shape[0]
+        start = max(0, min(start, total))
+        stop = total if stop is None else max(start, min(stop, total))
+
+        step = 1
+        if max_points is not None and max_points > 0 and stop - start > max_points:
+            step = math.ceil((stop - start) / max_points)
+
+        selected = samples[start:stop:step]
+        if variables is not None:
+            selected = selected[:, variables]
+
+        return np.array(selected)
+
+    def delete(self, sample_id: str) -> bool:
+        """Remove stored samples, returning whether anything was deleted"""
+        try:
+            path = self._path_for(sample_id)
+        except ValueError:
+            return False
+        if path.exists():
+            path.unlink()
+            return True
+        return False
+
+    def prune(self, keep: Optional[Path] = None) -> int:
+        """Enforce the TTL and size budget, returning the number of files removed
+
+        ``keep`` (the file just written) is never removed.
+        """
+        if self.max_bytes is None and self.ttl_seconds is None:
+            return 0
+
+        files = []
+        for path in self.storage_dir.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            if path == keep:
+                continue
+            expired = self.ttl_seconds is not None and now - mtime > self.ttl_seconds
+            over_budget = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or over_budget):
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug(f"Pruned {removed} stored sample files")
+        return removed
@@ -0,0 +1,388 @@
+"""
+Streaming Analysis
+Constant-memory statistics, risk metrics and convergence tracking for
+Monte Carlo runs too large to hold in memory
+"""
+
+import numpy as np
+import logging
+from typing import Dict, List, Any
+
+from .analysis import ResultAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class RunningMoments:
+    """Per-variable running count, mean, central moments (to 4th), min and max
+
+    Batches are folded in with the pairwise update formulas of Chan et al. /
+    Pébay, so results match the full-array calculation up to rounding.
+    """
+
+    def __init__(self, num_variables: int):
+        self.count = 0
+        self.mean = np.zeros(num_variables)
+        self.m2 = np.zeros(num_variables)
+        self.m3 = np.zeros(num_variables)
+        self.m4 = np.zeros(num_variables)
+        self.min = np.full(num_variables, np.inf)
+        self.max = np.full(num_variables, -np.inf)
+
+    def update(self, batch: np.ndarray):
+        """Fold a ``(rows x variables)`` batch into the running moments"""
+        nb = batch.shape[0]
+        if nb == 0:
+            return
+
+        mean_b = batch.mean(axis=0)
+        centered = batch - mean_b
+        sq = centered ** 2
+        m2_b = sq.sum(axis=0)
+        m3_b = (sq * centered).sum(axis=0)
+        m4_b = (sq * sq).sum(axis=0)
+
+        na = self.count
+        n = na + nb
+        delta = mean_b - self.mean
+
+        m4 = (self.m4 + m4_b
+              + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * delta ** 2 * (na * na * m2_b + nb * nb * self.m2) / n ** 2
+              + 4 * delta * (na * m3_b - nb * self.m3) / n)
+        m3 = (self.m3 + m3_b
+              + delta ** 3 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * m2_b - nb * self.m2) / n)
+        m2 = self.m2 + m2_b + delta ** 2 * na * nb / n
+
+        self.mean = self.mean + delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.count = n
+        self.min = np.minimum(self.min, batch.min(axis=0))
+        self.max = np.maximum(self.max, batch.max(axis=0))
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance (matches ``np.var``)"""
+        return self.m2 / self.count if self.count else np.zeros_like(self.m2)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+    @property
+    def skewness(self) -> np.ndarray:
+        var = self.variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skew = (self.m3 / self.count) / var ** 1.5
+        return np.where(var > 0, skew, 0.0)
+
+    @property
+    def kurtosis(self) -> np.ndarray:
+        """Excess kurtosis"""
+        var = self.variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kurt = (self.m4 / self.count) / var ** 2 - 3
+        return np.where(var > 0, kurt, 0.0)
+
+    def standard_error(self) -> np.ndarray:
+        """Standard error of the running mean"""
+        if self.count < 2:
+            return np.full_like(self.mean, np.inf)
+        return np.sqrt(self.m2 / (self.count - 1) / self.count)
+
+
+class OnlineCovariance:
+    """Running co-moment matrix for the online covariance/correlation"""
+
+    def __init__(self, num_variables: int):
+        self.count = 0
+        self.mean = np.zeros(num_variables)
+        self.comoment = np.zeros((num_variables, num_variables))
+
+    def update(self, batch: np.ndarray):
+        nb = batch.shape[0]
+        if nb == 0:
+            return
+
+        mean_b = batch.mean(axis=0)
+        centered = batch - mean_b
+        comoment_b = centered.T @ centered
+
+        na = self.count
+        n = na + nb
+        delta = mean_b - self.mean
+        self.comoment += comoment_b + np.outer(delta, delta) * na * nb / n
+        self.mean = self.mean + delta * nb / n
+        self.count = n
+
+    def covariance(self) -> np.ndarray:
+        if self.count < 2:
+            return np.zeros_like(self.comoment)
+        return self.comoment / (self.count - 1)
+
+    def correlation(self) -> np.ndarray:
+        cov = self.covariance()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        corr = np.nan_to_num(corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+
+class QuantileDigest:
+    """Mergeable t-digest quantile sketch with bounded memory
+
+    Values are clustered into at most roughly ``compression / 2`` weighted
+    centroids using the arcsine scale function, which keeps centroids small
+    in the tails where VaR/CVaR are read. Batches are merged with vectorized
+    sort/reduce operations rather than per-value updates.
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray):
+        """Add raw values to the sketch"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._merge(values, np.ones_like(values))
+
+    def merge(self, other: "QuantileDigest"):
+        """Fold another digest into this one"""
+        if other.count == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._merge(other.means, other.weights)
+
+    def _merge(self, means: np.ndarray, weights: np.ndarray):
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+
+        total = weights.sum()
+        q_left = (np.cumsum(weights) - weights) / total
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        groups = np.floor(scale - scale[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+        self.count = float(total)
+
+    def _knots(self):
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [self.count]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return positions, values
+
+    def quantile(self, q):
+        """Estimate quantile(s) ``q`` in ``[0, 1]``"""
+        if self.count == 0:
+            return np.nan
+        positions, values = self._knots()
+        return np.interp(np.asarray(q) * self.count, positions, values)
+
+    def cdf(self, x):
+        """Estimate the fraction of values ``<= x``"""
+        if self.count == 0:
+            return np.nan
+        positions, values = self._knots()
+        return np.interp(x, values, positions) / self.count
+
+    def tail_mean(self, threshold: float, resolution: int = 512) -> float:
+        """Estimate ``E[X | X >= threshold]`` by integrating the quantile function"""
+        if self.count == 0:
+            return np.nan
+        lower = float(self.cdf(threshold))
+        if lower >= 1.0:
+            return float(threshold)
+        grid = lower + (np.arange(resolution) + 0.5) * (1.0 - lower) / resolution
+        return float(np.mean(self.quantile(grid)))
+
+
+class StreamingAnalyzer:
+    """Batch-fed counterpart of ``ResultAnalyzer`` that runs in constant memory
+
+    Statistics, risk metrics and stress tests follow the same conventions and
+    output format as ``ResultAnalyzer`` so results are interchangeable, with
+    quantile-based values estimated from t-digest sketches.
+    """
+
+    PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, num_variables: int, compression: int = 200):
+        self.num_variables = num_variables
+        self.moments = RunningMoments(num_variables)
+        self.covariance = OnlineCovariance(num_variables)
+        self.digests = [QuantileDigest(compression) for _ in range(num_variables)]
+        self.compression = compression
+        self.batches = 0
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def update(self, batch: np.ndarray):
+        """Consume one batch of samples"""
+        batch = np.asarray(batch, dtype=float)
+        if batch.ndim == 1:
+            batch = batch.reshape(-1, 1)
+        if batch.shape[1] != self.num_variables:
+            raise ValueError(
+                f"Expected {self.num_variables} variables, got {batch.shape[1]}"
+            )
+
+        self.moments.update(batch)
+        self.covariance.update(batch)
+        for i, digest in enumerate(self.digests):
+            digest.update(batch[:, i])
+        self.batches += 1
+
+    def calculate_statistics(self) -> Dict[str, Any]:
+        """Per-variable statistics in ``ResultAnalyzer.calculate_statistics`` format"""
+        statistics = {}
+        for i, digest in enumerate(self.digests):
+            percentiles = digest.quantile(np.array(self.PERCENTILES) / 100)
+            statistics[f"variable_{i}"] = {
+                "mean": float(self.moments.mean[i]),
+                "median": float(digest.quantile(0.5)),
+                "std": float(self.moments.std[i]),
+                "min": float(self.moments.min[i]),
+                "max": float(self.moments.max[i]),
+                "skewness": float(self.moments.skewness[i]),
+                "kurtosis": float(self.moments.kurtosis[i]),
+                "percentiles": {
+                    str(p): float(v) for p, v in zip(self.PERCENTILES, percentiles)
+                }
+            }
+        return statistics
+
+    def calculate_risk_metrics(self, confidence_level: float = 0.95) -> Dict[str, Any]:
+        """Per-variable risk metrics in ``ResultAnalyzer.calculate_risk_metrics`` format"""
+        risk_metrics = {}
+        for i, digest in enumerate(self.digests):
+            var_95 = float(digest.quantile(0.05))
+            var_99 = float(digest.quantile(0.01))
+            threshold = float(digest.quantile(0.95))
+            tail_probability = 1.0 - float(digest.cdf(threshold))
+            tail_mean = digest.tail_mean(threshold)
+
+            risk_metrics[f"variable_{i}"] = {
+                "var_95": var_95,
+                "cvar_95": digest.tail_mean(var_95),
+                "var_99": var_99,
+                "cvar_99": digest.tail_mean(var_99),
+                "probability_of_failure": tail_probability,
+                "risk_exposure": float(tail_mean - threshold) if tail_probability > 0 else 0.0,
+                "impact_assessment": float(self.moments.max[i])
+            }
+        return risk_metrics
+
+    def perform_stress_tests(self) -> Dict[str, Any]:
+        """Stress tests over the pooled sample distribution
+
+        Mirrors ``ResultAnalyzer.perform_stress_tests``; each scenario is a
+        monotone transform of the samples, so it can be evaluated from the
+        pooled quantile sketch instead of the raw array.
+        """
+        pooled = QuantileDigest(self.compression)
+        for digest in self.digests:
+            pooled.merge(digest)
+
+        p95, p99 = (float(v) for v in pooled.quantile([0.95, 0.99]))
+        total = self.moments.count * self.num_variables
+        pooled_mean = float(self.moments.mean.mean())
+        pooled_var = float(
+            (self.moments.m2.sum() + self.moments.count * ((self.moments.mean - pooled_mean) ** 2).sum())
+            / total
+        ) if total else 0.0
+        original_vol = np.sqrt(pooled_var)
+
+        stress_tests = {}
+
+        stress_factor = 2.0
+        stress_tests["extreme_market"] = {
+            "stress_factor": stress_factor,
+            "original_var_95": p95,
+            "stressed_var_95": stress_factor * p95,
+            "var_increase": (stress_factor - 1) * p95,
+            "failure_probability_increase": float(
+                pooled.cdf(p99) - pooled.cdf(p99 / stress_factor)
+            )
+        }
+
+        if self.num_variables > 1:
+            corr = self.covariance.correlation()
+            off_diagonal = corr[~np.eye(self.num_variables, dtype=bool)]
+            original_corr = float(np.mean(off_diagonal))
+            stress_tests["correlation_breakdown"] = {
+                "original_correlation": original_corr,
+                "breakdown_correlation": 0.0,
+                "correlation_change": -original_corr
+            }
+        else:
+            stress_tests["correlation_breakdown"] = {
+                "original_correlation": 1.0,
+                "breakdown_correlation": 1.0,
+                "correlation_change": 0.0
+            }
+
+        spike = 3.0
+        stress_tests["volatility_spike"] = {
+            "original_volatility": float(original_vol),
+            "spike_volatility": float(original_vol * spike),
+            "volatility_increase": float(original_vol * (spike - 1)),
+            "var_impact": (spike - 1) * p95
+        }
+
+        tail_multiplier = 1.5
+        original_tail = 1.0 - float(pooled.cdf(p99))
+        stress_tests["tail_risk_events"] = {
+            "original_tail_probability": original_tail,
+            "increased_tail_probability": original_tail,
+            "tail_impact": p99 * (tail_multiplier - 1) if p99 > 0 else 0.0
+        }
+
+        systemic_shock = 0.5
+        stress_tests["systemic_risk"] = {
+            "systemic_shock": systemic_shock,
+            "original_mean": pooled_mean,
+            "systemic_mean": pooled_mean * (1 - systemic_shock),
+            "systemic_impact": pooled_mean * systemic_shock,
+            "systemic_var_95": p95 * (1 - systemic_shock)
+        }
+
+        stress_tests["aggregate"] = ResultAnalyzer()._aggregate_stress_test_results(stress_tests)
+        return stress_tests
+
+    def convergence(self) -> Dict[str, Any]:
+        """Progressive convergence estimates for the running means"""
+        standard_errors = self.moments.standard_error()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.abs(standard_errors / self.moments.mean)
+        return {
+            "iterations": int(self.count),
+            "batches": self.batches,
+            "standard_error": [float(v) for v in standard_errors],
+            "relative_standard_error": [
+                float(v) if np.isfinite(v) else None for v in relative
+            ],
+            "ci_95_half_width": [float(1.96 * v) for v in standard_errors]
+        }
+
+    def correlation_matrix(self) -> List[List[float]]:
+        return self.covariance.correlation().tolist()
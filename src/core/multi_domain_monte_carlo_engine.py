@@ -5,12 +5,17 @@ A comprehensive Monte Carlo simulation engine for defense, intelligence, and bus
 """
 
 import asyncio
+import copy
 import json
 import logging
+import os
+import threading
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
@@ -73,10 +78,29 @@ class SimulationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BatchSimulationSpec:
+    """One entry of a batched multi-scenario run."""
+    config: SimulationConfig
+    scenario_name: str
+    custom_variables: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BatchSimulationOutcome:
+    """Result (or error) for one spec of a batch, yielded as it completes."""
+    index: int
+    spec: BatchSimulationSpec
+    result: Optional[SimulationResult] = None
+    error: Optional[str] = None
+
+
 class MultiDomainMonteCarloEngine:
     """Multi-domain Monte Carlo simulation engine."""
     
-    def __init__(self, cache_dir: str = "cache/monte_carlo"):
+    CHOLESKY_CACHE_SIZE = 64
+    
+    def __init__(self, cache_dir: str = "cache/monte_carlo", max_workers: Optional[int] = None):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -86,6 +110,12 @@ class MultiDomainMonteCarloEngine:
         # Performance tracking
         self.performance_metrics = {}
         
+        # Batch execution: worker pool and factorizations shared across scenarios
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cholesky_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cholesky_lock = threading.Lock()
+        
     def _load_scenario_templates(self) -> Dict[DomainType, Dict[str, Any]]:
         """Load domain-specific scenario templates."""
         return {
@@ -281,37 +311,13 @@ class MultiDomainMonteCarloEngine:
         logger.info(f"Starting simulation {simulation_id} for domain {config.domain.value}")
         
         try:
-            # Get scenario template
-            scenario_template = self._get_scenario_template(config.domain, scenario_name)
-            
-            # Merge with custom variables if provided
-            if custom_variables:
-                scenario_template = self._merge_custom_variables(scenario_template, custom_variables)
+            scenario_template = self._prepare_scenario(config.domain, scenario_name, custom_variables)
             
             # Run the simulation
             samples = await self._run_monte_carlo_simulation(scenario_template, config)
             
-            # Calculate statistics
-            statistics = self._calculate_statistics(samples, scenario_template["variables"])
-            
-            # Calculate risk metrics
-            risk_metrics = self._calculate_risk_metrics(samples)
-            
-            # Calculate confidence intervals
-            confidence_intervals = self._calculate_confidence_intervals(samples, config.confidence_level)
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            result = SimulationResult(
-                simulation_id=simulation_id,
-                config=config,
-                samples=samples,
-                statistics=statistics,
-                risk_metrics=risk_metrics,
-                confidence_intervals=confidence_intervals,
-                execution_time=execution_time,
-                timestamp=start_time
-            )
+            result = self._build_result(simulation_id, config, scenario_template, samples, start_time)
+            execution_time = result.execution_time
             
             # Cache results if enabled
             if config.cache_results:
@@ -328,6 +334,154 @@ class MultiDomainMonteCarloEngine:
             logger.error(f"Error in simulation {simulation_id}: {e}")
             raise
     
+    async def run_batch(
+        self,
+        specs: List[BatchSimulationSpec],
+        seed: Optional[int] = None
+    ) -> AsyncIterator[BatchSimulationOutcome]:
+        """Run many (domain, scenario, custom_variables) specs, yielding as they complete.
+        
+        Specs with the same iteration count share one block of standard normal
+        base draws (common random numbers), so near-identical scenarios differ
+        only by their parameters, and identical correlation matrices share a
+        single Cholesky factorization. Specs run concurrently on the engine's
+        worker pool; a failing spec yields an outcome with ``error`` set
+        instead of aborting the batch.
+        """
+        
+        batch_id = str(uuid.uuid4())
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        
+        prepared = []
+        outcomes = []
+        for index, spec in enumerate(specs):
+            try:
+                scenario = self._prepare_scenario(
+                    spec.config.domain, spec.scenario_name, spec.custom_variables
+                )
+                prepared.append((index, spec, scenario))
+            except Exception as e:
+                outcomes.append(BatchSimulationOutcome(index=index, spec=spec, error=str(e)))
+        
+        # One base stream per iteration count, wide enough for every spec using it
+        widths: Dict[int, int] = {}
+        for _, spec, scenario in prepared:
+            n = spec.config.num_iterations
+            widths[n] = max(widths.get(n, 0), len(scenario["variables"]))
+        rng = np.random.default_rng(seed)
+        base_streams = {
+            n: rng.standard_normal((n, width)) for n, width in sorted(widths.items())
+        }
+        
+        logger.info(
+            f"Starting batch {batch_id}: {len(specs)} specs, "
+            f"{len(base_streams)} shared base streams, {self.max_workers} workers"
+        )
+        
+        for outcome in outcomes:
+            yield outcome
+        
+        async def run_one(index: int, spec: BatchSimulationSpec, scenario: Dict[str, Any]):
+            start_time = datetime.now()
+            try:
+                base = base_streams[spec.config.num_iterations]
+                result = await loop.run_in_executor(
+                    executor, self._run_from_base_stream,
+                    spec.config, scenario, base, start_time
+                )
+                result.metadata.update({"batch_id": batch_id, "batch_index": index})
+                if spec.config.cache_results:
+                    await self._cache_result(result)
+                self._update_performance_metrics(result)
+                return BatchSimulationOutcome(index=index, spec=spec, result=result)
+            except Exception as e:
+                logger.error(f"Batch {batch_id} spec {index} failed: {e}")
+                return BatchSimulationOutcome(index=index, spec=spec, error=str(e))
+        
+        tasks = [asyncio.ensure_future(run_one(*entry)) for entry in prepared]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def run_batch_simulations(
+        self,
+        specs: List[BatchSimulationSpec],
+        seed: Optional[int] = None
+    ) -> List[BatchSimulationOutcome]:
+        """Run a batch and return outcomes in spec order."""
+        outcomes = [outcome async for outcome in self.run_batch(specs, seed)]
+        return sorted(outcomes, key=lambda outcome: outcome.index)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the worker pool used for batched runs."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="multi_domain_mc"
+            )
+        return self._executor
+    
+    def _run_from_base_stream(
+        self,
+        config: SimulationConfig,
+        scenario: Dict[str, Any],
+        base_normals: np.ndarray,
+        start_time: datetime
+    ) -> SimulationResult:
+        """Worker body: transform shared base normals into one scenario's result."""
+        variables = scenario["variables"]
+        normals = base_normals[:, :len(variables)]
+        
+        correlations = scenario.get("correlations", [])
+        if correlations and len(correlations) > 0:
+            normals = normals @ self._get_cholesky_factor(correlations).T
+        
+        samples = self._transform_normals(variables, normals)
+        result = self._build_result(str(uuid.uuid4()), config, scenario, samples, start_time)
+        result.metadata["shared_base_stream"] = True
+        return result
+    
+    def _prepare_scenario(
+        self,
+        domain: DomainType,
+        scenario_name: str,
+        custom_variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Resolve a scenario template and merge custom variables into a private copy."""
+        scenario_template = self._get_scenario_template(domain, scenario_name)
+        
+        if custom_variables:
+            scenario_template = self._merge_custom_variables(scenario_template, custom_variables)
+        
+        return scenario_template
+    
+    def _build_result(
+        self,
+        simulation_id: str,
+        config: SimulationConfig,
+        scenario: Dict[str, Any],
+        samples: np.ndarray,
+        start_time: datetime
+    ) -> SimulationResult:
+        """Compute statistics, risk metrics and confidence intervals for samples."""
+        statistics = self._calculate_statistics(samples, scenario["variables"])
+        risk_metrics = self._calculate_risk_metrics(samples)
+        confidence_intervals = self._calculate_confidence_intervals(samples, config.confidence_level)
+        
+        return SimulationResult(
+            simulation_id=simulation_id,
+            config=config,
+            samples=samples,
+            statistics=statistics,
+            risk_metrics=risk_metrics,
+            confidence_intervals=confidence_intervals,
+            execution_time=(datetime.now() - start_time).total_seconds(),
+            timestamp=start_time
+        )
+    
     def _get_scenario_template(self, domain: DomainType, scenario_name: str) -> Dict[str, Any]:
         """Get scenario template for domain and scenario."""
         if domain not in self.scenario_templates:
@@ -341,7 +495,8 @@ class MultiDomainMonteCarloEngine:
     
     def _merge_custom_variables(self, template: Dict[str, Any], custom_variables: Dict[str, Any]) -> Dict[str, Any]:
         """Merge custom variables with template."""
-        merged = template.copy()
+        # Deep copy so merges never leak into the shared templates
+        merged = copy.deepcopy(template)
         
         if "variables" in custom_variables:
             merged["variables"].update(custom_variables["variables"])
@@ -393,8 +548,29 @@ class MultiDomainMonteCarloEngine:
     ) -> np.ndarray:
         """Generate correlated samples using Cholesky decomposition."""
         
+        cholesky_factor = self._get_cholesky_factor(correlations)
+        
+        # Generate independent standard normal samples
+        n_vars = len(variables)
+        independent_samples = np.random.standard_normal((num_iterations, n_vars))
+        
+        # Transform to correlated samples
+        correlated_normal = independent_samples @ cholesky_factor.T
+        
+        return self._transform_normals(variables, correlated_normal)
+    
+    def _get_cholesky_factor(self, correlations: List[List[float]]) -> np.ndarray:
+        """Cholesky factor of a correlation matrix, cached by matrix contents."""
+        
         # Convert correlation matrix to numpy array
-        corr_matrix = np.array(correlations)
+        corr_matrix = np.asarray(correlations, dtype=float)
+        key = corr_matrix.tobytes() + str(corr_matrix.shape).encode()
+        
+        with self._cholesky_lock:
+            cached = self._cholesky_cache.get(key)
+            if cached is not None:
+                self._cholesky_cache.move_to_end(key)
+                return cached
         
         # Ensure correlation matrix is positive definite
         try:
@@ -406,25 +582,21 @@ class MultiDomainMonteCarloEngine:
             corr_matrix = eigenvecs @ np.diag(eigenvals) @ eigenvecs.T
             cholesky_factor = np.linalg.cholesky(corr_matrix)
         
-        # Generate independent standard normal samples
-        n_vars = len(variables)
-        independent_samples = np.random.standard_normal((num_iterations, n_vars))
-        
-        # Transform to correlated samples
-        correlated_normal = independent_samples @ cholesky_factor.T
+        with self._cholesky_lock:
+            self._cholesky_cache[key] = cholesky_factor
+            while len(self._cholesky_cache) > self.CHOLESKY_CACHE_SIZE:
+                self._cholesky_cache.popitem(last=False)
         
-        # Transform to desired distributions
-        samples = np.zeros((num_iterations, n_vars))
-        var_names = list(variables.keys())
+        return cholesky_factor
+    
+    def _transform_normals(self, variables: Dict[str, Any], normals: np.ndarray) -> np.ndarray:
+        """Transform (correlated) standard normal columns to each variable's distribution."""
+        samples = np.zeros(normals.shape)
         
-        for i, var_name in enumerate(var_names):
-            var_config = variables[var_name]
-            distribution = var_config["distribution"]
-            parameters = var_config["parameters"]
-            
+        for i, var_config in enumerate(variables.values()):
             # Transform normal samples to desired distribution
             samples[:, i] = self._transform_to_distribution(
-                correlated_normal[:, i], distribution, parameters
+                normals[:, i], var_config["distribution"], var_config["parameters"]
             )
         
         return samples
@@ -493,6 +665,12 @@ class MultiDomainMonteCarloEngine:
         elif target_distribution == "gamma":
             from scipy.stats import gamma
             return gamma.ppf(norm.cdf(normal_samples), parameters["alpha"], scale=parameters["beta"])
+        elif target_distribution == "exponential":
+            # "lambda" is the scale, matching _generate_distribution_samples
+            return -parameters["lambda"] * np.log1p(-norm.cdf(normal_samples))
+        elif target_distribution == "poisson":
+            from scipy.stats import poisson
+            return poisson.ppf(norm.cdf(normal_samples), parameters["lambda"])
         else:
             # For other distributions, use direct generation
             return self._generate_distribution_samples(target_distribution, parameters, len(normal_samples))
@@ -0,0 +1,365 @@
+"""
+Shared Ollama HTTP client.
+
+One process-wide client for all Ollama calls with:
+- a keep-alive connection pool (one aiohttp session per event loop)
+- bounded concurrency per model
+- connect and request timeouts; a request's timeout bounds all its attempts
+- retries with exponential backoff and full jitter on connection errors,
+  timeouts and retryable status codes
+- streaming token support for /api/generate and /api/chat
+- ``run_sync`` for synchronous callers, which share one background event
+  loop (and so one connection pool)
+"""
+
+import asyncio
+import base64
+import io
+import json
+import os
+import random
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional
+
+import aiohttp
+from loguru import logger
+
+DEFAULT_OLLAMA_HOST = "http://localhost:11434"
+
+
+class OllamaError(Exception):
+    """Ollama request failed."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class OllamaClientConfig:
+    """Connection, concurrency and retry settings for the Ollama client."""
+    host: str = DEFAULT_OLLAMA_HOST
+    max_connections: int = 32
+    keepalive_timeout: float = 60.0
+    connect_timeout: float = 5.0
+    request_timeout: float = 60.0
+    default_model_concurrency: int = 4
+    model_concurrency: Dict[str, int] = field(default_factory=dict)
+    max_retries: int = 3
+    backoff_base: float = 0.25
+    backoff_max: float = 4.0
+    retry_statuses: tuple = (429, 500, 502, 503, 504)
+
+
+class OllamaClient:
+    """Pooled, retrying Ollama client shared by all agents and services."""
+
+    def __init__(self, config: Optional[OllamaClientConfig] = None):
+        self.config = config or OllamaClientConfig()
+        self.host = self.config.host.rstrip("/")
+        # aiohttp sessions and semaphores are bound to the loop that created them
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats: Dict[str, int] = {"requests": 0, "retries": 0, "failures": 0, "sessions_created": 0}
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_lock = threading.Lock()
+
+    async def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        **payload: Any
+    ) -> Dict[str, Any]:
+        """Non-streaming ``/api/generate``; returns the response JSON"""
+        body = {"model": model, "prompt": prompt, "stream": False, **payload}
+        if options:
+            body["options"] = options
+        return await self.post_json("/api/generate", body, model=model, timeout=timeout, max_retries=max_retries)
+
+    async def stream_generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **payload: Any
+    ) -> AsyncIterator[str]:
+        """Streaming ``/api/generate``; yields response tokens as they arrive"""
+        body = {"model": model, "prompt": prompt, "stream": True, **payload}
+        if options:
+            body["options"] = options
+        async for chunk in self.stream_json("/api/generate", body, model=model, timeout=timeout):
+            if chunk.get("response"):
+                yield chunk["response"]
+
+    async def chat(
+        self,
+        model: str,
+        messages: list,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **payload: Any
+    ) -> Dict[str, Any]:
+        """Non-streaming ``/api/chat``; returns the response JSON
+
+        Message ``images`` may be base64 strings, raw bytes, file paths or
+        PIL images.
+        """
+        body = {"model": model, "messages": _encode_images(messages), "stream": False, **payload}
+        if options:
+            body["options"] = options
+        return await self.post_json("/api/chat", body, model=model, timeout=timeout)
+
+    async def stream_chat(
+        self,
+        model: str,
+        messages: list,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **payload: Any
+    ) -> AsyncIterator[str]:
+        """Streaming ``/api/chat``; yields message content tokens as they arrive"""
+        body = {"model": model, "messages": _encode_images(messages), "stream": True, **payload}
+        if options:
+            body["options"] = options
+        async for chunk in self.stream_json("/api/chat", body, model=model, timeout=timeout):
+            content = chunk.get("message", {}).get("content")
+            if content:
+                yield content
+
+    async def list_models(self, timeout: Optional[float] = None) -> list:
+        """Model names reported by ``/api/tags``"""
+        data = await self.get_json("/api/tags", timeout=timeout)
+        return [model["name"] for model in data.get("models", [])]
+
+    async def get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await self._request("GET", path, params=params, timeout=timeout, max_retries=max_retries)
+
+    async def post_json(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await self._request(
+            "POST", path, json_body=payload, model=model, timeout=timeout, max_retries=max_retries
+        )
+
+    async def stream_json(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST and yield each NDJSON object of a streamed response
+
+        Opening the stream is retried like any request; once data has been
+        yielded, errors propagate to the caller.
+        """
+        async with self._model_slot(model):
+            response = await self._send(
+                "POST", path, json_body=payload, timeout=self._stream_timeout(timeout)
+            )
+            async with response:
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise OllamaError(f"Ollama stream error: {chunk['error']}")
+                    yield chunk
+                    if chunk.get("done"):
+                        break
+
+    async def close(self):
+        """Close the session of the current event loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def run_sync(self, coro: Awaitable[Any]) -> Any:
+        """Run a client coroutine from synchronous code and return its result
+
+        All synchronous callers share one background event loop, so their
+        requests reuse one pooled session. Must not be called from that loop.
+        """
+        with self._sync_lock:
+            if self._sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="ollama-client", daemon=True).start()
+                self._sync_loop = loop
+        return asyncio.run_coroutine_threadsafe(coro, self._sync_loop).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "host": self.host, "open_sessions": len(self._sessions)}
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, Any]:
+        total = self.config.request_timeout if timeout is None else timeout
+        async with self._model_slot(model):
+            response = await self._send(
+                method, path, json_body=json_body, params=params, max_retries=max_retries,
+                deadline=asyncio.get_running_loop().time() + total
+            )
+            async with response:
+                return await response.json(content_type=None)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        max_retries: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> aiohttp.ClientResponse:
+        """Send a request with retries; returns a successful, unread response
+
+        With a ``deadline`` (event loop time) every attempt gets the time
+        left as its total timeout and no retry starts after it, so a hung
+        model costs one timeout rather than one per attempt.
+        """
+        retries = self.config.max_retries if max_retries is None else max_retries
+        loop = asyncio.get_running_loop()
+        session = self.session()
+        url = f"{self.host}{path}"
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            if deadline is not None:
+                remaining = max(deadline - loop.time(), 0.001)
+                timeout = aiohttp.ClientTimeout(total=remaining, connect=min(self.config.connect_timeout, remaining))
+            try:
+                response = await session.request(method, url, json=json_body, params=params, timeout=timeout)
+                if response.status < 400:
+                    return response
+                error_text = await response.text()
+                response.release()
+                error = OllamaError(f"Ollama API error: {response.status} - {error_text}", response.status)
+                retryable = response.status in self.config.retry_statuses
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = OllamaError(f"Ollama request to {path} failed: {str(e) or type(e).__name__}")
+                retryable = True
+
+            delay = random.uniform(0, min(self.config.backoff_max, self.config.backoff_base * 2 ** attempt))
+            out_of_time = deadline is not None and loop.time() + delay >= deadline
+            if not retryable or attempt >= retries or out_of_time:
+                self.stats["failures"] += 1
+                raise error
+            attempt += 1
+            self.stats["retries"] += 1
+            logger.warning(f"{error}; retry {attempt}/{retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def session(self) -> aiohttp.ClientSession:
+        """Pooled keep-alive session for the current event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_timeout
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+            self.stats["sessions_created"] += 1
+        return session
+
+    def _model_slot(self, model: Optional[str]):
+        """Semaphore bounding in-flight requests per model (no limit without a model)"""
+        if model is None:
+            return _NO_LIMIT
+        limits = self._limits.setdefault(asyncio.get_running_loop(), {})
+        if model not in limits:
+            size = self.config.model_concurrency.get(model, self.config.default_model_concurrency)
+            limits[model] = asyncio.Semaphore(size)
+        return limits[model]
+
+    def _stream_timeout(self, total: Optional[float]) -> aiohttp.ClientTimeout:
+        # Bound the wait for each chunk rather than the whole generation
+        total = self.config.request_timeout if total is None else total
+        return aiohttp.ClientTimeout(total=None, connect=self.config.connect_timeout, sock_read=total)
+
+
+def _encode_images(messages: list) -> list:
+    """Messages with ``images`` converted to the base64 strings the API expects"""
+    encoded = []
+    for message in messages:
+        if message.get("images"):
+            message = {**message, "images": [_encode_image(image) for image in message["images"]]}
+        encoded.append(message)
+    return encoded
+
+
+def _encode_image(image: Any) -> str:
+    if hasattr(image, "save") and not isinstance(image, (str, bytes, os.PathLike)):
+        # PIL image
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        image = buffer.getvalue()
+    elif isinstance(image, os.PathLike) or (isinstance(image, str) and os.path.isfile(image)):
+        with open(image, "rb") as f:
+            image = f.read()
+    if isinstance(image, (bytes, bytearray)):
+        return base64.b64encode(image).decode("ascii")
+    return image
+
+
+class _NoLimit:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+_NO_LIMIT = _NoLimit()
+
+_clients: Dict[str, OllamaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _default_host() -> str:
+    try:
+        from src.config.model_config import model_config
+        return model_config.get_ollama_host()
+    except Exception:
+        return os.getenv("OLLAMA_HOST", DEFAULT_OLLAMA_HOST)
+
+
+def get_ollama_client(host: Optional[str] = None) -> OllamaClient:
+    """Process-wide client for ``host`` (the configured Ollama host by default)"""
+    host = (host or _default_host()).rstrip("/")
+    with _clients_lock:
+        client = _clients.get(host)
+        if client is None:
+            client = _clients[host] = OllamaClient(OllamaClientConfig(host=host))
+        return client
@@ -3,9 +3,10 @@ Ollama integration for the sentiment analysis system.
 This module provides Ollama model integration with proper fallback handling.
 """
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from loguru import logger
 from src.config.model_config import model_config
+from src.core.ollama_client import get_ollama_client
 
 # Import the new Strands-based integration
 try:
@@ -42,6 +43,8 @@ class OllamaIntegration:
     def __init__(self, host: str = None):
         # Use configurable host or default
         self.host = host or model_config.get_ollama_host()
+        # Pooled HTTP client shared with every other integration using this host
+        self.client = get_ollama_client(self.host)
         self.models: Dict[str, OllamaModel] = {}
         self._initialize_default_models()
 
@@ -143,28 +146,23 @@ class OllamaIntegration:
     def check_model_availability(self, model_id: str) -> bool:
         """Check if a specific model is available on the Ollama server."""
         try:
-            import aiohttp
             import asyncio
 
             async def check():
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{self.host}/api/tags") as response:
-                        if response.status == 200:
-                            models = await response.json()
-                            return any(
-                                model["name"] == model_id
-                                for model in models.get("models", [])
-                            )
-                        return False
-
-            # Run the async check
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, create a task
-                task = asyncio.create_task(check())
-                return asyncio.run_coroutine_threadsafe(task, loop).result()
-            else:
+                try:
+                    return model_id in await self.client.list_models(timeout=10)
+                finally:
+                    # The session belongs to this short-lived loop
+                    await self.client.close()
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
                 return asyncio.run(check())
+            # Blocking inside a running loop would deadlock it; check from a worker thread
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, check()).result()
 
         except Exception as e:
             logger.error(f"Error checking model availability: {e}")
@@ -195,48 +193,45 @@ class OllamaIntegration:
     ) -> str:
         """Generate a response using the specified Ollama model."""
         try:
-            import aiohttp
-
-            # Get model configuration
-            model_config = self.models.get(model)
-            if not model_config:
-                # Use default text model if specified model not found
-                model_config = self.models.get("text", self.models.get("llama3.2:latest"))
-
-            if not model_config:
-                raise Exception(
-                    f"Model {model} not found and no default model available"
-                )
-
-            # Prepare the request payload
-            payload = {
-                "model": model_config.model_id,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens
-                }
-            }
-
-            # Make the request to Ollama
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.host}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("response", "")
-                    else:
-                        error_text = await response.text()
-                        raise Exception(f"Ollama API error: {response.status} - {error_text}")
+            model_config = self._resolve_model(model)
+            data = await self.client.generate(
+                model_config.model_id,
+                prompt,
+                options={"temperature": temperature, "num_predict": max_tokens}
+            )
+            return data.get("response", "")
 
         except Exception as e:
             logger.error(f"Error generating response with Ollama: {e}")
             return f"Error generating response: {str(e)}"
 
+    async def stream_response(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """Stream response tokens from the specified Ollama model."""
+        model_config = self._resolve_model(model)
+        async for token in self.client.stream_generate(
+            model_config.model_id,
+            prompt,
+            options={"temperature": temperature, "num_predict": max_tokens}
+        ):
+            yield token
+
+    def _resolve_model(self, model: str) -> OllamaModel:
+        model_config = self.models.get(model)
+        if not model_config:
+            # Use default text model if specified model not found
+            model_config = self.models.get("text", self.models.get("llama3.2:latest"))
+
+        if not model_config:
+            raise Exception(
+                f"Model {model} not found and no default model available"
+            )
+        return model_config
 
 # Global Ollama integration instance
 ollama_integration = OllamaIntegration()
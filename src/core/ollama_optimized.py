@@ -6,13 +6,14 @@ model sharing, and performance monitoring.
 import asyncio
 import time
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from contextlib import asynccontextmanager
 from loguru import logger
-import aiohttp
 from collections.abc import Mapping, Sequence
 from collections import defaultdict
 
+from src.core.ollama_client import get_ollama_client
+
 # Mock OllamaModel for testing
 class OllamaModel:
     """Mock Ollama model for testing."""
@@ -51,46 +52,6 @@ class ModelMetrics:
             self.error_count += 1
 
 
-@dataclass
-class ConnectionPool:
-    """Connection pool for Ollama HTTP connections."""
-    host: str
-    max_connections: int = 10
-    max_keepalive: int = 30
-    connections: List[aiohttp.ClientSession] = field(default_factory=list)
-    active_connections: int = 0
-    
-    async def get_connection(self) -> aiohttp.ClientSession:
-        """Get a connection from the pool or create a new one."""
-        if (self.connections and 
-                self.active_connections < self.max_connections):
-            conn = self.connections.pop()
-            self.active_connections += 1
-            return conn
-        
-        # Create new connection
-        timeout = aiohttp.ClientTimeout(total=30)
-        conn = aiohttp.ClientSession(
-            timeout=timeout,
-            connector=aiohttp.TCPConnector(
-                limit=self.max_connections,
-                keepalive_timeout=self.max_keepalive
-            )
-        )
-        self.active_connections += 1
-        return conn
-    
-    async def return_connection(self, conn: aiohttp.ClientSession):
-        """Return a connection to the pool."""
-        if self.active_connections > 0:
-            self.active_connections -= 1
-        
-        if len(self.connections) < self.max_connections:
-            self.connections.append(conn)
-        else:
-            await conn.close()
-
-
 class OptimizedOllamaIntegration:
     """
     Optimized Ollama integration with:
@@ -103,7 +64,8 @@ class OptimizedOllamaIntegration:
     
     def __init__(self, host: str = "http://localhost:11434"):
         self.host = host
-        self.connection_pool = ConnectionPool(host)
+        # Pooled HTTP client shared with every other integration using this host
+        self.client = get_ollama_client(host)
         self.models: Dict[str, OllamaModel] = {}
         self.model_metrics: Dict[str, ModelMetrics] = defaultdict(ModelMetrics)
         self.model_configs: Dict[str, Dict[str, Any]] = {}
@@ -177,9 +139,8 @@ class OptimizedOllamaIntegration:
     async def _check_server_health(self) -> bool:
         """Check if Ollama server is healthy."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.host}/api/tags", timeout=5) as response:
-                    return response.status == 200
+            await self.client.get_json("/api/tags", timeout=5, max_retries=0)
+            return True
         except Exception:
             return False
     
@@ -253,12 +214,8 @@ class OptimizedOllamaIntegration:
     
     @asynccontextmanager
     async def get_connection(self):
-        """Get a connection from the pool with automatic cleanup."""
-        conn = await self.connection_pool.get_connection()
-        try:
-            yield conn
-        finally:
-            await self.connection_pool.return_connection(conn)
+        """Get the shared pooled HTTP session."""
+        yield self.client.session()
     
     async def execute_with_metrics(
         self, 
@@ -326,15 +283,7 @@ class OptimizedOllamaIntegration:
     async def check_model_availability(self, model_id: str) -> bool:
         """Check if a specific model is available on the Ollama server."""
         try:
-            async with self.get_connection() as session:
-                async with session.get(f"{self.host}/api/tags") as response:
-                    if response.status == 200:
-                        models = await response.json()
-                        return any(
-                            model["name"] == model_id 
-                            for model in models.get("models", [])
-                        )
-                    return False
+            return model_id in await self.client.list_models()
         except Exception as e:
             logger.error(f"Error checking model availability: {e}")
             return False
@@ -347,10 +296,8 @@ class OptimizedOllamaIntegration:
                 if hasattr(model, 'close'):
                     await model.close()
             
-            # Close connection pool
-            for conn in self.connection_pool.connections:
-                await conn.close()
-            
+            # The HTTP client is shared process-wide and stays open for other
+            # users; the API closes it at shutdown
             self.models.clear()
             self.model_metrics.clear()
             logger.info("Optimized Ollama integration cleaned up")
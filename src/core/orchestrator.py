@@ -4,24 +4,20 @@ Orchestrator for managing the agent swarm and routing requests.
 
 import os
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
 
 from loguru import logger
 
 from src.agents.base_agent import StrandsBaseAgent as BaseAgent
-from src.agents.unified_text_agent import UnifiedTextAgent
-from src.agents.unified_vision_agent import UnifiedVisionAgent
-from src.agents.unified_audio_agent import UnifiedAudioAgent
-from src.agents.web_agent_enhanced import EnhancedWebAgent
-from src.agents.knowledge_graph_agent import KnowledgeGraphAgent
-from src.agents.enhanced_file_extraction_agent import EnhancedFileExtractionAgent
 from src.core.models import (
     AnalysisRequest, AnalysisResult, DataType,
     ModelConfig, EnhancedReportRequest, EnhancedReportResult
 )
 from src.core.model_manager import ModelManager
 from src.core.duplicate_detection_service import DuplicateDetectionService
+from src.core.request_cache import RequestCache
+from src.core.agent_router import AgentRouter
+from src.core.lazy_loader import LazyAgent, import_factory, service_manager
 from src.core.unified_mcp_client import call_unified_mcp_tool
 
 
@@ -30,10 +26,17 @@ class SentimentOrchestrator:
 
     def __init__(self):
         self.agents: Dict[str, BaseAgent] = {}
+        self.agent_router = AgentRouter()
         self.model_manager = ModelManager()
-        self.request_cache: Dict[str, AnalysisResult] = {}
         self.cache_ttl = 3600  # 1 hour
-        self.cache_timestamps: Dict[str, datetime] = {}
+        self.cache_max_entries = 1024
+        self.request_cache = RequestCache(max_entries=self.cache_max_entries, ttl_seconds=self.cache_ttl)
+
+        # Reflection alternatives run concurrently; policy is "best", "quorum" or
+        # "first_acceptable" and can be overridden per request via request.metadata
+        self.reflection_policy = "first_acceptable"
+        self.reflection_quorum = 2
+        self.reflection_deadline = 30.0  # seconds
         
         # Initialize duplicate detection service
         self.duplicate_detection = DuplicateDetectionService()
@@ -60,92 +63,69 @@ class SentimentOrchestrator:
 
     def _register_agents(self):
         """Register all available agents."""
+        # Agents are registered as factories and built on first use; instances
+        # are shared with other orchestrators and the MCP server in this process
+
         # Text agent (unified with swarm mode)
-        text_agent = UnifiedTextAgent(use_strands=True, use_swarm=True)
-        self._register_agent(text_agent, [DataType.TEXT])
+        self._register_agent_factory(
+            "src.agents.unified_text_agent:UnifiedTextAgent", [DataType.TEXT],
+            use_strands=True, use_swarm=True
+        )
 
         # Vision agent (unified)
-        vision_agent = UnifiedVisionAgent()
-        self._register_agent(vision_agent, [DataType.IMAGE, DataType.VIDEO])
+        self._register_agent_factory(
+            "src.agents.unified_vision_agent:UnifiedVisionAgent", [DataType.IMAGE, DataType.VIDEO]
+        )
 
         # Audio agent (unified)
-        audio_agent = UnifiedAudioAgent()
-        self._register_agent(audio_agent, [DataType.AUDIO])
+        self._register_agent_factory("src.agents.unified_audio_agent:UnifiedAudioAgent", [DataType.AUDIO])
 
         # Web agent
-        web_agent = EnhancedWebAgent()
-        self._register_agent(web_agent, [DataType.WEBPAGE])
+        self._register_agent_factory("src.agents.web_agent_enhanced:EnhancedWebAgent", [DataType.WEBPAGE])
 
         # Knowledge Graph agent (GraphRAG-inspired)
-        knowledge_graph_agent = KnowledgeGraphAgent()
-        self._register_agent(knowledge_graph_agent, [
+        self._register_agent_factory("src.agents.knowledge_graph_agent:KnowledgeGraphAgent", [
             DataType.TEXT, DataType.AUDIO, DataType.VIDEO,
             DataType.WEBPAGE, DataType.PDF, DataType.SOCIAL_MEDIA
         ])
 
         # Enhanced File Extraction agent (using fixed version)
-        file_extraction_agent = EnhancedFileExtractionAgent()
-        self._register_agent(file_extraction_agent, [DataType.PDF])
+        self._register_agent_factory(
+            "src.agents.enhanced_file_extraction_agent:EnhancedFileExtractionAgent", [DataType.PDF]
+        )
 
         # Phase 4: Export & Automation Agents
-        from src.agents.report_generation_agent import ReportGenerationAgent
-        from src.agents.data_export_agent import DataExportAgent
-        
-        report_generation_agent = ReportGenerationAgent()
-        self._register_agent(report_generation_agent, [
+        self._register_agent_factory("src.agents.report_generation_agent:ReportGenerationAgent", [
             DataType.TEXT, DataType.AUDIO, DataType.VIDEO,
             DataType.WEBPAGE, DataType.PDF, DataType.SOCIAL_MEDIA
         ])
-        
-        data_export_agent = DataExportAgent()
-        self._register_agent(data_export_agent, [
+        self._register_agent_factory("src.agents.data_export_agent:DataExportAgent", [
             DataType.TEXT, DataType.AUDIO, DataType.VIDEO,
             DataType.WEBPAGE, DataType.PDF, DataType.SOCIAL_MEDIA
         ])
 
         # Escalation Analysis Agent
-        try:
-            from src.agents.escalation_analysis_agent import EscalationAnalysisAgent
-            escalation_analysis_agent = EscalationAnalysisAgent()
-            self._register_agent(escalation_analysis_agent, [
-                DataType.TEXT, DataType.PDF, DataType.IMAGE
-            ])
-            logger.info("✅ Escalation Analysis Agent registered")
-        except ImportError as e:
-            logger.warning(f"⚠️ Escalation Analysis Agent not available: {e}")
+        self._register_agent_factory("src.agents.escalation_analysis_agent:EscalationAnalysisAgent", [
+            DataType.TEXT, DataType.PDF, DataType.IMAGE
+        ])
 
         # Threat Assessment Agent
-        try:
-            from src.agents.threat_assessment_agent import ThreatAssessmentAgent
-            threat_assessment_agent = ThreatAssessmentAgent()
-            self._register_agent(threat_assessment_agent, [
-                DataType.TEXT, DataType.DOCUMENT, DataType.COMMUNICATION, DataType.REPORT
-            ])
-            logger.info("✅ Threat Assessment Agent registered")
-        except ImportError as e:
-            logger.warning(f"⚠️ Threat Assessment Agent not available: {e}")
+        self._register_agent_factory("src.agents.threat_assessment_agent:ThreatAssessmentAgent", [
+            DataType.TEXT, DataType.DOCUMENT, DataType.COMMUNICATION, DataType.REPORT
+        ])
 
         # Phase 5: Semantic Search & Agent Reflection Agents
-        from src.agents.semantic_search_agent import SemanticSearchAgent
-        from src.agents.reflection_agent import ReflectionCoordinatorAgent
-        
-        semantic_search_agent = SemanticSearchAgent()
-        self._register_agent(semantic_search_agent, [
+        self._register_agent_factory("src.agents.semantic_search_agent:SemanticSearchAgent", [
             DataType.TEXT, DataType.AUDIO, DataType.VIDEO,
             DataType.WEBPAGE, DataType.PDF, DataType.SOCIAL_MEDIA
         ])
-        
-        reflection_coordinator_agent = ReflectionCoordinatorAgent()
-        self._register_agent(reflection_coordinator_agent, [
+        self._register_agent_factory("src.agents.reflection_agent:ReflectionCoordinatorAgent", [
             DataType.TEXT, DataType.AUDIO, DataType.VIDEO,
             DataType.WEBPAGE, DataType.PDF, DataType.SOCIAL_MEDIA
         ])
 
         # Phase 1: Pattern Recognition Agent
-        from src.agents.pattern_recognition_agent import PatternRecognitionAgent
-        
-        pattern_recognition_agent = PatternRecognitionAgent()
-        self._register_agent(pattern_recognition_agent, [
+        self._register_agent_factory("src.agents.pattern_recognition_agent:PatternRecognitionAgent", [
             DataType.TIME_SERIES, DataType.NUMERICAL, DataType.TEXT,
             DataType.AUDIO, DataType.VIDEO, DataType.IMAGE
         ])
@@ -249,68 +229,40 @@ class SentimentOrchestrator:
             logger.warning(f"⚠️ Error initializing Phase 4 Multi-Domain Integration components: {e}")
 
         # Phase 2: Predictive Analytics Agent
-        from src.agents.predictive_analytics_agent import PredictiveAnalyticsAgent
-        
-        predictive_analytics_agent = PredictiveAnalyticsAgent()
-        self._register_agent(predictive_analytics_agent, [
+        self._register_agent_factory("src.agents.predictive_analytics_agent:PredictiveAnalyticsAgent", [
             DataType.TIME_SERIES, DataType.NUMERICAL
         ])
 
         # Phase 2.2: Scenario Analysis Agent
-        from src.agents.scenario_analysis_agent import ScenarioAnalysisAgent
-        
-        scenario_analysis_agent = ScenarioAnalysisAgent()
-        self._register_agent(scenario_analysis_agent, [
+        self._register_agent_factory("src.agents.scenario_analysis_agent:ScenarioAnalysisAgent", [
             DataType.TIME_SERIES, DataType.NUMERICAL, DataType.TEXT
         ])
 
         # Phase 2.3: Real-Time Monitoring Agent
-        from src.agents.real_time_monitoring_agent import RealTimeMonitoringAgent
-        
-        real_time_monitoring_agent = RealTimeMonitoringAgent()
-        self._register_agent(real_time_monitoring_agent, [
+        self._register_agent_factory("src.agents.real_time_monitoring_agent:RealTimeMonitoringAgent", [
             DataType.TIME_SERIES, DataType.NUMERICAL, DataType.TEXT
         ])
 
         # Phase 3.1: Decision Support Agent
-        from src.agents.decision_support_agent import DecisionSupportAgent
-        
-        decision_support_agent = DecisionSupportAgent()
-        self._register_agent(decision_support_agent, [
+        self._register_agent_factory("src.agents.decision_support_agent:DecisionSupportAgent", [
             DataType.TEXT, DataType.NUMERICAL, DataType.TIME_SERIES
         ])
 
         # Phase 3.2: Risk Assessment Agent
-        from src.agents.risk_assessment_agent import RiskAssessmentAgent
-        
-        risk_assessment_agent = RiskAssessmentAgent()
-        self._register_agent(risk_assessment_agent, [
+        self._register_agent_factory("src.agents.risk_assessment_agent:RiskAssessmentAgent", [
             DataType.TEXT, DataType.NUMERICAL, DataType.TIME_SERIES
         ])
 
         # Phase 3.3: Fault Detection Agent
-        try:
-            from src.agents.fault_detection_agent import FaultDetectionAgent
-            
-            fault_detection_agent = FaultDetectionAgent()
-            self._register_agent(fault_detection_agent, [
-                DataType.TEXT, DataType.NUMERICAL, DataType.TIME_SERIES
-            ])
-            logger.info("✅ Fault Detection Agent registered")
-        except Exception as e:
-            logger.warning(f"⚠️ Fault Detection Agent not available: {e}")
+        self._register_agent_factory("src.agents.fault_detection_agent:FaultDetectionAgent", [
+            DataType.TEXT, DataType.NUMERICAL, DataType.TIME_SERIES
+        ])
 
         # Phase 4: Classical Chinese HUMINT Analysis Agent
-        try:
-            from src.agents.classical_chinese_humint_agent import ClassicalChineseHUMINTAnalysisAgent
-            
-            classical_chinese_humint_agent = ClassicalChineseHUMINTAnalysisAgent()
-            self._register_agent(classical_chinese_humint_agent, [
-                DataType.TEXT, DataType.PDF
-            ])
-            logger.info("✅ Classical Chinese HUMINT Analysis Agent registered")
-        except ImportError as e:
-            logger.warning(f"⚠️ Classical Chinese HUMINT Analysis Agent not available: {e}")
+        self._register_agent_factory(
+            "src.agents.classical_chinese_humint_agent:ClassicalChineseHUMINTAnalysisAgent",
+            [DataType.TEXT, DataType.PDF]
+        )
 
         # Phase 5: Model Interpretability & Explainable AI Components
         try:
@@ -330,18 +282,9 @@ class SentimentOrchestrator:
             logger.warning(f"⚠️ Error initializing Phase 5 Model Interpretability & Explainable AI components: {e}")
 
         # Phase 1: Monte Carlo Simulation Agent
-        try:
-            from src.core.agents.monte_carlo_agent import MonteCarloAgent
-            
-            monte_carlo_agent = MonteCarloAgent()
-            self._register_agent(monte_carlo_agent, [
-                DataType.NUMERICAL, DataType.TIME_SERIES
-            ])
-            logger.info("✅ Phase 1 Monte Carlo Simulation Agent registered")
-        except ImportError as e:
-            logger.warning(f"⚠️ Phase 1 Monte Carlo Simulation Agent not available: {e}")
-        except Exception as e:
-            logger.warning(f"⚠️ Error initializing Phase 1 Monte Carlo Simulation Agent: {e}")
+        self._register_agent_factory("src.core.agents.monte_carlo_agent:MonteCarloAgent", [
+            DataType.NUMERICAL, DataType.TIME_SERIES
+        ])
 
         # Force Projection Engine
         try:
@@ -370,8 +313,29 @@ class SentimentOrchestrator:
         """Register an agent with its supported data types."""
         self.agents[agent.agent_id] = agent
         agent.metadata["supported_types"] = [dt.value for dt in supported_types]
+        self.agent_router.register(agent, supported_types)
         logger.info(f"Registered agent {agent.agent_id} for types: {supported_types}")
 
+    def _register_agent_factory(self, class_path: str, supported_types: List[DataType], **kwargs):
+        """Register an agent that is imported and built on first use.
+
+        ``class_path`` is ``"package.module:ClassName"``; the class name is the
+        agent's registry key, so orchestrators and the MCP server in one
+        process share a single instance. Agents that fail to import or build
+        are dropped from routing when first needed.
+        """
+        agent_key = class_path.split(":")[1]
+        agent = LazyAgent(agent_key, import_factory(class_path, **kwargs))
+        type_values = [dt.value for dt in supported_types]
+
+        def record_supported_types(instance):
+            instance.metadata["supported_types"] = type_values
+
+        agent.on_load(record_supported_types)
+        self.agents[agent_key] = agent
+        self.agent_router.register(agent, supported_types)
+        logger.debug(f"Registered lazy agent {agent_key} for types: {type_values}")
+
     async def analyze_text(self, content: str, language: str = "en", **kwargs) -> AnalysisResult:
         """Analyze text sentiment."""
         request = AnalysisRequest(
@@ -467,9 +431,9 @@ class SentimentOrchestrator:
             if duplicate_result.recommendation == "skip":
                 logger.info(f"Skipping duplicate request {request.id}")
                 # Return cached result if available
-                cache_key = self._generate_cache_key(request)
-                if cache_key in self.request_cache and self._is_cache_valid(cache_key):
-                    return self.request_cache[cache_key]
+                cached_result = self.request_cache.get(self._generate_cache_key(request))
+                if cached_result is not None:
+                    return cached_result
                 # Return a result indicating duplicate was found
                 return self._create_duplicate_result(request, duplicate_result)
             elif duplicate_result.recommendation == "update":
@@ -478,15 +442,10 @@ class SentimentOrchestrator:
 
         # Check cache first
         cache_key = self._generate_cache_key(request)
-        if cache_key in self.request_cache:
-            cached_result = self.request_cache[cache_key]
-            if self._is_cache_valid(cache_key):
-                logger.info(f"Returning cached result for request {request.id}")
-                return cached_result
-            else:
-                # Remove expired cache entry
-                del self.request_cache[cache_key]
-                del self.cache_timestamps[cache_key]
+        cached_result = self.request_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Returning cached result for request {request.id}")
+            return cached_result
 
         # Check if this is a PDF generation request
         if hasattr(request, 'pdf_generation') and request.pdf_generation:
@@ -525,20 +484,12 @@ class SentimentOrchestrator:
         if not agent:
             raise ValueError(f"No suitable agent found for data type: {request.data_type}")
 
-        # Process with reflection if enabled
+        # Concurrent identical requests share one computation; the result is cached.
+        # The lookup above already counted this miss.
         try:
-            if request.reflection_enabled:
-                result = await self._process_with_reflection(request, agent)
-            else:
-                result = await agent.process(request)
-
-            # Record processing in duplicate detection service
-            await self._record_processing(request, result)
-
-            # Cache the result
-            self._cache_result(cache_key, result)
-
-            return result
+            return await self.request_cache.get_or_compute(
+                cache_key, lambda: self._process_request(request, agent), record=False
+            )
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             # Return a proper error result
@@ -561,35 +512,33 @@ class SentimentOrchestrator:
             )
             return error_result
 
-    async def _find_suitable_agent(self, request: AnalysisRequest) -> Optional[BaseAgent]:
-        """Find a suitable agent for the request."""
-        suitable_agents = []
+    async def _process_request(self, request: AnalysisRequest, agent: BaseAgent) -> AnalysisResult:
+        """Run the agent pipeline for a request that missed the cache."""
+        # Every agent call holds one of the agent's concurrency slots; with
+        # reflection each pass and each alternative takes its own lease
+        if request.reflection_enabled:
+            result = await self._process_with_reflection(request, agent)
+        else:
+            result = await self._process_leased(request, agent)
 
-        for agent in self.agents.values():
-            # Handle both async and sync can_process methods
-            if asyncio.iscoroutinefunction(agent.can_process):
-                can_process_result = await agent.can_process(request)
-            else:
-                can_process_result = agent.can_process(request)
-            
-            if can_process_result:
-                suitable_agents.append(agent)
-
-        if not suitable_agents:
-            return None
-
-        # If user specified a model preference, prioritize agents that can use it
-        if request.model_preference:
-            preferred_agents = [
-                agent for agent in suitable_agents
-                if hasattr(agent, 'model_name') and
-                agent.model_name == request.model_preference
-            ]
-            if preferred_agents:
-                suitable_agents = preferred_agents
+        # Record processing in duplicate detection service
+        await self._record_processing(request, result)
 
-        # Return the first suitable agent (could be enhanced with load balancing)
-        return suitable_agents[0]
+        return result
+
+    async def _process_leased(self, request: AnalysisRequest, agent: BaseAgent) -> AnalysisResult:
+        """Run ``agent.process`` while holding one of the agent's concurrency slots."""
+        async with self.agent_router.lease(agent):
+            return await agent.process(request)
+
+    async def _find_suitable_agent(self, request: AnalysisRequest) -> Optional[BaseAgent]:
+        """Find a suitable agent for the request.
+
+        Uses the routing table built at registration: only agents registered
+        for the request's data type are checked, and load is spread across
+        equivalent agents.
+        """
+        return await self.agent_router.route(request)
 
     async def _process_with_reflection(
         self,
@@ -605,7 +554,7 @@ class SentimentOrchestrator:
 
         for iteration in range(request.max_iterations):
             # Process the request
-            result = await agent.process(request)
+            result = await self._process_leased(request, agent)
 
             # Assess confidence and quality
             confidence = result.sentiment.confidence
@@ -617,16 +566,16 @@ class SentimentOrchestrator:
                 alternatives = await self._generate_alternatives(request, agent, result)
                 reflection_note += f", generated {len(alternatives)} alternatives"
 
-                # Try alternatives
-                for alt_request in alternatives:
-                    alt_result = await agent.process(alt_request)
-                    if alt_result.sentiment.confidence > confidence:
-                        result = alt_result
-                        confidence = alt_result.sentiment.confidence
-                        reflection_note += (
-                            f", found better alternative "
-                            f"(confidence: {confidence:.3f})"
-                        )
+                # Try alternatives concurrently
+                alt_result, summary = await self._run_alternatives(request, agent, alternatives)
+                reflection_note += summary
+                if alt_result is not None and alt_result.sentiment.confidence > confidence:
+                    result = alt_result
+                    confidence = alt_result.sentiment.confidence
+                    reflection_note += (
+                        f", found better alternative "
+                        f"(confidence: {confidence:.3f})"
+                    )
 
             reflection_notes.append(reflection_note)
 
@@ -649,6 +598,69 @@ class SentimentOrchestrator:
 
         return best_result or result
 
+    async def _run_alternatives(
+        self,
+        request: AnalysisRequest,
+        agent: BaseAgent,
+        alternatives: List[AnalysisRequest]
+    ) -> Tuple[Optional[AnalysisResult], str]:
+        """Process alternatives concurrently and return the most confident result.
+
+        Stops waiting when the policy is satisfied or the deadline passes:
+        ``first_acceptable`` stops at the first result reaching the request's
+        confidence threshold, ``quorum`` after ``reflection_quorum`` results
+        and ``best`` when all alternatives finish. Unfinished alternatives are
+        cancelled; failed ones are skipped.
+        """
+        if not alternatives:
+            return None, ""
+
+        policy = request.metadata.get("reflection_policy", self.reflection_policy)
+        quorum = request.metadata.get("reflection_quorum", self.reflection_quorum)
+        deadline = request.metadata.get("reflection_deadline", self.reflection_deadline)
+        needed = len(alternatives)
+        if policy == "quorum":
+            needed = max(1, min(quorum, len(alternatives)))
+
+        loop = asyncio.get_running_loop()
+        stop_at = loop.time() + deadline
+        # Alternatives queue for the agent's concurrency slots like any other call
+        pending = {asyncio.ensure_future(self._process_leased(alt, agent)) for alt in alternatives}
+        best, completed, failed = None, 0, 0
+        try:
+            while pending and completed < needed:
+                remaining = stop_at - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        alt_result = task.result()
+                    except Exception as e:
+                        failed += 1
+                        logger.warning(f"Reflection alternative failed for request {request.id}: {e}")
+                        continue
+                    completed += 1
+                    if best is None or alt_result.sentiment.confidence > best.sentiment.confidence:
+                        best = alt_result
+                if (policy == "first_acceptable" and best is not None and
+                        best.sentiment.confidence >= request.confidence_threshold):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        summary = f", {completed} completed"
+        if failed:
+            summary += f", {failed} failed"
+        if pending:
+            summary += f", {len(pending)} cancelled"
+        return best, summary
+
     async def _generate_alternatives(
         self,
         request: AnalysisRequest,
@@ -704,51 +716,31 @@ class SentimentOrchestrator:
         content_hash = hashlib.md5(str(request.content).encode()).hexdigest()
         return f"{request.data_type.value}:{content_hash}"
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if a cached result is still valid."""
-        if cache_key not in self.cache_timestamps:
-            return False
-
-        timestamp = self.cache_timestamps[cache_key]
-        age = (datetime.now() - timestamp).total_seconds()
-        return age < self.cache_ttl
-
-    def _cache_result(self, cache_key: str, result: AnalysisResult):
-        """Cache a result."""
-        self.request_cache[cache_key] = result
-        self.cache_timestamps[cache_key] = datetime.now()
-
-        # Clean up old cache entries
-        self._cleanup_cache()
-
-    def _cleanup_cache(self):
-        """Clean up expired cache entries."""
-        current_time = datetime.now()
-        expired_keys = []
-
-        for key, timestamp in self.cache_timestamps.items():
-            age = (current_time - timestamp).total_seconds()
-            if age > self.cache_ttl:
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self.request_cache[key]
-            del self.cache_timestamps[key]
-
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get request cache statistics (hits, misses, coalesced requests)."""
+        return self.request_cache.get_stats()
 
     async def get_agent_status(self) -> Dict[str, Any]:
         """Get status of all agents."""
         status = {}
 
         for agent_id, agent in self.agents.items():
+            if isinstance(agent, LazyAgent) and not agent.is_loaded:
+                # Report agents that have not been needed yet without building them
+                status[agent_id] = {
+                    "agent_type": agent.agent_type,
+                    "status": "not_loaded",
+                    **self.agent_router.get_load(agent_id)
+                }
+                continue
+            instance = agent.instance if isinstance(agent, LazyAgent) else agent
             status[agent_id] = {
-                "agent_type": agent.__class__.__name__,
-                "supported_types": agent.metadata.get("supported_types", []),
-                "model": agent.metadata.get("model", "unknown"),
-                "capabilities": agent.metadata.get("capabilities", []),
-                "status": "active"
+                "agent_type": instance.__class__.__name__,
+                "supported_types": instance.metadata.get("supported_types", []),
+                "model": instance.metadata.get("model", "unknown"),
+                "capabilities": instance.metadata.get("capabilities", []),
+                "status": "active",
+                **self.agent_router.get_load(agent_id)
             }
 
         return status
@@ -759,8 +751,12 @@ class SentimentOrchestrator:
 
     async def cleanup(self):
         """Cleanup resources."""
-        # Cleanup agents
+        # Cleanup agents (lazy agents that were never built need none)
         for agent in self.agents.values():
+            if isinstance(agent, LazyAgent):
+                if not agent.is_loaded:
+                    continue
+                agent = agent.instance
             if hasattr(agent, 'cleanup'):
                 await agent.cleanup()
 
@@ -874,6 +870,11 @@ class SentimentOrchestrator:
         """Get list of registered services and their capabilities."""
         services = {}
         for agent_name, agent in self.agents.items():
+            if isinstance(agent, LazyAgent):
+                if not agent.is_loaded:
+                    services[agent_name] = {"type": "agent", "capabilities": [], "status": "not_loaded"}
+                    continue
+                agent = agent.instance
             services[agent_name] = {
                 "type": "agent",
                 "capabilities": [cap.value for cap in agent.supported_data_types] if hasattr(agent, 'supported_data_types') else [],
@@ -932,3 +933,15 @@ def set_orchestrator_instance(orch: SentimentOrchestrator):
     """Set the global orchestrator instance."""
     global _orchestrator_instance
     _orchestrator_instance = orch
+
+
+service_manager.register_sync_service("sentiment_orchestrator", SentimentOrchestrator)
+
+
+def get_shared_orchestrator() -> SentimentOrchestrator:
+    """Get the process-wide orchestrator, creating it on first call.
+
+    The API and the MCP server use this so that one process holds a single
+    orchestrator and a single set of agents.
+    """
+    return service_manager.get_sync_service("sentiment_orchestrator")
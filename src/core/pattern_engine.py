@@ -0,0 +1,209 @@
+"""
+Pattern Engine
+Precompiled regex pattern sets for pattern-based entity extraction.
+
+A ``PatternSet`` compiles a labelled pattern table once. ``scan`` merges the
+patterns into a single alternation with one named group per pattern and
+walks the text once, returning non-overlapping matches; ``iter_all`` and
+``findall`` keep per-pattern semantics for callers that need every match.
+Pattern sets are cached by the shared ``pattern_engine`` so each language's
+tables are compiled once per process.
+"""
+
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+PatternTable = Union[Dict[str, Sequence[str]], Sequence[Tuple[str, str]]]
+
+# Constructs that cannot be wrapped into a shared alternation
+_UNMERGEABLE = re.compile(r"\(\?P[<=]|\\[1-9]|\(\?[aiLmsux]+\)")
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One pattern hit; ``end`` is exclusive."""
+    start: int
+    end: int
+    text: str
+    label: str
+    pattern_index: int
+
+
+class SpanIndex:
+    """Sorted, non-overlapping spans with O(log n) overlap queries."""
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        position = bisect_right(self._starts, start)
+        # Only the span starting at or before ``start`` and the next one can overlap
+        if position and self._ends[position - 1] > start:
+            return True
+        return position < len(self._starts) and self._starts[position] < end
+
+    def add(self, start: int, end: int) -> bool:
+        """Add a span unless it overlaps an existing one; returns whether it was added"""
+        if self.overlaps(start, end):
+            return False
+        position = bisect_left(self._starts, start)
+        self._starts.insert(position, start)
+        self._ends.insert(position, end)
+        return True
+
+
+class PatternSet:
+    """A labelled pattern table compiled once.
+
+    Patterns keep their table order as priority: when several patterns
+    match at the same position, ``scan`` keeps the earliest one.
+    """
+
+    def __init__(self, patterns: PatternTable, flags: int = 0):
+        if isinstance(patterns, dict):
+            patterns = [(label, pattern) for label, group in patterns.items() for pattern in group]
+        self.flags = flags
+        self.entries: List[Tuple[str, str]] = []
+        self.compiled: List[re.Pattern] = []
+        for label, pattern in patterns:
+            try:
+                self.compiled.append(re.compile(pattern, flags))
+                self.entries.append((label, pattern))
+            except re.error as e:
+                logger.warning(f"Skipping invalid {label} pattern {pattern!r}: {e}")
+        self.merged = self._merge()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _merge(self) -> Optional[re.Pattern]:
+        if not self.entries or any(_UNMERGEABLE.search(pattern) for _, pattern in self.entries):
+            return None
+        alternation = "|".join(f"(?P<_p{i}>{pattern})" for i, (_, pattern) in enumerate(self.entries))
+        try:
+            return re.compile(alternation, self.flags)
+        except re.error:
+            return None
+
+    def _match(self, match: "re.Match", index: int) -> PatternMatch:
+        return PatternMatch(match.start(), match.end(), match.group(), self.entries[index][0], index)
+
+    def scan(self, text: str, accept: Optional[Callable[[PatternMatch], bool]] = None) -> List[PatternMatch]:
+        """Non-overlapping matches in text order from a single pass
+
+        At each position the earliest pattern that matches wins. When
+        ``accept`` rejects it, the lower-priority patterns are tried at the
+        same position; if none is accepted the span is not consumed and the
+        search resumes one character after its start.
+        """
+        if self.merged is None:
+            return self._scan_separately(text, accept)
+
+        results = []
+        position = 0
+        search = self.merged.search
+        while position <= len(text):
+            match = search(text, position)
+            if match is None:
+                break
+            start, end = match.span()
+            if start == end:
+                position = end + 1
+                continue
+            hit = self._match(match, int(match.lastgroup[2:]))
+            if accept is not None and not accept(hit):
+                hit = self._fallback_at(text, start, hit.pattern_index + 1, accept)
+            if hit is None:
+                position = start + 1
+            else:
+                results.append(hit)
+                position = hit.end
+        return results
+
+    def _fallback_at(self, text: str, start: int, first_index: int,
+                     accept: Callable[[PatternMatch], bool]) -> Optional[PatternMatch]:
+        """First accepted match at ``start`` among patterns from ``first_index`` on"""
+        for index in range(first_index, len(self.compiled)):
+            match = self.compiled[index].match(text, start)
+            if match is not None and match.end() > start:
+                hit = self._match(match, index)
+                if accept(hit):
+                    return hit
+        return None
+
+    def _scan_separately(self, text: str, accept: Optional[Callable[[PatternMatch], bool]]) -> List[PatternMatch]:
+        """``scan`` for tables that cannot be merged: resolve candidates by position and priority"""
+        candidates = sorted(
+            (hit for hit in self.iter_all(text) if hit.end > hit.start),
+            key=lambda hit: (hit.start, hit.pattern_index)
+        )
+        spans = SpanIndex()
+        results = []
+        for hit in candidates:
+            if not spans.overlaps(hit.start, hit.end) and (accept is None or accept(hit)):
+                spans.add(hit.start, hit.end)
+                results.append(hit)
+        return results
+
+    def iter_all(self, text: str) -> Iterator[PatternMatch]:
+        """Every match of every pattern, pattern by pattern (like ``re.finditer`` per pattern)"""
+        for index, compiled in enumerate(self.compiled):
+            for match in compiled.finditer(text):
+                yield self._match(match, index)
+
+    def findall(self, text: str) -> Iterator[Tuple[str, Any]]:
+        """``(label, match)`` pairs with ``re.findall`` semantics per pattern"""
+        for (label, _), compiled in zip(self.entries, self.compiled):
+            for match in compiled.findall(text):
+                yield label, match
+
+    def count(self, text: str) -> int:
+        """Total matches over all patterns, counted per pattern"""
+        return sum(1 for compiled in self.compiled for _ in compiled.finditer(text))
+
+
+class PatternEngine:
+    """Process-wide cache of compiled pattern sets."""
+
+    def __init__(self):
+        self._sets: Dict[Tuple[str, int, int], PatternSet] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, patterns: PatternTable, flags: int = 0) -> PatternSet:
+        """Return the compiled set for ``patterns``, compiling it on first use
+
+        The cache key includes a fingerprint of the table, so a changed
+        table under the same name is recompiled.
+        """
+        key = (name, flags, _fingerprint(patterns))
+        pattern_set = self._sets.get(key)
+        if pattern_set is None:
+            with self._lock:
+                pattern_set = self._sets.get(key)
+                if pattern_set is None:
+                    pattern_set = PatternSet(patterns, flags)
+                    self._sets[key] = pattern_set
+        return pattern_set
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+
+
+def _fingerprint(patterns: PatternTable) -> int:
+    if isinstance(patterns, dict):
+        return hash(tuple((label, tuple(group)) for label, group in patterns.items()))
+    return hash(tuple(tuple(entry) for entry in patterns))
+
+
+# Global instance
+pattern_engine = PatternEngine()
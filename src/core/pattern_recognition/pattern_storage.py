@@ -8,16 +8,17 @@ This module provides persistent pattern storage capabilities including:
 - Pattern versioning and history
 """
 
-import json
-import os
-import shutil
-import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from pathlib import Path
 from loguru import logger
 
 from src.core.error_handler import with_error_handling
+from src.core.pattern_recognition.pattern_storage_backends import (
+    PatternStorageBackend,
+    create_backend
+)
 
 
 class PatternStorage:
@@ -25,7 +26,11 @@ class PatternStorage:
     Manages persistent storage of patterns and pattern metadata.
     """
     
-    def __init__(self, storage_path: str = "data/pattern_storage"):
+    def __init__(
+        self,
+        storage_path: str = "data/pattern_storage",
+        backend: Union[str, PatternStorageBackend] = "sqlite"
+    ):
         self.storage_path = Path(storage_path)
         self.patterns_db = {}
         self.metadata_db = {}
@@ -34,10 +39,10 @@ class PatternStorage:
         # Create storage directory if it doesn't exist
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
-        # Initialize storage files
-        self.patterns_file = self.storage_path / "patterns.json"
-        self.metadata_file = self.storage_path / "metadata.json"
-        self.history_file = self.storage_path / "version_history.json"
+        # Initialize storage backend; existing JSON files are migrated into SQLite
+        if isinstance(backend, str):
+            backend = create_backend(backend, self.storage_path)
+        self.backend = backend
         
         # Load existing data
         self._load_existing_data()
@@ -45,62 +50,9 @@ class PatternStorage:
         logger.info(f"PatternStorage initialized at {self.storage_path}")
     
     def _load_existing_data(self):
-        """Load existing pattern data from disk."""
+        """Load existing pattern data from the storage backend."""
         try:
-            # Load patterns database
-            if os.path.exists(self.patterns_file):
-                try:
-                    with open(self.patterns_file, 'r') as f:
-                        self.patterns_db = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        f"Corrupted patterns.json file detected: {e}"
-                    )
-                    # Backup corrupted file
-                    backup_file = (
-                        f"{self.patterns_file}.backup.{int(time.time())}"
-                    )
-                    shutil.copy2(self.patterns_file, backup_file)
-                    logger.info(f"Backed up corrupted file to {backup_file}")
-                    # Start with empty patterns
-                    self.patterns_db = {}
-            
-            # Load metadata database
-            if os.path.exists(self.metadata_file):
-                try:
-                    with open(self.metadata_file, 'r') as f:
-                        self.metadata_db = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        f"Corrupted metadata.json file detected: {e}"
-                    )
-                    # Backup corrupted file
-                    backup_file = (
-                        f"{self.metadata_file}.backup.{int(time.time())}"
-                    )
-                    shutil.copy2(self.metadata_file, backup_file)
-                    logger.info(f"Backed up corrupted file to {backup_file}")
-                    # Start with empty metadata
-                    self.metadata_db = {}
-            
-            # Load version history
-            if os.path.exists(self.history_file):
-                try:
-                    with open(self.history_file, 'r') as f:
-                        self.version_history = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        f"Corrupted version_history.json file detected: {e}"
-                    )
-                    # Backup corrupted file
-                    backup_file = (
-                        f"{self.history_file}.backup.{int(time.time())}"
-                    )
-                    shutil.copy2(self.history_file, backup_file)
-                    logger.info(f"Backed up corrupted file to {backup_file}")
-                    # Start with empty version history
-                    self.version_history = {}
-                    
+            self.patterns_db, self.metadata_db, self.version_history = self.backend.load_all()
             logger.info(f"Loaded {len(self.patterns_db)} patterns from storage")
             
         except Exception as e:
@@ -110,6 +62,23 @@ class PatternStorage:
             self.metadata_db = {}
             self.version_history = {}
     
+    @contextmanager
+    def batch(self):
+        """
+        Group several pattern writes into a single commit.
+        
+        Usage:
+            with storage.batch():
+                await storage.store_pattern(...)
+                await storage.update_pattern(...)
+        """
+        with self.backend.batch():
+            yield
+    
+    def close(self):
+        """Release the storage backend."""
+        self.backend.close()
+    
     @with_error_handling("pattern_storage")
     async def store_pattern(
         self, 
@@ -162,7 +131,7 @@ class PatternStorage:
             }]
             
             # Persist to disk
-            await self._persist_data()
+            await self._persist_pattern(pattern_id)
             
             logger.info(f"Stored pattern {pattern_id} successfully")
             
@@ -264,7 +233,7 @@ class PatternStorage:
                 })
             
             # Persist to disk
-            await self._persist_data()
+            await self._persist_pattern(pattern_id)
             
             logger.info(f"Updated pattern {pattern_id} to version {current_version + 1}")
             
@@ -309,7 +278,7 @@ class PatternStorage:
                 })
             
             # Persist to disk
-            await self._persist_data()
+            await self._persist_pattern(pattern_id)
             
             logger.info(f"Deleted pattern {pattern_id}")
             
@@ -328,7 +297,9 @@ class PatternStorage:
         self, 
         pattern_type: Optional[str] = None,
         status: str = "active",
-        limit: int = 100
+        limit: int = 100,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Search for patterns based on criteria.
@@ -337,31 +308,25 @@ class PatternStorage:
             pattern_type: Filter by pattern type
             status: Filter by pattern status
             limit: Maximum number of results
+            created_after: Only patterns created at or after this ISO timestamp
+            created_before: Only patterns created before this ISO timestamp
             
         Returns:
             Dictionary containing search results
         """
         try:
-            results = []
-            
-            for pattern_id, pattern in self.patterns_db.items():
-                # Apply filters
-                if pattern_type and pattern["pattern_type"] != pattern_type:
-                    continue
-                
-                if pattern["status"] != status:
-                    continue
-                
-                results.append({
-                    "pattern_id": pattern_id,
+            results = [
+                {
+                    "pattern_id": pattern["pattern_id"],
                     "pattern_type": pattern["pattern_type"],
                     "created_at": pattern["created_at"],
                     "version": pattern["version"],
                     "status": pattern["status"]
-                })
-                
-                if len(results) >= limit:
-                    break
+                }
+                for pattern in self.backend.search(
+                    pattern_type, status, limit, created_after, created_before
+                )
+            ]
             
             return {
                 "results": results,
@@ -369,7 +334,9 @@ class PatternStorage:
                 "search_criteria": {
                     "pattern_type": pattern_type,
                     "status": status,
-                    "limit": limit
+                    "limit": limit,
+                    "created_after": created_after,
+                    "created_before": created_before
                 }
             }
             
@@ -423,27 +390,27 @@ class PatternStorage:
             logger.error(f"Failed to get history for pattern {pattern_id}: {e}")
             return {"error": str(e)}
     
-    async def _persist_data(self):
-        """Persist data to disk."""
+    async def _persist_pattern(self, pattern_id: str):
+        """Persist one pattern with its metadata and history in a single transaction."""
         try:
-            # Save patterns
-            with open(self.patterns_file, 'w') as f:
-                json.dump(self.patterns_db, f, indent=2)
-            
-            # Save metadata
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata_db, f, indent=2)
-            
-            # Save version history
-            with open(self.history_file, 'w') as f:
-                json.dump(self.version_history, f, indent=2)
-                
-            logger.debug("Pattern data persisted to disk successfully")
+            self.backend.save_pattern(
+                pattern_id,
+                self.patterns_db[pattern_id],
+                self.metadata_db.get(pattern_id),
+                self.version_history.get(pattern_id, [])
+            )
+            logger.debug(f"Pattern {pattern_id} persisted successfully")
             
         except Exception as e:
             logger.error(f"Failed to persist pattern data: {e}")
             raise
     
+    async def _persist_data(self):
+        """Persist all patterns to the storage backend."""
+        with self.backend.batch():
+            for pattern_id in list(self.patterns_db):
+                await self._persist_pattern(pattern_id)
+    
     @with_error_handling("pattern_summary")
     async def get_storage_summary(self) -> Dict[str, Any]:
         """Get a summary of the pattern storage."""
@@ -487,25 +454,22 @@ class PatternStorage:
             
             patterns_to_remove = []
             
-            for pattern_id, pattern in self.patterns_db.items():
-                if pattern["status"] == "deleted":
-                    deleted_at = datetime.fromisoformat(pattern["deleted_at"]).timestamp()
-                    if deleted_at < cutoff_date:
-                        patterns_to_remove.append(pattern_id)
+            for pattern in self.backend.search(None, "deleted", None):
+                deleted_at = datetime.fromisoformat(pattern["deleted_at"]).timestamp()
+                if deleted_at < cutoff_date:
+                    patterns_to_remove.append(pattern["pattern_id"])
+            
+            # Persist changes
+            if patterns_to_remove:
+                self.backend.remove_patterns(patterns_to_remove)
             
             # Remove patterns
             for pattern_id in patterns_to_remove:
-                del self.patterns_db[pattern_id]
-                if pattern_id in self.metadata_db:
-                    del self.metadata_db[pattern_id]
-                if pattern_id in self.version_history:
-                    del self.version_history[pattern_id]
+                self.patterns_db.pop(pattern_id, None)
+                self.metadata_db.pop(pattern_id, None)
+                self.version_history.pop(pattern_id, None)
                 removed_count += 1
             
-            # Persist changes
-            if removed_count > 0:
-                await self._persist_data()
-            
             return {
                 "status": "success",
                 "removed_patterns": removed_count,
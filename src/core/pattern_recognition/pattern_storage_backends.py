@@ -0,0 +1,345 @@
+"""
+Pattern Storage Backends
+
+Persistence backends for PatternStorage:
+- SQLitePatternBackend (default): one row per pattern in a WAL-mode database,
+  indexed by type, status and creation time, with per-pattern transactions
+  and optional batched commits
+- JsonPatternBackend: the original three JSON files, rewritten on each change
+
+The SQLite backend imports existing JSON files once, on first use.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+PatternRecord = Dict[str, Any]
+LoadedData = Tuple[Dict[str, PatternRecord], Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]
+
+PATTERNS_FILE = "patterns.json"
+METADATA_FILE = "metadata.json"
+HISTORY_FILE = "version_history.json"
+
+
+class PatternStorageBackend(ABC):
+    """Persistence for patterns, their metadata and version history."""
+
+    @abstractmethod
+    def load_all(self) -> LoadedData:
+        """Return ``(patterns, metadata, version_history)`` keyed by pattern id"""
+
+    @abstractmethod
+    def save_pattern(
+        self,
+        pattern_id: str,
+        pattern: PatternRecord,
+        metadata: Optional[Dict[str, Any]],
+        history: List[Dict[str, Any]]
+    ):
+        """Atomically write one pattern with its metadata and full history"""
+
+    @abstractmethod
+    def remove_patterns(self, pattern_ids: List[str]):
+        """Permanently remove patterns with their metadata and history"""
+
+    @abstractmethod
+    def search(
+        self,
+        pattern_type: Optional[str],
+        status: Optional[str],
+        limit: Optional[int],
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None
+    ) -> List[PatternRecord]:
+        """Patterns matching the filters, oldest first"""
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several writes into one commit"""
+        yield
+
+    def close(self):
+        pass
+
+
+class JsonPatternBackend(PatternStorageBackend):
+    """The original JSON file layout; every write rewrites all three files."""
+
+    def __init__(self, storage_path: Path):
+        self.storage_path = Path(storage_path)
+        self.patterns_file = self.storage_path / PATTERNS_FILE
+        self.metadata_file = self.storage_path / METADATA_FILE
+        self.history_file = self.storage_path / HISTORY_FILE
+        self.patterns_db: Dict[str, PatternRecord] = {}
+        self.metadata_db: Dict[str, Dict[str, Any]] = {}
+        self.version_history: Dict[str, List[Dict[str, Any]]] = {}
+        self._batch_depth = 0
+        self._dirty = False
+
+    def load_all(self) -> LoadedData:
+        self.patterns_db = load_json_file(self.patterns_file)
+        self.metadata_db = load_json_file(self.metadata_file)
+        self.version_history = load_json_file(self.history_file)
+        return dict(self.patterns_db), dict(self.metadata_db), dict(self.version_history)
+
+    def save_pattern(self, pattern_id, pattern, metadata, history):
+        self.patterns_db[pattern_id] = pattern
+        if metadata is not None:
+            self.metadata_db[pattern_id] = metadata
+        self.version_history[pattern_id] = history
+        self._write()
+
+    def remove_patterns(self, pattern_ids):
+        for pattern_id in pattern_ids:
+            self.patterns_db.pop(pattern_id, None)
+            self.metadata_db.pop(pattern_id, None)
+            self.version_history.pop(pattern_id, None)
+        self._write()
+
+    def search(self, pattern_type, status, limit, created_after=None, created_before=None):
+        results = []
+        for pattern in self.patterns_db.values():
+            if pattern_type and pattern["pattern_type"] != pattern_type:
+                continue
+            if status and pattern["status"] != status:
+                continue
+            if created_after and pattern["created_at"] < created_after:
+                continue
+            if created_before and pattern["created_at"] >= created_before:
+                continue
+            results.append(pattern)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    @contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._write()
+
+    def _write(self):
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        for path, data in (
+            (self.patterns_file, self.patterns_db),
+            (self.metadata_file, self.metadata_db),
+            (self.history_file, self.version_history)
+        ):
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+        self._dirty = False
+        logger.debug("Pattern data persisted to disk successfully")
+
+
+class SQLitePatternBackend(PatternStorageBackend):
+    """SQLite (WAL) pattern store with one row per pattern and indexed searches."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS patterns (
+            pattern_id TEXT PRIMARY KEY,
+            pattern_type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            document TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pattern_metadata (
+            pattern_id TEXT PRIMARY KEY,
+            document TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pattern_history (
+            pattern_id TEXT PRIMARY KEY,
+            document TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS storage_info (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_patterns_type_status_created
+            ON patterns(pattern_type, status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_patterns_status_created
+            ON patterns(status, created_at);
+    """
+
+    def __init__(self, db_path: Path, migrate_from: Optional[Path] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        if migrate_from is not None:
+            self.migrate_json(migrate_from)
+
+    def load_all(self) -> LoadedData:
+        with self._lock:
+            patterns = {
+                pattern_id: json.loads(document)
+                for pattern_id, document in self._conn.execute(
+                    "SELECT pattern_id, document FROM patterns ORDER BY rowid"
+                )
+            }
+            metadata = {
+                pattern_id: json.loads(document)
+                for pattern_id, document in self._conn.execute("SELECT pattern_id, document FROM pattern_metadata")
+            }
+            history = {
+                pattern_id: json.loads(document)
+                for pattern_id, document in self._conn.execute("SELECT pattern_id, document FROM pattern_history")
+            }
+        return patterns, metadata, history
+
+    def save_pattern(self, pattern_id, pattern, metadata, history):
+        with self._transaction() as conn:
+            self._write_pattern(conn, pattern_id, pattern, metadata, history)
+
+    def remove_patterns(self, pattern_ids):
+        with self._transaction() as conn:
+            rows = [(pattern_id,) for pattern_id in pattern_ids]
+            conn.executemany("DELETE FROM patterns WHERE pattern_id = ?", rows)
+            conn.executemany("DELETE FROM pattern_metadata WHERE pattern_id = ?", rows)
+            conn.executemany("DELETE FROM pattern_history WHERE pattern_id = ?", rows)
+
+    def search(self, pattern_type, status, limit, created_after=None, created_before=None):
+        clauses, params = [], []
+        for column, operator, value in (
+            ("pattern_type", "=", pattern_type),
+            ("status", "=", status),
+            ("created_at", ">=", created_after),
+            ("created_at", "<", created_before)
+        ):
+            if value:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        query = "SELECT document FROM patterns"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at, rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [json.loads(document) for (document,) in self._conn.execute(query, params)]
+
+    @contextmanager
+    def batch(self):
+        with self._transaction():
+            yield
+
+    def migrate_json(self, storage_path: Path) -> int:
+        """Import the JSON files in ``storage_path`` into the database once
+
+        The import is recorded in ``storage_info`` and skipped afterwards;
+        the JSON files are left untouched. Returns the number of imported
+        patterns.
+        """
+        storage_path = Path(storage_path)
+        patterns_file = storage_path / PATTERNS_FILE
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM storage_info WHERE key = 'json_migrated'").fetchone():
+                return 0
+
+            patterns = load_json_file(patterns_file)
+            metadata = load_json_file(storage_path / METADATA_FILE)
+            history = load_json_file(storage_path / HISTORY_FILE)
+            with self._transaction() as conn:
+                for pattern_id, pattern in patterns.items():
+                    self._write_pattern(
+                        conn, pattern_id, pattern, metadata.get(pattern_id), history.get(pattern_id, [])
+                    )
+                conn.execute(
+                    "INSERT INTO storage_info (key, value) VALUES ('json_migrated', ?)",
+                    (datetime.now().isoformat(),)
+                )
+
+        if patterns:
+            logger.info(f"Migrated {len(patterns)} patterns from JSON files to {self.db_path}")
+        return len(patterns)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes in a transaction; nested calls join the outermost one"""
+        with self._lock:
+            outermost = self._batch_depth == 0
+            if outermost:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._batch_depth -= 1
+                if outermost:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._batch_depth -= 1
+            if outermost:
+                self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _write_pattern(conn, pattern_id, pattern, metadata, history):
+        conn.execute(
+            "INSERT OR REPLACE INTO patterns (pattern_id, pattern_type, status, created_at, version, document) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                pattern_id, pattern["pattern_type"], pattern["status"], pattern["created_at"],
+                pattern["version"], json.dumps(pattern)
+            )
+        )
+        if metadata is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO pattern_metadata (pattern_id, document) VALUES (?, ?)",
+                (pattern_id, json.dumps(metadata))
+            )
+        conn.execute(
+            "INSERT OR REPLACE INTO pattern_history (pattern_id, document) VALUES (?, ?)",
+            (pattern_id, json.dumps(history))
+        )
+
+
+def load_json_file(path: Path) -> Dict[str, Any]:
+    """Load a JSON storage file; corrupted files are backed up and read as empty"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Corrupted {Path(path).name} file detected: {e}")
+        # Backup corrupted file
+        backup_file = f"{path}.backup.{int(time.time())}"
+        shutil.copy2(path, backup_file)
+        logger.info(f"Backed up corrupted file to {backup_file}")
+        return {}
+
+
+def create_backend(backend: str, storage_path: Path) -> PatternStorageBackend:
+    """Build a named backend rooted at ``storage_path``"""
+    if backend == "sqlite":
+        return SQLitePatternBackend(storage_path / "patterns.db", migrate_from=storage_path)
+    if backend == "json":
+        return JsonPatternBackend(storage_path)
+    raise ValueError(f"Unknown pattern storage backend: {backend}")
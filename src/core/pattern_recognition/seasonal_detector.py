@@ -15,6 +15,13 @@ from datetime import datetime, timedelta
 from loguru import logger
 
 from src.core.error_handler import with_error_handling
+from src.core.pattern_recognition.seasonality import (
+    autocorrelation,
+    batch_autocorrelation,
+    dominant_periods,
+    moving_average,
+    periodogram
+)
 
 
 class SeasonalDetector:
@@ -104,19 +111,18 @@ class SeasonalDetector:
             values = df.iloc[:, 1].values  # Assuming second column is the value
             autocorr_results = []
             
-            # Test different lag periods
+            # Test different lag periods; the full ACF comes from a single FFT
             max_lag = min(len(values) // 2, self.detection_config["max_periods"])
+            acf = np.abs(autocorrelation(values, max_lag))
             
-            for lag in range(1, max_lag + 1):
-                autocorr = self._calculate_autocorrelation(values, lag)
-                
-                if autocorr > self.detection_config["autocorr_threshold"]:
-                    autocorr_results.append({
-                        "lag": lag,
-                        "autocorrelation": float(autocorr),
-                        "significance": "high" if autocorr > 0.5 else "medium",
-                        "pattern_type": "seasonal"
-                    })
+            for lag in np.flatnonzero(acf[1:] > self.detection_config["autocorr_threshold"]) + 1:
+                autocorr = acf[lag]
+                autocorr_results.append({
+                    "lag": int(lag),
+                    "autocorrelation": float(autocorr),
+                    "significance": "high" if autocorr > 0.5 else "medium",
+                    "pattern_type": "seasonal"
+                })
             
             return {
                 "autocorrelation_results": autocorr_results,
@@ -133,47 +139,28 @@ class SeasonalDetector:
         if len(data) < lag * 2:
             return 0.0
         
-        # Calculate autocorrelation
-        mean = np.mean(data)
-        var = np.var(data)
-        
-        if var == 0:
-            return 0.0
-        
-        autocorr = 0.0
-        for i in range(len(data) - lag):
-            autocorr += (data[i] - mean) * (data[i + lag] - mean)
-        
-        autocorr /= (len(data) - lag) * var
-        return abs(autocorr)
+        return float(abs(autocorrelation(data, lag)[lag]))
     
     async def _fourier_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Perform Fourier analysis to detect periodic patterns."""
         try:
             values = df.iloc[:, 1].values
             
-            # Perform FFT
-            fft_values = np.fft.fft(values)
-            fft_freq = np.fft.fftfreq(len(values))
-            
-            # Find dominant frequencies
-            power_spectrum = np.abs(fft_values) ** 2
-            significant_freqs = []
+            # Power spectrum of the non-negative frequencies
+            fft_freq, power_spectrum = periodogram(values)
             
             # Find frequencies above threshold
             threshold = np.max(power_spectrum) * self.detection_config["fourier_threshold"]
             
-            for i, power in enumerate(power_spectrum[1:len(power_spectrum)//2]):
-                if power > threshold:
-                    freq = fft_freq[i + 1]
-                    if freq > 0:  # Only positive frequencies
-                        period = 1 / freq
-                        significant_freqs.append({
-                            "frequency": float(freq),
-                            "period": float(period),
-                            "power": float(power),
-                            "significance": "high" if power > threshold * 2 else "medium"
-                        })
+            significant_freqs = [
+                {
+                    "frequency": float(fft_freq[k]),
+                    "period": float(1 / fft_freq[k]),
+                    "power": float(power_spectrum[k]),
+                    "significance": "high" if power_spectrum[k] > threshold * 2 else "medium"
+                }
+                for k in np.flatnonzero(power_spectrum[1:len(values) // 2] > threshold) + 1
+            ]
             
             return {
                 "significant_frequencies": significant_freqs,
@@ -220,16 +207,7 @@ class SeasonalDetector:
     
     def _moving_average(self, data: np.ndarray, window: int) -> np.ndarray:
         """Calculate moving average with specified window size."""
-        if window >= len(data):
-            return np.full_like(data, np.mean(data))
-        
-        # Pad the data for edge handling
-        padded = np.pad(data, (window//2, window//2), mode='edge')
-        
-        # Calculate moving average
-        result = np.convolve(padded, np.ones(window)/window, mode='valid')
-        
-        return result
+        return moving_average(data, window)
     
     def _extract_seasonal_component(self, data: np.ndarray, trend: np.ndarray) -> np.ndarray:
         """Extract seasonal component from detrended data."""
@@ -328,6 +306,66 @@ class SeasonalDetector:
             logger.error(f"Seasonal strength calculation failed: {e}")
             return {"error": str(e)}
     
+    @with_error_handling("seasonal_batch_detection")
+    async def detect_seasonality_batch(
+        self,
+        series: Dict[str, List[float]],
+        top_periods: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Detect periodicity in many value series at once.
+
+        Args:
+            series: Mapping of series name to values ordered by time
+            top_periods: Number of dominant periodogram periods per series
+
+        Returns:
+            Dictionary with significant autocorrelation lags and dominant
+            periods for each series
+        """
+        try:
+            names = list(series)
+            values = [np.asarray(series[name], dtype=float) for name in names]
+            max_lag = self.detection_config["max_periods"]
+            acf = batch_autocorrelation(values, max_lag)
+            threshold = self.detection_config["autocorr_threshold"]
+
+            results = {}
+            for index, name in enumerate(names):
+                length = len(values[index])
+                if length < self.detection_config["min_periods"] * 2:
+                    results[name] = {"error": "Insufficient data for seasonal analysis"}
+                    continue
+
+                signed = acf[index, :min(length // 2, max_lag) + 2]
+                usable = np.abs(signed[1:min(length // 2, max_lag) + 1])
+                lags = np.flatnonzero(usable > threshold) + 1
+                # The season is the first positive ACF peak, not a later multiple of it
+                peaks = [
+                    lag for lag in lags
+                    if signed[lag] > 0 and signed[lag] >= signed[lag - 1]
+                    and (lag + 1 >= len(signed) or signed[lag] >= signed[lag + 1])
+                ]
+                results[name] = {
+                    "significant_lags": lags.tolist(),
+                    "best_lag": int(peaks[0]) if peaks else None,
+                    "max_autocorrelation": float(usable.max()) if len(usable) else 0.0,
+                    "dominant_periods": dominant_periods(
+                        values[index], top=top_periods, max_period=length / 2
+                    )[0],
+                    "data_points": length
+                }
+
+            return {
+                "series": results,
+                "total_series": len(names),
+                "analysis_method": "fft_autocorrelation"
+            }
+
+        except Exception as e:
+            logger.error(f"Batch seasonal detection failed: {e}")
+            return {"error": str(e)}
+
     async def get_seasonal_summary(self) -> Dict[str, Any]:
         """Get a summary of all detected seasonal patterns."""
         try:
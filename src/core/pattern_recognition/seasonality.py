@@ -0,0 +1,122 @@
+"""
+Seasonality Toolkit
+
+Vectorized time series primitives shared by the seasonal, temporal and trend
+analyzers:
+- full autocorrelation functions from one FFT per series, for a single series
+  or a batch of series with different lengths
+- periodogram-based dominant period detection
+- moving averages and turning points without Python loops
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+SeriesBatch = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def autocorrelation(values: Sequence[float], max_lag: Optional[int] = None) -> np.ndarray:
+    """Autocorrelation for lags ``0..max_lag`` of one series
+
+    Lag ``k`` is ``sum((x[i] - m) * (x[i + k] - m)) / ((n - k) * var(x))``;
+    constant series give zeros.
+    """
+    return batch_autocorrelation([values], max_lag)[0]
+
+
+def batch_autocorrelation(series: SeriesBatch, max_lag: Optional[int] = None) -> np.ndarray:
+    """Autocorrelation for lags ``0..max_lag`` of many series in one FFT
+
+    Series may differ in length: each is demeaned and zero-padded, which
+    leaves its lagged products unchanged, and normalized by its own length
+    and variance. Lags at or beyond a series' length are 0.
+    """
+    rows = [np.asarray(values, dtype=float).ravel() for values in series]
+    if not rows:
+        return np.zeros((0, (max_lag or 0) + 1))
+    lengths = np.array([len(row) for row in rows])
+    longest = int(lengths.max())
+    if max_lag is None:
+        max_lag = max(longest - 1, 0)
+
+    centered = np.zeros((len(rows), longest))
+    variances = np.zeros(len(rows))
+    for index, row in enumerate(rows):
+        if len(row):
+            centered[index, :len(row)] = row - row.mean()
+            variances[index] = row.var()
+
+    # Linear (not circular) correlation needs at least 2n - 1 points
+    size = 1 << max(int(2 * longest - 1).bit_length(), 1)
+    spectrum = np.fft.rfft(centered, n=size, axis=1)
+    lagged_sums = np.fft.irfft(spectrum * np.conj(spectrum), n=size, axis=1)[:, :max_lag + 1]
+    if lagged_sums.shape[1] < max_lag + 1:
+        lagged_sums = np.pad(lagged_sums, ((0, 0), (0, max_lag + 1 - lagged_sums.shape[1])))
+
+    lags = np.arange(max_lag + 1)
+    pairs = lengths[:, None] - lags[None, :]
+    denominator = pairs * variances[:, None]
+    valid = (pairs > 0) & (variances[:, None] > 0)
+    return np.divide(lagged_sums, denominator, out=np.zeros_like(lagged_sums), where=valid)
+
+
+def periodogram(values: SeriesBatch):
+    """Frequencies (cycles per sample) and unscaled power ``|FFT|^2`` for ``k = 0..n//2``
+
+    Accepts one series or a 2-D batch of equal-length series.
+    """
+    array = np.asarray(values, dtype=float)
+    spectrum = np.fft.rfft(array, axis=-1)
+    return np.fft.rfftfreq(array.shape[-1]), np.abs(spectrum) ** 2
+
+
+def dominant_periods(values: SeriesBatch, top: int = 3, min_period: float = 2.0,
+                     max_period: Optional[float] = None) -> List[List[dict]]:
+    """Strongest periodogram peaks per series, from each demeaned series"""
+    array = np.atleast_2d(np.asarray(values, dtype=float))
+    freqs, power = periodogram(array - array.mean(axis=1, keepdims=True))
+    with np.errstate(divide="ignore"):
+        periods = np.where(freqs > 0, 1.0 / freqs, np.inf)
+    allowed = (freqs > 0) & (periods >= min_period)
+    if max_period is not None:
+        allowed &= periods <= max_period
+
+    results = []
+    for row in power:
+        # Only spectral peaks, so leakage next to a strong period is not reported as another period
+        padded = np.pad(row, 1)
+        peaks = (row >= padded[:-2]) & (row >= padded[2:])
+        candidates = np.flatnonzero(allowed & peaks & (row > 0))
+        total = row[allowed].sum()
+        best = candidates[np.argsort(-row[candidates], kind="stable")[:top]]
+        results.append([
+            {
+                "period": float(periods[k]),
+                "frequency": float(freqs[k]),
+                "power": float(row[k]),
+                "relative_power": float(row[k] / total) if total > 0 else 0.0
+            }
+            for k in best
+        ])
+    return results
+
+
+def moving_average(data: np.ndarray, window: int) -> np.ndarray:
+    """Centered moving average with edge padding, same length as ``data``"""
+    if window >= len(data):
+        return np.full_like(data, np.mean(data))
+
+    # Pad the data for edge handling
+    padded = np.pad(data, (window//2, window//2), mode='edge')
+    return np.convolve(padded, np.ones(window)/window, mode='valid')
+
+
+def turning_points(values: Sequence[float]) -> List[int]:
+    """Indices of strict local maxima and minima"""
+    array = np.asarray(values)
+    if len(array) < 3:
+        return []
+    middle, before, after = array[1:-1], array[:-2], array[2:]
+    peaks = ((middle > before) & (middle > after)) | ((middle < before) & (middle < after))
+    return (np.flatnonzero(peaks) + 1).tolist()
@@ -20,6 +20,7 @@ from loguru import logger
 
 from src.core.models import AnalysisRequest, AnalysisResult
 from src.core.error_handler import with_error_handling
+from src.core.pattern_recognition.seasonality import autocorrelation
 
 
 class TemporalAnalyzer:
@@ -143,19 +144,22 @@ class TemporalAnalyzer:
         """Detect seasonal patterns in the data."""
         try:
             seasonal_patterns = []
+            values = df.iloc[:, 1].values
             
-            for period in self.analysis_config["seasonal_periods"]:
-                if len(df) >= period * 2:
-                    # Calculate autocorrelation for seasonal detection
-                    autocorr = self._calculate_autocorrelation(df.iloc[:, 1].values, period)
-                    
-                    if autocorr > 0.3:  # Threshold for seasonal pattern
-                        seasonal_patterns.append({
-                            "period_days": period,
-                            "strength": float(autocorr),
-                            "pattern_type": "seasonal",
-                            "confidence": min(0.9, autocorr)
-                        })
+            # One FFT gives the autocorrelation for every candidate period
+            periods = [p for p in self.analysis_config["seasonal_periods"] if len(df) >= p * 2]
+            acf = np.abs(autocorrelation(values, max(periods))) if periods else None
+            
+            for period in periods:
+                autocorr = float(acf[period])
+                
+                if autocorr > 0.3:  # Threshold for seasonal pattern
+                    seasonal_patterns.append({
+                        "period_days": period,
+                        "strength": float(autocorr),
+                        "pattern_type": "seasonal",
+                        "confidence": min(0.9, autocorr)
+                    })
             
             return {
                 "seasonal_patterns": seasonal_patterns,
@@ -172,19 +176,7 @@ class TemporalAnalyzer:
         if len(data) < lag * 2:
             return 0.0
         
-        # Calculate autocorrelation
-        mean = np.mean(data)
-        var = np.var(data)
-        
-        if var == 0:
-            return 0.0
-        
-        autocorr = 0.0
-        for i in range(len(data) - lag):
-            autocorr += (data[i] - mean) * (data[i + lag] - mean)
-        
-        autocorr /= (len(data) - lag) * var
-        return abs(autocorr)
+        return float(abs(autocorrelation(data, lag)[lag]))
     
     async def _analyze_temporal_relationships(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze temporal relationships between entities."""
@@ -15,6 +15,7 @@ from datetime import datetime
 from loguru import logger
 
 from src.core.error_handler import with_error_handling
+from src.core.pattern_recognition.seasonality import moving_average, turning_points
 
 
 class TrendEngine:
@@ -179,16 +180,7 @@ class TrendEngine:
     
     def _moving_average(self, data: np.ndarray, window: int) -> np.ndarray:
         """Calculate moving average with specified window size."""
-        if window >= len(data):
-            return np.full_like(data, np.mean(data))
-        
-        # Pad the data for edge handling
-        padded = np.pad(data, (window//2, window//2), mode='edge')
-        
-        # Calculate moving average
-        result = np.convolve(padded, np.ones(window)/window, mode='valid')
-        
-        return result
+        return moving_average(data, window)
     
     async def _calculate_trend_strength(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Calculate the overall strength of the trend."""
@@ -265,22 +257,8 @@ class TrendEngine:
             return {"error": str(e)}
     
     def _detect_trend_reversals(self, values: np.ndarray) -> List[int]:
-        """Detect trend reversals in the data."""
-        reversals = []
-        
-        if len(values) < 3:
-            return reversals
-        
-        # Simple reversal detection using local minima/maxima
-        for i in range(1, len(values) - 1):
-            # Local maximum
-            if values[i] > values[i-1] and values[i] > values[i+1]:
-                reversals.append(i)
-            # Local minimum
-            elif values[i] < values[i-1] and values[i] < values[i+1]:
-                reversals.append(i)
-        
-        return reversals
+        """Detect trend reversals (local minima/maxima) in the data."""
+        return turning_points(values)
     
     def _detect_trend_acceleration(self, values: np.ndarray) -> Dict[str, Any]:
         """Detect trend acceleration or deceleration."""
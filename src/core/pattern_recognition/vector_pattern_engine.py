@@ -13,6 +13,12 @@ from typing import Dict, List, Any, Optional
 from loguru import logger
 
 from src.core.error_handler import with_error_handling
+from src.core.pattern_recognition.vector_similarity import (
+    average_pairwise_similarity,
+    exact_similarity_search,
+    lsh_similarity_search,
+    normalize_rows
+)
 
 
 class VectorPatternEngine:
@@ -28,7 +34,13 @@ class VectorPatternEngine:
             "min_cluster_size": 3,
             "max_clusters": 50,
             "similarity_threshold": 0.7,
-            "vector_dimension": 768
+            "vector_dimension": 768,
+            "exact_max_vectors": 4096,
+            "similarity_block_size": 2048,
+            "ann_min_vectors": 20000,
+            "ann_tables": 16,
+            "max_pairs_returned": 1000,
+            "top_k_neighbors": 5
         }
         
         logger.info("VectorPatternEngine initialized successfully")
@@ -113,37 +125,64 @@ class VectorPatternEngine:
             return {"error": str(e)}
     
     async def _analyze_similarity_patterns(self, vectors: np.ndarray) -> Dict[str, Any]:
-        """Analyze similarity patterns between vectors."""
+        """Analyze similarity patterns between vectors.
+
+        Small inputs use one normalized matrix product, medium inputs are
+        processed in row blocks so the n x n matrix is never held in memory,
+        and large inputs use random-projection LSH. Only the strongest
+        pairs and each vector's top-k neighbours are returned.
+        """
         try:
             n_vectors = len(vectors)
-            similarity_matrix = np.zeros((n_vectors, n_vectors))
+            threshold = self.engine_config["similarity_threshold"]
+            top_k = self.engine_config["top_k_neighbors"]
             
-            # Calculate cosine similarity between all pairs
-            for i in range(n_vectors):
-                for j in range(i + 1, n_vectors):
-                    similarity = self._cosine_similarity(vectors[i], vectors[j])
-                    similarity_matrix[i, j] = similarity
-                    similarity_matrix[j, i] = similarity
+            if n_vectors >= self.engine_config["ann_min_vectors"]:
+                method = "approximate"
+                unit = normalize_rows(vectors, dtype=np.float32)
+                search = lsh_similarity_search(
+                    unit, threshold, top_k,
+                    n_tables=self.engine_config["ann_tables"],
+                    block_size=self.engine_config["similarity_block_size"]
+                )
+            else:
+                method = "exact" if n_vectors <= self.engine_config["exact_max_vectors"] else "blocked"
+                unit = normalize_rows(vectors, dtype=np.float64 if method == "exact" else np.float32)
+                block_size = n_vectors if method == "exact" else self.engine_config["similarity_block_size"]
+                search = exact_similarity_search(unit, threshold, top_k, block_size=max(block_size, 1))
             
-            # Find high similarity pairs
-            threshold = self.engine_config["similarity_threshold"]
-            high_similarity_pairs = []
+            # Strongest pairs first
+            order = np.argsort(-search.pair_similarities, kind="stable")
+            max_pairs = self.engine_config["max_pairs_returned"]
+            high_similarity_pairs = [
+                {
+                    "vector1": int(search.pair_rows[k]),
+                    "vector2": int(search.pair_cols[k]),
+                    "similarity": float(search.pair_similarities[k])
+                }
+                for k in order[:max_pairs]
+            ]
             
-            for i in range(n_vectors):
-                for j in range(i + 1, n_vectors):
-                    if similarity_matrix[i, j] > threshold:
-                        high_similarity_pairs.append({
-                            "vector1": i,
-                            "vector2": j,
-                            "similarity": float(similarity_matrix[i, j])
-                        })
+            nearest_neighbors = []
+            if search.neighbors is not None:
+                for i in range(n_vectors):
+                    nearest_neighbors.append({
+                        "vector": i,
+                        "neighbors": [
+                            {"vector": int(j), "similarity": float(similarity)}
+                            for j, similarity in zip(search.neighbors[i], search.neighbor_similarities[i])
+                            if j >= 0
+                        ]
+                    })
             
             return {
-                "similarity_matrix": similarity_matrix.tolist(),
+                "method": method,
                 "high_similarity_pairs": high_similarity_pairs,
-                "average_similarity": float(np.mean(similarity_matrix)),
+                "nearest_neighbors": nearest_neighbors,
+                "average_similarity": average_pairwise_similarity(unit),
                 "similarity_threshold": threshold,
-                "total_high_similarity_pairs": len(high_similarity_pairs)
+                "total_high_similarity_pairs": len(order),
+                "pairs_truncated": len(order) > max_pairs
             }
             
         except Exception as e:
@@ -0,0 +1,155 @@
+"""
+Vector Similarity
+
+Cosine similarity search over embedding matrices without materializing the
+full n x n similarity matrix:
+- exact search computes normalized row blocks against the whole matrix with
+  one BLAS product per block (a single block for small inputs)
+- approximate search buckets vectors with random-projection LSH tables and
+  verifies candidates exactly inside each bucket
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class SimilaritySearchResult:
+    """Pairs above a threshold and optional per-vector nearest neighbours.
+
+    ``pair_rows[k] < pair_cols[k]`` for every pair; ``neighbors`` is an
+    ``(n, k)`` index array padded with -1 and ``neighbor_similarities`` the
+    matching similarities.
+    """
+    pair_rows: np.ndarray
+    pair_cols: np.ndarray
+    pair_similarities: np.ndarray
+    neighbors: Optional[np.ndarray] = None
+    neighbor_similarities: Optional[np.ndarray] = None
+
+
+def normalize_rows(vectors, dtype=np.float64) -> np.ndarray:
+    """Unit-length rows; zero rows stay zero so their similarity is 0"""
+    array = np.asarray(vectors, dtype=dtype)
+    if array.ndim == 1:
+        array = array.reshape(len(array), -1)
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    return np.divide(array, norms, out=np.zeros_like(array), where=norms > 0)
+
+
+def average_pairwise_similarity(unit: np.ndarray) -> float:
+    """Mean of the n x n cosine matrix with a zero diagonal, in O(n * d)
+
+    The sum over pairs ``i != j`` is ``|sum(u)|^2 - sum(|u_i|^2)``.
+    """
+    n = len(unit)
+    if n == 0:
+        return 0.0
+    total = unit.sum(axis=0)
+    off_diagonal = float(total @ total) - float(np.einsum("ij,ij->", unit, unit))
+    return off_diagonal / (n * n)
+
+
+def exact_similarity_search(unit: np.ndarray, threshold: float, top_k: int = 0,
+                            block_size: int = 2048) -> SimilaritySearchResult:
+    """All pairs with similarity above ``threshold`` and exact top-k neighbours
+
+    Memory is ``block_size x n`` rather than ``n x n``.
+    """
+    n = len(unit)
+    k = min(top_k, n - 1) if top_k else 0
+    rows, cols, sims = [], [], []
+    neighbors = np.full((n, k), -1, dtype=np.int64) if k else None
+    neighbor_sims = np.zeros((n, k), dtype=unit.dtype) if k else None
+
+    for start in range(0, n, block_size):
+        block = unit[start:start + block_size] @ unit.T
+        local = np.arange(len(block))
+
+        # Pairs: only columns after the row's own index
+        r, c = np.nonzero(block > threshold)
+        keep = c > r + start
+        rows.append(r[keep] + start)
+        cols.append(c[keep])
+        sims.append(block[r[keep], c[keep]])
+
+        if k:
+            block[local, local + start] = -np.inf
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_sims = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_sims, axis=1, kind="stable")
+            neighbors[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+            neighbor_sims[start:start + len(block)] = np.take_along_axis(top_sims, order, axis=1)
+
+    return SimilaritySearchResult(
+        _concat(rows, np.int64), _concat(cols, np.int64), _concat(sims, unit.dtype),
+        neighbors, neighbor_sims
+    )
+
+
+def lsh_similarity_search(unit: np.ndarray, threshold: float, top_k: int = 0,
+                          n_tables: int = 16, n_bits: Optional[int] = None,
+                          bucket_target: int = 64, block_size: int = 2048,
+                          seed: int = 0) -> SimilaritySearchResult:
+    """Approximate pairs above ``threshold`` via random-projection LSH
+
+    Each table hashes vectors by the signs of ``n_bits`` random projections;
+    vectors at angle ``theta`` share a bucket with probability
+    ``(1 - theta / pi) ** n_bits`` per table. Candidates are verified with
+    exact similarities, so every returned pair is a true pair; recall grows
+    with ``n_tables``. Neighbours are the best verified pairs per vector.
+    """
+    n, dimension = unit.shape
+    if n_bits is None:
+        n_bits = max(1, int(np.log2(max(n / bucket_target, 2))))
+    rng = np.random.default_rng(seed)
+    weights = (1 << np.arange(n_bits)).astype(np.int64)
+
+    keys, sims = [], []
+    for _ in range(n_tables):
+        planes = rng.standard_normal((dimension, n_bits)).astype(unit.dtype)
+        codes = ((unit @ planes) > 0).astype(np.int64) @ weights
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        for bucket in np.split(order, boundaries):
+            if len(bucket) < 2:
+                continue
+            found = exact_similarity_search(unit[bucket], threshold, block_size=block_size)
+            first, second = bucket[found.pair_rows], bucket[found.pair_cols]
+            keys.append(np.minimum(first, second) * n + np.maximum(first, second))
+            sims.append(found.pair_similarities)
+
+    keys, unique = np.unique(_concat(keys, np.int64), return_index=True)
+    similarities = _concat(sims, unit.dtype)[unique]
+    rows, cols = keys // n, keys % n
+
+    neighbors = neighbor_sims = None
+    if top_k:
+        neighbors, neighbor_sims = _neighbors_from_pairs(n, rows, cols, similarities, min(top_k, n - 1))
+    return SimilaritySearchResult(rows, cols, similarities, neighbors, neighbor_sims)
+
+
+def _neighbors_from_pairs(n: int, rows: np.ndarray, cols: np.ndarray, sims: np.ndarray, k: int):
+    """Best ``k`` partners per vector among known pairs, padded with -1"""
+    neighbors = np.full((n, k), -1, dtype=np.int64)
+    neighbor_sims = np.zeros((n, k), dtype=sims.dtype)
+    if not k or not len(rows):
+        return neighbors, neighbor_sims
+    source = np.concatenate([rows, cols])
+    target = np.concatenate([cols, rows])
+    both = np.concatenate([sims, sims])
+    order = np.lexsort((-both, source))
+    source, target, both = source[order], target[order], both[order]
+    # Rank of each entry within its source group
+    group_start = np.searchsorted(source, source, side="left")
+    rank = np.arange(len(source)) - group_start
+    keep = rank < k
+    neighbors[source[keep], rank[keep]] = target[keep]
+    neighbor_sims[source[keep], rank[keep]] = both[keep]
+    return neighbors, neighbor_sims
+
+
+def _concat(parts, dtype) -> np.ndarray:
+    return np.concatenate(parts).astype(dtype, copy=False) if parts else np.zeros(0, dtype=dtype)
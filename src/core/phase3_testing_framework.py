@@ -119,7 +119,7 @@ class Phase3TestingFramework:
             
             # Run semantic similarity analysis
             similarity_results = self.semantic_analyzer.analyze_semantic_similarity(
-                test_entities, test_text
+                test_entities, test_text, min_score=self.semantic_analyzer.default_min_score
             )
             
             # Calculate metrics
@@ -321,7 +321,7 @@ class Phase3TestingFramework:
             
             # Step 1: Semantic similarity analysis
             similarity_results = self.semantic_analyzer.analyze_semantic_similarity(
-                test_entities, test_text
+                test_entities, test_text, min_score=self.semantic_analyzer.default_min_score
             )
             
             # Step 2: Generate relationship suggestions
@@ -425,7 +425,7 @@ class Phase3TestingFramework:
         
         # Run all Phase 3 operations
         similarity_results = self.semantic_analyzer.analyze_semantic_similarity(
-            test_entities, test_text
+            test_entities, test_text, min_score=self.semantic_analyzer.default_min_score
         )
         
         relationship_suggestions = self.semantic_analyzer.get_relationship_suggestions(
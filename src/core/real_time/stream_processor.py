@@ -37,6 +37,12 @@ class StreamConfig:
     enable_filtering: bool = True
     enable_aggregation: bool = True
     max_processing_latency: float = 1.0  # seconds
+    max_batch_wait: float = 0.01  # seconds to wait for a micro-batch to fill
+    queue_capacities: Dict[str, int] = field(
+        default_factory=lambda: {"high": 100, "normal": 1000, "low": 5000}
+    )
+    overflow_policy: str = "drop_oldest"  # "block", "drop_newest" or "drop_oldest"
+    enqueue_timeout: Optional[float] = None  # seconds a blocked producer waits
 
 
 class DataStreamProcessor:
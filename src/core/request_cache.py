@@ -0,0 +1,144 @@
+"""
+Request Cache
+
+Bounded in-process cache for analysis results:
+- LRU eviction once ``max_entries`` is reached
+- TTL expiry checked on read and swept incrementally from an expiry queue,
+  so each write costs amortized O(1) instead of a scan over all entries
+- single-flight computation: concurrent misses for the same key share one
+  in-flight computation instead of each running it
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+class RequestCache:
+    """LRU/TTL cache with single-flight deduplication of concurrent misses."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._expiry_queue: Deque[Tuple[float, str]] = deque()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: str, record: bool = True) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            if record:
+                self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if record:
+            self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any):
+        """Store a value, expiring stale entries and evicting the least recently used"""
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        self._expiry_queue.append((expires_at, key))
+        self._expire(now)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        # Drop queue records of evicted or overwritten entries once they dominate
+        if len(self._expiry_queue) > 2 * max(len(self._entries), 1):
+            self._expiry_queue = deque(
+                (expires_at, key) for expires_at, key in self._expiry_queue
+                if key in self._entries and self._entries[key][1] == expires_at
+            )
+
+    def invalidate(self, key: str):
+        self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._expiry_queue.clear()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                             record: bool = True) -> Any:
+        """Return the cached value or compute it once for all concurrent callers
+
+        The first caller for a missing key starts ``compute``; callers that
+        arrive while it runs await the same result. Successful results are
+        cached; exceptions propagate to every waiting caller and nothing is
+        cached. Cancelling one caller does not cancel the shared computation.
+        Pass ``record=False`` when the caller already looked the key up with
+        ``get``, so the miss is not counted twice.
+        """
+        cached = self.get(key, record=record)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight computation for {key}")
+        else:
+            task = asyncio.ensure_future(self._compute_and_store(key, compute))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = await compute()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def _expire(self, now: float):
+        """Pop due records from the front of the expiry queue"""
+        expired = 0
+        while self._expiry_queue and self._expiry_queue[0][0] <= now:
+            expires_at, key = self._expiry_queue.popleft()
+            entry = self._entries.get(key)
+            # Skip records superseded by a later write of the same key
+            if entry is not None and entry[1] == expires_at:
+                del self._entries[key]
+                expired += 1
+        if expired:
+            self.expirations += expired
+            logger.debug(f"Expired {expired} cache entries")
+
+    def _remove(self, key: str):
+        self._entries.pop(key, None)
@@ -4,11 +4,15 @@ Implements word embedding-based similarity analysis for Chinese entities and
 relationships.
 """
 
-from typing import Dict, List, Optional, Any
-import re
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from collections.abc import Mapping, Sequence
 from collections import defaultdict
+from itertools import combinations
+
+from src.core.entity_similarity import (
+    EntityOccurrenceIndex, minhash_candidate_pairs, proximity_candidate_pairs
+)
 
 
 @dataclass
@@ -59,55 +63,130 @@ class SemanticSimilarityAnalyzer:
             "oppositional": ["反对", "抵制", "抗议", "冲突", "分歧"]
         }
         
+        # Different weights for different relationship types
+        self.relationship_weights = {
+            "hierarchical": 0.8,
+            "collaborative": 0.7,
+            "competitive": 0.6,
+            "supportive": 0.7,
+            "oppositional": 0.6
+        }
+        self._indicator_terms = [
+            indicator for indicators in self.relationship_indicators.values() for indicator in indicators
+        ]
+        
         # Context window size for similarity analysis
         self.context_window = 100  # characters
+        self.sentence_pattern = r'[。！？]'
         
-    def analyze_semantic_similarity(self, entities: List[Dict], text: str) -> List[SimilarityResult]:
-        """Analyze semantic similarity between entities."""
+        # Candidate blocking used when a minimum score is requested
+        self.max_bucket_size = 200
+        self.max_neighbors = 20
+        # Score floor for callers that only use meaningful pairs
+        # (relationship suggestions need > 0.5, high-similarity filters 0.6);
+        # statistics over filtered results only cover pairs above it
+        self.default_min_score = 0.3
+        
+    def analyze_semantic_similarity(self, entities: List[Dict], text: str,
+                                    min_score: Optional[float] = None) -> List[SimilarityResult]:
+        """Analyze semantic similarity between entities.
+
+        Entity positions, sentences and relationship indicators are indexed
+        in one pass over ``text``, so each pair is scored from precomputed
+        offsets. By default every pair is returned. With ``min_score`` only
+        blocked candidates (same normalized name, shared MinHash bucket,
+        same semantic category, or nearby in the text) are scored, and pairs
+        below ``min_score`` are dropped. The blocking is approximate: MinHash
+        can miss moderately similar names, proximity keeps at most
+        ``max_neighbors`` neighbours per entity, and cross-category pairs
+        with relationship indicators nearby can still reach a low
+        ``min_score``, so a few qualifying pairs may be missed.
+        """
         results = []
         
         # Convert entities to simple list
         entity_list = [entity.get("text", entity.get("name", "")) for entity in entities]
+        occurrences = EntityOccurrenceIndex(
+            text, list(entity_list) + self._indicator_terms, self.sentence_pattern
+        )
+        categories = {entity: self._get_entity_category(entity) for entity in set(entity_list)}
         
-        # Generate all entity pairs
-        for i in range(len(entity_list)):
-            for j in range(i + 1, len(entity_list)):
-                entity1, entity2 = entity_list[i], entity_list[j]
-                
-                # Calculate different types of similarity
-                lexical_similarity = self._calculate_lexical_similarity(entity1, entity2)
-                semantic_similarity = self._calculate_semantic_similarity(entity1, entity2, text)
-                contextual_similarity = self._calculate_contextual_similarity(entity1, entity2, text)
-                
-                # Combine similarities with weights
-                combined_score = (
-                    lexical_similarity * 0.2 +
-                    semantic_similarity * 0.5 +
-                    contextual_similarity * 0.3
-                )
-                
-                # Get context evidence
-                context_evidence = self._get_context_evidence(entity1, entity2, text)
-                
-                # Determine similarity type
-                similarity_type = self._determine_similarity_type(
-                    lexical_similarity, semantic_similarity, contextual_similarity
-                )
-                
-                # Calculate confidence based on evidence strength
-                confidence = self._calculate_confidence(combined_score, len(context_evidence))
-                
-                results.append(SimilarityResult(
-                    entity1=entity1,
-                    entity2=entity2,
-                    similarity_score=combined_score,
-                    similarity_type=similarity_type,
-                    confidence=confidence,
-                    context_evidence=context_evidence
-                ))
+        if min_score is None:
+            pairs = combinations(range(len(entity_list)), 2)
+        else:
+            pairs = sorted(self._candidate_pairs(entity_list, occurrences, text, categories, min_score))
+        
+        for i, j in pairs:
+            entity1, entity2 = entity_list[i], entity_list[j]
+            
+            # Calculate different types of similarity
+            lexical_similarity = self._calculate_lexical_similarity(entity1, entity2)
+            semantic_similarity = self._category_similarity(categories[entity1], categories[entity2])
+            contextual_similarity = self._calculate_contextual_similarity(entity1, entity2, text, occurrences)
+            
+            # Combine similarities with weights
+            combined_score = (
+                lexical_similarity * 0.2 +
+                semantic_similarity * 0.5 +
+                contextual_similarity * 0.3
+            )
+            if min_score is not None and combined_score < min_score:
+                continue
+            
+            # Get context evidence
+            context_evidence = self._get_context_evidence(entity1, entity2, text, occurrences)
+            
+            # Determine similarity type
+            similarity_type = self._determine_similarity_type(
+                lexical_similarity, semantic_similarity, contextual_similarity
+            )
+            
+            # Calculate confidence based on evidence strength
+            confidence = self._calculate_confidence(combined_score, len(context_evidence))
+            
+            results.append(SimilarityResult(
+                entity1=entity1,
+                entity2=entity2,
+                similarity_score=combined_score,
+                similarity_type=similarity_type,
+                confidence=confidence,
+                context_evidence=context_evidence
+            ))
         
         return results
     
+    def _candidate_pairs(self, entity_list: List[str], occurrences: EntityOccurrenceIndex,
+                         text: str, categories: Dict[str, Optional[str]],
+                         min_score: float) -> Set[Tuple[int, int]]:
+        """Blocked candidate pairs: duplicate names, categories, MinHash buckets and text proximity."""
+        pairs = set()
+        by_name = defaultdict(list)
+        by_category = defaultdict(list)
+        for index, entity in enumerate(entity_list):
+            by_name[entity.strip().lower()].append(index)
+            if categories[entity]:
+                by_category[categories[entity]].append(index)
+        for indices in by_name.values():
+            pairs.update(combinations(indices, 2))
+        
+        # Upper bound for a same-category pair that MinHash and proximity
+        # leave out: the category term plus the indicator part of the
+        # contextual term. At the default floor the category term alone
+        # qualifies every same-category pair, so all are blocked
+        indicator_bound = 0.3 * 0.4 * max(self.relationship_weights.values())
+        for category, indices in by_category.items():
+            if self.semantic_patterns[category]["weight"] * 0.5 + indicator_bound >= min_score:
+                pairs.update(combinations(indices, 2))
+        
+        pairs |= minhash_candidate_pairs(entity_list, max_bucket_size=self.max_bucket_size)
+        
+        positions = [occurrences.first_position(entity) for entity in entity_list]
+        pairs |= proximity_candidate_pairs(
+            [position if position != -1 else None for position in positions],
+            len(text) * 0.1, self.max_neighbors
+        )
+        return pairs
+    
     def _calculate_lexical_similarity(self, entity1: str, entity2: str) -> float:
         """Calculate lexical similarity between entities."""
         # Simple character-based similarity for Chinese
@@ -124,9 +203,10 @@ class SemanticSimilarityAnalyzer:
     
     def _calculate_semantic_similarity(self, entity1: str, entity2: str, text: str) -> float:
         """Calculate semantic similarity based on category matching."""
-        category1 = self._get_entity_category(entity1)
-        category2 = self._get_entity_category(entity2)
-        
+        return self._category_similarity(self._get_entity_category(entity1), self._get_entity_category(entity2))
+    
+    def _category_similarity(self, category1: Optional[str], category2: Optional[str]) -> float:
+        """Semantic similarity of two precomputed categories."""
         if category1 == category2 and category1:
             return self.semantic_patterns[category1]["weight"]
         elif category1 and category2:
@@ -135,11 +215,15 @@ class SemanticSimilarityAnalyzer:
         else:
             return 0.1
     
-    def _calculate_contextual_similarity(self, entity1: str, entity2: str, text: str) -> float:
+    def _calculate_contextual_similarity(self, entity1: str, entity2: str, text: str,
+                                         occurrences: Optional[EntityOccurrenceIndex] = None) -> float:
         """Calculate contextual similarity based on text proximity and context."""
+        if occurrences is None:
+            occurrences = EntityOccurrenceIndex(text, [entity1, entity2] + self._indicator_terms, self.sentence_pattern)
+        
         # Find positions of entities in text
-        pos1 = text.find(entity1)
-        pos2 = text.find(entity2)
+        pos1 = occurrences.first_position(entity1)
+        pos2 = occurrences.first_position(entity2)
         
         if pos1 == -1 or pos2 == -1:
             return 0.0
@@ -149,10 +233,10 @@ class SemanticSimilarityAnalyzer:
         
         # Normalize distance (closer = higher similarity)
         max_distance = len(text) * 0.1  # 10% of text length
-        distance_score = max(0, 1 - (distance / max_distance))
+        distance_score = max(0, 1 - (distance / max_distance)) if max_distance else 0.0
         
         # Check for relationship indicators in context
-        context_score = self._get_context_relationship_score(entity1, entity2, text)
+        context_score = self._get_context_relationship_score(pos1, pos2, len(text), occurrences)
         
         return (distance_score * 0.6) + (context_score * 0.4)
     
@@ -164,19 +248,12 @@ class SemanticSimilarityAnalyzer:
                     return category
         return None
     
-    def _get_context_relationship_score(self, entity1: str, entity2: str, text: str) -> float:
-        """Get relationship score based on context indicators."""
-        # Find context around both entities
-        pos1 = text.find(entity1)
-        pos2 = text.find(entity2)
-        
-        if pos1 == -1 or pos2 == -1:
-            return 0.0
-        
+    def _get_context_relationship_score(self, pos1: int, pos2: int, text_length: int,
+                                        occurrences: EntityOccurrenceIndex) -> float:
+        """Get relationship score based on indicators around two entity positions."""
         # Get context window around both entities
-        start = min(pos1, pos2) - self.context_window
-        end = max(pos1, pos2) + self.context_window
-        context = text[max(0, start):min(len(text), end)]
+        start = max(0, min(pos1, pos2) - self.context_window)
+        end = min(text_length, max(pos1, pos2) + self.context_window)
         
         # Check for relationship indicators
         total_score = 0.0
@@ -184,36 +261,32 @@ class SemanticSimilarityAnalyzer:
         
         for rel_type, indicators in self.relationship_indicators.items():
             for indicator in indicators:
-                if indicator in context:
-                    # Different weights for different relationship types
-                    weights = {
-                        "hierarchical": 0.8,
-                        "collaborative": 0.7,
-                        "competitive": 0.6,
-                        "supportive": 0.7,
-                        "oppositional": 0.6
-                    }
-                    total_score += weights.get(rel_type, 0.5)
+                if occurrences.occurs_between(indicator, start, end):
+                    total_score += self.relationship_weights.get(rel_type, 0.5)
                     indicator_count += 1
         
         return total_score / max(indicator_count, 1)
     
-    def _get_context_evidence(self, entity1: str, entity2: str, text: str) -> List[str]:
+    def _get_context_evidence(self, entity1: str, entity2: str, text: str,
+                              occurrences: Optional[EntityOccurrenceIndex] = None) -> List[str]:
         """Get contextual evidence for entity similarity."""
+        if occurrences is None:
+            occurrences = EntityOccurrenceIndex(text, [entity1, entity2], self.sentence_pattern)
         evidence = []
         
         # Find sentences containing both entities
-        sentences = re.split(r'[。！？]', text)
+        shared = occurrences.sentence_ids(entity1) & occurrences.sentence_ids(entity2)
         
-        for sentence in sentences:
-            if entity1 in sentence and entity2 in sentence:
-                # Clean up sentence
-                clean_sentence = sentence.strip()
-                if len(clean_sentence) > 10:  # Only meaningful sentences
-                    evidence.append(clean_sentence)
+        for sentence_id in sorted(shared):
+            # Clean up sentence
+            clean_sentence = occurrences.sentences[sentence_id].strip()
+            if len(clean_sentence) > 10:  # Only meaningful sentences
+                evidence.append(clean_sentence)
+                if len(evidence) == 3:
+                    break
         
         # Limit evidence to top 3 most relevant
-        return evidence[:3]
+        return evidence
     
     def _determine_similarity_type(self, lexical: float, semantic: float, contextual: float) -> str:
         """Determine the type of similarity based on scores."""
@@ -23,6 +23,7 @@ except ImportError:
     logger.warning("⚠️ Using mock Strands implementation for strands ollama integration - real Strands not available")
 
 from src.config.model_config import model_config
+from src.core.ollama_client import get_ollama_client
 
 
 class StrandsOllamaModel:
@@ -228,17 +229,7 @@ class StrandsOllamaIntegration:
     async def check_model_availability(self, model_id: str) -> bool:
         """Check if a specific model is available on the Ollama server."""
         try:
-            import aiohttp
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.host}/api/tags") as response:
-                    if response.status == 200:
-                        models = await response.json()
-                        return any(
-                            model["name"] == model_id
-                            for model in models.get("models", [])
-                        )
-                    return False
+            return model_id in await get_ollama_client(self.host).list_models(timeout=10)
 
         except Exception as e:
             logger.error(f"Error checking model availability: {e}")
@@ -9,7 +9,8 @@ Enhanced data stream processor for real-time analytics dashboard with:
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Callable, Union
+import inspect
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from collections.abc import Mapping, Sequence
@@ -40,6 +41,9 @@ class StreamMetrics:
     total_filtered: int = 0
     total_aggregated: int = 0
     processing_errors: int = 0
+    total_completed: int = 0
+    total_dropped: int = 0
+    batches_processed: int = 0
     avg_latency: float = 0.0
     throughput: float = 0.0
     start_time: datetime = field(default_factory=datetime.now)
@@ -64,10 +68,20 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
         self.stream_metrics = StreamMetrics()
         self.alert_conditions: Dict[str, Callable] = {}
         
-        # Real-time processing queues
-        self.high_priority_queue = deque(maxlen=100)
-        self.normal_priority_queue = deque(maxlen=1000)
-        self.low_priority_queue = deque(maxlen=5000)
+        # Real-time processing queues; capacity is enforced by the overflow policy
+        self.high_priority_queue = deque()
+        self.normal_priority_queue = deque()
+        self.low_priority_queue = deque()
+        self._queues = {
+            "high": self.high_priority_queue,
+            "normal": self.normal_priority_queue,
+            "low": self.low_priority_queue
+        }
+        self.queue_capacities = {"high": 100, "normal": 1000, "low": 5000}
+        self.queue_capacities.update(self.config.queue_capacities)
+        self.dropped_by_priority: Dict[str, int] = defaultdict(int)
+        self._data_available = asyncio.Event()
+        self._space_available = asyncio.Condition()
         
         # Performance monitoring
         self.performance_monitor = {
@@ -100,7 +114,16 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
         priority: str = "normal",
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Add a data point with enhanced features."""
+        """
+        Add a data point with enhanced features.
+        
+        Quality validation runs in the processing loop. When the priority
+        queue is full, ``config.overflow_policy`` decides: ``block`` waits
+        for space (up to ``config.enqueue_timeout``), ``drop_newest``
+        rejects the point and ``drop_oldest`` evicts the oldest queued
+        point. Drops are counted in the stream metrics. Returns False if
+        the point was not queued.
+        """
         try:
             # Create enhanced data point
             data_point = RealTimeDataPoint(
@@ -112,16 +135,11 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
                 processing_latency=0.0
             )
             
-            # Validate data quality
-            data_point.quality_score = await self._validate_data_quality(data_point)
-            
             # Add to appropriate priority queue
-            if priority == "high":
-                self.high_priority_queue.append(data_point)
-            elif priority == "low":
-                self.low_priority_queue.append(data_point)
-            else:
-                self.normal_priority_queue.append(data_point)
+            if priority not in self._queues:
+                priority = "normal"
+            if not await self._enqueue(data_point, priority):
+                return False
             
             # Update metrics
             self.stream_metrics.total_processed += 1
@@ -133,76 +151,110 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
             self.stream_metrics.processing_errors += 1
             return False
     
-    async def _validate_data_quality(self, data_point: RealTimeDataPoint) -> float:
-        """Validate data quality using registered validators."""
-        quality_score = 1.0
+    async def _enqueue(self, data_point: RealTimeDataPoint, priority: str) -> bool:
+        """Queue a data point, applying the overflow policy when the queue is full."""
+        queue = self._queues[priority]
+        capacity = self.queue_capacities[priority]
         
-        for name, validator in self.quality_validators.items():
-            try:
-                score = await validator(data_point)
-                quality_score = min(quality_score, score)
-            except Exception as e:
-                logger.warning(f"Quality validator {name} failed: {str(e)}")
+        if len(queue) >= capacity:
+            policy = self.config.overflow_policy
+            if policy == "block":
+                try:
+                    async with self._space_available:
+                        await asyncio.wait_for(
+                            self._space_available.wait_for(lambda: len(queue) < capacity),
+                            timeout=self.config.enqueue_timeout
+                        )
+                except asyncio.TimeoutError:
+                    self._record_drop(priority)
+                    return False
+            elif policy == "drop_newest":
+                self._record_drop(priority)
+                return False
+            else:
+                queue.popleft()
+                self._record_drop(priority)
         
-        return quality_score
+        queue.append(data_point)
+        self._data_available.set()
+        return True
     
-    async def _process_real_time_analytics(self, data_point: RealTimeDataPoint) -> Dict[str, Any]:
-        """Process real-time analytics on data point."""
-        results = {}
-        
-        for name, analyzer in self.real_time_analytics.items():
-            try:
-                result = await analyzer(data_point)
-                results[name] = result
-            except Exception as e:
-                logger.warning(f"Real-time analytics {name} failed: {str(e)}")
+    def _record_drop(self, priority: str) -> None:
+        """Count a dropped data point and log the first and every 1000th drop."""
+        self.stream_metrics.total_dropped += 1
+        self.dropped_by_priority[priority] += 1
+        if self.stream_metrics.total_dropped % 1000 == 1:
+            logger.warning(
+                f"Stream queue full: dropped {self.stream_metrics.total_dropped} data points "
+                f"(policy {self.config.overflow_policy}, last priority {priority})"
+            )
+    
+    async def _run_callbacks(
+        self, 
+        callbacks: Dict[str, Callable], 
+        data_point: RealTimeDataPoint, 
+        kind: str
+    ) -> Dict[str, Any]:
+        """Run callbacks concurrently; sync and async callables are both accepted."""
+        async def invoke(callback: Callable) -> Any:
+            result = callback(data_point)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         
+        names = list(callbacks)
+        outcomes = await asyncio.gather(
+            *(invoke(callbacks[name]) for name in names), return_exceptions=True
+        )
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"{kind} {name} failed: {str(outcome)}")
+            else:
+                results[name] = outcome
         return results
     
+    async def _validate_data_quality(self, data_point: RealTimeDataPoint) -> float:
+        """Validate data quality using registered validators."""
+        scores = await self._run_callbacks(self.quality_validators, data_point, "Quality validator")
+        return min([1.0, *scores.values()])
+    
+    async def _process_real_time_analytics(self, data_point: RealTimeDataPoint) -> Dict[str, Any]:
+        """Process real-time analytics on data point."""
+        return await self._run_callbacks(self.real_time_analytics, data_point, "Real-time analytics")
+    
     async def _check_alert_conditions(self, data_point: RealTimeDataPoint) -> List[Dict[str, Any]]:
         """Check alert conditions for data point."""
-        alerts = []
-        
-        for name, condition in self.alert_conditions.items():
-            try:
-                if await condition(data_point):
-                    alerts.append({
-                        "condition": name,
-                        "timestamp": data_point.timestamp,
-                        "source": data_point.source,
-                        "value": data_point.value,
-                        "severity": "medium"
-                    })
-            except Exception as e:
-                logger.warning(f"Alert condition {name} failed: {str(e)}")
-        
-        return alerts
+        triggered = await self._run_callbacks(self.alert_conditions, data_point, "Alert condition")
+        return [
+            {
+                "condition": name,
+                "timestamp": data_point.timestamp,
+                "source": data_point.source,
+                "value": data_point.value,
+                "severity": "medium"
+            }
+            for name, fired in triggered.items() if fired
+        ]
     
     async def _enhanced_processing_loop(self):
-        """Enhanced processing loop with real-time analytics."""
+        """
+        Enhanced processing loop with real-time analytics.
+        
+        Each tick drains a micro-batch of up to ``config.batch_size`` points
+        (high priority first), waiting at most ``config.max_batch_wait`` for
+        the batch to fill, and processes the batch concurrently. An idle
+        loop wakes as soon as data arrives.
+        """
         while self.is_processing:
             try:
-                # Process high priority queue first
-                if self.high_priority_queue:
-                    data_point = self.high_priority_queue.popleft()
-                    await self._process_enhanced_data_point(data_point, "high")
-                
-                # Process normal priority queue
-                elif self.normal_priority_queue:
-                    data_point = self.normal_priority_queue.popleft()
-                    await self._process_enhanced_data_point(data_point, "normal")
-                
-                # Process low priority queue
-                elif self.low_priority_queue:
-                    data_point = self.low_priority_queue.popleft()
-                    await self._process_enhanced_data_point(data_point, "low")
+                batch = await self._next_batch()
+                if batch:
+                    await self._process_enhanced_batch(batch)
                 
                 # Update performance metrics
                 await self._update_performance_metrics()
                 
-                # Sleep based on configuration
-                await asyncio.sleep(self.config.processing_interval)
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -210,6 +262,55 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
                 self.stream_metrics.processing_errors += 1
                 await asyncio.sleep(1.0)
     
+    def _has_pending(self) -> bool:
+        return any(self._queues.values())
+    
+    def _drain(self, limit: int) -> List[Tuple[RealTimeDataPoint, str]]:
+        """Pop up to ``limit`` points in priority order."""
+        batch = []
+        for priority, queue in self._queues.items():
+            while queue and len(batch) < limit:
+                batch.append((queue.popleft(), priority))
+        return batch
+    
+    async def _wait_for_data(self, timeout: float) -> bool:
+        """Wait until a data point is queued; returns False on timeout."""
+        self._data_available.clear()
+        if self._has_pending():
+            return True
+        try:
+            await asyncio.wait_for(self._data_available.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _next_batch(self) -> List[Tuple[RealTimeDataPoint, str]]:
+        """Collect the next micro-batch, or an empty list after an idle interval."""
+        if not await self._wait_for_data(self.config.processing_interval):
+            return []
+        
+        limit = max(1, self.config.batch_size)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.max_batch_wait
+        batch = self._drain(limit)
+        while len(batch) < limit:
+            remaining = deadline - loop.time()
+            if remaining <= 0 or not await self._wait_for_data(remaining):
+                break
+            batch.extend(self._drain(limit - len(batch)))
+        
+        # Wake producers blocked on a full queue
+        async with self._space_available:
+            self._space_available.notify_all()
+        return batch
+    
+    async def _process_enhanced_batch(self, batch: List[Tuple[RealTimeDataPoint, str]]) -> None:
+        """Process a micro-batch with all data points handled concurrently."""
+        await asyncio.gather(
+            *(self._process_enhanced_data_point(data_point, priority) for data_point, priority in batch)
+        )
+        self.stream_metrics.batches_processed += 1
+    
     async def _process_enhanced_data_point(
         self, 
         data_point: RealTimeDataPoint, 
@@ -219,11 +320,14 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
         start_time = datetime.now()
         
         try:
-            # Process real-time analytics
-            analytics_results = await self._process_real_time_analytics(data_point)
+            # Validate quality first; analytics and alert conditions may read it
+            data_point.quality_score = await self._validate_data_quality(data_point)
             
-            # Check alert conditions
-            alerts = await self._check_alert_conditions(data_point)
+            # Run analytics and check alerts concurrently
+            analytics_results, alerts = await asyncio.gather(
+                self._process_real_time_analytics(data_point),
+                self._check_alert_conditions(data_point)
+            )
             
             # Update data point with results
             data_point.processing_latency = (datetime.now() - start_time).total_seconds()
@@ -239,6 +343,7 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
             # Update metrics
             processing_time = (datetime.now() - start_time).total_seconds()
             self.performance_monitor['processing_times'].append(processing_time)
+            self.stream_metrics.total_completed += 1
             
         except Exception as e:
             logger.error(f"Error processing enhanced data point: {str(e)}")
@@ -271,6 +376,11 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
             'total_filtered': self.stream_metrics.total_filtered,
             'total_aggregated': self.stream_metrics.total_aggregated,
             'processing_errors': self.stream_metrics.processing_errors,
+            'total_completed': self.stream_metrics.total_completed,
+            'total_dropped': self.stream_metrics.total_dropped,
+            'dropped_by_priority': dict(self.dropped_by_priority),
+            'batches_processed': self.stream_metrics.batches_processed,
+            'overflow_policy': self.config.overflow_policy,
             'avg_latency': self.stream_metrics.avg_latency,
             'throughput': self.stream_metrics.throughput,
             'queue_sizes': {
@@ -278,6 +388,7 @@ class EnhancedDataStreamProcessor(BaseStreamProcessor):
                 'normal_priority': len(self.normal_priority_queue),
                 'low_priority': len(self.low_priority_queue)
             },
+            'queue_capacities': dict(self.queue_capacities),
             'uptime': (datetime.now() - self.stream_metrics.start_time).total_seconds()
         }
     
@@ -315,7 +426,10 @@ def create_enhanced_stream_processor() -> EnhancedDataStreamProcessor:
         enable_batching=config.stream_processing.enable_batching,
         enable_filtering=config.stream_processing.enable_filtering,
         enable_aggregation=config.stream_processing.enable_aggregation,
-        max_processing_latency=config.stream_processing.max_latency
+        max_processing_latency=config.stream_processing.max_latency,
+        max_batch_wait=config.stream_processing.max_batch_wait,
+        overflow_policy=config.stream_processing.overflow_policy,
+        enqueue_timeout=config.stream_processing.enqueue_timeout
     )
     
     return EnhancedDataStreamProcessor(stream_config)
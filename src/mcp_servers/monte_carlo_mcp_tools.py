@@ -50,6 +50,25 @@ class MonteCarloMCPTools:
                         "include_phase5_features": {
                             "type": "boolean",
                             "description": "Include Phase 5 advanced features"
+                        },
+                        "target_precision": {
+                            "type": "object",
+                            "description": "Stop early once metrics reach this precision; num_iterations becomes the cap",
+                            "properties": {
+                                "metrics": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "string",
+                                        "enum": ["mean", "std", "var_95", "cvar_95", "var_99", "cvar_99"]
+                                    }
+                                },
+                                "variables": {"type": "array", "items": {"type": "string"}},
+                                "relative_standard_error": {"type": "number"},
+                                "ci_width": {"type": "number"},
+                                "confidence_level": {"type": "number"},
+                                "min_iterations": {"type": "integer"},
+                                "batch_size": {"type": "integer"}
+                            }
                         }
                     },
                     "required": ["scenario_config"]
@@ -411,7 +430,8 @@ class MonteCarloMCPTools:
                 arguments.get("scenario_config"),
                 arguments.get("num_iterations"),
                 arguments.get("parallel", True),
-                arguments.get("include_phase5_features", True)
+                arguments.get("include_phase5_features", True),
+                arguments.get("target_precision")
             )
         elif tool_name == "monte_carlo_run_scenario":
             return await self.monte_carlo_run_scenario_tool(
@@ -533,7 +553,8 @@ class MonteCarloMCPTools:
                                             scenario_config: Dict[str, Any],
                                             num_iterations: Optional[int] = None,
                                             parallel: bool = True,
-                                            include_phase5_features: bool = True) -> Dict[str, Any]:
+                                            include_phase5_features: bool = True,
+                                            target_precision: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Run Monte Carlo simulation with Phase 5 features"""
         try:
             # Enhance scenario config with Phase 5 features
@@ -542,7 +563,8 @@ class MonteCarloMCPTools:
             
             # Run simulation
             result = await self.engine.run_simulation(
-                scenario_config, num_iterations, parallel
+                scenario_config, num_iterations, parallel,
+                target_precision=target_precision
             )
             
             return {
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.core.multi_domain_monte_carlo_engine import (
     MultiDomainMonteCarloEngine,
+    BatchSimulationSpec,
     SimulationConfig,
     DomainType,
     SimulationType
@@ -311,6 +312,82 @@ class MultiDomainMonteCarloMCPTools:
                 "status": "failed"
             }
     
+    async def run_batch_simulations(
+        self,
+        specs: List[Dict[str, Any]],
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Run many scenario simulations as one batch.
+        
+        Args:
+            specs: Simulation specs, each with domain, scenario_name and
+                optionally simulation_type, custom_variables, num_iterations
+                and confidence_level
+            seed: Seed for the shared base random streams
+            
+        Returns:
+            Per-spec results in completion order
+        """
+        try:
+            batch_specs = []
+            for spec in specs:
+                config = SimulationConfig(
+                    domain=DomainType(spec["domain"]),
+                    simulation_type=SimulationType(spec.get("simulation_type", "risk_analysis")),
+                    num_iterations=spec.get("num_iterations", 10000),
+                    confidence_level=spec.get("confidence_level", 0.95)
+                )
+                batch_specs.append(BatchSimulationSpec(
+                    config=config,
+                    scenario_name=spec["scenario_name"],
+                    custom_variables=spec.get("custom_variables")
+                ))
+            
+            results = []
+            async for outcome in self.engine.run_batch(batch_specs, seed):
+                spec = outcome.spec
+                if outcome.error is not None:
+                    results.append({
+                        "index": outcome.index,
+                        "domain": spec.config.domain.value,
+                        "scenario": spec.scenario_name,
+                        "error": outcome.error,
+                        "status": "failed"
+                    })
+                    continue
+                
+                result = outcome.result
+                results.append({
+                    "index": outcome.index,
+                    "simulation_id": result.simulation_id,
+                    "domain": spec.config.domain.value,
+                    "scenario": spec.scenario_name,
+                    "iterations": result.config.num_iterations,
+                    "execution_time": result.execution_time,
+                    "statistics": result.statistics,
+                    "risk_metrics": result.risk_metrics,
+                    "confidence_intervals": result.confidence_intervals,
+                    "timestamp": result.timestamp.isoformat(),
+                    "status": "completed"
+                })
+            
+            failed = sum(1 for r in results if r["status"] == "failed")
+            return {
+                "results": results,
+                "total": len(results),
+                "completed": len(results) - failed,
+                "failed": failed,
+                "status": "completed" if not failed else "partial"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in batch simulation: {e}")
+            return {
+                "error": str(e),
+                "status": "failed"
+            }
+    
     async def get_available_scenarios(self) -> Dict[str, Any]:
         """
         Get available scenarios for all domains.
@@ -712,6 +789,14 @@ async def run_custom_simulation(
     )
 
 
+async def run_batch_simulations(
+    specs: List[Dict[str, Any]],
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run many scenario simulations as one batch."""
+    return await multi_domain_monte_carlo_tools.run_batch_simulations(specs, seed)
+
+
 async def get_available_scenarios() -> Dict[str, Any]:
     """Get available scenarios for all domains."""
     return await multi_domain_monte_carlo_tools.get_available_scenarios()
@@ -22,29 +22,12 @@ from core.model_manager import ModelManager
 from core.vector_db import VectorDBManager
 from core.improved_knowledge_graph_utility import ImprovedKnowledgeGraphUtility
 from core.translation_service import TranslationService
-from core.orchestrator import SentimentOrchestrator
+from src.core.orchestrator import get_shared_orchestrator
+from src.core.lazy_loader import LazyAgent, import_factory
 from core.duplicate_detection_service import DuplicateDetectionService
 from core.performance_monitor import PerformanceMonitor
 from core.semantic_search_service import semantic_search_service
 
-# Import agents
-# flake8: noqa: E402
-from src.agents.unified_text_agent import UnifiedTextAgent
-from src.agents.unified_vision_agent import UnifiedVisionAgent
-from src.agents.unified_audio_agent import UnifiedAudioAgent
-from src.agents.enhanced_file_extraction_agent import EnhancedFileExtractionAgent
-from src.agents.knowledge_graph_agent import KnowledgeGraphAgent
-from src.agents.web_agent_enhanced import EnhancedWebAgent
-
-# Import advanced analytics agents
-from src.agents.advanced_forecasting_agent import AdvancedForecastingAgent
-from src.agents.causal_analysis_agent import CausalAnalysisAgent
-from src.agents.anomaly_detection_agent import AnomalyDetectionAgent
-from src.agents.advanced_ml_agent import AdvancedMLAgent
-
-# Import Art of War deception analysis
-from src.agents.art_of_war_deception_agent import ArtOfWarDeceptionAgent
-
 # Import multi-domain strategic analysis
 try:
     from src.core.multi_domain_strategic_engine import MultiDomainStrategicEngine
@@ -158,6 +141,11 @@ except ImportError:
     logger.warning("MCP server not available - using mock MCP server")
 
 
+def _lazy_agent(class_path: str, **kwargs) -> LazyAgent:
+    """Shared agent keyed by class name, built on first use."""
+    return LazyAgent(class_path.split(":")[1], import_factory(class_path, **kwargs))
+
+
 class UnifiedMCPServer:
     """Unified MCP server providing consolidated access to all system functionality."""
 
@@ -175,49 +163,38 @@ class UnifiedMCPServer:
         self.performance_monitor = PerformanceMonitor()
         self.semantic_search = semantic_search_service
 
-        # Initialize orchestrator
-        self.orchestrator = SentimentOrchestrator()
-
-        # Initialize agents
-        self.text_agent = UnifiedTextAgent(use_strands=True, use_swarm=True)
-        self.vision_agent = UnifiedVisionAgent()
-        self.audio_agent = UnifiedAudioAgent()
-        self.file_agent = EnhancedFileExtractionAgent()
-        self.kg_agent = KnowledgeGraphAgent()
-        self.web_agent = EnhancedWebAgent()
+        # Shared orchestrator: the API in the same process uses this instance
+        self.orchestrator = get_shared_orchestrator()
+
+        # Agents are built on first use and shared with the orchestrator's agents
+        self.text_agent = _lazy_agent(
+            "src.agents.unified_text_agent:UnifiedTextAgent", use_strands=True, use_swarm=True
+        )
+        self.vision_agent = _lazy_agent("src.agents.unified_vision_agent:UnifiedVisionAgent")
+        self.audio_agent = _lazy_agent("src.agents.unified_audio_agent:UnifiedAudioAgent")
+        self.file_agent = _lazy_agent("src.agents.enhanced_file_extraction_agent:EnhancedFileExtractionAgent")
+        self.kg_agent = _lazy_agent("src.agents.knowledge_graph_agent:KnowledgeGraphAgent")
+        self.web_agent = _lazy_agent("src.agents.web_agent_enhanced:EnhancedWebAgent")
         
-        # Initialize advanced analytics agents
-        self.forecasting_agent = AdvancedForecastingAgent()
-        self.causal_agent = CausalAnalysisAgent()
-        self.anomaly_agent = AnomalyDetectionAgent()
-        self.ml_agent = AdvancedMLAgent()
+        # Advanced analytics agents
+        self.forecasting_agent = _lazy_agent("src.agents.advanced_forecasting_agent:AdvancedForecastingAgent")
+        self.causal_agent = _lazy_agent("src.agents.causal_analysis_agent:CausalAnalysisAgent")
+        self.anomaly_agent = _lazy_agent("src.agents.anomaly_detection_agent:AnomalyDetectionAgent")
+        self.ml_agent = _lazy_agent("src.agents.advanced_ml_agent:AdvancedMLAgent")
         
-        # Initialize Art of War deception analysis agent
-        self.art_of_war_agent = ArtOfWarDeceptionAgent()
+        # Art of War deception analysis agent
+        self.art_of_war_agent = _lazy_agent("src.agents.art_of_war_deception_agent:ArtOfWarDeceptionAgent")
 
-        # Initialize threat assessment agent if available
+        # Threat assessment agent if available
         if THREAT_ASSESSMENT_AVAILABLE:
-            self.threat_assessment_agent = ThreatAssessmentAgent()
-            logger.info("✅ Threat Assessment Agent initialized for MCP")
+            self.threat_assessment_agent = _lazy_agent("src.agents.threat_assessment_agent:ThreatAssessmentAgent")
         else:
             self.threat_assessment_agent = None
             logger.warning("⚠️ Threat Assessment Agent not available for MCP")
         
-        # Initialize scenario analysis agent (using existing scenario analysis agent)
-        try:
-            from src.agents.scenario_analysis_agent import ScenarioAnalysisAgent
-            self.scenario_agent = ScenarioAnalysisAgent()
-        except Exception as e:
-            logger.warning(f"⚠️ Could not initialize ScenarioAnalysisAgent: {e}")
-            self.scenario_agent = None
-
-        # Initialize enhanced decision support agent
-        try:
-            from src.agents.decision_support_agent import DecisionSupportAgent
-            self.decision_support_agent = DecisionSupportAgent()
-        except Exception as e:
-            logger.warning(f"⚠️ Could not initialize DecisionSupportAgent: {e}")
-            self.decision_support_agent = None
+        # Scenario analysis and enhanced decision support agents
+        self.scenario_agent = _lazy_agent("src.agents.scenario_analysis_agent:ScenarioAnalysisAgent")
+        self.decision_support_agent = _lazy_agent("src.agents.decision_support_agent:DecisionSupportAgent")
 
         # Initialize strategic analytics engine
         if STRATEGIC_ANALYTICS_AVAILABLE:
@@ -4277,6 +4254,14 @@ This report contains comprehensive analysis results including deception analysis
                         domain, scenario_name, simulation_type, variables, correlations, num_iterations, confidence_level
                     )
 
+                @self.mcp.tool(description="Run many multi-domain Monte Carlo scenarios as one batch")
+                async def multi_domain_batch_simulation(
+                    specs: List[Dict[str, Any]],
+                    seed: int = None
+                ) -> Dict[str, Any]:
+                    """Run a batch of (domain, scenario, custom_variables) simulations."""
+                    return await self.multi_domain_monte_carlo_tools.run_batch_simulations(specs, seed)
+
                 @self.mcp.tool(description="Get available scenarios for all domains")
                 async def multi_domain_get_scenarios() -> Dict[str, Any]:
                     """Get available scenarios for all domains."""